@@ -0,0 +1,60 @@
+"""Key article_analysis_cache by content and template hash
+
+Revision ID: analysis_cache_001
+Revises: projection_store_001
+Create Date: 2026-10-16
+
+ArticleAnalyzer's AnalysisCache used to write one JSON file per analysis
+under cache/. It now shares the article_analysis_cache table with
+Database.save_article_analysis_cache. Rows are keyed by
+(article_uri, analysis_type, model_used, content_hash, template_hash), and
+last_accessed_at drives size-based eviction. Existing rows get empty
+hashes, so callers that do not version their content keep their keys.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'analysis_cache_001'
+down_revision = 'projection_store_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('article_analysis_cache',
+                  sa.Column('content_hash', sa.Text(), nullable=False, server_default=''))
+    op.add_column('article_analysis_cache',
+                  sa.Column('template_hash', sa.Text(), nullable=False, server_default=''))
+    op.add_column('article_analysis_cache',
+                  sa.Column('last_accessed_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP')))
+
+    op.drop_constraint('uq_article_analysis_cache', 'article_analysis_cache', type_='unique')
+    op.create_unique_constraint(
+        'uq_article_analysis_cache_key', 'article_analysis_cache',
+        ['article_uri', 'analysis_type', 'model_used', 'content_hash', 'template_hash']
+    )
+    # Used by size eviction
+    op.create_index('idx_article_analysis_cache_last_accessed', 'article_analysis_cache', ['last_accessed_at'])
+
+
+def downgrade():
+    op.drop_index('idx_article_analysis_cache_last_accessed', table_name='article_analysis_cache')
+    op.drop_constraint('uq_article_analysis_cache_key', 'article_analysis_cache', type_='unique')
+    # Keep one row per (article_uri, analysis_type, model_used) before restoring the old key
+    op.execute("""
+        DELETE FROM article_analysis_cache a
+        USING article_analysis_cache b
+        WHERE a.article_uri = b.article_uri
+          AND a.analysis_type = b.analysis_type
+          AND a.model_used = b.model_used
+          AND a.id < b.id
+    """)
+    op.create_unique_constraint(
+        'uq_article_analysis_cache', 'article_analysis_cache',
+        ['article_uri', 'analysis_type', 'model_used']
+    )
+    op.drop_column('article_analysis_cache', 'last_accessed_at')
+    op.drop_column('article_analysis_cache', 'template_hash')
+    op.drop_column('article_analysis_cache', 'content_hash')
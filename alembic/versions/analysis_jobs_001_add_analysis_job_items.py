@@ -0,0 +1,52 @@
+"""Add analysis_job_items table for the durable analysis queue
+
+Revision ID: analysis_jobs_001
+Revises: analysis_cache_001
+Create Date: 2026-10-16
+
+Replaces the in-memory AnalysisQueue. Each row is one URL of a bulk
+analysis job; the job itself is the background_tasks row with the same id.
+Workers claim rows by priority (interactive > scheduled > backfill) under
+a time-limited lease, so rows held by a crashed or redeployed worker become
+claimable again once the lease expires.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'analysis_jobs_001'
+down_revision = 'analysis_cache_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'analysis_job_items',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column('job_id', sa.String(36), nullable=False),
+        sa.Column('url', sa.Text, nullable=False),
+        sa.Column('topic', sa.Text),
+        sa.Column('priority', sa.Integer, nullable=False, server_default='50'),
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('payload', sa.Text),
+        sa.Column('result', sa.Text),
+        sa.Column('error', sa.Text),
+        sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer, nullable=False, server_default='3'),
+        sa.Column('lease_owner', sa.String(100)),
+        sa.Column('lease_expires_at', sa.TIMESTAMP),
+        sa.Column('created_at', sa.TIMESTAMP, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.TIMESTAMP, server_default=sa.text('CURRENT_TIMESTAMP')),
+    )
+    # Claim query: next queued/expired row by priority, then age
+    op.create_index('idx_analysis_job_items_claim', 'analysis_job_items', ['status', 'priority', 'id'])
+    # Per-job progress counts
+    op.create_index('idx_analysis_job_items_job', 'analysis_job_items', ['job_id', 'status'])
+
+
+def downgrade():
+    op.drop_index('idx_analysis_job_items_job', table_name='analysis_job_items')
+    op.drop_index('idx_analysis_job_items_claim', table_name='analysis_job_items')
+    op.drop_table('analysis_job_items')
@@ -0,0 +1,26 @@
+"""Add not_before to analysis_job_items for retry backoff
+
+Revision ID: analysis_jobs_002
+Revises: keyset_pagination_001
+Create Date: 2026-10-16
+
+A failed item that still has attempts left is requeued with not_before set
+to an exponentially growing delay, and is not claimable until then.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'analysis_jobs_002'
+down_revision = 'keyset_pagination_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('analysis_job_items', sa.Column('not_before', sa.TIMESTAMP))
+
+
+def downgrade():
+    op.drop_column('analysis_job_items', 'not_before')
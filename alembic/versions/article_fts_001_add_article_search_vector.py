@@ -0,0 +1,57 @@
+"""Add full-text search vector and trigram indexes to articles
+
+Revision ID: article_fts_001
+Revises: keyword_cursors_001
+Create Date: 2026-10-16
+
+Adds a generated tsvector column over title (weight A), summary (B) and
+category, future_signal, sentiment and tags (C) with a GIN index, used for
+ranked keyword search. Trigram GIN indexes let substring filters on tags
+and news_source (LIKE/ILIKE '%...%') use an index.
+
+SQLite databases get an FTS5 table instead, created by the query facade on
+first use.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = 'article_fts_001'
+down_revision = 'keyword_cursors_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        ALTER TABLE articles
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+            setweight(to_tsvector('english',
+                coalesce(category, '') || ' ' || coalesce(future_signal, '') || ' ' ||
+                coalesce(sentiment, '') || ' ' || coalesce(tags, '')), 'C')
+        ) STORED
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_search_vector
+        ON articles USING GIN (search_vector)
+    """)
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_tags_trgm
+        ON articles USING GIN (tags gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_news_source_trgm
+        ON articles USING GIN (news_source gin_trgm_ops)
+    """)
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS idx_articles_news_source_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_articles_tags_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_articles_search_vector')
+    op.execute('ALTER TABLE articles DROP COLUMN IF EXISTS search_vector')
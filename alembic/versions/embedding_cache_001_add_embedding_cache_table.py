@@ -0,0 +1,40 @@
+"""Add embedding cache table
+
+Revision ID: embedding_cache_001
+Revises: auspex_enhance_001
+Create Date: 2026-10-16
+
+Persistent tier of the content-addressed embedding cache used by
+app/vector_store_pgvector.py. Rows are keyed by (model, sha256 of the
+truncated text) and hold the embedding as packed float32 bytes, so
+re-ingest, re-analysis and repeated searches do not call the embedding API.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'embedding_cache_001'
+down_revision = 'auspex_enhance_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'embedding_cache',
+        sa.Column('model', sa.String(100), nullable=False),
+        sa.Column('content_hash', sa.String(64), nullable=False),
+        sa.Column('dimensions', sa.Integer, nullable=False),
+        sa.Column('embedding', sa.LargeBinary, nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('last_accessed_at', sa.TIMESTAMP, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.PrimaryKeyConstraint('model', 'content_hash', name='pk_embedding_cache'),
+    )
+    # Used by TTL and size eviction
+    op.create_index('idx_embedding_cache_last_accessed', 'embedding_cache', ['last_accessed_at'])
+
+
+def downgrade():
+    op.drop_index('idx_embedding_cache_last_accessed', table_name='embedding_cache')
+    op.drop_table('embedding_cache')
@@ -0,0 +1,45 @@
+"""Add keyset pagination indexes for article and feed listings
+
+Revision ID: keyset_pagination_001
+Revises: article_fts_001
+Create Date: 2026-10-16
+
+Article listings page by (submission_date, uri) and the unified feed by
+(publication_date, id) or (created_at, id), newest first. These indexes
+match those orders so each page is an index range scan instead of an
+OFFSET over every earlier row.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = 'keyset_pagination_001'
+down_revision = 'article_fts_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_submission_date_uri
+        ON articles (submission_date DESC NULLS LAST, uri DESC)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_articles_topic_submission_date_uri
+        ON articles (topic, submission_date DESC NULLS LAST, uri DESC)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_feed_items_publication_date_id
+        ON feed_items (publication_date DESC NULLS LAST, id DESC)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_feed_items_created_at_id
+        ON feed_items (created_at DESC NULLS LAST, id DESC)
+    """)
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS idx_feed_items_created_at_id')
+    op.execute('DROP INDEX IF EXISTS idx_feed_items_publication_date_id')
+    op.execute('DROP INDEX IF EXISTS idx_articles_topic_submission_date_uri')
+    op.execute('DROP INDEX IF EXISTS idx_articles_submission_date_uri')
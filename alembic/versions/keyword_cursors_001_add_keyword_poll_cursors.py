@@ -0,0 +1,39 @@
+"""Add keyword_poll_cursors table for incremental keyword polling
+
+Revision ID: keyword_cursors_001
+Revises: analysis_jobs_001
+Create Date: 2026-10-16
+
+One row per (monitored keyword, provider) with the newest publication date
+and result URLs seen so far, so each poll only asks for newer items, plus
+an adaptive poll interval and the time the pair is next due.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'keyword_cursors_001'
+down_revision = 'analysis_jobs_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'keyword_poll_cursors',
+        sa.Column('keyword_id', sa.Integer, sa.ForeignKey('monitored_keywords.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('provider', sa.String(50), nullable=False),
+        sa.Column('last_published_at', sa.TIMESTAMP),
+        sa.Column('seen_urls', sa.Text),
+        sa.Column('poll_interval_seconds', sa.Integer),
+        sa.Column('next_poll_at', sa.TIMESTAMP),
+        sa.Column('empty_polls', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('last_polled_at', sa.TIMESTAMP),
+        sa.Column('last_new_count', sa.Integer, nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('keyword_id', 'provider', name='keyword_poll_cursors_pkey'),
+    )
+
+
+def downgrade():
+    op.drop_table('keyword_poll_cursors')
@@ -0,0 +1,53 @@
+"""Add precomputed embedding projection tables
+
+Revision ID: projection_store_001
+Revises: embedding_cache_001
+Create Date: 2026-10-16
+
+Stores fitted UMAP/t-SNE/PCA coordinates and k-means cluster labels per
+filter scope so /api/embedding_projection reads a table instead of
+refitting the reducer on every request. New articles are appended by the
+projection refresh task via transform(); a scope is refitted once the
+share of appended points exceeds the drift threshold.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'projection_store_001'
+down_revision = 'embedding_cache_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'projection_scopes',
+        sa.Column('scope_key', sa.String(64), primary_key=True),
+        sa.Column('method', sa.String(20), nullable=False),
+        sa.Column('dims', sa.Integer, nullable=False),
+        sa.Column('n_clusters', sa.Integer, nullable=False),
+        sa.Column('filters', sa.Text),
+        sa.Column('fitted_count', sa.Integer, nullable=False, server_default=sa.text('0')),
+        sa.Column('placed_count', sa.Integer, nullable=False, server_default=sa.text('0')),
+        sa.Column('explain', sa.Text),
+        sa.Column('fitted_at', sa.TIMESTAMP, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.TIMESTAMP, server_default=sa.text('CURRENT_TIMESTAMP')),
+    )
+    op.create_table(
+        'projection_points',
+        sa.Column('scope_key', sa.String(64), sa.ForeignKey('projection_scopes.scope_key', ondelete='CASCADE'), nullable=False),
+        sa.Column('uri', sa.Text, nullable=False),
+        sa.Column('x', sa.Float, nullable=False),
+        sa.Column('y', sa.Float, nullable=False),
+        sa.Column('z', sa.Float),
+        sa.Column('cluster', sa.Integer, nullable=False),
+        sa.Column('fitted', sa.Boolean, nullable=False, server_default=sa.text('TRUE')),
+        sa.PrimaryKeyConstraint('scope_key', 'uri', name='pk_projection_points'),
+    )
+
+
+def downgrade():
+    op.drop_table('projection_points')
+    op.drop_table('projection_scopes')
@@ -4,7 +4,7 @@ import logging
 from urllib.parse import urlparse
 import hashlib
 from .prompt_templates import PromptTemplates, PromptTemplateError
-from .cache import AnalysisCache, CacheError
+from .cache import AnalysisCache, CacheError, get_analysis_cache
 from app.exceptions import PipelineError, ErrorSeverity, LLMErrorClassifier
 import json
 import traceback
@@ -50,7 +50,7 @@ Article text:
 {content}
 """
 
-    def __init__(self, ai_model, custom_templates_path: str = None, cache_dir: str = "cache", cache_ttl_hours: int = 24, use_cache: bool = True):
+    def __init__(self, ai_model, custom_templates_path: str = None, use_cache: bool = True, cache: AnalysisCache = None):
         if not ai_model:
             raise ArticleAnalyzerError("AI model is required")
         self.ai_model = ai_model
@@ -60,8 +60,8 @@ Article text:
         logger.debug(f"Initialized ArticleAnalyzer with model={self.model_name}, use_cache={self.use_cache}")
         try:
             self.prompt_templates = PromptTemplates(custom_templates_path)
-            self.cache = AnalysisCache(cache_dir, cache_ttl_hours)
-        except (PromptTemplateError, CacheError) as e:
+            self.cache = cache or get_analysis_cache()
+        except PromptTemplateError as e:
             logger.error(f"Failed to initialize: {str(e)}")
             raise ArticleAnalyzerError(f"Failed to initialize: {str(e)}")
 
@@ -129,9 +129,8 @@ Article text:
             if self.use_cache:
                 logger.debug(f"Cache check enabled for model {self.model_name}")
                 content_hash = self._compute_content_hash(article_text)
-                cache_key = f"{uri}_{self.model_name}"
-                logger.debug(f"Checking cache with key: {cache_key}, content_hash: {content_hash}")
-                cached_result = self.cache.get(cache_key, content_hash, model_info, template_hash)
+                logger.debug(f"Checking cache for {uri}, content_hash: {content_hash}")
+                cached_result = self.cache.get(uri, content_hash, model_info, template_hash)
                 
                 if cached_result:
                     logger.info(f"Using cached analysis for {uri} with model {self.model_name}")
@@ -191,8 +190,7 @@ Article text:
             if self.use_cache:
                 try:
                     content_hash = self._compute_content_hash(article_text)
-                    cache_key = f"{uri}_{self.ai_model.model_name}"
-                    self.cache.set(cache_key, content_hash, result, model_info, template_hash)
+                    self.cache.set(uri, content_hash, result, model_info, template_hash)
                 except CacheError as e:
                     logger.warning(f"Failed to cache analysis: {str(e)}")
 
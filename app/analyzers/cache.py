@@ -1,180 +1,237 @@
-from typing import Dict, Optional, Any
+"""
+Database-backed cache of ArticleAnalyzer results.
+
+Entries live in the ``article_analysis_cache`` table, which is shared with
+Database.save_article_analysis_cache. Each row is keyed by
+(article_uri, analysis_type, model_used, content_hash, template_hash).
+Lookups and writes are batched, and rows are evicted by TTL and by total
+size, least recently accessed first.
+
+Configuration (environment):
+- ANALYSIS_CACHE_TTL_HOURS (default 24)
+- ANALYSIS_CACHE_MAX_ENTRIES (default 100000 rows; 0 disables size eviction)
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
 import json
-import os
-import time
 import logging
+import os
+import threading
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+ARTICLE_ANALYSIS = "article_analysis"
+
+# Run size eviction after this many new rows have been written
+EVICTION_EVERY = 500
+
+CacheKey = Tuple[str, str]  # (uri, content_hash)
+
+
 class CacheError(Exception):
     pass
 
+
 class AnalysisCache:
-    def __init__(self, cache_dir: str = "cache", ttl_hours: int = 24):
-        self.cache_dir = cache_dir
+    def __init__(self, db=None, ttl_hours: float = 24, analysis_type: str = ARTICLE_ANALYSIS,
+                 max_entries: Optional[int] = 100000):
+        self._db = db
         self.ttl = timedelta(hours=ttl_hours)
-        self._ensure_cache_dir()
-
-    def _ensure_cache_dir(self) -> None:
-        try:
-            os.makedirs(self.cache_dir, exist_ok=True)
-        except Exception as e:
-            raise CacheError(f"Failed to create cache directory: {str(e)}")
-
-    def _get_cache_key(self, uri: str, content_hash: str) -> str:
-        """Generate a cache key that includes model information."""
-        # Remove the old model name extraction since we'll handle it differently
-        return f"{uri}_{content_hash}"
-
-    def _get_cache_path(self, uri: str, content_hash: str) -> str:
-        """Create a cache path that includes model information."""
-        # Create a safe filename from the URI
-        safe_uri = uri.replace('://', '_').replace('/', '_')
-        filename = f"{safe_uri}_{content_hash}.json"
-        
-        # Create subdirectories based on the first few characters of the hash
-        subdir = content_hash[:2]
-        subdir_path = os.path.join(self.cache_dir, subdir)
-        os.makedirs(subdir_path, exist_ok=True)
-        
-        return os.path.join(subdir_path, filename)
-
-    def get(self, uri: str, content_hash: str, model_info: Dict[str, str] = None, template_hash: str = None) -> Optional[Dict[str, Any]]:
-        """Get cached analysis with model version checking."""
+        self.analysis_type = analysis_type
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    def _facade(self):
+        if self._db is None:
+            from app.database import get_database_instance
+            self._db = get_database_instance()
+        return self._db.facade
+
+    @staticmethod
+    def _model_key(model_info: Optional[Dict[str, str]]) -> str:
+        return (model_info or {}).get('name') or ''
+
+    @staticmethod
+    def _cached_provider(row: Dict[str, Any]) -> Optional[str]:
+        """Provider recorded in a row's metadata; rows are keyed by model name only."""
         try:
-            cache_key = self._get_cache_key(uri, content_hash)
-            cache_path = self._get_cache_path(uri, content_hash)
-
-            logger.debug(f"Checking cache with key: {cache_key}")
-            if not os.path.exists(cache_path):
-                logger.debug(f"No cache file found at: {cache_path}")
-                return None
-
-            with open(cache_path, 'r') as f:
-                cached_data = json.load(f)
-
-            # Check if cache has expired
-            cached_time = datetime.fromisoformat(cached_data['cached_at'])
-            if datetime.now() - cached_time > self.ttl:
-                logger.debug(f"Cache expired for {cache_key}")
-                self.delete(uri, content_hash)
-                return None
-
-            # Check model version if provided
-            if model_info:
-                cached_model = cached_data.get('model_info', {})
-                if cached_model.get('name') != model_info.get('name') or \
-                   cached_model.get('provider') != model_info.get('provider'):
-                    logger.debug(f"Model mismatch for {cache_key}")
-                    self.delete(uri, content_hash)
-                    return None
-
-            # Check template version if provided
-            if template_hash and cached_data.get('template_hash') != template_hash:
-                logger.debug(f"Template version mismatch for {cache_key}")
-                self.delete(uri, content_hash)
-                return None
-
-            logger.debug(f"Cache hit for {cache_key}")
-            return cached_data['analysis']
-        except Exception as e:
-            logger.error(f"Error reading from cache: {str(e)}")
+            metadata = json.loads(row.get('metadata') or '{}')
+        except (TypeError, ValueError):
             return None
+        return ((metadata or {}).get('model_info') or {}).get('provider')
 
-    def set(self, uri: str, content_hash: str, analysis: Dict[str, Any], model_info: Dict[str, str] = None, template_hash: str = None) -> None:
-        """Store analysis with model version information."""
-        try:
-            cache_key = self._get_cache_key(uri, content_hash)
-            cache_path = self._get_cache_path(uri, content_hash)
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def get_many(self, keys: Iterable[CacheKey], model_info: Dict[str, str] = None,
+                 template_hash: str = None) -> Dict[CacheKey, Dict[str, Any]]:
+        """Get cached analyses for several (uri, content_hash) keys in one query.
+
+        Returns:
+            Dict mapping each cached key to its analysis. Misses are absent.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
 
-            cache_data = {
-                'uri': uri,
+        try:
+            rows = self._facade().get_analysis_cache_entries(
+                self.analysis_type,
+                self._model_key(model_info),
+                [(uri, content_hash, template_hash or '') for uri, content_hash in keys]
+            )
+        except Exception as e:
+            logger.error(f"Error reading from cache: {str(e)}")
+            self._count(errors=1, misses=len(keys))
+            return {}
+
+        found = {}
+        for (uri, content_hash, _), row in rows.items():
+            if model_info and self._cached_provider(row) != model_info.get('provider'):
+                logger.debug(f"Provider mismatch for cached analysis of {uri}")
+                continue
+            try:
+                found[(uri, content_hash)] = json.loads(row['content'])
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cache entry for {uri}: {str(e)}")
+
+        self._count(hits=len(found), misses=len(keys) - len(found))
+        logger.debug(f"Analysis cache: {len(found)}/{len(keys)} hits")
+        return found
+
+    def get(self, uri: str, content_hash: str, model_info: Dict[str, str] = None,
+            template_hash: str = None) -> Optional[Dict[str, Any]]:
+        """Get a cached analysis, or None if missing, expired or for another model/template."""
+        return self.get_many([(uri, content_hash)], model_info, template_hash).get((uri, content_hash))
+
+    def set_many(self, analyses: Dict[CacheKey, Dict[str, Any]], model_info: Dict[str, str] = None,
+                 template_hash: str = None) -> None:
+        """Store analyses for several (uri, content_hash) keys in one statement."""
+        if not analyses:
+            return
+
+        expires_at = datetime.utcnow() + self.ttl
+        metadata = json.dumps({'model_info': model_info}) if model_info else None
+        rows = [
+            {
+                'article_uri': uri,
+                'analysis_type': self.analysis_type,
+                'model_used': self._model_key(model_info),
                 'content_hash': content_hash,
-                'analysis': analysis,
-                'cached_at': datetime.now().isoformat(),
-                'template_hash': template_hash,
-                'model_info': model_info
+                'template_hash': template_hash or '',
+                'content': json.dumps(analysis),
+                'metadata': metadata,
+                'expires_at': expires_at,
             }
+            for (uri, content_hash), analysis in analyses.items()
+        ]
 
-            with open(cache_path, 'w') as f:
-                json.dump(cache_data, f, indent=2)
-
-            logger.debug(f"Cached analysis for {uri} with model info: {model_info}")
+        try:
+            self._facade().save_analysis_cache_entries(rows)
         except Exception as e:
             logger.error(f"Error writing to cache: {str(e)}")
+            self._count(errors=1)
             raise CacheError(f"Failed to cache analysis: {str(e)}")
 
+        with self._lock:
+            self._stats["writes"] += len(rows)
+            self._writes_since_eviction += len(rows)
+            run_eviction = self.max_entries and self._writes_since_eviction >= EVICTION_EVERY
+            if run_eviction:
+                self._writes_since_eviction = 0
+        if run_eviction:
+            try:
+                self.evict()
+            except CacheError:
+                pass
+
+        logger.debug(f"Cached {len(rows)} analyses with model info: {model_info}")
+
+    def set(self, uri: str, content_hash: str, analysis: Dict[str, Any], model_info: Dict[str, str] = None,
+            template_hash: str = None) -> None:
+        """Store an analysis with its model and template versions."""
+        self.set_many({(uri, content_hash): analysis}, model_info, template_hash)
+
     def delete(self, uri: str, content_hash: str) -> None:
         try:
-            cache_key = self._get_cache_key(uri, content_hash)
-            cache_path = self._get_cache_path(uri, content_hash)
-
-            if os.path.exists(cache_path):
-                os.remove(cache_path)
-                logger.debug(f"Deleted cache for {uri}")
+            self._facade().delete_analysis_cache_entries(self.analysis_type, uri, content_hash)
+            logger.debug(f"Deleted cache for {uri}")
         except Exception as e:
             logger.error(f"Error deleting cache: {str(e)}")
             raise CacheError(f"Failed to delete cache: {str(e)}")
 
     def clear(self) -> None:
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    os.remove(os.path.join(self.cache_dir, filename))
-            logger.info("Cache cleared")
+            deleted = self._facade().delete_analysis_cache_entries(self.analysis_type)
+            logger.info(f"Cache cleared ({deleted} entries)")
         except Exception as e:
             logger.error(f"Error clearing cache: {str(e)}")
             raise CacheError(f"Failed to clear cache: {str(e)}")
 
-    def get_stats(self) -> Dict[str, Any]:
+    def evict(self) -> int:
+        """Drop expired entries, then the least recently used ones beyond max_entries."""
         try:
-            total_files = 0
-            total_size = 0
-            oldest_cache = None
-            newest_cache = None
-
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    total_files += 1
-                    total_size += os.path.getsize(file_path)
-
-                    with open(file_path, 'r') as f:
-                        cache_data = json.load(f)
-                        cached_at = datetime.fromisoformat(cache_data['cached_at'])
-                        
-                        if oldest_cache is None or cached_at < oldest_cache:
-                            oldest_cache = cached_at
-                        if newest_cache is None or cached_at > newest_cache:
-                            newest_cache = cached_at
-
-            return {
-                'total_files': total_files,
-                'total_size_bytes': total_size,
-                'oldest_cache': oldest_cache.isoformat() if oldest_cache else None,
-                'newest_cache': newest_cache.isoformat() if newest_cache else None
-            }
+            deleted = self._facade().evict_analysis_cache(self.analysis_type, self.max_entries or None)
         except Exception as e:
-            logger.error(f"Error getting cache stats: {str(e)}")
-            raise CacheError(f"Failed to get cache stats: {str(e)}")
+            logger.error(f"Error evicting cache entries: {str(e)}")
+            self._count(errors=1)
+            raise CacheError(f"Failed to evict cache entries: {str(e)}")
+        self._count(evictions=deleted)
+        if deleted:
+            logger.info(f"Evicted {deleted} analysis cache entries")
+        return deleted
 
     def cleanup_expired(self) -> int:
         try:
-            cleaned = 0
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    with open(file_path, 'r') as f:
-                        cache_data = json.load(f)
-                        cached_at = datetime.fromisoformat(cache_data['cached_at'])
-                        
-                        if datetime.now() - cached_at > self.ttl:
-                            os.remove(file_path)
-                            cleaned += 1
-
-            logger.info(f"Cleaned up {cleaned} expired cache files")
-            return cleaned
+            cleaned = self._facade().evict_analysis_cache(self.analysis_type)
         except Exception as e:
             logger.error(f"Error cleaning up expired cache: {str(e)}")
-            raise CacheError(f"Failed to clean up expired cache: {str(e)}") 
\ No newline at end of file
+            raise CacheError(f"Failed to clean up expired cache: {str(e)}")
+        self._count(evictions=cleaned)
+        logger.info(f"Cleaned up {cleaned} expired cache entries")
+        return cleaned
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return table size plus hit/miss counters and hit rate for this process."""
+        try:
+            summary = self._facade().get_analysis_cache_summary(self.analysis_type)
+        except Exception as e:
+            logger.error(f"Error getting cache stats: {str(e)}")
+            raise CacheError(f"Failed to get cache stats: {str(e)}")
+
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats.update({
+            'total_entries': summary['entries'],
+            'total_size_bytes': summary['total_size_bytes'],
+            'oldest_cache': summary['oldest'].isoformat() if summary['oldest'] else None,
+            'newest_cache': summary['newest'].isoformat() if summary['newest'] else None,
+        })
+        return stats
+
+
+_analysis_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Return the process-wide analysis cache shared by ArticleAnalyzer instances."""
+    global _analysis_cache
+
+    if _analysis_cache is None:
+        _analysis_cache = AnalysisCache(
+            ttl_hours=float(os.getenv("ANALYSIS_CACHE_TTL_HOURS", "24")),
+            max_entries=int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "100000")) or None,
+        )
+    return _analysis_cache
@@ -205,6 +205,40 @@ Output Format (JSON Object):
         }
     }
 
+    # User prompt for scoring several articles in one request. It shares the
+    # system prompt of "relevance_analysis" and is not versioned separately.
+    RELEVANCE_BATCH_USER_PROMPT = """You are an AI assistant evaluating the relevance of several news articles to a specific topic and set of keywords.
+
+Monitoring Criteria:
+- Target Topic: {topic}
+- Target Keywords: {keywords}
+
+Articles (JSON array; each has an "id", "title", "source" and "content"):
+{articles}
+
+Evaluate EACH article independently:
+1.  **Topic Alignment:** How closely the article's main subject aligns with the Target Topic, from 0.0 (no alignment) to 1.0 (perfect alignment).
+2.  **Keyword Presence & Relevance:** Whether the Target Keywords are present and relevant to the article's core message, from 0.0 to 1.0.
+3.  **Overall Match Explanation:** One or two sentences explaining both scores.
+4.  **Confidence Score:** Your confidence in the evaluation (0.0 to 1.0).
+5.  **Extracted Article Topics:** The 1-3 main topics actually discussed.
+6.  **Extracted Article Keywords:** 3-5 keywords that best represent the article.
+
+Output Format (JSON Object, one entry per article, using the article's "id"):
+{{
+    "results": [
+        {{
+            "id": "<article id>",
+            "topic_alignment_score": <float, 0.0-1.0>,
+            "keyword_relevance_score": <float, 0.0-1.0>,
+            "overall_match_explanation": "<string>",
+            "confidence_score": <float, 0.0-1.0>,
+            "extracted_article_topics": ["<string>", ...],
+            "extracted_article_keywords": ["<string>", ...]
+        }}
+    ]
+}}"""
+
     def __init__(self, custom_templates_path: str = None):
         try:
             self.prompt_manager = PromptManager()
@@ -356,4 +390,25 @@ Output Format (JSON Object):
                 topic=topic_context,  # Use enhanced topic context
                 keywords=keywords
             )}
-        ] 
\ No newline at end of file
+        ]
+
+    def format_relevance_batch_prompt(self, articles: List[Dict[str, str]], topic: str, keywords: str, topic_description: str = "") -> List[Dict[str, str]]:
+        """Format one relevance prompt covering several articles.
+
+        ``articles`` are compact records with "id", "title", "source" and
+        "content" keys; content should already be truncated by the caller.
+        """
+        template = self.get_template("relevance_analysis")
+
+        topic_context = f"{topic}"
+        if topic_description:
+            topic_context = f"{topic}\nTopic Description: {topic_description}"
+
+        return [
+            {"role": "system", "content": template["system_prompt"]},
+            {"role": "user", "content": self.RELEVANCE_BATCH_USER_PROMPT.format(
+                topic=topic_context,
+                keywords=keywords,
+                articles=json.dumps(articles, ensure_ascii=False, indent=1)
+            )}
+        ]
@@ -10,9 +10,9 @@ import logging
 import traceback
 import datetime
 import json
-import os
 import asyncio
 from app.database_query_facade import DatabaseQueryFacade
+from app.services.ontology_registry import get_ontology_registry
 
 # flake8: noqa  # Disable style warnings (long lines etc.) for this file
 
@@ -52,6 +52,23 @@ class BulkResearch:
             logger.error(traceback.format_exc())
             raise
 
+    def _ontology_kwargs(self, topic: Optional[str] = None) -> Dict[str, List[str]]:
+        """Ontology lists for analyze_content, served from the shared ontology registry.
+
+        Falls back to the Research instance's config for topics the registry
+        does not know about (e.g. the built-in default topic).
+        """
+        ontology = get_ontology_registry().get(topic or self.research.current_topic)
+        if ontology:
+            return ontology.analyzer_kwargs()
+        return {
+            "categories": self.research.CATEGORIES,
+            "future_signals": self.research.FUTURE_SIGNALS,
+            "sentiment_options": self.research.SENTIMENT,
+            "time_to_impact_options": self.research.TIME_TO_IMPACT,
+            "driver_types": self.research.DRIVER_TYPES,
+        }
+
     def is_bluesky_url(self, uri: str) -> bool:
         """Check if a URL is from the Bluesky platform."""
         parsed_uri = urlparse(uri)
@@ -99,9 +116,6 @@ class BulkResearch:
                 else:
                     logger.warning("⚠️ Firecrawl initialization failed - will fallback to individual scraping")
             
-            # Create cache directory if it doesn't exist
-            os.makedirs("cache", exist_ok=True)
-            
             # Initialize ArticleAnalyzer with the AI model and caching
             self.article_analyzer = ArticleAnalyzer(
                 self.research.ai_model,
@@ -241,11 +255,7 @@ class BulkResearch:
                     summary_length=summary_length,
                     summary_voice=summary_voice,
                     summary_type=summary_type,
-                    categories=self.research.CATEGORIES,
-                    future_signals=self.research.FUTURE_SIGNALS,
-                    sentiment_options=self.research.SENTIMENT,
-                    time_to_impact_options=self.research.TIME_TO_IMPACT,
-                    driver_types=self.research.DRIVER_TYPES
+                    **self._ontology_kwargs()
                 )
 
                 # Add news source, publication date and submission date
@@ -631,48 +641,17 @@ class BulkResearch:
                     })
 
     async def _index_articles_vector(self, vector_articles: List[Dict]):
-        """Index articles into vector database asynchronously with batching"""
+        """Index articles into vector database with batched embedding requests and writes"""
         if not vector_articles:
             return
 
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-
-        # Process vector indexing in smaller batches to avoid blocking
-        VECTOR_BATCH_SIZE = 3
-        total_batches = (len(vector_articles) + VECTOR_BATCH_SIZE - 1) // VECTOR_BATCH_SIZE
-
-        for batch_idx in range(total_batches):
-            start_idx = batch_idx * VECTOR_BATCH_SIZE
-            end_idx = min(start_idx + VECTOR_BATCH_SIZE, len(vector_articles))
-            batch_articles = vector_articles[start_idx:end_idx]
-
-            def index_batch_sync():
-                try:
-                    from app.vector_store import upsert_article
-
-                    for article in batch_articles:
-                        try:
-                            upsert_article(article)
-                            logger.debug(f"Indexed article into vector database: {article.get('title', 'Unknown')}")
-                        except Exception as e:
-                            logger.error(f"Failed to index article {article.get('uri')}: {str(e)}")
-
-                    logger.debug(f"Successfully indexed batch of {len(batch_articles)} articles into vector database")
-
-                except Exception as e:
-                    logger.error(f"Vector indexing batch error: {str(e)}")
-
-            # Run vector indexing batch in thread pool
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                await loop.run_in_executor(executor, index_batch_sync)
-
-            # Brief pause between vector batches to allow other operations
-            if batch_idx < total_batches - 1:
-                await asyncio.sleep(0.05)
+        from app.vector_store import upsert_articles_bulk_async
 
-        logger.info(f"Successfully indexed all {len(vector_articles)} articles into vector database")
+        stats = await upsert_articles_bulk_async(vector_articles)
+        logger.info(
+            f"Indexed {stats['indexed']}/{len(vector_articles)} articles into vector database "
+            f"({stats['cached']} from embedding cache, {stats['failed']} failed)"
+        )
     
     def extract_source(self, uri):
         domain = urlparse(uri).netloc
@@ -1006,7 +985,6 @@ class BulkResearch:
                 else:
                     logger.warning("[stream] ⚠️ Firecrawl initialization failed - will fallback to individual scraping")
 
-            os.makedirs("cache", exist_ok=True)
             self.article_analyzer = ArticleAnalyzer(
                 self.research.ai_model,
                 use_cache=True,
@@ -1119,11 +1097,7 @@ class BulkResearch:
                     summary_length=summary_length,
                     summary_voice=summary_voice,
                     summary_type=summary_type,
-                    categories=self.research.CATEGORIES,
-                    future_signals=self.research.FUTURE_SIGNALS,
-                    sentiment_options=self.research.SENTIMENT,
-                    time_to_impact_options=self.research.TIME_TO_IMPACT,
-                    driver_types=self.research.DRIVER_TYPES,
+                    **self._ontology_kwargs(),
                 )
                 result.update({
                     "news_source": source,
@@ -1223,11 +1197,7 @@ class BulkResearch:
                 summary_length=50,
                 summary_voice="neutral",
                 summary_type="curious_ai",
-                categories=self.research.CATEGORIES,
-                future_signals=self.research.FUTURE_SIGNALS,
-                sentiment_options=self.research.SENTIMENT,
-                time_to_impact_options=self.research.TIME_TO_IMPACT,
-                driver_types=self.research.DRIVER_TYPES,
+                **self._ontology_kwargs(),
             )
             
             # Add news_source if not present
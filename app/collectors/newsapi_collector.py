@@ -2,9 +2,11 @@ import aiohttp
 from datetime import datetime
 from typing import List, Dict, Optional
 from .base_collector import ArticleCollector
+from .transport import get_transport
 import logging
 import os
 import json
+import threading
 from app.database import Database
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,8 @@ class NewsAPICollector(ArticleCollector):
             
         self.db = db
         self.base_url = "https://newsapi.org/v2"
+        # Keyword searches run concurrently, possibly from several threads
+        self._counter_lock = threading.Lock()
         self._init_request_counter()
         self.last_request_time = None
 
@@ -55,16 +59,18 @@ class NewsAPICollector(ArticleCollector):
     def _update_request_counter(self):
         """Update request counter in the database after a successful API call"""
         try:
-            # Increment the in-memory counter
-            self.requests_today += 1
-            
-            # Update in database
             today = datetime.now().date().isoformat()
 
-            # Make sure we have a row in the status table with today's date
-            self.db.facade.stamp_keyword_monitor_status_table_with_todays_date((self.requests_today, today))
+            # Increment the in-memory counter and store it, so concurrent
+            # searches never write an older count over a newer one
+            with self._counter_lock:
+                self.requests_today += 1
+                requests_today = self.requests_today
+
+                # Make sure we have a row in the status table with today's date
+                self.db.facade.stamp_keyword_monitor_status_table_with_todays_date((requests_today, today))
 
-            logger.debug(f"Updated NewsAPI request count to {self.requests_today}")
+            logger.debug(f"Updated NewsAPI request count to {requests_today}")
 
             # Check if we're at or near the limit
             # Default limit is 100 (NewsAPI free tier)
@@ -75,8 +81,8 @@ class NewsAPICollector(ArticleCollector):
             if limit_row and limit_row[0]:
                 daily_limit = limit_row[0]
 
-            if self.requests_today >= daily_limit:
-                logger.warning(f"NewsAPI request limit reached: {self.requests_today}/{daily_limit}")
+            if requests_today >= daily_limit:
+                logger.warning(f"NewsAPI request limit reached: {requests_today}/{daily_limit}")
         except Exception as e:
             logger.error(f"Error updating request counter: {str(e)}")
 
@@ -197,58 +203,57 @@ class NewsAPICollector(ArticleCollector):
             self._update_request_counter()
             
             # Make the API request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/everything", params=params) as response:
-                    status = response.status
-                    data = await response.json()
+            async with get_transport("newsapi").get(f"{self.base_url}/everything", params=params) as response:
+                status = response.status
+                data = await response.json()
+                
+                # Log API response for debugging
+                logger.debug(f"NewsAPI response status: {status}")
+                logger.debug(f"NewsAPI response: {data.get('status')}, total results: {data.get('totalResults', 0)}")
+                
+                if status == 200 and data.get('status') == 'ok':
+                    # Successful response
+                    articles = data.get('articles', [])
+                    logger.info(f"NewsAPI returned {len(articles)} articles for query '{query}'")
                     
-                    # Log API response for debugging
-                    logger.debug(f"NewsAPI response status: {status}")
-                    logger.debug(f"NewsAPI response: {data.get('status')}, total results: {data.get('totalResults', 0)}")
+                    if len(articles) == 0:
+                        logger.warning(f"NewsAPI returned 0 articles for query '{query}' - check search parameters")
+                    else:
+                        # Log first article for debugging
+                        if articles:
+                            first_article = articles[0]
+                            logger.debug(f"First article: {first_article.get('title')} - {first_article.get('publishedAt')}")
                     
-                    if status == 200 and data.get('status') == 'ok':
-                        # Successful response
-                        articles = data.get('articles', [])
-                        logger.info(f"NewsAPI returned {len(articles)} articles for query '{query}'")
-                        
-                        if len(articles) == 0:
-                            logger.warning(f"NewsAPI returned 0 articles for query '{query}' - check search parameters")
-                        else:
-                            # Log first article for debugging
-                            if articles:
-                                first_article = articles[0]
-                                logger.debug(f"First article: {first_article.get('title')} - {first_article.get('publishedAt')}")
-                        
-                        # Transform to our standard format, maintaining compatibility
-                        return [{
-                            'title': article.get('title', ''),
-                            'summary': article.get('description', '') or '',
-                            'url': article.get('url', ''),
-                            'source': article.get('source', {}).get('name', 'NewsAPI'),  # Set default source name
-                            'authors': [article.get('author')] if article.get('author') else [],
-                            'published_date': article.get('publishedAt', ''),
-                            'topic': topic,  # Add topic field for auto-ingest pipeline
-                            'raw_data': {
-                                'url_to_image': article.get('urlToImage'),
-                                'content': article.get('content')
-                            }
-                        } for article in articles if article.get('url')]
+                    # Transform to our standard format, maintaining compatibility
+                    return [{
+                        'title': article.get('title', ''),
+                        'summary': article.get('description', '') or '',
+                        'url': article.get('url', ''),
+                        'source': article.get('source', {}).get('name', 'NewsAPI'),  # Set default source name
+                        'authors': [article.get('author')] if article.get('author') else [],
+                        'published_date': article.get('publishedAt', ''),
+                        'topic': topic,  # Add topic field for auto-ingest pipeline
+                        'raw_data': {
+                            'url_to_image': article.get('urlToImage'),
+                            'content': article.get('content')
+                        }
+                    } for article in articles if article.get('url')]
 
-                    elif status == 429:
-                        error_msg = data.get('message', 'Unknown error')
-                        logger.error(f"NewsAPI rate limit exceeded: {error_msg}")
-                        raise ValueError(f"Rate limit exceeded: {error_msg}")
+                elif status == 429:
+                    error_msg = data.get('message', 'Unknown error')
+                    logger.error(f"NewsAPI rate limit exceeded: {error_msg}")
+                    raise ValueError(f"Rate limit exceeded: {error_msg}")
+                
+                else:
+                    error_msg = data.get('message', 'Unknown error')
+                    error_code = data.get('code', 'unknown')
+                    
+                    logger.error(
+                        f"NewsAPI error: status={status}, code={error_code}, "
+                        f"message={error_msg}, query='{query}'"
+                    )
+                    return []
                     
-                    else:
-                        error_msg = data.get('message', 'Unknown error')
-                        error_code = data.get('code', 'unknown')
-                        
-                        logger.error(
-                            f"NewsAPI error: status={status}, code={error_code}, "
-                            f"message={error_msg}, query='{query}'"
-                        )
-                        return []
-                        
         except aiohttp.ClientError as e:
             logger.error(f"HTTP error when calling NewsAPI: {str(e)}")
             return []
@@ -1,9 +1,10 @@
 import os
 import logging
-import aiohttp
+import threading
 from typing import Dict, List, Optional
 from datetime import datetime, date
 from .base_collector import ArticleCollector
+from .transport import get_transport
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -25,23 +26,28 @@ class NewsdataCollector(ArticleCollector):
         self.base_url = "https://newsdata.io/api/1/news"
         self.requests_today = 0
         self.last_request_date = date.today()
+        # Keyword searches run concurrently, possibly from several threads
+        self._counter_lock = threading.Lock()
         self.daily_limit = 200  # NewsData.io free tier limit
 
     def _check_rate_limit(self) -> bool:
         """Check if we've hit the daily rate limit."""
         current_date = date.today()
-        
-        # Reset counter if it's a new day
-        if current_date > self.last_request_date:
-            self.requests_today = 0
-            self.last_request_date = current_date
-            
-        return self.requests_today < self.daily_limit
+
+        with self._counter_lock:
+            # Reset counter if it's a new day
+            if current_date > self.last_request_date:
+                self.requests_today = 0
+                self.last_request_date = current_date
+
+            return self.requests_today < self.daily_limit
 
     def _increment_request_count(self):
         """Increment the request counter."""
-        self.requests_today += 1
-        logger.debug(f"NewsData.io requests today: {self.requests_today}")
+        with self._counter_lock:
+            self.requests_today += 1
+            count = self.requests_today
+        logger.debug(f"NewsData.io requests today: {count}")
 
     def _simplify_query(self, query: str) -> str:
         """Simplify complex boolean queries for NewsData.io API compatibility."""
@@ -185,37 +191,36 @@ class NewsdataCollector(ArticleCollector):
             # Log the parameters being sent for debugging 422 errors
             logger.info(f"NewsData.io API request - URL: {self.base_url}, Params: {params}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    if response.status != 200:
-                        # Get more detailed error information
-                        try:
-                            error_data = await response.json()
-                            error_message = error_data.get('results', {}).get('message', f'HTTP {response.status}')
-                            logger.error(f"NewsData.io API error {response.status}: {error_message}")
-                        except:
-                            logger.error(f"NewsData.io API error: {response.status}")
-                        return []
-                    
-                    data = await response.json()
-                    
-                    # Check for API errors
-                    if data.get('status') == 'error':
-                        error_message = data.get('results', {}).get('message', 'Unknown error')
-                        logger.error(f"NewsData.io API error: {error_message}")
-                        return []
-                    
-                    articles = data.get("results", [])
-                    
-                    # Format articles to standard format
-                    formatted_articles = []
-                    for article in articles:
-                        formatted_article = self._format_article(article, topic)
-                        if formatted_article:
-                            formatted_articles.append(formatted_article)
-                    
-                    logger.info(f"NewsData.io: Retrieved {len(formatted_articles)} articles for query '{query}'")
-                    return formatted_articles
+            async with get_transport("newsdata").get(self.base_url, params=params) as response:
+                if response.status != 200:
+                    # Get more detailed error information
+                    try:
+                        error_data = await response.json()
+                        error_message = error_data.get('results', {}).get('message', f'HTTP {response.status}')
+                        logger.error(f"NewsData.io API error {response.status}: {error_message}")
+                    except:
+                        logger.error(f"NewsData.io API error: {response.status}")
+                    return []
+                
+                data = await response.json()
+                
+                # Check for API errors
+                if data.get('status') == 'error':
+                    error_message = data.get('results', {}).get('message', 'Unknown error')
+                    logger.error(f"NewsData.io API error: {error_message}")
+                    return []
+                
+                articles = data.get("results", [])
+                
+                # Format articles to standard format
+                formatted_articles = []
+                for article in articles:
+                    formatted_article = self._format_article(article, topic)
+                    if formatted_article:
+                        formatted_articles.append(formatted_article)
+                
+                logger.info(f"NewsData.io: Retrieved {len(formatted_articles)} articles for query '{query}'")
+                return formatted_articles
 
         except Exception as e:
             logger.error(f"Error searching articles from NewsData.io: {str(e)}", exc_info=True)
@@ -242,27 +247,26 @@ class NewsdataCollector(ArticleCollector):
             
             self._increment_request_count()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    if response.status != 200:
-                        return None
-                    
-                    data = await response.json()
-                    articles = data.get("results", [])
-                    
-                    # Try to find the article with matching URL
-                    for article in articles:
-                        if article.get('link') == url:
-                            return {
-                                'title': article.get('title', ''),
-                                'content': article.get('content', '') or article.get('description', ''),
-                                'source': article.get('source_id', ''),
-                                'published_date': article.get('pubDate', ''),
-                                'url': article.get('link', ''),
-                                'raw_data': article
-                            }
-                    
+            async with get_transport("newsdata").get(self.base_url, params=params) as response:
+                if response.status != 200:
                     return None
+                
+                data = await response.json()
+                articles = data.get("results", [])
+                
+                # Try to find the article with matching URL
+                for article in articles:
+                    if article.get('link') == url:
+                        return {
+                            'title': article.get('title', ''),
+                            'content': article.get('content', '') or article.get('description', ''),
+                            'source': article.get('source_id', ''),
+                            'published_date': article.get('pubDate', ''),
+                            'url': article.get('link', ''),
+                            'raw_data': article
+                        }
+                
+                return None
 
         except Exception as e:
             logger.error(f"Error fetching article from NewsData.io: {str(e)}")
@@ -355,23 +359,22 @@ class NewsdataCollector(ArticleCollector):
             
             self._increment_request_count()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    logger.info(f"NewsData.io test response status: {response.status}")
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(f"NewsData.io test response: status={data.get('status')}, results_count={len(data.get('results', []))}")
-                        return data.get("status") != "error"
-                    else:
-                        # Log error details for debugging
-                        try:
-                            error_data = await response.json()
-                            logger.error(f"NewsData.io test failed {response.status}: {error_data}")
-                        except:
-                            logger.error(f"NewsData.io test failed {response.status}: No JSON response")
-                        return False
-                    
+            async with get_transport("newsdata").get(self.base_url, params=params) as response:
+                logger.info(f"NewsData.io test response status: {response.status}")
+                
+                if response.status == 200:
+                    data = await response.json()
+                    logger.info(f"NewsData.io test response: status={data.get('status')}, results_count={len(data.get('results', []))}")
+                    return data.get("status") != "error"
+                else:
+                    # Log error details for debugging
+                    try:
+                        error_data = await response.json()
+                        logger.error(f"NewsData.io test failed {response.status}: {error_data}")
+                    except:
+                        logger.error(f"NewsData.io test failed {response.status}: No JSON response")
+                    return False
+                
         except Exception as e:
             logger.error(f"NewsData.io connection test failed: {str(e)}")
             return False
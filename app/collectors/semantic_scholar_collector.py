@@ -2,8 +2,10 @@ import aiohttp
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
 from .base_collector import ArticleCollector
+from .transport import get_transport
 import logging
 import os
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,8 @@ class SemanticScholarCollector(ArticleCollector):
         self.api_key = os.getenv('SEMANTIC_SCHOLAR_API_KEY')  # Optional
         self.base_url = "https://api.semanticscholar.org/graph/v1"
         self.requests_today = 0  # Track API requests for compatibility with keyword monitor
+        # Keyword searches run concurrently, possibly from several threads
+        self._counter_lock = threading.Lock()
 
         # Mapping of our topics to Semantic Scholar fieldsOfStudy
         self.topic_field_mapping = {
@@ -28,6 +32,11 @@ class SemanticScholarCollector(ArticleCollector):
             "Neuroscience": ["Medicine", "Psychology", "Biology"],
         }
 
+    def _increment_request_count(self):
+        """Increment the request counter."""
+        with self._counter_lock:
+            self.requests_today += 1
+
     async def search_articles(
         self,
         query: str,
@@ -103,46 +112,45 @@ class SemanticScholarCollector(ArticleCollector):
             logger.info(f"Searching Semantic Scholar: query='{query}', date_range={date_range}")
 
             # Make API request
-            self.requests_today += 1  # Increment request counter
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/paper/search",
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-
-                    if response.status == 429:
-                        logger.warning("Semantic Scholar rate limit hit - consider adding API key")
-                        return []
-
-                    if response.status == 400:
-                        error_text = await response.text()
-                        logger.error(f"Semantic Scholar bad request: {error_text}")
-                        return []
-
-                    if response.status == 404:
-                        logger.warning(f"Semantic Scholar returned 404 for query: {query}")
-                        return []
-
-                    if response.status != 200:
-                        logger.error(f"Semantic Scholar API error: {response.status}")
-                        return []
-
-                    data = await response.json()
-                    papers = data.get('data', [])
-                    total = data.get('total', 0)
-
-                    logger.info(f"Found {len(papers)} papers from Semantic Scholar (total available: {total})")
-
-                    # Format to standard format
-                    results = []
-                    for paper in papers:
-                        formatted = self._format_article(paper, topic)
-                        if formatted:
-                            results.append(formatted)
-
-                    return results
+            self._increment_request_count()
+            async with get_transport("semantic_scholar").get(
+                f"{self.base_url}/paper/search",
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+
+                if response.status == 429:
+                    logger.warning("Semantic Scholar rate limit hit - consider adding API key")
+                    return []
+
+                if response.status == 400:
+                    error_text = await response.text()
+                    logger.error(f"Semantic Scholar bad request: {error_text}")
+                    return []
+
+                if response.status == 404:
+                    logger.warning(f"Semantic Scholar returned 404 for query: {query}")
+                    return []
+
+                if response.status != 200:
+                    logger.error(f"Semantic Scholar API error: {response.status}")
+                    return []
+
+                data = await response.json()
+                papers = data.get('data', [])
+                total = data.get('total', 0)
+
+                logger.info(f"Found {len(papers)} papers from Semantic Scholar (total available: {total})")
+
+                # Format to standard format
+                results = []
+                for paper in papers:
+                    formatted = self._format_article(paper, topic)
+                    if formatted:
+                        results.append(formatted)
+
+                return results
 
         except aiohttp.ClientError as e:
             logger.error(f"Network error searching Semantic Scholar: {str(e)}")
@@ -171,40 +179,39 @@ class SemanticScholarCollector(ArticleCollector):
                 headers['x-api-key'] = self.api_key
 
             # Fetch paper details
-            self.requests_today += 1  # Increment request counter
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/paper/{paper_id}",
-                    params={'fields': 'title,abstract,authors,year,venue,url,publicationDate,citationCount'},
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-
-                    if response.status != 200:
-                        logger.error(f"Error fetching Semantic Scholar paper {paper_id}: {response.status}")
-                        return None
-
-                    paper = await response.json()
-
-                    # Format response
-                    authors = []
-                    if paper.get('authors'):
-                        authors = [a.get('name', '') for a in paper['authors']]
-
-                    return {
-                        'title': paper.get('title', ''),
-                        'content': paper.get('abstract', ''),  # S2 provides abstract as content
-                        'authors': authors,
-                        'published_date': paper.get('publicationDate', ''),
-                        'url': paper.get('url', url),
-                        'source': 'semantic_scholar',
-                        'raw_data': {
-                            'paper_id': paper.get('paperId', ''),
-                            'citation_count': paper.get('citationCount', 0),
-                            'venue': paper.get('venue', ''),
-                            'year': paper.get('year', '')
-                        }
+            self._increment_request_count()
+            async with get_transport("semantic_scholar").get(
+                f"{self.base_url}/paper/{paper_id}",
+                params={'fields': 'title,abstract,authors,year,venue,url,publicationDate,citationCount'},
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+
+                if response.status != 200:
+                    logger.error(f"Error fetching Semantic Scholar paper {paper_id}: {response.status}")
+                    return None
+
+                paper = await response.json()
+
+                # Format response
+                authors = []
+                if paper.get('authors'):
+                    authors = [a.get('name', '') for a in paper['authors']]
+
+                return {
+                    'title': paper.get('title', ''),
+                    'content': paper.get('abstract', ''),  # S2 provides abstract as content
+                    'authors': authors,
+                    'published_date': paper.get('publicationDate', ''),
+                    'url': paper.get('url', url),
+                    'source': 'semantic_scholar',
+                    'raw_data': {
+                        'paper_id': paper.get('paperId', ''),
+                        'citation_count': paper.get('citationCount', 0),
+                        'venue': paper.get('venue', ''),
+                        'year': paper.get('year', '')
                     }
+                }
 
         except Exception as e:
             logger.error(f"Error fetching Semantic Scholar article: {str(e)}")
@@ -1,9 +1,11 @@
 import os
 import logging
+import threading
 import aiohttp
 from typing import Dict, List, Optional
 from datetime import datetime, date
 from .base_collector import ArticleCollector
+from .transport import get_transport
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -19,23 +21,28 @@ class TheNewsAPICollector(ArticleCollector):
         self.base_url = "https://api.thenewsapi.com/v1/news"
         self.requests_today = 0
         self.last_request_date = date.today()
+        # Keyword searches run concurrently, possibly from several threads
+        self._counter_lock = threading.Lock()
         self.daily_limit = 100  # TheNewsAPI free tier limit
 
     def _check_rate_limit(self) -> bool:
         """Check if we've hit the daily rate limit."""
         current_date = date.today()
-        
-        # Reset counter if it's a new day
-        if current_date > self.last_request_date:
-            self.requests_today = 0
-            self.last_request_date = current_date
-            
-        return self.requests_today < self.daily_limit
+
+        with self._counter_lock:
+            # Reset counter if it's a new day
+            if current_date > self.last_request_date:
+                self.requests_today = 0
+                self.last_request_date = current_date
+
+            return self.requests_today < self.daily_limit
 
     def _increment_request_count(self):
         """Increment the request counter."""
-        self.requests_today += 1
-        logger.debug(f"TheNewsAPI requests today: {self.requests_today}")
+        with self._counter_lock:
+            self.requests_today += 1
+            count = self.requests_today
+        logger.debug(f"TheNewsAPI requests today: {count}")
 
     async def search_articles(
         self,
@@ -116,53 +123,52 @@ class TheNewsAPICollector(ArticleCollector):
 
             logger.debug(f"TheNewsAPI search params: {params}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/all", params=params) as response:
-                    response_status = response.status
-                    response_content_type = response.content_type
-
-                    if response.status != 200:
-                        logger.error(f"❌ TheNewsAPI HTTP ERROR")
-                        logger.error(f"❌ Status Code: {response_status}")
-                        logger.error(f"❌ Content-Type: {response_content_type}")
-                        logger.error(f"❌ URL: {response.url}")
-
-                        # Try to get response body for debugging
-                        try:
-                            if 'json' in response_content_type:
-                                error_data = await response.json()
-                                logger.error(f"❌ Error Response (JSON): {error_data}")
-                            else:
-                                error_text = await response.text()
-                                # Log first 500 chars of HTML/text response
-                                logger.error(f"❌ Error Response (Text): {error_text[:500]}...")
-                        except Exception as parse_error:
-                            logger.error(f"❌ Could not parse error response: {parse_error}")
-
-                        return []
-
-                    self._increment_request_count()
-
-                    # Try to parse JSON response
+            async with get_transport("thenewsapi").get(f"{self.base_url}/all", params=params) as response:
+                response_status = response.status
+                response_content_type = response.content_type
+
+                if response.status != 200:
+                    logger.error(f"❌ TheNewsAPI HTTP ERROR")
+                    logger.error(f"❌ Status Code: {response_status}")
+                    logger.error(f"❌ Content-Type: {response_content_type}")
+                    logger.error(f"❌ URL: {response.url}")
+
+                    # Try to get response body for debugging
+                    try:
+                        if 'json' in response_content_type:
+                            error_data = await response.json()
+                            logger.error(f"❌ Error Response (JSON): {error_data}")
+                        else:
+                            error_text = await response.text()
+                            # Log first 500 chars of HTML/text response
+                            logger.error(f"❌ Error Response (Text): {error_text[:500]}...")
+                    except Exception as parse_error:
+                        logger.error(f"❌ Could not parse error response: {parse_error}")
+
+                    return []
+
+                self._increment_request_count()
+
+                # Try to parse JSON response
+                try:
+                    data = await response.json()
+                except Exception as json_error:
+                    logger.error(f"❌ TheNewsAPI JSON PARSE ERROR")
+                    logger.error(f"❌ Status Code: {response_status}")
+                    logger.error(f"❌ Content-Type: {response_content_type}")
+                    logger.error(f"❌ Parse Error: {json_error}")
+                    # Get the actual response body
                     try:
-                        data = await response.json()
-                    except Exception as json_error:
-                        logger.error(f"❌ TheNewsAPI JSON PARSE ERROR")
-                        logger.error(f"❌ Status Code: {response_status}")
-                        logger.error(f"❌ Content-Type: {response_content_type}")
-                        logger.error(f"❌ Parse Error: {json_error}")
-                        # Get the actual response body
-                        try:
-                            response_text = await response.text()
-                            logger.error(f"❌ Response Body (first 500 chars): {response_text[:500]}...")
-                        except Exception as text_error:
-                            logger.error(f"❌ Could not read response text: {text_error}")
-                        return []
-
-                    articles = data.get("data", [])
-                    logger.info(f"✅ TheNewsAPI returned {len(articles)} articles for query '{query}'")
-
-                    return [self._format_article(article, topic) for article in articles]
+                        response_text = await response.text()
+                        logger.error(f"❌ Response Body (first 500 chars): {response_text[:500]}...")
+                    except Exception as text_error:
+                        logger.error(f"❌ Could not read response text: {text_error}")
+                    return []
+
+                articles = data.get("data", [])
+                logger.info(f"✅ TheNewsAPI returned {len(articles)} articles for query '{query}'")
+
+                return [self._format_article(article, topic) for article in articles]
 
         except aiohttp.ClientError as e:
             logger.error(f"❌ TheNewsAPI NETWORK ERROR")
@@ -186,90 +192,89 @@ class TheNewsAPICollector(ArticleCollector):
                 'url': url
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/all", params=params) as response:
-                    response_status = response.status
-                    response_content_type = response.content_type
-
-                    if response.status != 200:
-                        logger.error(f"❌ TheNewsAPI fetch_article_content HTTP ERROR")
-                        logger.error(f"❌ Status Code: {response_status}")
-                        logger.error(f"❌ Content-Type: {response_content_type}")
-                        logger.error(f"❌ Article URL: {url}")
-
-                        # Try to get response body for debugging
-                        try:
-                            if 'json' in response_content_type:
-                                error_data = await response.json()
-                                logger.error(f"❌ Error Response (JSON): {error_data}")
-                            else:
-                                error_text = await response.text()
-                                logger.error(f"❌ Error Response (Text): {error_text[:500]}...")
-                        except Exception as parse_error:
-                            logger.error(f"❌ Could not parse error response: {parse_error}")
-
-                        return None
-
-                    # Try to parse JSON response
+            async with get_transport("thenewsapi").get(f"{self.base_url}/all", params=params) as response:
+                response_status = response.status
+                response_content_type = response.content_type
+
+                if response.status != 200:
+                    logger.error(f"❌ TheNewsAPI fetch_article_content HTTP ERROR")
+                    logger.error(f"❌ Status Code: {response_status}")
+                    logger.error(f"❌ Content-Type: {response_content_type}")
+                    logger.error(f"❌ Article URL: {url}")
+
+                    # Try to get response body for debugging
+                    try:
+                        if 'json' in response_content_type:
+                            error_data = await response.json()
+                            logger.error(f"❌ Error Response (JSON): {error_data}")
+                        else:
+                            error_text = await response.text()
+                            logger.error(f"❌ Error Response (Text): {error_text[:500]}...")
+                    except Exception as parse_error:
+                        logger.error(f"❌ Could not parse error response: {parse_error}")
+
+                    return None
+
+                # Try to parse JSON response
+                try:
+                    data = await response.json()
+                except Exception as json_error:
+                    logger.error(f"❌ TheNewsAPI fetch_article_content JSON PARSE ERROR")
+                    logger.error(f"❌ Status Code: {response_status}")
+                    logger.error(f"❌ Content-Type: {response_content_type}")
+                    logger.error(f"❌ Parse Error: {json_error}")
+                    logger.error(f"❌ Article URL: {url}")
                     try:
-                        data = await response.json()
-                    except Exception as json_error:
-                        logger.error(f"❌ TheNewsAPI fetch_article_content JSON PARSE ERROR")
-                        logger.error(f"❌ Status Code: {response_status}")
-                        logger.error(f"❌ Content-Type: {response_content_type}")
-                        logger.error(f"❌ Parse Error: {json_error}")
-                        logger.error(f"❌ Article URL: {url}")
-                        try:
-                            response_text = await response.text()
-                            logger.error(f"❌ Response Body (first 500 chars): {response_text[:500]}...")
-                        except Exception as text_error:
-                            logger.error(f"❌ Could not read response text: {text_error}")
-                        return None
-
-                    articles = data.get("data", [])
-                    if not articles:
-                        logger.warning(f"⚠️ TheNewsAPI returned no articles for URL: {url}")
-                        return None
-
-                    article = articles[0]
-
-                    # Extract source name using the same logic as _format_article
-                    source = article.get('source', {})
-                    # ALWAYS extract domain from URL first (full domain with TLD)
-                    # API source name often lacks TLD or is inconsistent
-                    source_name = ''
-                    if article.get('url'):
-                        parsed_url = urlparse(article['url'])
-                        source_name = parsed_url.netloc.replace('www.', '')
-
-                    # Only use API source name as fallback if URL parsing failed
-                    if not source_name:
-                        source_name = source.get('name', '') if isinstance(source, dict) else str(source)
-
-                    # Handle keywords - TheNewsAPI can return them as strings or arrays
-                    keywords = article.get('keywords', [])
-                    if isinstance(keywords, str):
-                        # Split comma-separated string into array and clean up
-                        keywords = [k.strip() for k in keywords.split(',') if k.strip()]
-                    elif not isinstance(keywords, list):
-                        # Ensure it's a list
-                        keywords = []
-
-                    return {
-                        'title': article['title'],
-                        'content': article.get('snippet', ''),
-                        'authors': [],  # TheNewsAPI doesn't provide author info
-                        'published_date': article['published_at'],
-                        'url': article['url'],
-                        'source': source_name,
-                        'raw_data': {
-                            'source': article.get('source'),
-                            'image_url': article.get('image_url'),
-                            'keywords': keywords,
-                            'categories': article.get('categories', []),
-                            'locale': article.get('locale')
-                        }
+                        response_text = await response.text()
+                        logger.error(f"❌ Response Body (first 500 chars): {response_text[:500]}...")
+                    except Exception as text_error:
+                        logger.error(f"❌ Could not read response text: {text_error}")
+                    return None
+
+                articles = data.get("data", [])
+                if not articles:
+                    logger.warning(f"⚠️ TheNewsAPI returned no articles for URL: {url}")
+                    return None
+
+                article = articles[0]
+
+                # Extract source name using the same logic as _format_article
+                source = article.get('source', {})
+                # ALWAYS extract domain from URL first (full domain with TLD)
+                # API source name often lacks TLD or is inconsistent
+                source_name = ''
+                if article.get('url'):
+                    parsed_url = urlparse(article['url'])
+                    source_name = parsed_url.netloc.replace('www.', '')
+
+                # Only use API source name as fallback if URL parsing failed
+                if not source_name:
+                    source_name = source.get('name', '') if isinstance(source, dict) else str(source)
+
+                # Handle keywords - TheNewsAPI can return them as strings or arrays
+                keywords = article.get('keywords', [])
+                if isinstance(keywords, str):
+                    # Split comma-separated string into array and clean up
+                    keywords = [k.strip() for k in keywords.split(',') if k.strip()]
+                elif not isinstance(keywords, list):
+                    # Ensure it's a list
+                    keywords = []
+
+                return {
+                    'title': article['title'],
+                    'content': article.get('snippet', ''),
+                    'authors': [],  # TheNewsAPI doesn't provide author info
+                    'published_date': article['published_at'],
+                    'url': article['url'],
+                    'source': source_name,
+                    'raw_data': {
+                        'source': article.get('source'),
+                        'image_url': article.get('image_url'),
+                        'keywords': keywords,
+                        'categories': article.get('categories', []),
+                        'locale': article.get('locale')
                     }
+                }
 
         except aiohttp.ClientError as e:
             logger.error(f"❌ TheNewsAPI fetch_article_content NETWORK ERROR")
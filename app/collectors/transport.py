@@ -0,0 +1,311 @@
+"""
+Shared HTTP transport for collectors.
+
+Each provider gets one pooled aiohttp session (keep-alive, DNS cache) and a
+token-bucket rate limiter, so searches can fan out across keywords and
+providers without opening a connection per call or tripping 429s.
+
+- Rate limits come from the optional ``rate_limit`` block of a provider in
+  ``app/config/provider_config.json``::
+
+      "rate_limit": {"requests_per_second": 1, "burst": 5, "max_connections": 10}
+
+  Providers without one use DEFAULT_RATE_LIMIT.
+- 429/503 responses are retried after the ``Retry-After`` delay (or an
+  exponential backoff), and the whole provider bucket pauses meanwhile.
+  Delays longer than MAX_RETRY_AFTER (e.g. an exhausted daily quota) are not
+  waited for; the response is returned to the collector as is.
+- Identical GET requests already in flight share one upstream request.
+- Sessions are per event loop. A session is closed when its loop shuts down
+  through asyncio.run() (or loop.shutdown_asyncgens()), so threads that run
+  their own loops do not leak connectors; close_transports() closes the
+  current loop's sessions explicitly.
+
+Usage mirrors aiohttp::
+
+    async with get_transport("newsapi").get(url, params=params) as response:
+        data = await response.json()
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncGenerator, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'provider_config.json')
+
+DEFAULT_RATE_LIMIT = {"requests_per_second": 1.0, "burst": 5, "max_connections": 10}
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 3
+MAX_RETRY_AFTER = 120  # seconds
+DEFAULT_TIMEOUT = 30  # seconds
+
+
+class TokenBucket:
+    """Token bucket that hands out waiting times instead of blocking.
+
+    Callers reserve a token and sleep for the returned delay, so the bucket
+    works from any event loop or thread.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (e.g. after a Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class TransportResponse:
+    """Fully read response; safe to share between coalesced callers."""
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes, url: str, content_type: str,
+                 charset: Optional[str] = None):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+        self.content_type = content_type
+        self.charset = charset or 'utf-8'
+
+    async def text(self) -> str:
+        return self.body.decode(self.charset, errors='replace')
+
+    async def json(self, **_: Any) -> Any:
+        return json.loads(self.body.decode(self.charset, errors='replace'))
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderTransport:
+    """Pooled session, rate limiter and request coalescing for one provider."""
+
+    def __init__(self, provider: str, requests_per_second: float = 1.0, burst: int = 5,
+                 max_connections: int = 10, max_retries: int = MAX_RETRIES):
+        self.provider = provider
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncGenerator]] = {}
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "retries": 0,
+            "throttled_seconds": 0.0,
+        }
+
+    async def _session(self) -> aiohttp.ClientSession:
+        # Sessions belong to an event loop; keep one per loop that uses us
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Forget loops that were closed without shutting down async generators
+            for stale in [l for l in self._sessions if l.is_closed()]:
+                del self._sessions[stale]
+            entry = self._sessions.get(loop)
+        if entry is not None and not entry[0].closed:
+            return entry[0]
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            ),
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+        )
+        guard = self._close_on_loop_shutdown(loop, session)
+        # Starting the generator registers it with the loop, whose shutdown
+        # (asyncio.run() does this) closes it and so the session
+        await guard.__anext__()
+        with self._lock:
+            self._sessions[loop] = (session, guard)
+        return session
+
+    async def _close_on_loop_shutdown(self, loop: asyncio.AbstractEventLoop,
+                                      session: aiohttp.ClientSession) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._sessions.get(loop, (None,))[0] is session:
+                    del self._sessions[loop]
+            if not session.closed:
+                await session.close()
+
+    def _count(self, key: str, value: float = 1) -> None:
+        with self._lock:
+            self._stats[key] += value
+
+    @asynccontextmanager
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None, timeout: Optional[aiohttp.ClientTimeout] = None):
+        """Rate-limited GET; identical requests in flight share one response."""
+        key = (
+            id(asyncio.get_running_loop()),
+            url,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+
+        shared = self._in_flight.get(key)
+        if shared is not None:
+            self._count("coalesced")
+            yield await asyncio.shield(shared)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await self._request(url, params, headers, timeout)
+            future.set_result(response)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters receive the exception; don't warn if nobody was waiting
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+        yield response
+
+    async def _request(self, url, params, headers, timeout) -> TransportResponse:
+        attempt = 0
+        while True:
+            waited = await self.bucket.acquire()
+            if waited:
+                self._count("throttled_seconds", waited)
+            self._count("requests")
+
+            kwargs = {"timeout": timeout} if timeout else {}
+            session = await self._session()
+            async with session.get(url, params=params, headers=headers, **kwargs) as response:
+                result = TransportResponse(
+                    status=response.status,
+                    headers=response.headers.copy(),
+                    body=await response.read(),
+                    url=str(response.url),
+                    content_type=response.content_type,
+                    charset=response.charset
+                )
+
+            if result.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                return result
+
+            delay = _retry_after_seconds(result.headers.get('Retry-After'))
+            if delay is None:
+                delay = min(2 ** attempt, 30)
+            if delay > MAX_RETRY_AFTER:
+                logger.warning("%s asked to retry after %.0fs; not retrying", self.provider, delay)
+                return result
+
+            attempt += 1
+            self._count("retries")
+            logger.info("%s returned %s; retrying in %.1fs (attempt %d/%d)",
+                        self.provider, result.status, delay, attempt, self.max_retries)
+            self.bucket.pause(delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["throttled_seconds"] = round(stats["throttled_seconds"], 2)
+        stats["requests_per_second"] = self.bucket.rate
+        stats["burst"] = self.bucket.capacity
+        return stats
+
+    async def close(self) -> None:
+        """Close the session opened on the current event loop."""
+        with self._lock:
+            entry = self._sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+
+_transports: Dict[str, ProviderTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def _load_rate_limits() -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(PROVIDER_CONFIG_PATH, 'r') as f:
+            providers = json.load(f).get('providers', [])
+    except (OSError, ValueError) as e:
+        logger.warning("Could not read provider rate limits: %s", e)
+        return {}
+    return {p['name']: p['rate_limit'] for p in providers if p.get('name') and p.get('rate_limit')}
+
+
+def get_transport(provider: str) -> ProviderTransport:
+    """Return the shared transport for ``provider``."""
+    with _transports_lock:
+        transport = _transports.get(provider)
+        if transport is None:
+            limits = dict(DEFAULT_RATE_LIMIT, **_load_rate_limits().get(provider, {}))
+            transport = ProviderTransport(
+                provider,
+                requests_per_second=float(limits["requests_per_second"]),
+                burst=int(limits["burst"]),
+                max_connections=int(limits["max_connections"])
+            )
+            _transports[provider] = transport
+        return transport
+
+
+def get_transport_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-provider request, coalescing, retry and throttling counters."""
+    with _transports_lock:
+        transports = list(_transports.values())
+    return {t.provider: t.get_stats() for t in transports}
+
+
+async def close_transports() -> None:
+    """Close the sessions opened on the current event loop."""
+    with _transports_lock:
+        transports = list(_transports.values())
+    for transport in transports:
+        await transport.close()
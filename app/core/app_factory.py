@@ -79,6 +79,21 @@ async def lifespan(app: FastAPI):
         asyncio.create_task(delayed_keyword_monitor_start())
         logger.info("Scheduled keyword monitor to start in 5 seconds")
 
+        # Keep precomputed embedding projections up to date
+        if os.getenv("PROJECTION_REFRESH_ENABLED", "true").lower() in ("1", "true", "yes"):
+            try:
+                from app.tasks.projection_refresher import run_projection_refresher
+                asyncio.create_task(run_projection_refresher())
+            except Exception as e:
+                logger.error(f"Failed to start projection refresher: {str(e)}")
+
+        # Resume analysis jobs that were queued or in flight before a restart
+        try:
+            from app.services.analysis_queue import resume_analysis_queue
+            await resume_analysis_queue()
+        except Exception as e:
+            logger.error(f"Failed to resume analysis queue: {str(e)}")
+
     except Exception as e:
         logging.error(f"Error during startup: {str(e)}", exc_info=True)
         raise
@@ -98,6 +113,20 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Failed to close async database pool: {e}")
 
+        # Stop analysis workers; their leased items are re-claimed after the lease expires
+        try:
+            from app.services.analysis_queue import shutdown_analysis_queue
+            await shutdown_analysis_queue()
+        except Exception as e:
+            logger.error(f"Failed to stop analysis queue workers: {e}")
+
+        # Close pooled collector HTTP sessions
+        try:
+            from app.collectors.transport import close_transports
+            await close_transports()
+        except Exception as e:
+            logger.error(f"Failed to close collector sessions: {e}")
+
         # Cleanup AutomatedIngestService executor
         try:
             from app.database import get_database_instance
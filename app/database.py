@@ -11,6 +11,7 @@ from sqlalchemy.ext.declarative import declarative_base
 import logging
 from fastapi import HTTPException, Query
 from app.security.auth import get_password_hash
+from app.security.user_cache import invalidate_user
 import shutil
 from fastapi.responses import FileResponse
 from pathlib import Path
@@ -1120,15 +1121,18 @@ Remember to cite your sources and provide actionable insights where possible."""
             conn.rollback()
             return False
 
-    def get_article(self, uri):
+    def get_article(self, uri, projection='analysis'):
         logger.debug(f"Fetching article with URI: {uri}")
         # Use PostgreSQL-compatible connection via SQLAlchemy
-        from sqlalchemy import text
+        from sqlalchemy import select
+        from app.database_models import t_articles, article_columns
         conn = self._temp_get_connection()
 
         # Execute query with .mappings() for dictionary access
         # Note: Do not close the connection - it's managed by the connection pool
-        result = conn.execute(text("SELECT * FROM articles WHERE uri = :uri"), {"uri": uri}).mappings()
+        # Explicit columns: SELECT * would also ship the pgvector embedding
+        stmt = select(*article_columns(projection)).where(t_articles.c.uri == uri)
+        result = conn.execute(stmt).mappings()
         article = result.fetchone()
 
         if article:
@@ -1175,7 +1179,9 @@ Remember to cite your sources and provide actionable insights where possible."""
     def save_article_analysis_cache(self, article_uri: str, analysis_type: str, content: str, model_used: str, metadata: dict = None) -> bool:
         """Save analysis result to cache with expiration.
 
-        PostgreSQL-compatible implementation using SQLAlchemy Core.
+        Writes through the same article_analysis_cache upsert as
+        app.analyzers.cache.AnalysisCache. Entries saved here are not tied to
+        a content or template version.
 
         Args:
             article_uri: Article URI
@@ -1188,61 +1194,22 @@ Remember to cite your sources and provide actionable insights where possible."""
             True if cached successfully, False otherwise
         """
         from datetime import datetime, timedelta
-        from sqlalchemy import insert, update, select
-        from sqlalchemy.exc import IntegrityError
-        from app.database_models import t_article_analysis_cache
-
-        expires_at = datetime.utcnow() + timedelta(days=30)  # Cache for 30 days
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        conn = self._temp_get_connection()
 
         try:
-            # Check if cache entry exists
-            check_stmt = select(t_article_analysis_cache.c.id).where(
-                (t_article_analysis_cache.c.article_uri == article_uri) &
-                (t_article_analysis_cache.c.analysis_type == analysis_type) &
-                (t_article_analysis_cache.c.model_used == model_used)
-            )
-            exists = conn.execute(check_stmt).fetchone()
-
-            if exists:
-                # Update existing cache
-                stmt = update(t_article_analysis_cache).where(
-                    (t_article_analysis_cache.c.article_uri == article_uri) &
-                    (t_article_analysis_cache.c.analysis_type == analysis_type) &
-                    (t_article_analysis_cache.c.model_used == model_used)
-                ).values(
-                    content=content,
-                    generated_at=datetime.utcnow(),
-                    expires_at=expires_at,
-                    metadata=metadata_json
-                )
-                conn.execute(stmt)
-            else:
-                # Insert new cache entry
-                stmt = insert(t_article_analysis_cache).values(
-                    article_uri=article_uri,
-                    analysis_type=analysis_type,
-                    content=content,
-                    model_used=model_used,
-                    generated_at=datetime.utcnow(),
-                    expires_at=expires_at,
-                    metadata=metadata_json
-                )
-                conn.execute(stmt)
-
-            conn.commit()
+            self.facade.save_analysis_cache_entries([{
+                'article_uri': article_uri,
+                'analysis_type': analysis_type,
+                'model_used': model_used,
+                'content_hash': '',
+                'template_hash': '',
+                'content': content,
+                'metadata': json.dumps(metadata) if metadata else None,
+                'expires_at': datetime.utcnow() + timedelta(days=30),  # Cache for 30 days
+            }])
             logger.info(f"Cached {analysis_type} analysis for article {article_uri} with model {model_used}")
             return True
-
-        except IntegrityError as ie:
-            logger.error(f"Integrity error saving analysis cache: {ie}")
-            conn.rollback()
-            return False
         except Exception as e:
             logger.error(f"Error saving analysis cache: {e}")
-            conn.rollback()
             return False
 
     def get_article_analysis_cache(self, article_uri: str, analysis_type: str, model_used: str = None) -> dict:
@@ -1314,29 +1281,12 @@ Remember to cite your sources and provide actionable insights where possible."""
         Returns:
             Number of entries removed
         """
-        from datetime import datetime
-        from sqlalchemy import delete
-        from app.database_models import t_article_analysis_cache
-
-        conn = self._temp_get_connection()
-
         try:
-            stmt = delete(t_article_analysis_cache).where(
-                (t_article_analysis_cache.c.expires_at.isnot(None)) &
-                (t_article_analysis_cache.c.expires_at < datetime.utcnow())
-            )
-
-            result = conn.execute(stmt)
-            conn.commit()
-
-            deleted_count = result.rowcount
+            deleted_count = self.facade.evict_analysis_cache()
             logger.info(f"Cleaned up {deleted_count} expired analysis cache entries")
             return deleted_count
-
         except Exception as e:
             logger.error(f"Error cleaning analysis cache: {e}")
-            conn.rollback()
-            conn.commit()  # CRITICAL: Commit to close transaction
             return 0
 
     def save_signal_instruction(self, name: str, description: str, instruction: str, topic: str = None, is_active: bool = True) -> bool:
@@ -1688,7 +1638,9 @@ Remember to cite your sources and provide actionable insights where possible."""
         per_page: int = Query(10),
         date_type: str = 'publication',  # Add date_type parameter with default
         date_field: str = None,  # Add date_field parameter
-        require_category: bool = False # New parameter to filter for articles with a category
+        require_category: bool = False, # New parameter to filter for articles with a category
+        projection: str = 'analysis',  # Named column projection; vectors only with 'with_embedding'
+        sort: str = 'date'  # 'relevance' ranks keyword matches by full-text score
     ) -> Tuple[List[Dict], int]:
         """Search articles with filters including topic."""
         # Use facade method which has proper SQLAlchemy implementation
@@ -1705,7 +1657,9 @@ Remember to cite your sources and provide actionable insights where possible."""
             per_page=per_page,
             date_type=date_type,
             date_field=date_field,
-            require_category=require_category
+            require_category=require_category,
+            projection=projection,
+            sort=sort
         )
 
     def save_report(self, content: str) -> int:
@@ -1762,7 +1716,7 @@ Remember to cite your sources and provide actionable insights where possible."""
             logger.error(f"Error in fetch_one: {e}")
             raise
 
-    def get_articles_by_ids(self, article_ids):
+    def get_articles_by_ids(self, article_ids, projection='analysis'):
         """
         Get multiple articles by their URIs (batch fetch).
 
@@ -1771,6 +1725,7 @@ Remember to cite your sources and provide actionable insights where possible."""
 
         Args:
             article_ids: List of article URIs to retrieve
+            projection: Named column projection (see ARTICLE_PROJECTIONS)
 
         Returns:
             List of article dictionaries
@@ -1779,7 +1734,7 @@ Remember to cite your sources and provide actionable insights where possible."""
             Exception: Database errors are logged and re-raised
         """
         from sqlalchemy import select
-        from app.database_models import t_articles
+        from app.database_models import t_articles, article_columns
 
         if not article_ids:
             return []
@@ -1787,7 +1742,7 @@ Remember to cite your sources and provide actionable insights where possible."""
         conn = self._temp_get_connection()
 
         try:
-            stmt = select(t_articles).where(t_articles.c.uri.in_(article_ids))
+            stmt = select(*article_columns(projection)).where(t_articles.c.uri.in_(article_ids))
             result = conn.execute(stmt).mappings()
 
             articles = []
@@ -2141,13 +2096,13 @@ Remember to cite your sources and provide actionable insights where possible."""
 
         # Fallback to direct query
         from sqlalchemy import select, or_, func
-        from app.database_models import t_articles
+        from app.database_models import t_articles, article_columns
 
         conn = self._temp_get_connection()
 
         try:
             # Build base query
-            stmt = select(t_articles).where(t_articles.c.topic == topic_name)
+            stmt = select(*article_columns()).where(t_articles.c.topic == topic_name)
 
             # Add date filters if provided
             if start_date or end_date:
@@ -2387,6 +2342,7 @@ Remember to cite your sources and provide actionable insights where possible."""
             conn.commit()
 
             if result.rowcount > 0:
+                invalidate_user(username=username)
                 logger.info(f"Password updated successfully for user: {username}")
                 return True
             else:
@@ -2524,6 +2480,7 @@ Remember to cite your sources and provide actionable insights where possible."""
             conn.commit()
 
             if result.rowcount > 0:
+                invalidate_user(username=username)
                 logger.info(f"Onboarding status updated for user: {username} (completed={completed})")
                 return True
             else:
@@ -2569,6 +2526,7 @@ Remember to cite your sources and provide actionable insights where possible."""
             conn.commit()
 
             if result.rowcount > 0:
+                invalidate_user(username=username)
                 logger.info(f"Force password change flag set for user: {username} (force={force})")
                 return True
             else:
@@ -1,5 +1,6 @@
-from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, JSON, MetaData, REAL, String, TIMESTAMP, Table, Text, UniqueConstraint, text
+from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, JSON, LargeBinary, MetaData, PrimaryKeyConstraint, REAL, String, TIMESTAMP, Table, Text, UniqueConstraint, literal_column, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.types import UserDefinedType
 
 metadata = MetaData()
 
@@ -177,10 +178,16 @@ t_article_analysis_cache = Table(
     Column('generated_at', TIMESTAMP, default=text('CURRENT_TIMESTAMP')),
     Column('expires_at', TIMESTAMP),
     Column('metadata', Text),
-    UniqueConstraint('article_uri', 'analysis_type', 'model_used'),
+    # Empty for analyses that are not tied to a content/template version
+    Column('content_hash', Text, nullable=False, server_default=text("''")),
+    Column('template_hash', Text, nullable=False, server_default=text("''")),
+    Column('last_accessed_at', TIMESTAMP, server_default=text('CURRENT_TIMESTAMP')),
+    UniqueConstraint('article_uri', 'analysis_type', 'model_used', 'content_hash', 'template_hash',
+                     name='uq_article_analysis_cache_key'),
     Index('idx_article_analysis_cache_uri', 'article_uri'),
     Index('idx_article_analysis_cache_type', 'analysis_type'),
-    Index('idx_article_analysis_cache_expires', 'expires_at')
+    Index('idx_article_analysis_cache_expires', 'expires_at'),
+    Index('idx_article_analysis_cache_last_accessed', 'last_accessed_at')
 )
 
 t_articles = Table(
@@ -230,6 +237,56 @@ t_articles = Table(
     Index('idx_articles_uri', 'uri', unique=True)
 )
 
+# Named column projections for article reads. The pgvector ``embedding``
+# column (vector(1536), ~6-12 KB per row) is added by migration and is not
+# modelled on t_articles, so only the 'with_embedding' projection reads it.
+ARTICLE_PROJECTIONS = {
+    # Cards, lists, dashboards and sampling
+    'list': (
+        'uri', 'title', 'news_source', 'publication_date', 'submission_date', 'summary',
+        'category', 'future_signal', 'sentiment', 'time_to_impact', 'driver_type', 'tags',
+        'topic', 'analyzed', 'bias', 'factual_reporting', 'mbfc_credibility_rating',
+        'media_type', 'ingest_status', 'quality_score', 'auto_ingested'
+    ),
+    # Every modelled column, including explanations and scores
+    'analysis': tuple(column.name for column in t_articles.c),
+    # Columns written by the article export/import
+    'export': (
+        'uri', 'submission_date', 'title', 'news_source', 'publication_date', 'summary',
+        'category', 'future_signal', 'future_signal_explanation', 'sentiment',
+        'sentiment_explanation', 'time_to_impact', 'time_to_impact_explanation', 'tags',
+        'driver_type', 'driver_type_explanation', 'topic', 'analyzed', 'bias',
+        'factual_reporting', 'mbfc_credibility_rating', 'bias_source', 'bias_country',
+        'press_freedom', 'media_type', 'popularity', 'topic_alignment_score',
+        'keyword_relevance_score', 'confidence_score', 'overall_match_explanation',
+        'extracted_article_topics', 'extracted_article_keywords', 'ingest_status',
+        'quality_score', 'quality_issues', 'auto_ingested'
+    ),
+    # Analysis columns plus the vector (PostgreSQL only)
+    'with_embedding': tuple(column.name for column in t_articles.c) + ('embedding',),
+}
+
+
+def article_columns(projection='analysis'):
+    """Column expressions of a named article projection, for ``select(*article_columns(...))``."""
+    try:
+        names = ARTICLE_PROJECTIONS[projection]
+    except KeyError:
+        raise ValueError(f"Unknown article projection: {projection}")
+    return [
+        t_articles.c[name] if name in t_articles.c else literal_column(f'articles.{name}').label(name)
+        for name in names
+    ]
+
+
+class Vector(UserDefinedType):
+    """pgvector ``vector`` type, for casting bound query embeddings (PostgreSQL only)."""
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "vector"
+
+
 t_articles_scenario_1 = Table(
     'articles_scenario_1', metadata,
     Column('uri', Text, primary_key=True),
@@ -901,3 +958,81 @@ t_auspex_search_routing = Table(
     Index('ix_auspex_search_routing_created_at', 'created_at'),
     Index('ix_auspex_search_routing_recommended_source', 'recommended_source')
 )
+
+# Embedding cache (content-addressed by model + sha256 of the embedded text)
+t_embedding_cache = Table(
+    'embedding_cache', metadata,
+    Column('model', String(100), nullable=False),
+    Column('content_hash', String(64), nullable=False),
+    Column('dimensions', Integer, nullable=False),
+    Column('embedding', LargeBinary, nullable=False),  # packed float32
+    Column('created_at', TIMESTAMP, server_default=text('CURRENT_TIMESTAMP')),
+    Column('last_accessed_at', TIMESTAMP, server_default=text('CURRENT_TIMESTAMP')),
+    PrimaryKeyConstraint('model', 'content_hash', name='pk_embedding_cache'),
+    Index('idx_embedding_cache_last_accessed', 'last_accessed_at')
+)
+
+# Precomputed 2-D/3-D embedding projections, one row per filter scope
+t_projection_scopes = Table(
+    'projection_scopes', metadata,
+    Column('scope_key', String(64), primary_key=True),  # sha256 of method/dims/clusters/filters
+    Column('method', String(20), nullable=False),
+    Column('dims', Integer, nullable=False),
+    Column('n_clusters', Integer, nullable=False),
+    Column('filters', Text),  # JSON metadata filter
+    Column('fitted_count', Integer, nullable=False, server_default=text('0')),
+    Column('placed_count', Integer, nullable=False, server_default=text('0')),  # added via transform() since fit
+    Column('explain', Text),  # JSON cluster labels
+    Column('fitted_at', TIMESTAMP, server_default=text('CURRENT_TIMESTAMP')),
+    Column('updated_at', TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+)
+
+t_projection_points = Table(
+    'projection_points', metadata,
+    Column('scope_key', String(64), ForeignKey('projection_scopes.scope_key', ondelete='CASCADE'), nullable=False),
+    Column('uri', Text, nullable=False),
+    Column('x', Float, nullable=False),
+    Column('y', Float, nullable=False),
+    Column('z', Float),
+    Column('cluster', Integer, nullable=False),
+    Column('fitted', Boolean, nullable=False, server_default=text('TRUE')),
+    PrimaryKeyConstraint('scope_key', 'uri', name='pk_projection_points')
+)
+
+# Durable analysis job queue: one row per URL, grouped by background_tasks.id
+t_analysis_job_items = Table(
+    'analysis_job_items', metadata,
+    Column('id', Integer, primary_key=True, autoincrement=True),
+    Column('job_id', String(36), nullable=False),
+    Column('url', Text, nullable=False),
+    Column('topic', Text),
+    Column('priority', Integer, nullable=False, server_default=text('50')),
+    Column('status', String(20), nullable=False, server_default=text("'queued'")),  # queued/leased/completed/failed/cancelled
+    Column('payload', Text),  # JSON: title, summary, source, analysis parameters
+    Column('result', Text),   # JSON
+    Column('error', Text),
+    Column('attempts', Integer, nullable=False, server_default=text('0')),
+    Column('max_attempts', Integer, nullable=False, server_default=text('3')),
+    Column('lease_owner', String(100)),
+    Column('lease_expires_at', TIMESTAMP),
+    Column('not_before', TIMESTAMP),  # retry backoff: not claimable before this time
+    Column('created_at', TIMESTAMP, server_default=text('CURRENT_TIMESTAMP')),
+    Column('updated_at', TIMESTAMP, server_default=text('CURRENT_TIMESTAMP')),
+    Index('idx_analysis_job_items_claim', 'status', 'priority', 'id'),
+    Index('idx_analysis_job_items_job', 'job_id', 'status')
+)
+
+# Incremental keyword polling: what each provider last returned for a keyword
+t_keyword_poll_cursors = Table(
+    'keyword_poll_cursors', metadata,
+    Column('keyword_id', ForeignKey('monitored_keywords.id', ondelete='CASCADE'), nullable=False),
+    Column('provider', String(50), nullable=False),
+    Column('last_published_at', TIMESTAMP),  # newest publication date seen
+    Column('seen_urls', Text),  # JSON list of the most recent result URLs
+    Column('poll_interval_seconds', Integer),
+    Column('next_poll_at', TIMESTAMP),
+    Column('empty_polls', Integer, nullable=False, server_default=text('0')),
+    Column('last_polled_at', TIMESTAMP),
+    Column('last_new_count', Integer, nullable=False, server_default=text('0')),
+    PrimaryKeyConstraint('keyword_id', 'provider', name='keyword_poll_cursors_pkey')
+)
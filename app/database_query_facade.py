@@ -23,8 +23,17 @@ from sqlalchemy import (select,
                         inspect,
                         case,
                         text,
-                        Text)
-
+                        Text,
+                        any_,
+                        bindparam,
+                        table,
+                        column,
+                        cast,
+                        Float)
+
+from app.security.user_cache import invalidate_user
+from app.database_models import ARTICLE_PROJECTIONS, Vector, article_columns
+from app.utils.pagination import CountCache, decode_cursor, encode_cursor
 from app.database_models import (t_keyword_monitor_settings as keyword_monitor_settings,
                                  t_keyword_monitor_status as keyword_monitor_status,
                                  t_keyword_article_matches as keyword_article_matches,
@@ -58,7 +67,13 @@ from app.database_models import (t_keyword_monitor_settings as keyword_monitor_s
                                  t_processing_jobs as processing_jobs,
                                  t_auspex_research_sessions as auspex_research_sessions,
                                  t_auspex_tool_usage as auspex_tool_usage,
-                                 t_auspex_search_routing as auspex_search_routing)
+                                 t_auspex_search_routing as auspex_search_routing,
+                                 t_embedding_cache as embedding_cache,
+                                 t_article_analysis_cache as article_analysis_cache,
+                                 t_analysis_job_items as analysis_job_items,
+                                 t_keyword_poll_cursors as keyword_poll_cursors,
+                                 t_projection_scopes as projection_scopes,
+                                 t_projection_points as projection_points)
                                  # t_paper_search_results as paper_search_results,  # Table doesn't exist
                                  # t_news_search_results as news_search_results,  # Table doesn't exist
                              # t_keyword_alert_articles as keyword_alert_articles)  # Table doesn't exist
@@ -75,6 +90,8 @@ class DatabaseQueryFacade:
     def __init__(self, db, logger):
         self.db = db
         self.logger = logger
+        self._article_fts_ready = None
+        self._article_count_cache = CountCache()
 
     @property
     def connection(self):
@@ -398,11 +415,181 @@ class DatabaseQueryFacade:
             self.connection.rollback()
             raise e
 
+    def save_keyword_articles(self, keyword_id, topic, candidates, chunk_size=500):
+        """
+        Bulk version of article_exists + create_article for a keyword sweep.
+
+        Per chunk, existing URIs are resolved with one query, new articles and
+        new group matches are inserted with ON CONFLICT DO NOTHING, and
+        existing matches get the keyword appended, all in one transaction.
+
+        Args:
+            keyword_id: Monitored keyword that found the articles
+            topic: Topic stored on newly inserted articles
+            candidates: Collector article dicts (url, title, source, ...)
+            chunk_size: Articles per transaction
+
+        A chunk that fails is rolled back and reported; later chunks are
+        still saved.
+
+        Returns:
+            Dict with the URIs of inserted articles ('inserted'), of all
+            articles whose row or group match changed ('changed') and of
+            articles in chunks that could not be saved ('failed')
+        """
+        if self.db.db_type == 'postgresql':
+            from sqlalchemy.dialects.postgresql import ARRAY, insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        by_uri = {}
+        for article in candidates:
+            uri = (article.get('url') or '').strip()
+            if uri and uri not in by_uri:
+                by_uri[uri] = article
+
+        inserted, changed, failed = [], [], []
+        if not by_uri:
+            return {'inserted': inserted, 'changed': changed, 'failed': failed}
+
+        group_id = self._execute_with_rollback(
+            select(monitored_keywords.c.group_id).where(monitored_keywords.c.id == keyword_id),
+            operation_name="save_keyword_articles_group"
+        ).scalar()
+
+        uris = list(by_uri)
+        for start in range(0, len(uris), chunk_size):
+            chunk = uris[start:start + chunk_size]
+            if self.db.db_type == 'postgresql':
+                uri_param = bindparam('uris', chunk, type_=ARRAY(Text))
+                uri_filter = articles.c.uri == any_(uri_param)
+                match_filter = keyword_article_matches.c.article_uri == any_(uri_param)
+            else:
+                uri_filter = articles.c.uri.in_(chunk)
+                match_filter = keyword_article_matches.c.article_uri.in_(chunk)
+
+            connection = self._get_connection()
+            try:
+                existing = set(connection.execute(select(articles.c.uri).where(uri_filter)).scalars())
+
+                new_rows = [{
+                    'uri': uri,
+                    'title': by_uri[uri].get('title'),
+                    'news_source': by_uri[uri].get('source'),
+                    'publication_date': by_uri[uri].get('published_date'),
+                    'summary': by_uri[uri].get('summary', ''),
+                    'topic': topic,
+                    'analyzed': False
+                } for uri in chunk if uri not in existing]
+                chunk_inserted = []
+                if new_rows:
+                    chunk_inserted = list(connection.execute(
+                        dialect_insert(articles).on_conflict_do_nothing(
+                            index_elements=['uri']
+                        ).returning(articles.c.uri),
+                        new_rows
+                    ).scalars())
+
+                matches = {
+                    row.article_uri: row
+                    for row in connection.execute(
+                        select(
+                            keyword_article_matches.c.id,
+                            keyword_article_matches.c.article_uri,
+                            keyword_article_matches.c.keyword_ids
+                        ).where(match_filter, keyword_article_matches.c.group_id == group_id)
+                    )
+                }
+
+                match_updates = []
+                for uri, match in matches.items():
+                    keyword_id_list = match.keyword_ids.split(',')
+                    if str(keyword_id) not in keyword_id_list:
+                        keyword_id_list.append(str(keyword_id))
+                        match_updates.append({'match_id': match.id, 'new_keyword_ids': ','.join(keyword_id_list)})
+                if match_updates:
+                    connection.execute(
+                        update(keyword_article_matches)
+                        .where(keyword_article_matches.c.id == bindparam('match_id'))
+                        .values(keyword_ids=bindparam('new_keyword_ids')),
+                        match_updates
+                    )
+
+                new_matches = [
+                    {'article_uri': uri, 'keyword_ids': str(keyword_id), 'group_id': group_id}
+                    for uri in chunk if uri not in matches
+                ]
+                if new_matches:
+                    connection.execute(
+                        dialect_insert(keyword_article_matches).on_conflict_do_nothing(
+                            index_elements=['article_uri', 'group_id']
+                        ),
+                        new_matches
+                    )
+
+                connection.commit()
+            except Exception as e:
+                self.logger.error(f"Error executing save_keyword_articles: {e}")
+                try:
+                    connection.rollback()
+                except Exception as rollback_error:
+                    self.logger.error(f"Error during rollback: {rollback_error}")
+                failed.extend(chunk)
+                continue
+
+            updated_ids = {update_row['match_id'] for update_row in match_updates}
+            inserted.extend(chunk_inserted)
+            chunk_inserted = set(chunk_inserted)
+            changed.extend(
+                uri for uri in chunk
+                if uri in chunk_inserted or uri not in matches or matches[uri].id in updated_ids
+            )
+
+        return {'inserted': inserted, 'changed': changed, 'failed': failed}
+
     def update_monitored_keyword_last_checked(self, params):
         statement = update(monitored_keywords).where(monitored_keywords.c.id == params[1]).values(last_checked = params[0])
         self._execute_with_rollback(statement)
         self.connection.commit() 
 
+    def get_keyword_poll_cursors(self, keyword_ids: List[int]) -> Dict[tuple, Dict]:
+        """Return poll cursors of the given keywords, keyed by (keyword_id, provider)."""
+        if not keyword_ids:
+            return {}
+        rows = self._execute_with_rollback(
+            select(keyword_poll_cursors).where(keyword_poll_cursors.c.keyword_id.in_(keyword_ids)),
+            operation_name="get_keyword_poll_cursors"
+        ).mappings().fetchall()
+        return {(row['keyword_id'], row['provider']): dict(row) for row in rows}
+
+    def save_keyword_poll_cursors(self, cursors: List[Dict]) -> None:
+        """Insert or update poll cursors (one dict per keyword_id/provider pair)."""
+        if not cursors:
+            return
+
+        if self.db.db_type == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(keyword_poll_cursors)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['keyword_id', 'provider'],
+            set_={
+                column.name: stmt.excluded[column.name]
+                for column in keyword_poll_cursors.c
+                if column.name not in ('keyword_id', 'provider')
+            }
+        )
+        self._execute_with_rollback(stmt, cursors, operation_name="save_keyword_poll_cursors")
+
+    def get_next_keyword_poll_time(self) -> Optional[datetime]:
+        """Earliest next_poll_at over all cursors, or None if there are none."""
+        return self._execute_with_rollback(
+            select(func.min(keyword_poll_cursors.c.next_poll_at)),
+            operation_name="get_next_keyword_poll_time"
+        ).scalar()
+
     def update_keyword_monitor_counter(self, params):
         statement = update(keyword_monitor_status).where(keyword_monitor_status.c.id == 1).values(requests_today = params[0])
         self._execute_with_rollback(statement)
@@ -1209,6 +1396,7 @@ class DatabaseQueryFacade:
             self._execute_with_rollback(insert_statement)
 
         self.connection.commit()
+        invalidate_user(email=email)
 
     def remove_oauth_user_from_allowlist(self, email):
         statement = update(
@@ -1220,6 +1408,7 @@ class DatabaseQueryFacade:
         )
         result = self._execute_with_rollback(statement)
         self.connection.commit()
+        invalidate_user(email=email)
         return result.rowcount 
     
     def get_oauth_active_users(self, provider):
@@ -1248,6 +1437,7 @@ class DatabaseQueryFacade:
         )
         result = self._execute_with_rollback(statement)
         self.connection.commit()
+        invalidate_user(email=email)
 
         return result.rowcount 
 
@@ -1388,6 +1578,7 @@ class DatabaseQueryFacade:
         stmt = update(t_users).where(t_users.c.username == username.lower()).values(**updates)
         self._execute_with_rollback(stmt, operation_name="update_user")
         self.connection.commit()
+        invalidate_user(username=username, email=updates.get('email'))
         return True
 
     def deactivate_user_by_username(self, username: str):
@@ -1398,6 +1589,7 @@ class DatabaseQueryFacade:
         stmt = update(t_users).where(t_users.c.username == username.lower()).values(is_active=False)
         self._execute_with_rollback(stmt, operation_name="deactivate_user_by_username")
         self.connection.commit()
+        invalidate_user(username=username)
         return True
 
     def check_user_is_admin(self, username: str):
@@ -4253,7 +4445,10 @@ class DatabaseQueryFacade:
     def search_for_articles_based_on_query_date_range_and_topic(self, query, topic, start_date, end_date, limit):
         statement = select(articles)
 
-        if query:
+        text_search = self._article_text_search(query) if query else None
+        if text_search:
+            statement = statement.where(text_search[0])
+        elif query:
             statement = statement.where(
                 or_(
                     articles.c.title.ilike(f"%{query}%"),
@@ -4665,7 +4860,95 @@ class DatabaseQueryFacade:
         return self._execute_with_rollback(select(mediabias)).mappings().fetchall()
 
     #### ARTICLE SEARCH QUERIES ####
-    def search_articles(
+    def _ensure_article_fts(self) -> bool:
+        """
+        Check (once) that a full-text index over articles is available.
+
+        PostgreSQL needs the generated ``search_vector`` column from
+        migration article_fts_001. On SQLite an external-content FTS5 table
+        kept in sync by triggers is created, and filled, on first use.
+        """
+        if self._article_fts_ready is not None:
+            return self._article_fts_ready
+
+        try:
+            if self.db.db_type == 'postgresql':
+                self._article_fts_ready = self._execute_with_rollback(text("""
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'articles' AND column_name = 'search_vector'
+                """), operation_name="check_article_fts").first() is not None
+                if not self._article_fts_ready:
+                    self.logger.warning("articles.search_vector is missing (run migrations), using LIKE search")
+            else:
+                existed = self._execute_with_rollback(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+                ), operation_name="check_article_fts").first() is not None
+                fields = "title, summary, category, future_signal, sentiment, tags"
+                new_fields = ", ".join(f"new.{field}" for field in fields.split(", "))
+                old_fields = ", ".join(f"old.{field}" for field in fields.split(", "))
+                for statement in (
+                    f"""CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                        {fields}, content='articles', content_rowid='rowid',
+                        tokenize='porter unicode61')""",
+                    f"""CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+                        INSERT INTO articles_fts(rowid, {fields}) VALUES (new.rowid, {new_fields});
+                    END""",
+                    f"""CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+                        INSERT INTO articles_fts(articles_fts, rowid, {fields}) VALUES ('delete', old.rowid, {old_fields});
+                    END""",
+                    f"""CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+                        INSERT INTO articles_fts(articles_fts, rowid, {fields}) VALUES ('delete', old.rowid, {old_fields});
+                        INSERT INTO articles_fts(rowid, {fields}) VALUES (new.rowid, {new_fields});
+                    END""",
+                ):
+                    self._execute_with_rollback(text(statement), operation_name="create_article_fts")
+                if not existed:
+                    self._execute_with_rollback(
+                        text("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')"),
+                        operation_name="rebuild_article_fts"
+                    )
+                self._article_fts_ready = True
+        except Exception as e:
+            self.logger.warning(f"Article full-text index unavailable, using LIKE search: {e}")
+            self._article_fts_ready = False
+
+        return self._article_fts_ready
+
+    def _article_text_search(self, query):
+        """
+        Full-text match condition and relevance expression for ``query``.
+
+        Returns (condition, rank) with higher rank meaning more relevant
+        (ts_rank on PostgreSQL, negated bm25 on SQLite), or None when there
+        is no full-text index or no indexable term (only stop words or
+        punctuation), so callers fall back to LIKE.
+        """
+        terms = [term for term in (query or '').split() if any(char.isalnum() for char in term)]
+        if not terms or not self._ensure_article_fts():
+            return None
+
+        if self.db.db_type == 'postgresql':
+            tsquery = func.websearch_to_tsquery(literal_column("'english'"), bindparam('fts_query', query))
+            # Stop words are dropped from the tsquery; an empty one matches nothing
+            if not self._execute_with_rollback(
+                select(func.numnode(tsquery)), operation_name="article_tsquery_terms"
+            ).scalar():
+                return None
+            search_vector = literal_column('articles.search_vector')
+            return search_vector.op('@@')(tsquery), func.ts_rank(search_vector, tsquery)
+
+        # Quote every term so FTS5 operators in user input are matched literally
+        fts_query = ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+        articles_fts = table('articles_fts', column('rowid'))
+        match = text('articles_fts MATCH :fts_query').bindparams(fts_query=fts_query)
+        article_rowid = literal_column('articles.rowid')
+        condition = article_rowid.in_(select(articles_fts.c.rowid).where(match))
+        rank = select(-func.bm25(literal_column('articles_fts'))).select_from(articles_fts).where(
+            match, articles_fts.c.rowid == article_rowid
+        ).scalar_subquery()
+        return condition, rank
+
+    def _article_search_filters(
         self,
         topic=None,
         category=None,
@@ -4675,15 +4958,11 @@ class DatabaseQueryFacade:
         keyword=None,
         pub_date_start=None,
         pub_date_end=None,
-        page=1,
-        per_page=10,
         date_type='publication',
         date_field=None,
         require_category=False
     ):
-        """Search articles with filters including topic - SQLAlchemy version."""
-        from typing import Tuple, List, Dict, Optional
-
+        """WHERE clause and full-text search (or None) shared by the article listings."""
         # Use the appropriate date field based on date_type
         date_field_to_use = articles.c.publication_date if date_type == 'publication' else articles.c.submission_date
         # Override with date_field if explicitly provided
@@ -4713,7 +4992,10 @@ class DatabaseQueryFacade:
             if tag_conditions:
                 conditions.append(or_(*tag_conditions))
 
-        if keyword:
+        text_search = self._article_text_search(keyword) if keyword else None
+        if text_search:
+            conditions.append(text_search[0])
+        elif keyword:
             keyword_conditions = [
                 articles.c.title.like(f"%{keyword}%"),
                 articles.c.summary.like(f"%{keyword}%"),
@@ -4739,15 +5021,92 @@ class DatabaseQueryFacade:
 
         # Build the WHERE clause
         where_clause = and_(*conditions) if conditions else literal(True)
+        return where_clause, text_search
+
+    def _count_articles(self, where_clause, filters, count='exact'):
+        """
+        Total for an article listing.
+
+        Args:
+            where_clause: Filter built by _article_search_filters
+            filters: The filter arguments, used as the cache signature
+            count: 'exact' (always counted), 'estimated' (pg_class.reltuples
+                for an unfiltered PostgreSQL listing, otherwise a count cached
+                per filter signature for a few seconds) or None to skip
+                counting
+
+        Returns:
+            (total or None, whether the total is an estimate)
+        """
+        if count is None:
+            return None, False
+
+        if count == 'estimated' and self.db.db_type == 'postgresql' and not any(filters.values()):
+            estimate = self._execute_with_rollback(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'articles'::regclass"),
+                operation_name="estimate_article_count"
+            ).scalar()
+            # -1 until the table has been vacuumed/analyzed
+            if estimate is not None and estimate >= 0:
+                return int(estimate), True
+
+        def load_count():
+            return self._execute_with_rollback(
+                select(func.count()).select_from(articles).where(where_clause),
+                operation_name="count_articles"
+            ).scalar()
+
+        if count != 'estimated':
+            return load_count(), False
+
+        # A cached count may miss writes from the last few seconds
+        signature = json.dumps(filters, sort_keys=True, default=str)
+        return self._article_count_cache.get(signature, load_count), True
+
+    def search_articles(
+        self,
+        topic=None,
+        category=None,
+        future_signal=None,
+        sentiment=None,
+        tags=None,
+        keyword=None,
+        pub_date_start=None,
+        pub_date_end=None,
+        page=1,
+        per_page=10,
+        date_type='publication',
+        date_field=None,
+        require_category=False,
+        projection='analysis',
+        sort='date'
+    ):
+        """Search articles with filters including topic - SQLAlchemy version.
 
-        # Count total results
-        count_query = select(func.count()).select_from(articles).where(where_clause)
-        total_count = self._execute_with_rollback(count_query).scalar()
+        ``keyword`` uses the full-text index (title, summary, category,
+        future_signal, sentiment, tags) when available; ``sort='relevance'``
+        orders keyword matches by rank instead of submission date.
+        ``projection`` names the columns to return (see ARTICLE_PROJECTIONS);
+        vectors are only read with 'with_embedding'.
+
+        Page/per_page (OFFSET) compatibility API; search_articles_page pages
+        by keyset instead.
+        """
+        filters = dict(
+            topic=topic, category=category, future_signal=future_signal, sentiment=sentiment,
+            tags=tags, keyword=keyword, pub_date_start=pub_date_start, pub_date_end=pub_date_end,
+            date_type=date_type, date_field=date_field, require_category=require_category
+        )
+        where_clause, text_search = self._article_search_filters(**filters)
+        total_count, _ = self._count_articles(where_clause, filters)
 
         # Get paginated results
         offset = (page - 1) * per_page
-        query = select(articles).where(where_clause).order_by(
-            desc(articles.c.submission_date)
+        order_by = [articles.c.submission_date.desc().nulls_last(), articles.c.uri.desc()]
+        if sort == 'relevance' and text_search:
+            order_by.insert(0, desc(text_search[1]))
+        query = select(*article_columns(projection)).where(where_clause).order_by(
+            *order_by
         ).limit(per_page).offset(offset)
 
         result = self._execute_with_rollback(query).mappings().fetchall()
@@ -4755,7 +5114,178 @@ class DatabaseQueryFacade:
 
         return articles_list, total_count
 
-    def get_recent_articles_by_topic(self, topic_name, limit=10, start_date=None, end_date=None):
+    def search_articles_page(self, cursor=None, per_page=10, count='estimated', projection='list', **filters):
+        """
+        Keyset-paginated article search, newest submission first.
+
+        Pages continue after the (submission_date, uri) of the previous
+        page's last row, so deep pages cost the same as the first.
+
+        Args:
+            cursor: Opaque next_cursor of the previous page, None for the first page
+            per_page: Page size
+            count: See _count_articles ('exact', 'estimated' or None)
+            projection: Named column projection (see ARTICLE_PROJECTIONS)
+            **filters: Same filters as search_articles
+
+        Returns:
+            Dict with articles, next_cursor (None on the last page),
+            total_count and total_is_estimate
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        where_clause, _ = self._article_search_filters(**filters)
+        total_count, total_is_estimate = self._count_articles(where_clause, filters, count)
+
+        conditions = [where_clause]
+        if cursor:
+            last_date, last_uri = decode_cursor(cursor, 2)
+            submission_date = articles.c.submission_date
+            if last_date is None:
+                conditions.append(and_(submission_date.is_(None), articles.c.uri < last_uri))
+            else:
+                conditions.append(or_(
+                    submission_date < last_date,
+                    and_(submission_date == last_date, articles.c.uri < last_uri),
+                    submission_date.is_(None)
+                ))
+
+        columns = article_columns(projection)
+        selected = {column.name for column in columns}
+        # The cursor needs the sort key even if the projection leaves it out
+        columns += [c for c in (articles.c.submission_date, articles.c.uri) if c.name not in selected]
+
+        query = select(*columns).where(and_(*conditions)).order_by(
+            articles.c.submission_date.desc().nulls_last(),
+            articles.c.uri.desc()
+        ).limit(per_page + 1)
+        rows = [dict(row) for row in self._execute_with_rollback(
+            query, operation_name="search_articles_page"
+        ).mappings().fetchall()]
+
+        next_cursor = None
+        if len(rows) > per_page:
+            rows = rows[:per_page]
+            next_cursor = encode_cursor([rows[-1]['submission_date'], rows[-1]['uri']])
+        for row in rows:
+            for name in ('submission_date', 'uri'):
+                if name not in selected:
+                    row.pop(name)
+
+        return {
+            "articles": rows,
+            "next_cursor": next_cursor,
+            "total_count": total_count,
+            "total_is_estimate": total_is_estimate
+        }
+
+    def article_filter_condition(self, metadata_filter):
+        """
+        SQL condition for a vector-store style metadata filter.
+
+        Accepts ``{"field": value}``, ``{"field": {"$op": value}}`` with $eq,
+        $ne, $in, $nin, $gt, $gte, $lt or $lte, and ``{"$and": [...]}`` /
+        ``{"$or": [...]}`` of such filters. Fields must be columns of the
+        'list' article projection.
+
+        Raises:
+            ValueError: On an unknown field or operator
+        """
+        conditions = []
+        for field, value in (metadata_filter or {}).items():
+            if field in ('$and', '$or'):
+                parts = [self.article_filter_condition(part) for part in value]
+                conditions.append(and_(*parts) if field == '$and' else or_(*parts))
+                continue
+            if field not in ARTICLE_PROJECTIONS['list'] or field not in articles.c:
+                raise ValueError(f"Unsupported article filter field: {field}")
+
+            field_column = articles.c[field]
+            for op, operand in (value.items() if isinstance(value, dict) else [('$eq', value)]):
+                if op == '$eq':
+                    conditions.append(field_column == operand)
+                elif op == '$ne':
+                    conditions.append(field_column.is_distinct_from(operand))
+                elif op == '$in':
+                    conditions.append(field_column.in_(list(operand)))
+                elif op == '$nin':
+                    conditions.append(or_(field_column.is_(None), field_column.not_in(list(operand))))
+                elif op == '$gt':
+                    conditions.append(field_column > operand)
+                elif op == '$gte':
+                    conditions.append(field_column >= operand)
+                elif op == '$lt':
+                    conditions.append(field_column < operand)
+                elif op == '$lte':
+                    conditions.append(field_column <= operand)
+                else:
+                    raise ValueError(f"Unsupported article filter operator for {field}: {op}")
+
+        return and_(*conditions) if conditions else literal(True)
+
+    def lexical_article_candidates(self, query, limit=100, condition=None, projection='list'):
+        """
+        Articles matching ``query`` in the full-text index, most relevant first.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of candidates
+            condition: Optional SQL condition the articles must also meet
+            projection: Named column projection (see ARTICLE_PROJECTIONS)
+
+        Returns:
+            List of article dicts, or [] when there is no full-text index
+        """
+        text_search = self._article_text_search(query)
+        if not text_search:
+            return []
+        match, rank = text_search
+
+        stmt = select(*article_columns(projection)).where(
+            match, condition if condition is not None else literal(True)
+        ).order_by(rank.desc(), articles.c.uri).limit(limit)
+        return [dict(row) for row in self._execute_with_rollback(
+            stmt, operation_name="lexical_article_candidates"
+        ).mappings().fetchall()]
+
+    def vector_article_candidates(self, query_embedding, limit=100, condition=None, projection='list'):
+        """
+        Articles nearest to ``query_embedding`` by cosine distance (PostgreSQL only).
+
+        Ordered by the HNSW index on articles.embedding. ``hnsw.ef_search``
+        is raised to ``limit`` for the query, since the index never returns
+        more than ef_search rows.
+
+        Returns:
+            List of article dicts with a ``distance`` key, nearest first
+        """
+        if self.db.db_type != 'postgresql':
+            return []
+
+        embedding = literal_column('articles.embedding')
+        query_vector = cast(bindparam('query_embedding', '[' + ','.join(str(x) for x in query_embedding) + ']'), Vector())
+        distance = embedding.op('<=>', return_type=Float)(query_vector)
+        stmt = select(*article_columns(projection), distance.label('distance')).where(
+            embedding.isnot(None), condition if condition is not None else literal(True)
+        ).order_by(distance).limit(limit)
+
+        connection = self._get_connection()
+        try:
+            # set_config(..., true) lasts until the end of this transaction only
+            connection.execute(select(func.set_config('hnsw.ef_search', str(max(limit, 40)), True)))
+            rows = [dict(row) for row in connection.execute(stmt).mappings().fetchall()]
+            connection.commit()
+            return rows
+        except Exception as e:
+            self.logger.error(f"Error executing vector_article_candidates: {e}")
+            try:
+                connection.rollback()
+            except Exception as rollback_error:
+                self.logger.error(f"Error during rollback: {rollback_error}")
+            raise
+
+    def get_recent_articles_by_topic(self, topic_name, limit=10, start_date=None, end_date=None, projection='analysis'):
         """Fetch recent articles for a topic - SQLAlchemy version."""
         from sqlalchemy import case, cast, Date
         import logging
@@ -4777,7 +5307,7 @@ class DatabaseQueryFacade:
 
         # Build query
         # Note: PostgreSQL doesn't have rowid, so we only order by date
-        query = select(articles).where(
+        query = select(*article_columns(projection)).where(
             and_(*conditions)
         ).order_by(
             desc(coalesce_date)
@@ -4790,7 +5320,7 @@ class DatabaseQueryFacade:
 
         # Convert tags string back to list
         for article in articles_list:
-            if article['tags']:
+            if article.get('tags'):
                 article['tags'] = article['tags'].split(',')
             else:
                 article['tags'] = []
@@ -7010,6 +7540,254 @@ class DatabaseQueryFacade:
         result = self._execute_with_rollback(query, {'task_id': task_id})
         return result.fetchone()
 
+    def update_background_task_progress(self, task_id: str, processed_items: int, progress: float,
+                                        current_item: Optional[str] = None, status: Optional[str] = None,
+                                        result: Optional[str] = None):
+        """Update progress (and optionally the final status/result) of a background task.
+
+        Completed, failed and cancelled tasks are left untouched.
+        """
+        from sqlalchemy import text
+
+        query = text("""
+            UPDATE background_tasks SET
+                processed_items = :processed_items,
+                progress = :progress,
+                current_item = COALESCE(:current_item, current_item),
+                status = COALESCE(:status, status),
+                completed_at = CASE WHEN :status IS NULL THEN completed_at ELSE :now END,
+                result = COALESCE(:result, result)
+            WHERE id = :task_id
+              AND status NOT IN ('completed', 'failed', 'cancelled')
+        """)
+
+        self._execute_with_rollback(query, {
+            'task_id': task_id,
+            'processed_items': processed_items,
+            'progress': progress,
+            'current_item': current_item,
+            'status': status,
+            'result': result,
+            'now': datetime.now()
+        }, operation_name="update_background_task_progress")
+
+    # =============================================================================
+    # Analysis Job Queue - durable, priority-ordered items for AnalysisQueue
+    # =============================================================================
+
+    def enqueue_analysis_job_items(self, items: List[Dict]) -> None:
+        """Insert queued items (job_id, url, topic, priority, payload, max_attempts)."""
+        if not items:
+            return
+        self._execute_with_rollback(
+            insert(analysis_job_items),
+            items,
+            operation_name="enqueue_analysis_job_items"
+        )
+
+    def claim_analysis_job_items(self, worker_id: str, limit: int, lease_seconds: int) -> List[Dict]:
+        """
+        Lease up to ``limit`` items for ``worker_id``.
+
+        Queued items past their retry backoff and leased items whose lease
+        has expired (their worker crashed or was redeployed) with attempts
+        left are claimable, highest priority first and oldest first within a
+        priority. On PostgreSQL, concurrent workers skip each other's locked
+        rows.
+
+        Returns:
+            The claimed rows
+        """
+        now = datetime.utcnow()
+        candidates = select(analysis_job_items.c.id).where(
+            or_(
+                and_(
+                    analysis_job_items.c.status == 'queued',
+                    or_(
+                        analysis_job_items.c.not_before.is_(None),
+                        analysis_job_items.c.not_before <= now
+                    )
+                ),
+                and_(
+                    analysis_job_items.c.status == 'leased',
+                    analysis_job_items.c.lease_expires_at < now,
+                    analysis_job_items.c.attempts < analysis_job_items.c.max_attempts
+                )
+            )
+        ).order_by(
+            analysis_job_items.c.priority.desc(),
+            analysis_job_items.c.id
+        ).limit(limit)
+
+        if self.db.db_type == 'postgresql':
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        statement = update(analysis_job_items).where(
+            analysis_job_items.c.id.in_(candidates.scalar_subquery())
+        ).values(
+            status='leased',
+            lease_owner=worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            attempts=analysis_job_items.c.attempts + 1,
+            updated_at=now
+        ).returning(*analysis_job_items.c)
+
+        # The RETURNING rows must be read before committing (SQLite refuses
+        # to commit while the statement is still open)
+        connection = self._get_connection()
+        try:
+            rows = [dict(row) for row in connection.execute(statement).mappings().fetchall()]
+            connection.commit()
+            return rows
+        except Exception as e:
+            self.logger.error(f"Error executing claim_analysis_job_items: {e}")
+            try:
+                connection.rollback()
+            except Exception as rollback_error:
+                self.logger.error(f"Error during rollback: {rollback_error}")
+            raise
+
+    def fail_exhausted_analysis_job_items(self) -> List[str]:
+        """
+        Fail items whose lease expired on their last allowed attempt.
+
+        Such items crashed their worker every time they were tried, so they
+        are not claimed again.
+
+        Returns:
+            The job ids of the failed items, one per item
+        """
+        now = datetime.utcnow()
+        statement = update(analysis_job_items).where(
+            and_(
+                analysis_job_items.c.status == 'leased',
+                analysis_job_items.c.lease_expires_at < now,
+                analysis_job_items.c.attempts >= analysis_job_items.c.max_attempts
+            )
+        ).values(
+            status='failed',
+            error='Lease expired on the last attempt',
+            lease_owner=None,
+            lease_expires_at=None,
+            updated_at=now
+        ).returning(analysis_job_items.c.job_id)
+
+        connection = self._get_connection()
+        try:
+            job_ids = list(connection.execute(statement).scalars())
+            connection.commit()
+            return job_ids
+        except Exception as e:
+            self.logger.error(f"Error executing fail_exhausted_analysis_job_items: {e}")
+            try:
+                connection.rollback()
+            except Exception as rollback_error:
+                self.logger.error(f"Error during rollback: {rollback_error}")
+            raise
+
+    def extend_analysis_job_item_leases(self, item_ids: List[int], worker_id: str, lease_seconds: int) -> int:
+        """Push out the lease of items ``worker_id`` is still working on."""
+        if not item_ids:
+            return 0
+        result = self._execute_with_rollback(
+            update(analysis_job_items).where(
+                and_(
+                    analysis_job_items.c.id.in_(item_ids),
+                    analysis_job_items.c.status == 'leased',
+                    analysis_job_items.c.lease_owner == worker_id
+                )
+            ).values(lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds)),
+            operation_name="extend_analysis_job_item_leases"
+        )
+        return result.rowcount or 0
+
+    def finish_analysis_job_item(self, item_id: int, worker_id: str, status: str,
+                                 result: Optional[str] = None, error: Optional[str] = None,
+                                 retry_delay_seconds: float = 0) -> bool:
+        """
+        Record the outcome of a leased item.
+
+        ``status`` is 'completed', 'failed' or 'queued' (retry); a retried
+        item is not claimable again for ``retry_delay_seconds``. Nothing is
+        written if the lease was lost to another worker in the meantime.
+
+        Returns:
+            True if the item was still leased by ``worker_id``
+        """
+        now = datetime.utcnow()
+        not_before = now + timedelta(seconds=retry_delay_seconds) if status == 'queued' and retry_delay_seconds else None
+        outcome = self._execute_with_rollback(
+            update(analysis_job_items).where(
+                and_(
+                    analysis_job_items.c.id == item_id,
+                    analysis_job_items.c.status == 'leased',
+                    analysis_job_items.c.lease_owner == worker_id
+                )
+            ).values(
+                status=status,
+                result=result,
+                error=error,
+                lease_owner=None,
+                lease_expires_at=None,
+                not_before=not_before,
+                updated_at=now
+            ),
+            operation_name="finish_analysis_job_item"
+        )
+        return bool(outcome.rowcount)
+
+    def cancel_analysis_job_items(self, job_id: str) -> int:
+        """Cancel every item of ``job_id`` that has not been claimed yet."""
+        result = self._execute_with_rollback(
+            update(analysis_job_items).where(
+                and_(
+                    analysis_job_items.c.job_id == job_id,
+                    analysis_job_items.c.status == 'queued'
+                )
+            ).values(status='cancelled', updated_at=datetime.utcnow()),
+            operation_name="cancel_analysis_job_items"
+        )
+        return result.rowcount or 0
+
+    def get_analysis_job_counts(self, job_id: str) -> Dict[str, int]:
+        """Return item counts by status for one job."""
+        rows = self._execute_with_rollback(
+            select(
+                analysis_job_items.c.status,
+                func.count()
+            ).where(
+                analysis_job_items.c.job_id == job_id
+            ).group_by(analysis_job_items.c.status),
+            operation_name="get_analysis_job_counts"
+        ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def get_analysis_job_results(self, job_id: str) -> List[Dict]:
+        """Return url, topic, status, result, error and attempts for every item of a job."""
+        rows = self._execute_with_rollback(
+            select(
+                analysis_job_items.c.url,
+                analysis_job_items.c.topic,
+                analysis_job_items.c.status,
+                analysis_job_items.c.result,
+                analysis_job_items.c.error,
+                analysis_job_items.c.attempts
+            ).where(
+                analysis_job_items.c.job_id == job_id
+            ).order_by(analysis_job_items.c.id),
+            operation_name="get_analysis_job_results"
+        ).mappings().fetchall()
+        return [dict(row) for row in rows]
+
+    def has_pending_analysis_job_items(self) -> bool:
+        """True if any item is queued or leased (e.g. left over from before a restart)."""
+        return self._execute_with_rollback(
+            select(
+                exists().where(analysis_job_items.c.status.in_(['queued', 'leased']))
+            ),
+            operation_name="has_pending_analysis_job_items"
+        ).scalar()
+
     # =============================================================================
     # Trend Convergence Dashboard Reference Articles
     # =============================================================================
@@ -8336,3 +9114,455 @@ class DatabaseQueryFacade:
         except Exception as e:
             self.logger.error(f"Failed to get search routing accuracy: {e}")
             return {"period_days": days, "total_queries": 0, "accuracy_pct": 0.0}
+
+    # ==================== EMBEDDING CACHE ====================
+
+    def get_cached_embeddings(self, model: str, content_hashes: List[str]) -> Dict[str, bytes]:
+        """
+        Fetch cached embeddings for a batch of content hashes.
+
+        Hits have their last_accessed_at bumped so size eviction keeps
+        recently used vectors.
+
+        Args:
+            model: Embedding model name
+            content_hashes: sha256 hex digests of the embedded texts
+
+        Returns:
+            Dict mapping content_hash to the packed float32 embedding bytes
+        """
+        if not content_hashes:
+            return {}
+
+        result = self._execute_with_rollback(
+            select(
+                embedding_cache.c.content_hash,
+                embedding_cache.c.embedding
+            ).where(
+                and_(
+                    embedding_cache.c.model == model,
+                    embedding_cache.c.content_hash.in_(content_hashes)
+                )
+            ),
+            operation_name="get_cached_embeddings"
+        )
+        found = {row[0]: bytes(row[1]) for row in result.fetchall()}
+
+        if found:
+            self._execute_with_rollback(
+                update(embedding_cache).where(
+                    and_(
+                        embedding_cache.c.model == model,
+                        embedding_cache.c.content_hash.in_(list(found))
+                    )
+                ).values(last_accessed_at=func.now()),
+                operation_name="touch_cached_embeddings"
+            )
+
+        return found
+
+    def save_cached_embeddings(self, model: str, dimensions: int, entries: Dict[str, bytes]) -> None:
+        """
+        Store embeddings in the cache table, ignoring keys that already exist.
+
+        Args:
+            model: Embedding model name
+            dimensions: Vector dimensionality
+            entries: Dict mapping content_hash to packed float32 embedding bytes
+        """
+        if not entries:
+            return
+
+        rows = [
+            {"model": model, "content_hash": content_hash, "dimensions": dimensions, "embedding": blob}
+            for content_hash, blob in entries.items()
+        ]
+
+        if self.db.db_type == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        self._execute_with_rollback(
+            dialect_insert(embedding_cache).on_conflict_do_nothing(
+                index_elements=['model', 'content_hash']
+            ),
+            rows,
+            operation_name="save_cached_embeddings"
+        )
+
+    def evict_embedding_cache(self, max_age_days: Optional[int] = None, max_entries: Optional[int] = None) -> int:
+        """
+        Evict embedding cache rows by age and/or total size.
+
+        Args:
+            max_age_days: Drop rows not accessed within this many days
+            max_entries: Keep at most this many rows (least recently accessed go first)
+
+        Returns:
+            Number of rows deleted
+        """
+        deleted = 0
+
+        if max_age_days:
+            cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+            result = self._execute_with_rollback(
+                delete(embedding_cache).where(embedding_cache.c.last_accessed_at < cutoff),
+                operation_name="evict_embedding_cache_ttl"
+            )
+            deleted += result.rowcount or 0
+
+        if max_entries:
+            # Find the access time of the oldest row we still want to keep
+            cutoff_row = self._execute_with_rollback(
+                select(embedding_cache.c.last_accessed_at)
+                .order_by(embedding_cache.c.last_accessed_at.desc())
+                .offset(max_entries)
+                .limit(1),
+                operation_name="evict_embedding_cache_cutoff"
+            ).fetchone()
+            if cutoff_row is not None:
+                result = self._execute_with_rollback(
+                    delete(embedding_cache).where(embedding_cache.c.last_accessed_at <= cutoff_row[0]),
+                    operation_name="evict_embedding_cache_size"
+                )
+                deleted += result.rowcount or 0
+
+        return deleted
+
+    def count_cached_embeddings(self) -> int:
+        """Return the number of rows in the embedding cache table."""
+        return self._execute_with_rollback(
+            select(func.count()).select_from(embedding_cache),
+            operation_name="count_cached_embeddings"
+        ).scalar() or 0
+
+    # ==================== ANALYSIS CACHE ====================
+
+    def get_analysis_cache_entries(self, analysis_type: str, model_used: str, keys: List[tuple]) -> Dict[tuple, Dict]:
+        """
+        Fetch unexpired analysis cache rows for a batch of keys.
+
+        Hits have their last_accessed_at bumped so size eviction keeps
+        recently used analyses.
+
+        Args:
+            analysis_type: Analysis type, e.g. 'article_analysis'
+            model_used: Model name the analyses were generated with
+            keys: (article_uri, content_hash, template_hash) tuples
+
+        Returns:
+            Dict mapping each found key to its row (content, model_used,
+            generated_at, metadata)
+        """
+        if not keys:
+            return {}
+
+        wanted = set(keys)
+        result = self._execute_with_rollback(
+            select(
+                article_analysis_cache.c.id,
+                article_analysis_cache.c.article_uri,
+                article_analysis_cache.c.content_hash,
+                article_analysis_cache.c.template_hash,
+                article_analysis_cache.c.content,
+                article_analysis_cache.c.model_used,
+                article_analysis_cache.c.generated_at,
+                article_analysis_cache.c.metadata
+            ).where(
+                and_(
+                    article_analysis_cache.c.article_uri.in_({key[0] for key in wanted}),
+                    article_analysis_cache.c.analysis_type == analysis_type,
+                    article_analysis_cache.c.model_used == model_used,
+                    or_(
+                        article_analysis_cache.c.expires_at.is_(None),
+                        article_analysis_cache.c.expires_at > datetime.utcnow()
+                    )
+                )
+            ),
+            operation_name="get_analysis_cache_entries"
+        )
+
+        found = {}
+        for row in result.mappings().fetchall():
+            key = (row['article_uri'], row['content_hash'], row['template_hash'])
+            if key in wanted:
+                found[key] = dict(row)
+
+        if found:
+            self._execute_with_rollback(
+                update(article_analysis_cache).where(
+                    article_analysis_cache.c.id.in_([row['id'] for row in found.values()])
+                ).values(last_accessed_at=datetime.utcnow()),
+                operation_name="touch_analysis_cache_entries"
+            )
+
+        return found
+
+    def save_analysis_cache_entries(self, entries: List[Dict]) -> None:
+        """
+        Insert or replace analysis cache rows.
+
+        Args:
+            entries: Row dicts with article_uri, analysis_type, model_used,
+                content_hash, template_hash, content, metadata and expires_at
+        """
+        if not entries:
+            return
+
+        now = datetime.utcnow()
+        rows = [{**entry, "generated_at": now, "last_accessed_at": now} for entry in entries]
+
+        if self.db.db_type == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(article_analysis_cache)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['article_uri', 'analysis_type', 'model_used', 'content_hash', 'template_hash'],
+            set_={
+                column: stmt.excluded[column]
+                for column in ('content', 'metadata', 'generated_at', 'expires_at', 'last_accessed_at')
+            }
+        )
+        self._execute_with_rollback(stmt, rows, operation_name="save_analysis_cache_entries")
+
+    def delete_analysis_cache_entries(self, analysis_type: str, article_uri: Optional[str] = None,
+                                      content_hash: Optional[str] = None) -> int:
+        """
+        Delete analysis cache rows of one type, optionally for a single article/content version.
+
+        Returns:
+            Number of rows deleted
+        """
+        conditions = [article_analysis_cache.c.analysis_type == analysis_type]
+        if article_uri is not None:
+            conditions.append(article_analysis_cache.c.article_uri == article_uri)
+        if content_hash is not None:
+            conditions.append(article_analysis_cache.c.content_hash == content_hash)
+
+        result = self._execute_with_rollback(
+            delete(article_analysis_cache).where(and_(*conditions)),
+            operation_name="delete_analysis_cache_entries"
+        )
+        return result.rowcount or 0
+
+    def evict_analysis_cache(self, analysis_type: Optional[str] = None, max_entries: Optional[int] = None) -> int:
+        """
+        Evict expired analysis cache rows and, optionally, trim to a maximum size.
+
+        Args:
+            analysis_type: Limit eviction to one analysis type (default: all)
+            max_entries: Keep at most this many rows (least recently accessed go first)
+
+        Returns:
+            Number of rows deleted
+        """
+        scope = [article_analysis_cache.c.analysis_type == analysis_type] if analysis_type else []
+
+        result = self._execute_with_rollback(
+            delete(article_analysis_cache).where(
+                and_(
+                    article_analysis_cache.c.expires_at.isnot(None),
+                    article_analysis_cache.c.expires_at < datetime.utcnow(),
+                    *scope
+                )
+            ),
+            operation_name="evict_analysis_cache_ttl"
+        )
+        deleted = result.rowcount or 0
+
+        if max_entries:
+            excess = self._execute_with_rollback(
+                select(func.count()).select_from(article_analysis_cache).where(*scope),
+                operation_name="evict_analysis_cache_count"
+            ).scalar() - max_entries
+            if excess > 0:
+                # Delete exactly the excess rows by id; rows written in one
+                # batch share last_accessed_at, so a timestamp cutoff would
+                # take all of them
+                least_recent = (
+                    select(article_analysis_cache.c.id)
+                    .where(*scope)
+                    .order_by(
+                        article_analysis_cache.c.last_accessed_at.asc().nulls_first(),
+                        article_analysis_cache.c.id
+                    )
+                    .limit(excess)
+                )
+                result = self._execute_with_rollback(
+                    delete(article_analysis_cache).where(article_analysis_cache.c.id.in_(least_recent)),
+                    operation_name="evict_analysis_cache_size"
+                )
+                deleted += result.rowcount or 0
+
+        return deleted
+
+    def get_analysis_cache_summary(self, analysis_type: Optional[str] = None) -> Dict:
+        """Return row count, content size and generated_at range of the analysis cache."""
+        scope = [article_analysis_cache.c.analysis_type == analysis_type] if analysis_type else []
+        row = self._execute_with_rollback(
+            select(
+                func.count(),
+                func.coalesce(func.sum(func.length(article_analysis_cache.c.content)), 0),
+                func.min(article_analysis_cache.c.generated_at),
+                func.max(article_analysis_cache.c.generated_at)
+            ).where(*scope),
+            operation_name="get_analysis_cache_summary"
+        ).fetchone()
+        return {
+            "entries": row[0] or 0,
+            "total_size_bytes": int(row[1] or 0),
+            "oldest": row[2],
+            "newest": row[3],
+        }
+
+    # ==================== PROJECTION STORE ====================
+
+    def get_projection_scope(self, scope_key: str) -> Optional[Dict]:
+        """Return the stored projection scope row, or None if it was never fitted."""
+        row = self._execute_with_rollback(
+            select(projection_scopes).where(projection_scopes.c.scope_key == scope_key),
+            operation_name="get_projection_scope"
+        ).mappings().fetchone()
+        return dict(row) if row else None
+
+    def list_projection_scopes(self) -> List[Dict]:
+        """Return every stored projection scope."""
+        result = self._execute_with_rollback(
+            select(projection_scopes).order_by(projection_scopes.c.updated_at),
+            operation_name="list_projection_scopes"
+        )
+        return [dict(row) for row in result.mappings().fetchall()]
+
+    def save_projection(self, scope: Dict, points: List[Dict]) -> None:
+        """
+        Replace a scope's projection with a fresh fit.
+
+        Args:
+            scope: scope_key, method, dims, n_clusters, filters (JSON) and explain (JSON)
+            points: Dicts with uri, x, y, z, cluster
+        """
+        scope_key = scope["scope_key"]
+        values = {
+            "method": scope["method"],
+            "dims": scope["dims"],
+            "n_clusters": scope["n_clusters"],
+            "filters": scope["filters"],
+            "explain": scope["explain"],
+            "fitted_count": len(points),
+            "placed_count": 0,
+            "fitted_at": func.now(),
+            "updated_at": func.now(),
+        }
+
+        # One transaction, so readers never see the scope without its points
+        connection = self._get_connection()
+        try:
+            connection.execute(
+                delete(projection_points).where(projection_points.c.scope_key == scope_key)
+            )
+            updated = connection.execute(
+                update(projection_scopes).where(projection_scopes.c.scope_key == scope_key).values(**values)
+            )
+            if not updated.rowcount:
+                connection.execute(insert(projection_scopes).values(scope_key=scope_key, **values))
+            if points:
+                connection.execute(
+                    insert(projection_points),
+                    [dict(point, scope_key=scope_key, fitted=True) for point in points]
+                )
+            connection.commit()
+        except Exception as e:
+            self.logger.error(f"Error executing save_projection: {e}")
+            try:
+                connection.rollback()
+            except Exception as rollback_error:
+                self.logger.error(f"Error during rollback: {rollback_error}")
+            raise
+
+    def add_projection_points(self, scope_key: str, points: List[Dict]) -> None:
+        """Append points placed with transform() and bump the scope's placed_count."""
+        if not points:
+            return
+        self._execute_with_rollback(
+            insert(projection_points),
+            [dict(point, scope_key=scope_key, fitted=False) for point in points],
+            operation_name="add_projection_points"
+        )
+        self._execute_with_rollback(
+            update(projection_scopes)
+            .where(projection_scopes.c.scope_key == scope_key)
+            .values(
+                placed_count=projection_scopes.c.placed_count + len(points),
+                updated_at=func.now()
+            ),
+            operation_name="bump_projection_placed_count"
+        )
+
+    def get_projection_points(self, scope_key: str, uris: Optional[List[str]] = None,
+                              limit: Optional[int] = None, fitted_only: bool = False) -> List[Dict]:
+        """
+        Read projected points joined with current article metadata.
+
+        Points whose article has been deleted are dropped by the join.
+        """
+        stmt = select(
+            projection_points.c.uri,
+            projection_points.c.x,
+            projection_points.c.y,
+            projection_points.c.z,
+            projection_points.c.cluster,
+            articles.c.title,
+            articles.c.sentiment,
+            articles.c.driver_type,
+            articles.c.category,
+            articles.c.time_to_impact
+        ).select_from(
+            projection_points.join(articles, articles.c.uri == projection_points.c.uri)
+        ).where(projection_points.c.scope_key == scope_key)
+
+        if uris is not None:
+            stmt = stmt.where(projection_points.c.uri.in_(uris))
+        if fitted_only:
+            stmt = stmt.where(projection_points.c.fitted == True)
+        stmt = stmt.order_by(articles.c.submission_date.desc())
+        if limit:
+            stmt = stmt.limit(limit)
+
+        result = self._execute_with_rollback(stmt, operation_name="get_projection_points")
+        return [dict(row) for row in result.mappings().fetchall()]
+
+    def get_unprojected_article_uris(self, scope_key: str, filters: Dict, limit: int) -> List[str]:
+        """Return URIs of embedded articles in a scope's filter that have no projected point yet."""
+        conditions = [
+            literal_column("articles.embedding").isnot(None),
+            ~exists().where(and_(
+                projection_points.c.scope_key == scope_key,
+                projection_points.c.uri == articles.c.uri
+            ))
+        ]
+        for field, value in (filters or {}).items():
+            conditions.append(articles.c[field] == value)
+
+        result = self._execute_with_rollback(
+            select(articles.c.uri)
+            .where(and_(*conditions))
+            .order_by(articles.c.submission_date.desc())
+            .limit(limit),
+            operation_name="get_unprojected_article_uris"
+        )
+        return [row[0] for row in result.fetchall()]
+
+    def delete_projection_scopes(self, scope_key: Optional[str] = None) -> int:
+        """Drop one stored projection scope, or all of them when scope_key is None."""
+        point_stmt = delete(projection_points)
+        scope_stmt = delete(projection_scopes)
+        if scope_key is not None:
+            point_stmt = point_stmt.where(projection_points.c.scope_key == scope_key)
+            scope_stmt = scope_stmt.where(projection_scopes.c.scope_key == scope_key)
+
+        self._execute_with_rollback(point_stmt, operation_name="delete_projection_points")
+        result = self._execute_with_rollback(scope_stmt, operation_name="delete_projection_scopes")
+        return result.rowcount or 0
@@ -3,7 +3,7 @@
 A lightweight query language for semantic vector search with ChromaDB.
 """
 
-from app.kissql.parser import parse_query, parse_full_query
+from app.kissql.parser import parse_query, parse_full_query, parse_query_cached
 from app.kissql.executor import execute_query
 from app.kissql.pipe_operators import (
     apply_head_operation,
@@ -30,7 +30,7 @@ def extract_and_apply_pipe_operations(query_string, results):
         return results
         
     # Parse the query to get pipe operations
-    parsed_query = parse_full_query(query_string)
+    parsed_query = parse_query_cached(query_string)
     
     # If no pipe operations, return original results
     if not parsed_query.pipe_operations:
@@ -60,6 +60,7 @@ def extract_and_apply_pipe_operations(query_string, results):
 __all__ = [
     "parse_query", 
     "parse_full_query", 
+    "parse_query_cached",
     "execute_query",
     "apply_head_operation",
     "apply_tail_operation",
@@ -1,24 +1,61 @@
 """KISSQL Query Executor.
 
-This module handles the execution of parsed queries against ChromaDB.
+This module handles the execution of parsed queries against the pgvector
+``articles`` table. Constraints are compiled to SQL (see sql_compiler), so a
+query embeds its text once and filters, ranks and aggregates in the database.
+Free text is ranked by hybrid full-text + vector retrieval.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
 
-from app.kissql.parser import Query, Constraint
+from app.kissql.parser import Query
 from app.kissql.pipe_operators import apply_pipe_operations
-from app.vector_store import search_articles, similar_articles
+from app.kissql.sql_compiler import (
+    FACET_FIELDS,
+    SEARCHABLE_SQL,
+    KissqlCompileError,
+    QueryPlan,
+    compile_plan,
+)
+from app.vector_store import similar_articles
 
 logger = logging.getLogger(__name__)
 
+# Article columns returned as result metadata
+RESULT_FIELDS = (
+    "title", "news_source", "category", "future_signal", "sentiment",
+    "time_to_impact", "driver_type", "topic", "publication_date", "tags",
+    "summary",
+)
 
-def execute_query(query: Query, top_k: int = 100) -> Dict[str, Any]:
+
+@contextmanager
+def _stage(timings: Optional[Dict[str, float]], name: str):
+    """Record the wall time of an execution stage in milliseconds."""
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round((time.perf_counter() - start) * 1000, 3)
+
+
+def execute_query(
+    query: Query,
+    top_k: int = 100,
+    timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
     """Execute a parsed query and return the results.
     
     Args:
         query: The parsed Query object
         top_k: Maximum number of results to return
+        timings: Optional dict that receives per-stage timings in ms
         
     Returns:
         A dict with search results, facets, and timeline
@@ -88,100 +125,43 @@ def execute_query(query: Query, top_k: int = 100) -> Dict[str, Any]:
             "timeline": {},
         }
     
-    # Extract equality constraints for ChromaDB native filtering
-    metadata_filter = {}
-    for constraint in query.constraints:
-        if constraint.operator == '=':
-            # Get field and value for filtering
-            field = constraint.field
-            value = constraint.value
-            
-            # For categorical fields, normalize for exact DB matching
-            if field.lower() in [
-                "sentiment", "topic", "category", "news_source"
-            ]:
-                if isinstance(value, str):
-                    # Remove any quote marks to ensure clean values
-                    value = value.strip('"\'')
-                    logger.info(
-                        "Processing filter value for %s: %s",
-                        field, value
-                    )
-                    
-                    # NOTE: Don't convert case - keep original value
-                    # This preserves exact match with DB values
-            
-            # Capture the constraint without case changes
-            metadata_filter[field] = value
-            logger.debug(
-                "Adding constraint: %s = %s", 
-                field, 
-                value
-            )
-    
-    # First, execute the search without filters to get complete facets
-    # Use a very high limit to effectively get all results
-    full_results = search_articles(
-        query.text,
-        top_k=100000,  # Effectively unlimited
-        metadata_filter={},  # No filtering for facet generation
-    )
+    # Compile every constraint into one WHERE clause (cached per constraint set)
+    try:
+        with _stage(timings, "compile"):
+            plan = compile_plan(query.constraints)
+    except KissqlCompileError as exc:
+        logger.warning("Cannot compile KISSQL constraints: %s", exc)
+        return {
+            "results": [],
+            "facets": {},
+            "filtered_facets": {},
+            "timeline": {},
+            "comparison": {"total_before": 0, "total_after": 0, "facet_impact": {}},
+            "error": str(exc),
+        }
     
-    # Log the search parameters and number of results before filtering
     logger.info(
-        "Searching with query: %s, metadata_filter: %s", 
-        query.text,
-        metadata_filter
+        "Searching with query: %s, where: %s %s",
+        query.text, plan.where.sql, plan.where.params
     )
     
-    # Build query kwargs dynamically to avoid passing an *empty* ``where``
-    # dict – newer Chroma versions treat an empty filter as invalid and
-    # raise "Expected where to have exactly one operator".
-    query_kwargs: dict[str, Any] = {
-        "n_results": limit,
-        "include": ["metadatas", "distances"],
-    }
-    if metadata_filter:
-        query_kwargs["where"] = (
-            metadata_filter
-            if len(metadata_filter) == 1
-            else {"$and": [{k: v} for k, v in metadata_filter.items()]}
-        )
-        
-        # Debug log the actual where filter being sent to Chroma
-        logger.info(
-            "Chroma where filter: %s", 
-            query_kwargs.get("where")
-        )
-    
-    # Then do the actual search with filters applied
+    # Single pass: one embedding, one hybrid ranking, one aggregate query
     try:
-        results = search_articles(
+        filtered_results, aggregates = _run_search(
             query.text,
-            top_k=limit,
-            metadata_filter=metadata_filter,
+            plan,
+            limit,
+            include_vectors=cluster_id is not None,
+            timings=timings,
         )
-        # Log the number of results after filtering
         logger.info(
-            "Found %d results after applying metadata filters", 
-            len(results)
+            "Found %d results after applying constraints",
+            len(filtered_results)
         )
     except Exception as exc:
         logger.error("Error executing search: %s", exc)
-        results = []
-    
-    # Post-process for advanced filtering
-    filtered_results = []
-    for result in results:
-        # Apply constraints that ChromaDB doesn't support natively
-        if _passes_advanced_constraints(result, query.constraints):
-            filtered_results.append(result)
-    
-    # Log the number of results after advanced filtering
-    logger.info(
-        "Found %d results after applying advanced constraints", 
-        len(filtered_results)
-    )
+        filtered_results = []
+        aggregates = _empty_aggregates()
     
     # Apply pipe operations immediately after filtering but before clustering or other processing
     if pipe_ops:
@@ -189,10 +169,11 @@ def execute_query(query: Query, top_k: int = 100) -> Dict[str, Any]:
             "Applying %d pipe operations", 
             len(pipe_ops)
         )
-        filtered_results = apply_pipe_operations(
-            filtered_results, 
-            pipe_ops
-        )
+        with _stage(timings, "pipe"):
+            filtered_results = apply_pipe_operations(
+                filtered_results, 
+                pipe_ops
+            )
         logger.info(
             "After pipe operations: %d results", 
             len(filtered_results)
@@ -203,16 +184,16 @@ def execute_query(query: Query, top_k: int = 100) -> Dict[str, Any]:
     if cluster_id is not None:
         try:
             from sklearn.cluster import MiniBatchKMeans
+            import numpy as np
             
-            # Extract vectors from the results - may return None
-            vectors = _extract_vectors_from_results(filtered_results)
+            vectors = [r.pop("_vector", None) for r in filtered_results]
             
-            # Only proceed if we got actual vectors back
-            if vectors is not None and len(vectors) > 0:
+            # Only proceed if every result came back with its vector
+            if vectors and all(v is not None for v in vectors):
                 # Cluster the vectors
                 n_clusters = max(2, min(10, len(vectors)))
                 km = MiniBatchKMeans(n_clusters=n_clusters, random_state=42)
-                clusters = km.fit_predict(vectors)
+                clusters = km.fit_predict(np.vstack(vectors))
                 
                 # Filter by cluster
                 cluster_results = []
@@ -229,11 +210,13 @@ def execute_query(query: Query, top_k: int = 100) -> Dict[str, Any]:
                 )
         except Exception as exc:
             logger.error("Clustering failed: %s", exc)
+        finally:
+            for result in filtered_results:
+                result.pop("_vector", None)
     
-    # Compute facets for both unfiltered and filtered results
-    unfiltered_facets = _compute_facets(full_results)
-    filtered_facets = _compute_facets(filtered_results)
-    _, timeline = _compute_facets_and_timeline(filtered_results)
+    unfiltered_facets = aggregates["facets"]
+    filtered_facets = aggregates["filtered_facets"]
+    timeline = aggregates["timeline"]
     
     # Apply sorting if requested
     if sort_field:
@@ -377,8 +360,8 @@ def execute_query(query: Query, top_k: int = 100) -> Dict[str, Any]:
     
     # Calculate impact statistics to show the effect of filters
     comparison = {
-        "total_before": len(full_results),
-        "total_after": len(filtered_results),
+        "total_before": aggregates["total"],
+        "total_after": aggregates["matching"],
         "facet_impact": {}
     }
     
@@ -407,202 +390,157 @@ def execute_query(query: Query, top_k: int = 100) -> Dict[str, Any]:
     }
 
 
-def _passes_advanced_constraints(
-    result: Dict[str, Any], 
-    constraints: List[Constraint]
-) -> bool:
-    """Check if a result passes advanced constraints not handled by ChromaDB.
-    
-    Args:
-        result: The search result to check
-        constraints: The list of constraints to apply
-        
-    Returns:
-        True if the result passes all constraints, False otherwise
-    """
-    metadata = result.get("metadata", {})
-    
-    for constraint in constraints:
-        field_value = metadata.get(constraint.field)
-        
-        # Skip constraints that were already handled by ChromaDB
-        if constraint.operator == '=':
-            continue
-        
-        # Handle existence check (has:field) operator
-        if constraint.operator == 'exists':
-            # Log for debugging
-            logger.info(
-                "Existence check for field %s: exists=%s, value=%s", 
-                constraint.field, 
-                field_value is not None, 
-                field_value
-            )
-            
-            # True means field must exist; False means field must not exist
-            if constraint.value:
-                # Field must exist and have a non-empty value
-                if field_value is None or field_value == '':
-                    return False
-            else:
-                # Field must not exist
-                if field_value is not None and field_value != '':
-                    return False
-            continue
-        
-        # Skip if field doesn't exist in the result
-        if field_value is None:
-            continue
-        
-        # Handle comparison operators
-        if constraint.operator == '!=':
-            if field_value == constraint.value:
-                return False
-        elif constraint.operator == '>':
-            try:
-                if not float(field_value) > float(constraint.value):
-                    return False
-            except (ValueError, TypeError):
-                return False
-        elif constraint.operator == '>=':
-            try:
-                if not float(field_value) >= float(constraint.value):
-                    return False
-            except (ValueError, TypeError):
-                return False
-        elif constraint.operator == '<':
-            try:
-                if not float(field_value) < float(constraint.value):
-                    return False
-            except (ValueError, TypeError):
-                return False
-        elif constraint.operator == '<=':
-            try:
-                if not float(field_value) <= float(constraint.value):
-                    return False
-            except (ValueError, TypeError):
-                return False
-        elif constraint.operator == 'range':
-            try:
-                value = float(field_value)
-                min_val = float(constraint.value.get("min", 0))
-                max_val = float(constraint.value.get("max", float('inf')))
-                if not (min_val <= value <= max_val):
-                    return False
-            except (ValueError, TypeError, AttributeError):
-                return False
-        elif constraint.operator == 'in':
-            if field_value not in constraint.value:
-                return False
-    
-    return True
+def _empty_aggregates() -> Dict[str, Any]:
+    return {
+        "facets": {},
+        "filtered_facets": {},
+        "timeline": {},
+        "total": 0,
+        "matching": 0,
+    }
 
 
-def _compute_facets(
-    results: List[Dict[str, Any]]
-) -> Dict[str, Dict[str, int]]:
-    """Compute facets from search results.
+def _run_search(
+    text_query: str,
+    plan: QueryPlan,
+    limit: int,
+    include_vectors: bool = False,
+    timings: Optional[Dict[str, float]] = None,
+) -> tuple:
+    """Run the ranked search and the facet aggregate for a compiled query.
+    
+    Free text is ranked by hybrid retrieval (full-text and vector candidates
+    fused by reciprocal rank, see app.services.hybrid_search), with the
+    compiled constraints applied in SQL on both sides; without free text,
+    results are ordered by publication date. Facets, filtered facets and the
+    timeline come from one GROUPING SETS aggregate.
     
     Args:
-        results: The search results
+        text_query: Free-text part of the query
+        plan: Compiled constraints and facet query
+        limit: Maximum number of results
+        include_vectors: Attach each embedding as ``_vector`` (for cluster:)
+        timings: Optional dict that receives per-stage timings in ms
         
     Returns:
-        A dict of facets
+        A tuple of (results, aggregates)
     """
-    from collections import Counter, defaultdict
+    from sqlalchemy import text
+    from app.database import get_database_instance
+    from app.services.hybrid_search import hybrid_search_articles
     
-    facets = defaultdict(Counter)
+    where = plan.where
+    # Same article set as the facet aggregate (and every result has a vector for cluster:)
+    where_sql = f"{SEARCHABLE_SQL} AND ({where.sql})"
     
-    for result in results:
-        metadata = result.get("metadata", {})
+    db = get_database_instance()
+    conn = db._temp_get_connection()
+    try:
+        if text_query.strip():
+            with _stage(timings, "search"):
+                hits = hybrid_search_articles(
+                    text_query,
+                    top_k=limit,
+                    where=text(where_sql).bindparams(**where.params),
+                    db=db,
+                )
+            rows = [
+                {**hit["metadata"], "id": hit["id"], "score": hit["score"]}
+                for hit in hits
+            ]
+        else:
+            search_stmt = text(f"""
+                SELECT
+                    uri AS id,
+                    0.0 AS score,
+                    {", ".join(RESULT_FIELDS)}
+                FROM articles
+                WHERE {where_sql}
+                ORDER BY publication_date DESC NULLS LAST
+                LIMIT :limit
+            """)
+            with _stage(timings, "search"):
+                rows = conn.execute(search_stmt, {**where.params, "limit": limit}).mappings().all()
         
-        # Compute facets - always include these fields
-        for field in (
-            "topic", "category", "news_source", "driver_type", "sentiment"
-        ):
-            val = metadata.get(field)
-            if val:
-                facets[field][str(val)] += 1
+        vectors = {}
+        if include_vectors and rows:
+            with _stage(timings, "vectors"):
+                vectors = dict(conn.execute(
+                    text("SELECT uri, vector_send(embedding) AS vector FROM articles WHERE uri = ANY(:uris)"),
+                    {"uris": [row["id"] for row in rows]},
+                ).fetchall())
+        with _stage(timings, "aggregate"):
+            facet_rows = conn.execute(text(plan.facet_sql), where.params).mappings().all()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    
+    results = []
+    for row in rows:
+        metadata = {field: row.get(field) for field in RESULT_FIELDS}
+        metadata["uri"] = row["id"]
+        result = {
+            "id": row["id"],
+            "score": float(row["score"]),
+            "metadata": metadata,
+        }
+        if include_vectors:
+            result["_vector"] = _decode_vector_send(vectors.get(row["id"]))
+        results.append(result)
     
-    return dict(facets)
+    return results, _collect_aggregates(facet_rows)
 
 
-def _compute_facets_and_timeline(
-    results: List[Dict[str, Any]]
-) -> tuple:
-    """Compute facets and timeline from search results.
+def _decode_vector_send(buf) -> Optional[Any]:
+    """Decode a pgvector ``vector_send`` value into a float32 array."""
+    import numpy as np
     
-    Args:
-        results: The search results
-        
-    Returns:
-        A tuple of (facets, timeline)
-    """
+    if buf is None:
+        return None
+    buf = bytes(buf)
+    dim = int.from_bytes(buf[:2], "big")
+    return np.frombuffer(buf, dtype=">f4", count=dim, offset=4).astype(np.float32)
+
+
+def _collect_aggregates(rows) -> Dict[str, Any]:
+    """Fold GROUPING SETS rows into facets, filtered facets and timeline."""
     from collections import Counter, defaultdict
-    from datetime import datetime
+    from datetime import date
     
+    aggregates = _empty_aggregates()
     facets = defaultdict(Counter)
+    filtered_facets = defaultdict(Counter)
     timeline = defaultdict(Counter)
     
-    for result in results:
-        metadata = result.get("metadata", {})
-        
-        # Compute facets - always include these fields even if filtered
-        for field in (
-            "topic", "category", "news_source", "driver_type", "sentiment"
-        ):
-            val = metadata.get(field)
-            if val:
-                facets[field][str(val)] += 1
+    for row in rows:
+        total = int(row["total"] or 0)
+        matching = int(row["matching"] or 0)
         
-        # Compute timeline
-        pub_date = metadata.get("publication_date")
-        if pub_date:
+        if all(row[f"g_{f}"] for f in FACET_FIELDS) and row["g_day"]:
+            # Empty grouping set: overall totals
+            aggregates["total"] = total
+            aggregates["matching"] = matching
+        elif not row["g_day"]:
+            # (category, day) grouping set
+            day = row["day"]
+            if not matching or not day:
+                continue
             try:
-                date_obj = datetime.fromisoformat(str(pub_date))
-                date_bucket = date_obj.date().isoformat()
-                category = metadata.get("category", "Uncategorized")
-                timeline[category][date_bucket] += 1
-            except Exception:
-                pass
-    
-    return dict(facets), dict(timeline)
-
-
-def _extract_vectors_from_results(
-    results: List[Dict[str, Any]]
-) -> Optional[List[List[float]]]:
-    """Extract embedding vectors from search results.
-    
-    Gets the actual embeddings from ChromaDB for the result IDs.
-    
-    Args:
-        results: The search results
-        
-    Returns:
-        A list of embedding vectors or None if not available
-    """
-    # No results means no vectors
-    if not results:
-        return None
-    
-    try:
-        from app.vector_store import _get_collection
-        
-        # Extract IDs from results
-        ids = [result["id"] for result in results]
-        
-        # Fetch embeddings from ChromaDB
-        collection = _get_collection()
-        response = collection.get(
-            ids=ids,
-            include=["embeddings"]
-        )
-        
-        if response and "embeddings" in response and response["embeddings"]:
-            return response["embeddings"]
-    
-    except Exception as exc:
-        logger.error("Failed to extract vectors: %s", exc)
-    
-    return None 
\ No newline at end of file
+                bucket = date.fromisoformat(day).isoformat()
+            except ValueError:
+                continue
+            timeline[row["category"] or "Uncategorized"][bucket] += matching
+        else:
+            for f in FACET_FIELDS:
+                value = row[f]
+                if not row[f"g_{f}"] and value:
+                    facets[f][str(value)] += total
+                    if matching:
+                        filtered_facets[f][str(value)] += matching
+                    break
+    
+    aggregates["facets"] = {f: dict(c) for f, c in facets.items()}
+    aggregates["filtered_facets"] = {f: dict(c) for f, c in filtered_facets.items()}
+    aggregates["timeline"] = {k: dict(c) for k, c in timeline.items()}
+    return aggregates
@@ -3,7 +3,10 @@
 This module handles tokenizing and parsing of query strings into structured Query objects.
 """
 
+import copy
+import os
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
@@ -41,6 +44,7 @@ class Constraint:
     field: str
     operator: str
     value: Any
+    negated: bool = False
 
 
 @dataclass
@@ -98,6 +102,17 @@ TOKEN_PATTERNS = [
 ]
 
 
+# All token patterns combined into one compiled alternation. Alternatives are
+# tried in TOKEN_PATTERNS order at each position, so the first pattern that
+# matches wins exactly as when the patterns were tried one by one.
+_MASTER_PATTERN = re.compile(
+    '|'.join(f'(?P<{token_type}>{pattern})' for pattern, token_type in TOKEN_PATTERNS)
+)
+
+# Maximum number of distinct query strings kept by parse_query_cached
+PARSE_CACHE_SIZE = int(os.getenv("KISSQL_PARSE_CACHE_SIZE", "512"))
+
+
 def tokenize(query: str) -> List[Token]:
     """Tokenize a query string into individual tokens.
     
@@ -109,23 +124,20 @@ def tokenize(query: str) -> List[Token]:
     """
     tokens = []
     position = 0
+    match_at = _MASTER_PATTERN.match
     
     while position < len(query):
-        match = None
-        for pattern, token_type in TOKEN_PATTERNS:
-            regex = re.compile(pattern)
-            match = regex.match(query, position)
-            if match:
-                if token_type != 'WHITESPACE':  # Skip whitespace
-                    tokens.append(Token(
-                        type=token_type,
-                        value=match.group(0),
-                        position=position
-                    ))
-                position = match.end()
-                break
-        
-        if not match:
+        match = match_at(query, position)
+        if match:
+            token_type = match.lastgroup
+            if token_type != 'WHITESPACE':  # Skip whitespace
+                tokens.append(Token(
+                    type=token_type,
+                    value=match.group(0),
+                    position=position
+                ))
+            position = match.end()
+        else:
             # Skip unrecognized character
             position += 1
     
@@ -270,8 +282,12 @@ def parse_full_query(query_string: str) -> Query:
     tokens = tokenize(query_string)
     query = Query(text="")
     text_parts = []
+    # Index in text_parts of a NOT that may apply to the next constraint
+    pending_not = None
     
     for token in tokens:
+        constraint_count = len(query.constraints)
+        
         if token.type == 'WORD':
             text_parts.append(token.value)
         elif token.type == 'EXACT_PHRASE':
@@ -430,8 +446,61 @@ def parse_full_query(query_string: str) -> Query:
                 query.meta_controls.append(
                     MetaControl(name='cluster', value=str(cluster_id))
                 )
+        
+        # NOT directly before a constraint negates it instead of being
+        # passed through as search text
+        if token.type == 'LOGIC_NOT':
+            pending_not = len(text_parts) - 1
+        elif pending_not is not None:
+            if len(query.constraints) > constraint_count:
+                query.constraints[-1].negated = True
+                del text_parts[pending_not]
+            pending_not = None
     
     # Set the query text
     query.text = ' '.join(text_parts)
     
-    return query 
\ No newline at end of file
+    return query
+
+
+def normalize_query(query_string: str) -> str:
+    """Collapse whitespace outside double-quoted phrases.
+    
+    Equivalent queries that differ only in spacing share a cache entry.
+    """
+    parts = re.split(r'("[^"]*")', query_string.strip())
+    return ''.join(
+        part if part.startswith('"') else re.sub(r'\s+', ' ', part)
+        for part in parts
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_normalized(normalized: str) -> Query:
+    return parse_full_query(normalized)
+
+
+def parse_query_cached(query_string: str) -> Query:
+    """Parse a query string, reusing the result for repeated queries.
+    
+    Parsed queries are cached by normalized query text. A copy is returned
+    because callers add constraints and meta controls to the Query.
+    
+    Args:
+        query_string: The query string to parse
+        
+    Returns:
+        A Query object representing the parsed query
+    """
+    return copy.deepcopy(_parse_normalized(normalize_query(query_string)))
+
+
+def parse_cache_info() -> Dict[str, int]:
+    """Return hit/miss statistics for parse_query_cached."""
+    info = _parse_normalized.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
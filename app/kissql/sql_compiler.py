@@ -0,0 +1,216 @@
+"""KISSQL to SQL compiler.
+
+This module translates parsed KISSQL constraints into a parameterised WHERE
+clause over the ``articles`` table, and builds the aggregate query that
+computes facets and the timeline in SQL.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from app.kissql.parser import Constraint
+
+
+# KISSQL field aliases -> articles columns
+FIELD_ALIASES = {
+    "source": "news_source",
+    "date": "publication_date",
+}
+
+# Text columns on ``articles`` that constraints may reference
+TEXT_FIELDS = {
+    "uri", "title", "news_source", "publication_date", "submission_date",
+    "summary", "category", "future_signal", "sentiment", "time_to_impact",
+    "tags", "driver_type", "topic", "bias", "factual_reporting",
+    "mbfc_credibility_rating", "bias_source", "bias_country", "press_freedom",
+    "media_type", "popularity", "extracted_article_topics",
+    "extracted_article_keywords", "ingest_status",
+}
+
+# Numeric columns, compared as numbers rather than strings
+NUMERIC_FIELDS = {
+    "topic_alignment_score", "keyword_relevance_score", "confidence_score",
+    "quality_score",
+}
+
+# Fields returned as facets, in display order
+FACET_FIELDS = ("topic", "category", "news_source", "driver_type", "sentiment")
+
+# Articles a query ranges over; results, facets, totals and the timeline all
+# use it so their counts agree
+SEARCHABLE_SQL = "embedding IS NOT NULL"
+
+# Day bucket for the timeline (publication dates are ISO strings)
+TIMELINE_DAY = "SUBSTR(publication_date, 1, 10)"
+
+# Maximum number of distinct constraint sets kept by compile_plan
+PLAN_CACHE_SIZE = int(os.getenv("KISSQL_PLAN_CACHE_SIZE", "512"))
+
+
+class KissqlCompileError(ValueError):
+    """Raised when a constraint cannot be expressed over ``articles``."""
+
+
+@dataclass
+class CompiledWhere:
+    """A WHERE clause fragment and its bind parameters."""
+
+    sql: str = "TRUE"
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+def _column(name: str) -> str:
+    column = FIELD_ALIASES.get(name.lower(), name.lower())
+    if column not in TEXT_FIELDS and column not in NUMERIC_FIELDS:
+        raise KissqlCompileError(f"Unknown field: {name}")
+    return column
+
+
+def _coerce(value: Any, numeric: bool) -> Any:
+    if isinstance(value, str):
+        # Quoted values keep their quotes in some token types
+        value = value.strip('"\'')
+    if not numeric:
+        return str(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise KissqlCompileError(f"Expected a number, got {value!r}")
+
+
+def compile_constraint(constraint: Constraint, params: Dict[str, Any]) -> str:
+    """Compile one constraint to SQL, adding its bind values to ``params``.
+
+    Comparisons on text columns are string comparisons, which order ISO
+    dates correctly. A range on a text column matches values starting
+    between the bounds, so ``publication_date=2023..2024`` covers both
+    years. ``!=`` matches rows where the field is missing.
+    """
+    column = _column(constraint.field)
+    numeric = column in NUMERIC_FIELDS
+    operator = constraint.operator
+    value = constraint.value
+
+    def bind(raw: Any) -> str:
+        name = f"k{len(params)}"
+        params[name] = _coerce(raw, numeric)
+        return f":{name}"
+
+    if operator == "=":
+        expr = f"{column} = {bind(value)}"
+    elif operator == "!=":
+        expr = f"({column} IS NULL OR {column} <> {bind(value)})"
+    elif operator in (">", ">=", "<", "<="):
+        expr = f"{column} {operator} {bind(value)}"
+    elif operator == "range":
+        low, high = value.get("min"), value.get("max")
+        if numeric:
+            expr = f"{column} BETWEEN {bind(low)} AND {bind(high)}"
+        else:
+            expr = f"({column} >= {bind(low)} AND {column} < {bind(int(high) + 1)})"
+    elif operator == "in":
+        if not value:
+            raise KissqlCompileError(f"Empty in() list for {constraint.field}")
+        expr = f"{column} IN ({', '.join(bind(v) for v in value)})"
+    elif operator == "exists":
+        present = f"{column} IS NOT NULL" if numeric else f"({column} IS NOT NULL AND {column} <> '')"
+        expr = present if value else f"NOT {present}"
+    else:
+        raise KissqlCompileError(f"Unsupported operator: {operator}")
+
+    if getattr(constraint, "negated", False):
+        # NULL comparisons must count as "not matching" before negation
+        expr = f"NOT COALESCE({expr}, FALSE)"
+    return expr
+
+
+def compile_where(constraints: List[Constraint]) -> CompiledWhere:
+    """Compile all constraints into a single AND-ed WHERE fragment.
+
+    Args:
+        constraints: Parsed KISSQL constraints
+
+    Returns:
+        CompiledWhere; ``sql`` is ``TRUE`` when there are no constraints
+
+    Raises:
+        KissqlCompileError: for unknown fields or unsupported operators
+    """
+    compiled = CompiledWhere()
+    clauses = [compile_constraint(c, compiled.params) for c in constraints]
+    if clauses:
+        compiled.sql = " AND ".join(clauses)
+    return compiled
+
+
+def build_facet_query(where: CompiledWhere) -> str:
+    """Build the aggregate query for facets, filtered facets and timeline.
+
+    One GROUPING SETS pass over all embedded articles returns, per facet
+    value and per (category, day), both the total count and the count
+    matching ``where``. The empty grouping set carries the overall totals.
+    """
+    grouping_sets = ", ".join(f"({f})" for f in FACET_FIELDS)
+    groupings = ", ".join(f"GROUPING({f}) AS g_{f}" for f in FACET_FIELDS)
+    return f"""
+        SELECT
+            {", ".join(FACET_FIELDS)},
+            {TIMELINE_DAY} AS day,
+            {groupings},
+            GROUPING({TIMELINE_DAY}) AS g_day,
+            COUNT(*) AS total,
+            SUM(CASE WHEN {where.sql} THEN 1 ELSE 0 END) AS matching
+        FROM articles
+        WHERE {SEARCHABLE_SQL}
+        GROUP BY GROUPING SETS ({grouping_sets}, (category, {TIMELINE_DAY}), ())
+    """
+
+
+@dataclass
+class QueryPlan:
+    """Compiled SQL for a set of constraints."""
+
+    where: CompiledWhere
+    facet_sql: str
+
+
+def _plan_key(constraints: List[Constraint]) -> Tuple:
+    return tuple(
+        (c.field, c.operator, json.dumps(c.value, sort_keys=True, default=str), bool(c.negated))
+        for c in constraints
+    )
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile_plan(key: Tuple) -> QueryPlan:
+    constraints = [
+        Constraint(field=f, operator=op, value=json.loads(value), negated=negated)
+        for f, op, value, negated in key
+    ]
+    where = compile_where(constraints)
+    return QueryPlan(where=where, facet_sql=build_facet_query(where))
+
+
+def compile_plan(constraints: List[Constraint]) -> QueryPlan:
+    """Return the compiled plan for ``constraints``, cached by their content.
+
+    The returned plan is shared between callers and must not be modified.
+
+    Raises:
+        KissqlCompileError: for unknown fields or unsupported operators
+    """
+    return _compile_plan(_plan_key(constraints))
+
+
+def plan_cache_info() -> Dict[str, int]:
+    """Return hit/miss statistics for compile_plan."""
+    info = _compile_plan.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
@@ -31,6 +31,7 @@ import importlib
 from app.ai_models import get_ai_model, get_available_models, ai_get_available_models
 from app.bulk_research import BulkResearch
 from app.config.config import load_config, get_topic_config, get_news_query, set_news_query, get_paper_query, set_paper_query, load_news_monitoring, save_news_monitoring
+from app.services.ontology_registry import invalidate_topic
 import os
 from dotenv import load_dotenv
 from app.collectors.collector_factory import CollectorFactory
@@ -873,6 +874,8 @@ async def search_articles(
     page: int = Query(1),
     per_page: int = Query(10),
     date_type: str = Query('publication'),  # Default to 'publication'
+    cursor: Optional[str] = Query(None, description="Keyset pagination: next_cursor of the previous page ('' for the first page); page is ignored"),
+    count: Optional[str] = Query('exact', description="Total count: exact, estimated or none (keyset pagination only)"),
     session=Depends(verify_session)  # Add authentication
 ):
     pub_date_start, pub_date_end = None, None
@@ -891,6 +894,32 @@ async def search_articles(
     date_field = 'publication_date' if date_type == 'publication' else 'submission_date'
     
     tags_list = tags.split(',') if tags else None
+
+    if cursor is not None:
+        # Keyset pagination: pages never slow down with depth
+        if count not in ('exact', 'estimated', 'none'):
+            raise HTTPException(status_code=400, detail="count must be exact, estimated or none")
+        try:
+            result = db.facade.search_articles_page(
+                cursor=cursor or None,
+                per_page=per_page,
+                count=None if count == 'none' else count,
+                projection='analysis',
+                topic=topic,
+                category=category,
+                future_signal=future_signal,
+                sentiment=sentiment,
+                tags=tags_list,
+                keyword=keyword,
+                date_field=date_field,
+                pub_date_start=pub_date_start,
+                pub_date_end=pub_date_end
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        result["per_page"] = per_page
+        return JSONResponse(content=result)
+
     articles, total_count = db.search_articles(
         topic=topic,  # Add topic parameter
         category=category,
@@ -1600,6 +1629,7 @@ async def create_topic(topic_data: dict):
         # Save updated config
         with open(config_path, 'w') as f:
             json.dump(config, f, indent=2)
+        invalidate_topic(topic_data['name'])
         
         # ADD THIS SECTION only - for news_monitoring.json update
         news_monitoring_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
@@ -1837,6 +1867,7 @@ async def delete_topic(topic_id: str, delete_articles: bool = Body(False)):
         # Save updated config
         with open(config_path, 'w') as f:
             json.dump(config, f, indent=2)
+        invalidate_topic(topic_id)
         
         # ADD THIS SECTION only - for news_monitoring.json update
         news_monitoring_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
@@ -1,11 +1,14 @@
 """Media bias database models and import functions."""
 
+import bisect
 import csv
 import logging
 import os
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import sqlite3
+import threading
+import weakref
 from urllib.parse import urlparse
 
 from app.database import Database
@@ -114,6 +117,245 @@ def domains_match(source_domain, target_domain):
 
     return False
 
+
+class DomainIndex:
+    """Precomputed lookup structure equivalent to scanning sources with domains_match().
+
+    Every key maps to a sorted list of source positions so the earliest
+    matching source (the one a linear scan would have returned first) is
+    always at index 0, and sources can be added or removed without a rebuild.
+
+    Indexes:
+        exact:   normalized domain -> positions
+        subtree: reversed-label trie, flattened so each node is keyed by its
+                 label suffix (e.g. "uk", "co.uk", "bbc.co.uk"); a node holds
+                 every source at or below it
+        root:    last two labels (e.g. "example.com") -> positions
+        label:   second-to-last label of multi-label domains, for TLD-less lookups
+    """
+
+    def __init__(self):
+        self._exact: Dict[str, List[int]] = {}
+        self._subtree: Dict[str, List[int]] = {}
+        self._root: Dict[str, List[int]] = {}
+        self._label: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def _keys(domain: str):
+        parts = domain.split('.')
+        suffixes = ['.'.join(parts[i:]) for i in range(len(parts))]
+        root = '.'.join(parts[-2:]) if len(parts) >= 2 else domain
+        label = parts[-2] if len(parts) >= 2 else None
+        return suffixes, root, label
+
+    @staticmethod
+    def _insert(index: Dict[str, List[int]], key: str, position: int) -> None:
+        bisect.insort(index.setdefault(key, []), position)
+
+    @staticmethod
+    def _discard(index: Dict[str, List[int]], key: str, position: int) -> None:
+        positions = index.get(key)
+        if not positions:
+            return
+        i = bisect.bisect_left(positions, position)
+        if i < len(positions) and positions[i] == position:
+            del positions[i]
+        if not positions:
+            del index[key]
+
+    def add(self, domain: str, position: int) -> None:
+        """Index a normalized domain under the given source position."""
+        if not domain:
+            return
+        suffixes, root, label = self._keys(domain)
+        self._insert(self._exact, domain, position)
+        for suffix in suffixes:
+            self._insert(self._subtree, suffix, position)
+        self._insert(self._root, root, position)
+        if label is not None:
+            self._insert(self._label, label, position)
+
+    def remove(self, domain: str, position: int) -> None:
+        """Remove a previously indexed domain/position pair."""
+        if not domain:
+            return
+        suffixes, root, label = self._keys(domain)
+        self._discard(self._exact, domain, position)
+        for suffix in suffixes:
+            self._discard(self._subtree, suffix, position)
+        self._discard(self._root, root, position)
+        if label is not None:
+            self._discard(self._label, label, position)
+
+    def find_exact(self, domain: str) -> Optional[int]:
+        """Return the first source position whose domain equals ``domain``."""
+        positions = self._exact.get(domain)
+        return positions[0] if positions else None
+
+    def find_match(self, domain: str) -> Optional[int]:
+        """Return the first source position for which domains_match() holds."""
+        if not domain:
+            return None
+
+        parts = domain.split('.')
+        suffixes, root, _ = self._keys(domain)
+        candidates = [
+            self._subtree.get(domain),  # equal, or source is a subdomain of domain
+            self._root.get(root),       # same root domain
+        ]
+        # domain is a subdomain of the source
+        candidates.extend(self._exact.get(suffix) for suffix in suffixes[1:])
+        if len(parts) == 1:
+            # domain has no TLD, source does
+            candidates.append(self._label.get(domain))
+        else:
+            # source has no TLD, domain does
+            candidates.append(self._exact.get(parts[-2]))
+
+        firsts = [positions[0] for positions in candidates if positions]
+        return min(firsts) if firsts else None
+
+
+class _SourceIndex:
+    """Media bias sources plus the domain indexes built over them.
+
+    One instance per database is shared by every MediaBias object (see
+    _shared_source_index) so per-article MediaBias(db) construction does not
+    reload and reindex the whole table. Mutations take the instance lock.
+    """
+
+    def __init__(self, sources: List[Dict[str, Any]]):
+        self.lock = threading.RLock()
+        self.sources = sources
+        self._build()
+
+    def _build(self):
+        """Build domain lookup indexes over self.sources.
+
+        Positions follow the order of self.sources so lookups return the same
+        source a linear scan would.
+        """
+        self.by_position: Dict[int, Dict[str, Any]] = {}
+        self.domains: Dict[int, str] = {}
+        self.position_by_id: Dict[Any, int] = {}
+        self.position_by_source: Dict[str, int] = {}
+        self.enabled_index = DomainIndex()
+        self.all_index = DomainIndex()
+        self._next_position = 0
+
+        for source in self.sources:
+            self.index_source(source, append=False)
+
+    def find(self, normalized_source: str) -> Tuple[Optional[int], bool]:
+        """Return (position, enabled) of the best match, preferring enabled sources."""
+        position = self.enabled_index.find_exact(normalized_source)
+        if position is None:
+            position = self.enabled_index.find_match(normalized_source)
+        if position is not None:
+            return position, True
+
+        position = self.all_index.find_exact(normalized_source)
+        if position is None:
+            position = self.all_index.find_match(normalized_source)
+        return position, False
+
+    def enable(self, position: int) -> None:
+        with self.lock:
+            self.by_position[position]['enabled'] = 1
+            self.enabled_index.add(self.domains[position], position)
+
+    def index_source(self, source: Dict[str, Any], append: bool = True) -> None:
+        with self.lock:
+            position = self._next_position
+            self._next_position += 1
+            if append:
+                self.sources.append(source)
+
+            domain = normalize_domain(source.get('source', ''))
+            self.by_position[position] = source
+            self.domains[position] = domain
+            if source.get('id') is not None:
+                self.position_by_id[source['id']] = position
+            if source.get('source'):
+                self.position_by_source.setdefault(source['source'], position)
+
+            self.all_index.add(domain, position)
+            if source.get('enabled') == 1:
+                self.enabled_index.add(domain, position)
+
+    def unindex_source(self, position: int) -> Dict[str, Any]:
+        with self.lock:
+            source = self.by_position.pop(position)
+            domain = self.domains.pop(position)
+            self.all_index.remove(domain, position)
+            self.enabled_index.remove(domain, position)
+            if self.position_by_id.get(source.get('id')) == position:
+                del self.position_by_id[source['id']]
+            if self.position_by_source.get(source.get('source')) == position:
+                del self.position_by_source[source['source']]
+            self.sources = [s for s in self.sources if s is not source]
+            return source
+
+    def reindex_source(self, position: int, record: Dict[str, Any]) -> None:
+        """Replace the source at ``position`` in place, keeping its precedence."""
+        with self.lock:
+            source = self.by_position[position]
+            old_domain = self.domains[position]
+            self.all_index.remove(old_domain, position)
+            self.enabled_index.remove(old_domain, position)
+            if self.position_by_source.get(source.get('source')) == position:
+                del self.position_by_source[source['source']]
+
+            # Mutate the existing dict so self.sources keeps its order
+            source.update(record)
+            domain = normalize_domain(source.get('source', ''))
+            self.domains[position] = domain
+            if source.get('id') is not None:
+                self.position_by_id[source['id']] = position
+            self.position_by_source.setdefault(source['source'], position)
+
+            self.all_index.add(domain, position)
+            if source.get('enabled') == 1:
+                self.enabled_index.add(domain, position)
+
+
+# Shared per-database source indexes; dropped by invalidate_media_bias_index()
+_source_indexes: "weakref.WeakKeyDictionary[Database, _SourceIndex]" = weakref.WeakKeyDictionary()
+_source_indexes_lock = threading.Lock()
+
+
+def _load_sources(db: Database) -> List[Dict[str, Any]]:
+    """Load media bias sources from the database."""
+    try:
+        return [dict(row) for row in db.facade.load_media_bias_sources_from_database()]
+    except Exception as e:
+        logger.error(f"Error loading media bias sources: {e}")
+        return []
+
+
+def _shared_source_index(db: Database) -> _SourceIndex:
+    """Return the source index for ``db``, loading it on first use."""
+    with _source_indexes_lock:
+        index = _source_indexes.get(db)
+        if index is None:
+            index = _SourceIndex(_load_sources(db))
+            _source_indexes[db] = index
+            logger.info(f"Loaded {len(index.sources)} media bias sources")
+        return index
+
+
+def invalidate_media_bias_index(db: Optional[Database] = None) -> None:
+    """Drop the shared source index for ``db`` (or for every database).
+
+    The next MediaBias lookup reloads sources from the database.
+    """
+    with _source_indexes_lock:
+        if db is None:
+            _source_indexes.clear()
+        else:
+            _source_indexes.pop(db, None)
+
+
 class MediaBias:
     """Media bias data management and enrichment."""
     
@@ -121,8 +363,7 @@ class MediaBias:
         """Initialize with database connection."""
         self.db = db
         self.logger = logging.getLogger(__name__)
-        self.sources = self._load_sources()
-        logger.info(f"Loaded {len(self.sources)} media bias sources")
+        self._index = _shared_source_index(db)
         # Enable media bias enrichment by default
         self.set_enabled(True)
     
@@ -218,6 +459,7 @@ class MediaBias:
                         self.db.facade.update_media_bias_settings(file_path)
                             
                     logger.info(f"Imported {imported_count} sources, failed {failed_count}")
+                    self._reload()
                     return imported_count, failed_count
                     
                 except Exception as e:
@@ -317,6 +559,7 @@ class MediaBias:
         """
         try:
             self.db.facade.reset_media_bias_sources()
+            self._reload()
             return True
         except Exception as e:
             logger.error(f"Error resetting media bias data: {str(e)}")
@@ -342,61 +585,34 @@ class MediaBias:
         
         # Load sources if needed
         if not self.sources:
-            self.sources = self._load_sources()
+            self._reload()
         
         # Debug empty sources
         if not self.sources:
             self.logger.warning("No media bias sources loaded")
             return None
         
-        # First try an exact match on normalized source with enabled=1
-        for s in self.sources:
-            source_domain = normalize_domain(s.get('source', ''))
-            if source_domain == normalized_source:
-                # Check if source is enabled
-                if 'enabled' in s and s['enabled'] == 1:
-                    self.logger.debug(f"Found exact match for {normalized_source} using source {source_domain} (enabled)")
-                    return s
-        
-        # Then try domain matching with enabled=1
-        for s in self.sources:
-            source_domain = normalize_domain(s.get('source', ''))
-            if domains_match(source_domain, normalized_source):
-                # Check if source is enabled
-                if 'enabled' in s and s['enabled'] == 1:
-                    self.logger.debug(f"Found domain match for {normalized_source} using source {source_domain} (enabled)")
-                    return s
-        
-        # If no enabled sources found, try again with disabled ones
-        # First exact match with disabled sources
-        for s in self.sources:
-            source_domain = normalize_domain(s.get('source', ''))
-            if source_domain == normalized_source:
-                self.logger.debug(f"Found exact match for {normalized_source} using source {source_domain} (disabled)")
-                # Auto-enable this source for future requests
-                try:
-                    self.db.facade.enable_media_source(s.get('source'))
-                    # Update the current record
-                    s['enabled'] = 1
-                    self.logger.info(f"Auto-enabled media bias source: {s.get('source')}")
-                except Exception as e:
-                    self.logger.error(f"Error auto-enabling source {s.get('source')}: {e}")
-                return s
-                
-        # Then domain matching with disabled sources
-        for s in self.sources:
-            source_domain = normalize_domain(s.get('source', ''))
-            if domains_match(source_domain, normalized_source):
-                self.logger.debug(f"Found domain match for {normalized_source} using source {source_domain} (disabled)")
-                # Auto-enable this source for future requests
-                try:
-                    self.db.facade.enable_media_source(s.get('source'))
-                    # Update the current record
-                    s['enabled'] = 1
-                    self.logger.info(f"Auto-enabled media bias source: {s.get('source')}")
-                except Exception as e:
-                    self.logger.error(f"Error auto-enabling source {s.get('source')}: {e}")
-                return s
+        # Prefer enabled sources: exact match first, then domain match.
+        # If no enabled sources match, try again with disabled ones.
+        index = self._index
+        position, enabled = index.find(normalized_source)
+        if position is not None and enabled:
+            s = index.by_position[position]
+            self.logger.debug(f"Found match for {normalized_source} using source {s.get('source')} (enabled)")
+            return s
+
+        if position is not None:
+            s = index.by_position[position]
+            self.logger.debug(f"Found match for {normalized_source} using source {s.get('source')} (disabled)")
+            # Auto-enable this source for future requests
+            try:
+                self.db.facade.enable_media_source(s.get('source'))
+                # Update the shared record
+                index.enable(position)
+                self.logger.info(f"Auto-enabled media bias source: {s.get('source')}")
+            except Exception as e:
+                self.logger.error(f"Error auto-enabling source {s.get('source')}: {e}")
+            return s
 
         self.logger.debug(f"No match found for {normalized_source}")
         return None
@@ -502,6 +718,19 @@ class MediaBias:
 
             # Update last_updated in settings
             self.db.facade.update_media_bias_last_updated()
+
+            # insert_media_bias updates in place when the source already exists
+            record = self._source_record(source_data, source)
+            index = self._index
+            with index.lock:
+                position = index.position_by_source.get(source)
+                if position is not None:
+                    record['id'] = index.by_position[position].get('id')
+                    index.reindex_source(position, record)
+                else:
+                    record['id'] = source_id
+                    record['enabled'] = 1
+                    index.index_source(record)
             return source_id
 
         except Exception as e:
@@ -545,6 +774,16 @@ class MediaBias:
             # Update last_updated in settings
             self.db.facade.update_media_bias_last_updated()
 
+            record = self._source_record(source_data, source)
+            record['id'] = source_id
+            index = self._index
+            with index.lock:
+                position = index.position_by_id.get(source_id)
+                if position is not None:
+                    index.reindex_source(position, record)
+                else:
+                    index.index_source(record)
+
             return True
                 
         except Exception as e:
@@ -568,6 +807,12 @@ class MediaBias:
             # Delete the source
             self.db.facade.delete_media_bias_source(source_id)
 
+            index = self._index
+            with index.lock:
+                position = index.position_by_id.get(source_id)
+                if position is not None:
+                    index.unindex_source(position)
+
             # Update last_updated in settings
             # Return success if a row was affected
             return self.db.facade.update_media_bias_last_updated() > 0
@@ -625,10 +870,35 @@ class MediaBias:
             logger.error(f"Error getting filter options: {str(e)}")
             return {'biases': [], 'factual_levels': [], 'countries': []}
     
-    def _load_sources(self):
-        """Load media bias sources from the database."""
-        try:
-            return self.db.facade.load_media_bias_sources_from_database()
-        except Exception as e:
-            logger.error(f"Error loading media bias sources: {e}")
-            return [] 
\ No newline at end of file
+    @property
+    def sources(self) -> List[Dict[str, Any]]:
+        return self._index.sources
+
+    @property
+    def _enabled_index(self) -> DomainIndex:
+        return self._index.enabled_index
+
+    @property
+    def _all_index(self) -> DomainIndex:
+        return self._index.all_index
+
+    def _reload(self) -> None:
+        """Drop the shared index for this database and load it again."""
+        invalidate_media_bias_index(self.db)
+        self._index = _shared_source_index(self.db)
+
+    @staticmethod
+    def _source_record(source_data: Dict[str, Any], source: str) -> Dict[str, Any]:
+        """Build an in-memory source record from add/update form data."""
+        return {
+            'source': source,
+            'country': source_data.get('country', ''),
+            'bias': source_data.get('bias', ''),
+            'factual_reporting': source_data.get('factual_reporting', ''),
+            'press_freedom': source_data.get('press_freedom', ''),
+            'media_type': source_data.get('media_type', ''),
+            'popularity': source_data.get('popularity', ''),
+            'mbfc_credibility_rating': source_data.get('mbfc_credibility_rating', ''),
+            'enabled': source_data.get('enabled', 1),
+        }
+
@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from typing import Dict, List, Optional, Tuple
 from app.analyzers.prompt_templates import PromptTemplates, PromptTemplateError
 from app.ai_models import get_ai_model, LiteLLMModel
@@ -8,6 +9,15 @@ import litellm
 
 logger = logging.getLogger(__name__)
 
+# Batched relevance scoring: articles per request, approximate prompt token
+# budget per request, and content characters sent per article
+RELEVANCE_BATCH_SIZE = int(os.getenv("RELEVANCE_BATCH_SIZE", "10"))
+RELEVANCE_BATCH_TOKEN_BUDGET = int(os.getenv("RELEVANCE_BATCH_TOKEN_BUDGET", "6000"))
+RELEVANCE_BATCH_CONTENT_CHARS = int(os.getenv("RELEVANCE_BATCH_CONTENT_CHARS", "1500"))
+
+# Rough characters-per-token ratio used to size batches
+CHARS_PER_TOKEN = 4
+
 class RelevanceCalculatorError(Exception):
     """Custom exception for relevance calculation errors."""
     pass
@@ -18,6 +28,9 @@ class RelevanceCalculator:
         self.model_name = model_name
         self.ai_model = None
         self.prompt_templates = PromptTemplates()
+        # Counters for analyze_relevance_batch: LLM requests, items scored in a
+        # batch, and items re-scored individually
+        self.batch_stats = {"requests": 0, "batched": 0, "fallbacks": 0}
         
         if model_name:
             self._initialize_model(model_name)
@@ -142,6 +155,49 @@ class RelevanceCalculator:
             logger.error(f"Error extracting article keywords: {str(e)}")
             return []
 
+    def _generate(self, messages: List[Dict[str, str]]) -> str:
+        """Send messages to the model and return the response text."""
+        if hasattr(self.ai_model, 'generate_response'):
+            return self.ai_model.generate_response(messages)
+
+        # Fallback for older model interface
+        combined_prompt = f"{messages[0]['content']}\n\n{messages[1]['content']}"
+        response = self.ai_model.generate(combined_prompt)
+        if hasattr(response, 'message') and hasattr(response.message, 'content'):
+            return response.message.content
+        elif hasattr(response, 'content'):
+            return response.content
+        return str(response)
+
+    @staticmethod
+    def _validate_result(result: Dict) -> Dict:
+        """Normalize one parsed relevance result: defaults, clamped scores, combined score."""
+        validated_result = {
+            "topic_alignment_score": float(result.get("topic_alignment_score", 0.0)),
+            "keyword_relevance_score": float(result.get("keyword_relevance_score", 0.0)),
+            "overall_match_explanation": str(result.get("overall_match_explanation", "No explanation provided")),
+            "confidence_score": float(result.get("confidence_score", 0.0)),
+            "extracted_article_topics": result.get("extracted_article_topics", []),
+            "extracted_article_keywords": result.get("extracted_article_keywords", [])
+        }
+
+        # Ensure scores are within valid range [0.0, 1.0]
+        for score_field in ["topic_alignment_score", "keyword_relevance_score", "confidence_score"]:
+            score = validated_result[score_field]
+            validated_result[score_field] = max(0.0, min(1.0, score))
+
+        # Calculate combined relevance score (average of topic and keyword scores)
+        topic_score = validated_result["topic_alignment_score"]
+        keyword_score = validated_result["keyword_relevance_score"]
+        validated_result["relevance_score"] = (topic_score + keyword_score) / 2.0
+
+        # Ensure lists are actually lists
+        for list_field in ["extracted_article_topics", "extracted_article_keywords"]:
+            if not isinstance(validated_result[list_field], list):
+                validated_result[list_field] = []
+
+        return validated_result
+
     def analyze_relevance(self, title: str, source: str, content: str, topic: str, keywords: str, topic_description: str = None) -> Dict:
         """
         Perform comprehensive relevance analysis using the configured LLM model.
@@ -179,18 +235,7 @@ class RelevanceCalculator:
                 logger.debug(f"First message: {messages[0]}")
 
             # Generate response using the AI model
-            if hasattr(self.ai_model, 'generate_response'):
-                response_text = self.ai_model.generate_response(messages)
-            else:
-                # Fallback for older model interface
-                combined_prompt = f"{messages[0]['content']}\n\n{messages[1]['content']}"
-                response = self.ai_model.generate(combined_prompt)
-                if hasattr(response, 'message') and hasattr(response.message, 'content'):
-                    response_text = response.message.content
-                elif hasattr(response, 'content'):
-                    response_text = response.content
-                else:
-                    response_text = str(response)
+            response_text = self._generate(messages)
             
             # Parse the JSON response
             try:
@@ -207,30 +252,7 @@ class RelevanceCalculator:
                 json_str = response_text[start_idx:end_idx]
                 result = json.loads(json_str)
                 
-                # Validate required fields and provide defaults
-                validated_result = {
-                    "topic_alignment_score": float(result.get("topic_alignment_score", 0.0)),
-                    "keyword_relevance_score": float(result.get("keyword_relevance_score", 0.0)),
-                    "overall_match_explanation": str(result.get("overall_match_explanation", "No explanation provided")),
-                    "confidence_score": float(result.get("confidence_score", 0.0)),
-                    "extracted_article_topics": result.get("extracted_article_topics", []),
-                    "extracted_article_keywords": result.get("extracted_article_keywords", [])
-                }
-                
-                # Ensure scores are within valid range [0.0, 1.0]
-                for score_field in ["topic_alignment_score", "keyword_relevance_score", "confidence_score"]:
-                    score = validated_result[score_field]
-                    validated_result[score_field] = max(0.0, min(1.0, score))
-                
-                # Calculate combined relevance score (average of topic and keyword scores)
-                topic_score = validated_result["topic_alignment_score"]
-                keyword_score = validated_result["keyword_relevance_score"]
-                validated_result["relevance_score"] = (topic_score + keyword_score) / 2.0
-                
-                # Ensure lists are actually lists
-                for list_field in ["extracted_article_topics", "extracted_article_keywords"]:
-                    if not isinstance(validated_result[list_field], list):
-                        validated_result[list_field] = []
+                validated_result = self._validate_result(result)
                 
                 logger.info(f"Successfully analyzed relevance. Topic alignment: {validated_result['topic_alignment_score']:.2f}, "
                            f"Keyword relevance: {validated_result['keyword_relevance_score']:.2f}")
@@ -264,14 +286,176 @@ class RelevanceCalculator:
             # For non-fatal errors, wrap in RelevanceCalculatorError
             raise RelevanceCalculatorError(f"Relevance analysis failed: {str(e)}")
 
-    def analyze_articles_batch(self, articles: List[Dict], topic: str, keywords: str) -> List[Dict]:
+    def _pack_batches(self, records: List[Dict[str, str]], batch_size: int, token_budget: int) -> List[List[Dict[str, str]]]:
+        """Split compact article records into batches bounded by count and token budget."""
+        batches = []
+        current = []
+        current_tokens = 0
+        for record in records:
+            tokens = len(json.dumps(record, ensure_ascii=False)) // CHARS_PER_TOKEN + 1
+            if current and (len(current) >= batch_size or current_tokens + tokens > token_budget):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(record)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _parse_batch_response(response_text: str) -> Dict[str, Dict]:
+        """Parse a batched response into {id: raw result}; malformed items are skipped."""
+        response_text = (response_text or "").strip()
+        starts = [i for i in (response_text.find('{'), response_text.find('[')) if i != -1]
+        if not starts:
+            raise ValueError("No JSON found in batch response")
+        start_idx = min(starts)
+        end_idx = max(response_text.rfind('}'), response_text.rfind(']')) + 1
+        parsed = json.loads(response_text[start_idx:end_idx])
+
+        items = parsed.get("results", []) if isinstance(parsed, dict) else parsed
+        if not isinstance(items, list):
+            raise ValueError("Batch response has no results list")
+
+        results = {}
+        for item in items:
+            if isinstance(item, dict) and item.get("id") is not None:
+                results[str(item["id"])] = item
+        return results
+
+    @classmethod
+    def _validate_batch_item(cls, item: Dict) -> Dict:
+        """Validate one item of a batched response.
+
+        Unlike a single response, an item without both scores is rejected
+        rather than defaulted to 0, so it is re-scored on its own.
+
+        Raises:
+            ValueError: if a score is missing or not a number
+        """
+        for score_field in ("topic_alignment_score", "keyword_relevance_score"):
+            score = item.get(score_field)
+            if isinstance(score, bool) or not isinstance(score, (int, float)):
+                raise ValueError(f"Batch item {item.get('id')} has no numeric {score_field}")
+        return cls._validate_result(item)
+
+    def analyze_relevance_batch(
+        self,
+        articles: List[Dict],
+        topic: str,
+        keywords: str,
+        topic_description: str = None,
+        batch_size: int = None,
+        token_budget: int = None
+    ) -> List[Dict]:
+        """
+        Score several articles per LLM request.
+
+        Articles are packed into requests of at most ``batch_size`` items and
+        roughly ``token_budget`` prompt tokens, with content truncated to
+        RELEVANCE_BATCH_CONTENT_CHARS. Items the model drops, returns
+        malformed or without numeric topic and keyword scores, and every item
+        of a request that fails outright, are re-scored one at a time with
+        analyze_relevance.
+
+        Args:
+            articles: Dictionaries with 'title', 'source' (or 'news_source') and
+                'content' (or 'summary') keys
+            topic: Target topic for monitoring
+            keywords: Target keywords (comma-separated string)
+            topic_description: Optional detailed description of the topic
+            batch_size: Maximum articles per request (default RELEVANCE_BATCH_SIZE)
+            token_budget: Approximate prompt tokens per request
+                (default RELEVANCE_BATCH_TOKEN_BUDGET)
+
+        Returns:
+            Relevance results in the same order as ``articles``; None for an
+            article whose individual fallback also failed
+
+        Raises:
+            RelevanceCalculatorError: if no model is initialized
+            PipelineError: on fatal LLM errors
+        """
+        if not self.ai_model:
+            raise RelevanceCalculatorError("No AI model initialized for batch relevance analysis")
+
+        records = []
+        for i, article in enumerate(articles):
+            content = article.get('content') or article.get('summary') or ""
+            records.append({
+                "id": str(i),
+                "title": article.get('title') or "No title available",
+                "source": article.get('source') or article.get('news_source') or "Unknown source",
+                "content": content[:RELEVANCE_BATCH_CONTENT_CHARS] or "No content available"
+            })
+
+        batches = self._pack_batches(
+            records,
+            batch_size or RELEVANCE_BATCH_SIZE,
+            token_budget or RELEVANCE_BATCH_TOKEN_BUDGET
+        )
+        results: Dict[int, Dict] = {}
+
+        for batch in batches:
+            parsed = {}
+            try:
+                messages = self.prompt_templates.format_relevance_batch_prompt(
+                    articles=batch,
+                    topic=topic or "No topic specified",
+                    keywords=keywords or "No keywords specified",
+                    topic_description=topic_description or ""
+                )
+                parsed = self._parse_batch_response(self._generate(messages))
+            except PipelineError:
+                raise
+            except Exception as e:
+                logger.warning(f"Batched relevance request for {len(batch)} articles failed, scoring individually: {str(e)}")
+
+            for record in batch:
+                index = int(record["id"])
+                try:
+                    results[index] = self._validate_batch_item(parsed[record["id"]])
+                    self.batch_stats["batched"] += 1
+                    continue
+                except (KeyError, TypeError, ValueError):
+                    pass
+
+                # Dropped, malformed or unscored item: score it on its own
+                self.batch_stats["fallbacks"] += 1
+                article = articles[index]
+                try:
+                    results[index] = self.analyze_relevance(
+                        title=article.get('title', ''),
+                        source=article.get('source') or article.get('news_source', ''),
+                        content=article.get('content') or article.get('summary', ''),
+                        topic=topic,
+                        keywords=keywords,
+                        topic_description=topic_description
+                    )
+                except RelevanceCalculatorError as e:
+                    logger.error(f"Relevance analysis failed for article {index + 1}: {str(e)}")
+                    results[index] = None
+
+            self.batch_stats["requests"] += 1
+
+        logger.info(
+            f"Batched relevance analysis: {len(articles)} articles in {len(batches)} requests "
+            f"({self.batch_stats['fallbacks']} individual fallbacks so far)"
+        )
+        return [results[i] for i in range(len(articles))]
+
+    def analyze_articles_batch(self, articles: List[Dict], topic: str, keywords: str, topic_description: str = None) -> List[Dict]:
         """
         Analyze relevance for a batch of articles.
         
+        Articles are scored several per LLM request (see analyze_relevance_batch).
+        If batched scoring fails, each article is analyzed on its own.
+        
         Args:
             articles: List of article dictionaries with 'title', 'source', 'content', 'uri' keys
             topic: Target topic for monitoring
             keywords: Target keywords (comma-separated string)
+            topic_description: Optional detailed description of the topic
             
         Returns:
             List of dictionaries containing original article data plus relevance analysis
@@ -279,40 +463,51 @@ class RelevanceCalculator:
         if not self.ai_model:
             raise RelevanceCalculatorError("No AI model initialized for batch relevance analysis")
         
+        try:
+            relevance_results = self.analyze_relevance_batch(articles, topic, keywords, topic_description)
+        except PipelineError:
+            raise
+        except Exception as e:
+            logger.error(f"Batched relevance analysis failed, analyzing articles one by one: {str(e)}")
+            relevance_results = None
+        
         results = []
         
         for i, article in enumerate(articles):
-            try:
-                logger.info(f"Analyzing article {i+1}/{len(articles)}: {article.get('title', 'No title')[:50]}...")
-                
-                # Perform relevance analysis
-                relevance_result = self.analyze_relevance(
-                    title=article.get('title', ''),
-                    source=article.get('source', ''),
-                    content=article.get('content', ''),
-                    topic=topic,
-                    keywords=keywords
-                )
-                
-                # Combine original article data with relevance analysis
-                result = article.copy()
-                result.update(relevance_result)
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Failed to analyze article {i+1}: {str(e)}")
+            error = "individual analysis failed"
+            if relevance_results is not None:
+                relevance_result = relevance_results[i]
+            else:
+                try:
+                    logger.info(f"Analyzing article {i+1}/{len(articles)}: {article.get('title', 'No title')[:50]}...")
+                    relevance_result = self.analyze_relevance(
+                        title=article.get('title', ''),
+                        source=article.get('source', ''),
+                        content=article.get('content', ''),
+                        topic=topic,
+                        keywords=keywords,
+                        topic_description=topic_description
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to analyze article {i+1}: {str(e)}")
+                    relevance_result = None
+                    error = str(e)
+            
+            if relevance_result is None:
                 # Add the article with default relevance scores
-                result = article.copy()
-                result.update({
+                relevance_result = {
                     "topic_alignment_score": 0.0,
                     "keyword_relevance_score": 0.0,
-                    "overall_match_explanation": f"Analysis failed: {str(e)}",
+                    "overall_match_explanation": f"Analysis failed: {error}",
                     "confidence_score": 0.0,
                     "extracted_article_topics": [],
                     "extracted_article_keywords": [],
                     "relevance_score": 0.0
-                })
-                results.append(result)
+                }
+            
+            result = article.copy()
+            result.update(relevance_result)
+            results.append(result)
         
         logger.info(f"Completed batch analysis of {len(articles)} articles")
-        return results 
\ No newline at end of file
+        return results
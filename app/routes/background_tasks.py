@@ -12,6 +12,13 @@ from app.services.background_task_manager import (
     run_bulk_analysis_task,
     run_bulk_save_task
 )
+from app.services.analysis_queue import (
+    AnalysisTask,
+    PRIORITIES,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SCHEDULED,
+    get_analysis_queue
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/background-tasks", tags=["background-tasks"])
@@ -30,6 +37,8 @@ async def start_bulk_analysis(
         model_name = request_data.get("model_name", "gpt-4")
         summary_length = request_data.get("summary_length", 50)
         summary_voice = request_data.get("summary_voice", "neutral")
+        # Single-article analyses are interactive unless the caller says otherwise
+        priority_name = request_data.get("priority")
 
         if not urls:
             raise HTTPException(status_code=400, detail="No URLs provided")
@@ -37,6 +46,13 @@ async def start_bulk_analysis(
         if not topic:
             raise HTTPException(status_code=400, detail="Topic is required")
 
+        if priority_name is None:
+            priority = PRIORITY_INTERACTIVE if len(urls) == 1 else PRIORITY_SCHEDULED
+        elif priority_name in PRIORITIES:
+            priority = PRIORITIES[priority_name]
+        else:
+            raise HTTPException(status_code=400, detail=f"Unknown priority: {priority_name}")
+
         # Create background task
         task_manager = get_task_manager()
         task_id = task_manager.create_task(
@@ -46,10 +62,25 @@ async def start_bulk_analysis(
                 "topic": topic,
                 "url_count": len(urls),
                 "summary_type": summary_type,
-                "model_name": model_name
+                "model_name": model_name,
+                "priority": priority
             }
         )
 
+        # Queue the URLs durably right away; workers process them even if
+        # the tracking task below never runs or the server restarts
+        analysis_params = {
+            "summary_type": summary_type,
+            "model_name": model_name,
+            "summary_length": summary_length,
+            "summary_voice": summary_voice
+        }
+        await get_analysis_queue().add_tasks(
+            [AnalysisTask(url=url, topic=topic, metadata=analysis_params) for url in urls],
+            job_id=task_id,
+            priority=priority
+        )
+
         # Start the background task
         background_tasks.add_task(
             task_manager.run_task,
@@ -57,6 +88,8 @@ async def start_bulk_analysis(
             run_bulk_analysis_task,
             urls=urls,
             topic=topic,
+            job_id=task_id,
+            priority=priority,
             summary_type=summary_type,
             model_name=model_name,
             summary_length=summary_length,
@@ -8,7 +8,7 @@ import logging
 import json
 from datetime import datetime, timedelta
 from app.analyze_db import AnalyzeDB
-from app.vector_store import search_articles as vector_search_articles
+from app.services.hybrid_search import hybrid_search_articles_async
 from typing import List, Dict
 
 router = APIRouter()
@@ -64,12 +64,12 @@ async def chat_with_database(
         topic_options = analyze_db.get_topic_options(chat_request.topic)
 
         # Enhanced search strategy: Use both SQL and vector search
-        # First, try vector search for semantic understanding
+        # First, try hybrid (full-text + vector) search for semantic understanding
         vector_articles = []
         try:
-            # Build metadata filter for vector search
+            # Build metadata filter for hybrid search
             metadata_filter = {"topic": chat_request.topic}
-            vector_results = vector_search_articles(
+            vector_results = await hybrid_search_articles_async(
                 query=chat_request.message,
                 top_k=100,
                 metadata_filter=metadata_filter
@@ -92,10 +92,10 @@ async def chat_with_database(
                         "similarity_score": result.get("score", 0)
                     })
             
-            logger.debug(f"Vector search found {len(vector_articles)} semantically relevant articles")
+            logger.debug(f"Hybrid search found {len(vector_articles)} semantically relevant articles")
             
         except Exception as e:
-            logger.warning(f"Vector search failed, falling back to SQL search: {e}")
+            logger.warning(f"Hybrid search failed, falling back to SQL search: {e}")
             vector_articles = []
 
         # If vector search found good results, use them; otherwise fall back to SQL search
@@ -382,8 +382,8 @@ def select_diverse_articles(articles, limit):
     if len(articles) <= limit:
         return articles
     
-    # Sort by similarity score first (best matches first)
-    sorted_articles = sorted(articles, key=lambda x: x.get('similarity_score', 1.0))
+    # Sort by similarity score first (best matches first; higher is better)
+    sorted_articles = sorted(articles, key=lambda x: x.get('similarity_score', 0.0), reverse=True)
     
     selected = []
     seen_categories = set()
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
 from starlette.background import BackgroundTask
 from app.database import get_database_instance, Database
 from app.security.session import verify_session
 from typing import List, Optional
 from pydantic import BaseModel
 import os
+import json
+import zlib
 from urllib.parse import unquote_plus
 import logging
 from sqlalchemy.exc import IntegrityError
@@ -21,7 +23,8 @@ from app.database_models import (
     t_feed_group_sources as feed_group_sources,
     t_keyword_monitor_settings as keyword_monitor_settings,
     t_keyword_article_matches as keyword_article_matches,
-    t_keyword_alerts as keyword_alerts
+    t_keyword_alerts as keyword_alerts,
+    ARTICLE_PROJECTIONS
 )
 try:
     from scripts.db_merge import DatabaseMerger
@@ -1428,108 +1431,346 @@ async def reset_database(db: Database = Depends(get_database_instance), session=
             pass
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/api/export-articles-enriched")
-async def export_articles_enriched(
-    db: Database = Depends(get_database_instance),
-    session=Depends(verify_session)
+# Columns shared by both article export formats and accepted by import
+ARTICLE_EXPORT_FIELDS = [
+    field for field in ARTICLE_PROJECTIONS['export'] if field not in ('uri', 'submission_date')
+]
+
+# Rows fetched per round-trip from the server-side export cursor
+EXPORT_YIELD_PER = 500
+
+# Records written per transaction when importing a stream
+IMPORT_BATCH_SIZE = 500
+
+
+def _json_default(value):
+    """Serialize datetimes and other non-JSON values in export rows."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _build_article_export_query(include_raw: bool, topic: Optional[str], start_date: Optional[str], end_date: Optional[str]):
+    """Build the article export SELECT with optional topic/date filters."""
+    columns = ["a.uri", "a.submission_date"] + [f"a.{field}" for field in ARTICLE_EXPORT_FIELDS]
+    from_clause = "articles a"
+    if include_raw:
+        columns += ["r.raw_markdown", "r.last_updated"]
+        from_clause += " LEFT JOIN raw_articles r ON a.uri = r.uri"
+
+    where_clauses = []
+    params = {}
+    if topic:
+        where_clauses.append("a.topic = :topic")
+        params["topic"] = topic
+    if start_date:
+        where_clauses.append("a.publication_date >= :start_date")
+        params["start_date"] = start_date
+    if end_date:
+        where_clauses.append("a.publication_date <= :end_date")
+        params["end_date"] = end_date
+
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    query = text(f"""
+        SELECT {', '.join(columns)}
+        FROM {from_clause}
+        {where_sql}
+        ORDER BY a.submission_date DESC
+    """)
+    return query, params
+
+
+def _iter_article_export(
+    db: Database,
+    export_type: str,
+    export_format: str,
+    topic: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
 ):
-    """Export enriched article data (without raw markdown content)"""
-    try:
-        conn = db._temp_get_connection()
+    """Yield an article export as text chunks without materialising all rows.
 
-        # Export enriched articles data
-        export_data = {
-            "export_timestamp": datetime.now().isoformat(),
-            "export_type": "enriched",
-            "version": "1.0",
-            "articles": []
-        }
+    Uses a dedicated pooled connection with a server-side cursor so memory
+    stays flat regardless of corpus size. ``json`` keeps the legacy document
+    shape; ``ndjson`` writes one article per line.
+    """
+    query, params = _build_article_export_query(export_type == "raw", topic, start_date, end_date)
+    engine = db._temp_get_connection().engine
+    total = 0
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=EXPORT_YIELD_PER).execute(query, params)
+
+        if export_format == "json":
+            header = {
+                "export_timestamp": datetime.now().isoformat(),
+                "export_type": export_type,
+                "version": "1.0",
+            }
+            yield json.dumps(header)[:-1] + ', "articles": ['
 
-        # Query enriched articles from the articles table
-        result = conn.execute(text("""
-            SELECT
-                uri, title, news_source, publication_date, submission_date,
-                summary, category, future_signal, future_signal_explanation,
-                sentiment, sentiment_explanation, time_to_impact, time_to_impact_explanation,
-                tags, driver_type, driver_type_explanation, topic, analyzed,
-                bias, factual_reporting, mbfc_credibility_rating, bias_source,
-                bias_country, press_freedom, media_type, popularity,
-                topic_alignment_score, keyword_relevance_score, confidence_score,
-                overall_match_explanation, extracted_article_topics, extracted_article_keywords,
-                ingest_status, quality_score, quality_issues, auto_ingested
-            FROM articles
-            ORDER BY submission_date DESC
-        """))
+        for partition in result.mappings().partitions():
+            lines = [json.dumps(dict(row), default=_json_default) for row in partition]
+            if export_format == "json":
+                yield ("," if total else "") + ",".join(lines)
+            else:
+                yield "\n".join(lines) + "\n"
+            total += len(lines)
 
-        for row in result.mappings():
-            export_data["articles"].append(dict(row))
+        if export_format == "json":
+            yield f'], "total_articles": {total}}}'
 
-        export_data["total_articles"] = len(export_data["articles"])
-        logger.info(f"Exported {export_data['total_articles']} enriched articles")
+    logger.info(f"Exported {total} {export_type} articles ({export_format})")
 
-        conn.commit()  # CRITICAL: Commit to close transaction
-        return export_data
 
-    except Exception as e:
-        logger.error(f"Error exporting enriched articles: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+def _gzip_chunks(chunks):
+    """Gzip-compress an iterator of text chunks incrementally."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _article_export_response(
+    db: Database,
+    export_type: str,
+    export_format: str,
+    compress: bool,
+    topic: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> StreamingResponse:
+    if export_format not in ("json", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'ndjson'")
+
+    chunks = _iter_article_export(db, export_type, export_format, topic, start_date, end_date)
+    media_type = "application/json" if export_format == "json" else "application/x-ndjson"
+    headers = {}
+
+    if compress:
+        chunks = _gzip_chunks(chunks)
+        filename = f"articles-{export_type}-{datetime.now().strftime('%Y-%m-%d')}.{export_format}.gz"
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        media_type = "application/gzip"
+
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+@router.get("/api/export-articles-enriched")
+async def export_articles_enriched(
+    format: str = Query("json", description="json (single document) or ndjson (one article per line)"),
+    compress: bool = Query(False, description="Gzip the streamed output"),
+    topic: Optional[str] = Query(None),
+    start_date: Optional[str] = Query(None, description="Minimum publication date"),
+    end_date: Optional[str] = Query(None, description="Maximum publication date"),
+    db: Database = Depends(get_database_instance),
+    session=Depends(verify_session)
+):
+    """Export enriched article data (without raw markdown content) as a stream"""
+    return _article_export_response(db, "enriched", format, compress, topic, start_date, end_date)
 
 @router.get("/api/export-articles-raw")
 async def export_articles_raw(
+    format: str = Query("json", description="json (single document) or ndjson (one article per line)"),
+    compress: bool = Query(False, description="Gzip the streamed output"),
+    topic: Optional[str] = Query(None),
+    start_date: Optional[str] = Query(None, description="Minimum publication date"),
+    end_date: Optional[str] = Query(None, description="Maximum publication date"),
     db: Database = Depends(get_database_instance),
     session=Depends(verify_session)
 ):
-    """Export complete article data including raw markdown content"""
-    try:
-        conn = db._temp_get_connection()
+    """Export complete article data including raw markdown content as a stream"""
+    return _article_export_response(db, "raw", format, compress, topic, start_date, end_date)
 
-        # Export complete article data
-        export_data = {
-            "export_timestamp": datetime.now().isoformat(),
-            "export_type": "raw",
-            "version": "1.0",
-            "articles": []
-        }
+class ArticleImportRequest(BaseModel):
+    merge_mode: bool = True
+    skip_duplicates: bool = True
+    update_existing: bool = False
 
-        # Query all article data including raw content
-        result = conn.execute(text("""
-            SELECT
-                a.uri, a.title, a.news_source, a.publication_date, a.submission_date,
-                a.summary, a.category, a.future_signal, a.future_signal_explanation,
-                a.sentiment, a.sentiment_explanation, a.time_to_impact, a.time_to_impact_explanation,
-                a.tags, a.driver_type, a.driver_type_explanation, a.topic, a.analyzed,
-                a.bias, a.factual_reporting, a.mbfc_credibility_rating, a.bias_source,
-                a.bias_country, a.press_freedom, a.media_type, a.popularity,
-                a.topic_alignment_score, a.keyword_relevance_score, a.confidence_score,
-                a.overall_match_explanation, a.extracted_article_topics, a.extracted_article_keywords,
-                a.ingest_status, a.quality_score, a.quality_issues, a.auto_ingested,
-                r.raw_markdown, r.last_updated
-            FROM articles a
-            LEFT JOIN raw_articles r ON a.uri = r.uri
-            ORDER BY a.submission_date DESC
-        """))
 
-        for row in result.mappings():
-            export_data["articles"].append(dict(row))
+def _write_article_record(conn, article: dict, skip_duplicates: bool, update_existing: bool) -> str:
+    """Insert or update a single imported article; returns the stats key of the outcome."""
+    uri = article["uri"]
+
+    # Check if article already exists
+    existing = conn.execute(
+        text("SELECT uri FROM articles WHERE uri = :uri"),
+        {"uri": uri}
+    ).first()
+
+    if existing:
+        if skip_duplicates and not update_existing:
+            return "skipped"
+        elif update_existing:
+            # Update existing article
+            update_fields = []
+            update_values = {"uri": uri}
+
+            # Build update query dynamically for non-null fields
+            for field in ARTICLE_EXPORT_FIELDS:
+                if field in article and article[field] is not None:
+                    update_fields.append(f"{field} = :{field}")
+                    update_values[field] = article[field]
+
+            if update_fields:
+                update_query = f"UPDATE articles SET {', '.join(update_fields)} WHERE uri = :uri"
+                conn.execute(text(update_query), update_values)
+
+            # Update raw_articles if raw_markdown is present
+            if "raw_markdown" in article and article["raw_markdown"] is not None:
+                raw_exists = conn.execute(
+                    text("SELECT uri FROM raw_articles WHERE uri = :uri"),
+                    {"uri": uri}
+                ).first()
+
+                if raw_exists:
+                    conn.execute(
+                        text("""
+                            UPDATE raw_articles
+                            SET raw_markdown = :raw_markdown,
+                                last_updated = CURRENT_TIMESTAMP,
+                                topic = :topic
+                            WHERE uri = :uri
+                        """),
+                        {
+                            "uri": uri,
+                            "raw_markdown": article["raw_markdown"],
+                            "topic": article.get("topic")
+                        }
+                    )
+                else:
+                    conn.execute(
+                        text("""
+                            INSERT INTO raw_articles (uri, raw_markdown, topic, submission_date, last_updated)
+                            VALUES (:uri, :raw_markdown, :topic, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                        """),
+                        {
+                            "uri": uri,
+                            "raw_markdown": article["raw_markdown"],
+                            "topic": article.get("topic")
+                        }
+                    )
 
-        export_data["total_articles"] = len(export_data["articles"])
-        logger.info(f"Exported {export_data['total_articles']} raw articles")
+            return "updated"
+        else:
+            return "skipped"
+    else:
+        # Insert new article
+        insert_fields = ["uri"]
+        insert_placeholders = [":uri"]
+        insert_values = {"uri": uri}
+
+        # Build insert query for available fields
+        for field in ARTICLE_EXPORT_FIELDS:
+            if field in article and article[field] is not None:
+                insert_fields.append(field)
+                insert_placeholders.append(f":{field}")
+                insert_values[field] = article[field]
+
+        insert_query = f"""
+            INSERT INTO articles ({', '.join(insert_fields)})
+            VALUES ({', '.join(insert_placeholders)})
+        """
+        conn.execute(text(insert_query), insert_values)
+
+        # Insert raw_articles if raw_markdown is present
+        if "raw_markdown" in article and article["raw_markdown"] is not None:
+            conn.execute(
+                text("""
+                    INSERT INTO raw_articles (uri, raw_markdown, topic, submission_date, last_updated)
+                    VALUES (:uri, :raw_markdown, :topic, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                """),
+                {
+                    "uri": uri,
+                    "raw_markdown": article["raw_markdown"],
+                    "topic": article.get("topic")
+                }
+            )
 
-        conn.commit()  # CRITICAL: Commit to close transaction
-        return export_data
+        return "imported"
+
+
+def _import_article_record(conn, article: dict, idx: int, stats: dict, skip_duplicates: bool, update_existing: bool) -> None:
+    """Import a single article in its own SAVEPOINT, recording the outcome in stats.
 
+    A failing record is rolled back to its savepoint, so on PostgreSQL it
+    does not abort the transaction the rest of its batch is written in.
+    """
+    # Validate required field
+    if not article.get("uri"):
+        stats["failed"] += 1
+        stats["errors"].append(f"Record {idx + 1}: Missing required field 'uri'")
+        return
+
+    try:
+        with conn.begin_nested():
+            outcome = _write_article_record(conn, article, skip_duplicates, update_existing)
     except Exception as e:
-        logger.error(f"Error exporting raw articles: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        stats["failed"] += 1
+        error_msg = f"Record {idx + 1} (URI: {article.get('uri', 'unknown')}): {str(e)}"
+        stats["errors"].append(error_msg)
+        logger.warning(f"Failed to import article: {error_msg}")
+        return
+
+    stats[outcome] += 1
+
+
+def _import_article_batch(conn, batch: list, first_idx: int, stats: dict, skip_duplicates: bool, update_existing: bool) -> None:
+    """Import a batch of article records in one transaction, each record in its own savepoint."""
+    trans = conn.begin()
+    try:
+        for offset, article in enumerate(batch):
+            _import_article_record(conn, article, first_idx + offset, stats, skip_duplicates, update_existing)
+        trans.commit()
+    except Exception:
+        trans.rollback()
+        raise
+
+
+async def _iter_ndjson_records(request: Request):
+    """Parse a (optionally gzip-compressed) NDJSON request body record by record."""
+    gzipped = (
+        request.headers.get("content-encoding", "").lower() == "gzip"
+        or request.headers.get("content-type", "").split(";")[0].strip() in ("application/gzip", "application/x-gzip")
+    )
+    decompressor = zlib.decompressobj(47) if gzipped else None
+    buffer = b""
+
+    async for chunk in request.stream():
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+
+    if decompressor is not None:
+        buffer += decompressor.flush()
+    if buffer.strip():
+        yield json.loads(buffer)
+
+
+def _build_import_message(stats: dict) -> str:
+    message_parts = []
+    if stats["imported"] > 0:
+        message_parts.append(f"imported {stats['imported']}")
+    if stats["updated"] > 0:
+        message_parts.append(f"updated {stats['updated']}")
+    if stats["skipped"] > 0:
+        message_parts.append(f"skipped {stats['skipped']}")
+    if stats["failed"] > 0:
+        message_parts.append(f"failed {stats['failed']}")
+
+    return f"Article import completed: {', '.join(message_parts)} of {stats['total_records']} records"
 
-class ArticleImportRequest(BaseModel):
-    merge_mode: bool = True
-    skip_duplicates: bool = True
-    update_existing: bool = False
 
 @router.post("/api/import-articles")
 async def import_articles(
-    import_data: dict,
+    request: Request,
     merge_mode: bool = True,
     skip_duplicates: bool = True,
     update_existing: bool = False,
@@ -1539,26 +1780,28 @@ async def import_articles(
     """
     Import article data with robust validation and conflict resolution
 
+    Accepts either the legacy JSON document ({"articles": [...]}) or the
+    streaming export format: NDJSON (Content-Type application/x-ndjson),
+    optionally gzip-compressed (Content-Encoding: gzip or Content-Type
+    application/gzip). Streams are imported in batches of IMPORT_BATCH_SIZE,
+    each committed in its own transaction, so memory stays bounded.
+
     Args:
-        import_data: JSON data containing articles to import
+        request: Request whose body holds the articles to import
         merge_mode: If True, keep existing articles; if False, clear before import
         skip_duplicates: If True, skip articles with duplicate URIs
         update_existing: If True, update existing articles with new data
     """
-    try:
-        conn = db._temp_get_connection()
-
-        # Validate import data structure
-        if "articles" not in import_data:
-            raise HTTPException(status_code=400, detail="Invalid import data: missing 'articles' field")
-
-        articles = import_data.get("articles", [])
-        if not isinstance(articles, list):
-            raise HTTPException(status_code=400, detail="Invalid import data: 'articles' must be a list")
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    streamed = (
+        content_type in ("application/x-ndjson", "application/ndjson", "application/gzip", "application/x-gzip")
+        or request.headers.get("content-encoding", "").lower() == "gzip"
+    )
 
+    try:
         # Track import statistics
         stats = {
-            "total_records": len(articles),
+            "total_records": 0,
             "imported": 0,
             "updated": 0,
             "skipped": 0,
@@ -1566,181 +1809,69 @@ async def import_articles(
             "errors": []
         }
 
-        # Begin transaction
-        trans = conn.begin()
+        if not streamed:
+            import_data = await request.json()
 
-        try:
-            # If not merge mode, clear existing data (with confirmation required in UI)
-            if not merge_mode:
-                logger.warning("Clearing existing articles (non-merge mode)")
-                conn.execute(text("DELETE FROM raw_articles"))
-                conn.execute(text("DELETE FROM articles"))
+            # Validate import data structure
+            if not isinstance(import_data, dict) or "articles" not in import_data:
+                raise HTTPException(status_code=400, detail="Invalid import data: missing 'articles' field")
 
-            # Process each article
-            for idx, article in enumerate(articles):
-                try:
-                    # Validate required field
-                    if not article.get("uri"):
-                        stats["failed"] += 1
-                        stats["errors"].append(f"Record {idx + 1}: Missing required field 'uri'")
-                        continue
-
-                    uri = article["uri"]
-
-                    # Check if article already exists
-                    existing = conn.execute(
-                        text("SELECT uri FROM articles WHERE uri = :uri"),
-                        {"uri": uri}
-                    ).first()
-
-                    if existing:
-                        if skip_duplicates and not update_existing:
-                            stats["skipped"] += 1
-                            continue
-                        elif update_existing:
-                            # Update existing article
-                            update_fields = []
-                            update_values = {"uri": uri}
-
-                            # Build update query dynamically for non-null fields
-                            for field in [
-                                "title", "news_source", "publication_date", "summary", "category",
-                                "future_signal", "future_signal_explanation", "sentiment", "sentiment_explanation",
-                                "time_to_impact", "time_to_impact_explanation", "tags", "driver_type",
-                                "driver_type_explanation", "topic", "analyzed", "bias", "factual_reporting",
-                                "mbfc_credibility_rating", "bias_source", "bias_country", "press_freedom",
-                                "media_type", "popularity", "topic_alignment_score", "keyword_relevance_score",
-                                "confidence_score", "overall_match_explanation", "extracted_article_topics",
-                                "extracted_article_keywords", "ingest_status", "quality_score", "quality_issues",
-                                "auto_ingested"
-                            ]:
-                                if field in article and article[field] is not None:
-                                    update_fields.append(f"{field} = :{field}")
-                                    update_values[field] = article[field]
-
-                            if update_fields:
-                                update_query = f"UPDATE articles SET {', '.join(update_fields)} WHERE uri = :uri"
-                                conn.execute(text(update_query), update_values)
-
-                            # Update raw_articles if raw_markdown is present
-                            if "raw_markdown" in article and article["raw_markdown"] is not None:
-                                raw_exists = conn.execute(
-                                    text("SELECT uri FROM raw_articles WHERE uri = :uri"),
-                                    {"uri": uri}
-                                ).first()
-
-                                if raw_exists:
-                                    conn.execute(
-                                        text("""
-                                            UPDATE raw_articles
-                                            SET raw_markdown = :raw_markdown,
-                                                last_updated = CURRENT_TIMESTAMP,
-                                                topic = :topic
-                                            WHERE uri = :uri
-                                        """),
-                                        {
-                                            "uri": uri,
-                                            "raw_markdown": article["raw_markdown"],
-                                            "topic": article.get("topic")
-                                        }
-                                    )
-                                else:
-                                    conn.execute(
-                                        text("""
-                                            INSERT INTO raw_articles (uri, raw_markdown, topic, submission_date, last_updated)
-                                            VALUES (:uri, :raw_markdown, :topic, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                                        """),
-                                        {
-                                            "uri": uri,
-                                            "raw_markdown": article["raw_markdown"],
-                                            "topic": article.get("topic")
-                                        }
-                                    )
-
-                            stats["updated"] += 1
-                        else:
-                            stats["skipped"] += 1
-                            continue
-                    else:
-                        # Insert new article
-                        insert_fields = ["uri"]
-                        insert_placeholders = [":uri"]
-                        insert_values = {"uri": uri}
-
-                        # Build insert query for available fields
-                        for field in [
-                            "title", "news_source", "publication_date", "summary", "category",
-                            "future_signal", "future_signal_explanation", "sentiment", "sentiment_explanation",
-                            "time_to_impact", "time_to_impact_explanation", "tags", "driver_type",
-                            "driver_type_explanation", "topic", "analyzed", "bias", "factual_reporting",
-                            "mbfc_credibility_rating", "bias_source", "bias_country", "press_freedom",
-                            "media_type", "popularity", "topic_alignment_score", "keyword_relevance_score",
-                            "confidence_score", "overall_match_explanation", "extracted_article_topics",
-                            "extracted_article_keywords", "ingest_status", "quality_score", "quality_issues",
-                            "auto_ingested"
-                        ]:
-                            if field in article and article[field] is not None:
-                                insert_fields.append(field)
-                                insert_placeholders.append(f":{field}")
-                                insert_values[field] = article[field]
-
-                        insert_query = f"""
-                            INSERT INTO articles ({', '.join(insert_fields)})
-                            VALUES ({', '.join(insert_placeholders)})
-                        """
-                        conn.execute(text(insert_query), insert_values)
-
-                        # Insert raw_articles if raw_markdown is present
-                        if "raw_markdown" in article and article["raw_markdown"] is not None:
-                            conn.execute(
-                                text("""
-                                    INSERT INTO raw_articles (uri, raw_markdown, topic, submission_date, last_updated)
-                                    VALUES (:uri, :raw_markdown, :topic, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                                """),
-                                {
-                                    "uri": uri,
-                                    "raw_markdown": article["raw_markdown"],
-                                    "topic": article.get("topic")
-                                }
-                            )
+            articles = import_data.get("articles", [])
+            if not isinstance(articles, list):
+                raise HTTPException(status_code=400, detail="Invalid import data: 'articles' must be a list")
 
-                        stats["imported"] += 1
+            stats["total_records"] = len(articles)
 
-                except Exception as e:
-                    stats["failed"] += 1
-                    error_msg = f"Record {idx + 1} (URI: {article.get('uri', 'unknown')}): {str(e)}"
-                    stats["errors"].append(error_msg)
-                    logger.warning(f"Failed to import article: {error_msg}")
-                    continue
-
-            # Commit transaction
-            trans.commit()
-
-            # Build response message
-            message_parts = []
-            if stats["imported"] > 0:
-                message_parts.append(f"imported {stats['imported']}")
-            if stats["updated"] > 0:
-                message_parts.append(f"updated {stats['updated']}")
-            if stats["skipped"] > 0:
-                message_parts.append(f"skipped {stats['skipped']}")
-            if stats["failed"] > 0:
-                message_parts.append(f"failed {stats['failed']}")
+        conn = db._temp_get_connection()
 
-            message = f"Article import completed: {', '.join(message_parts)} of {stats['total_records']} records"
+        if not streamed:
+            # Legacy document: the whole import runs in one transaction
+            trans = conn.begin()
+            try:
+                # If not merge mode, clear existing data (with confirmation required in UI)
+                if not merge_mode:
+                    logger.warning("Clearing existing articles (non-merge mode)")
+                    conn.execute(text("DELETE FROM raw_articles"))
+                    conn.execute(text("DELETE FROM articles"))
 
-            logger.info(message)
-            return {
-                "message": message,
-                "statistics": stats
-            }
+                for idx, article in enumerate(articles):
+                    _import_article_record(conn, article, idx, stats, skip_duplicates, update_existing)
 
-        except Exception as e:
-            trans.rollback()
-            raise e
+                trans.commit()
+            except Exception as e:
+                trans.rollback()
+                raise e
+        else:
+            if not merge_mode:
+                logger.warning("Clearing existing articles (non-merge mode)")
+                with conn.begin():
+                    conn.execute(text("DELETE FROM raw_articles"))
+                    conn.execute(text("DELETE FROM articles"))
+
+            # Stream: commit every IMPORT_BATCH_SIZE records
+            batch = []
+            async for article in _iter_ndjson_records(request):
+                batch.append(article)
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    _import_article_batch(conn, batch, stats["total_records"], stats, skip_duplicates, update_existing)
+                    stats["total_records"] += len(batch)
+                    batch = []
+            if batch:
+                _import_article_batch(conn, batch, stats["total_records"], stats, skip_duplicates, update_existing)
+                stats["total_records"] += len(batch)
+
+        message = _build_import_message(stats)
+        logger.info(message)
+        return {
+            "message": message,
+            "statistics": stats
+        }
 
     except HTTPException:
         raise
+    except (json.JSONDecodeError, zlib.error) as e:
+        logger.error(f"Invalid article import stream: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Invalid import data: {str(e)}")
     except Exception as e:
         logger.error(f"Error importing articles: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -97,6 +97,7 @@ class UnifiedFeedResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 # Feed Group Management Endpoints
 
@@ -390,6 +391,7 @@ async def get_unified_feed(
     starred: Optional[str] = Query(None, description="Filter by starred status (starred/unstarred)"),
     topic: Optional[str] = Query(None, description="Filter by topic"),
     sort: Optional[str] = Query("publication_date", description="Sort by: publication_date, created_at, or engagement"),
+    cursor: Optional[str] = Query(None, description="Keyset pagination: next_cursor of the previous page ('' for the first page); offset is ignored"),
     include_hidden: bool = Query(False, description="Include hidden items"),
     db: Database = Depends(get_database_instance),
     session=Depends(verify_session_api)
@@ -448,7 +450,8 @@ async def get_unified_feed(
             min_engagement=min_engagement,
             starred=starred,
             topic=topic,
-            sort=sort
+            sort=sort,
+            cursor=cursor
         )
         
         if not result["success"]:
@@ -459,6 +462,8 @@ async def get_unified_feed(
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"API: Error getting unified feed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get unified feed: {str(e)}")
@@ -478,6 +483,7 @@ async def get_group_feed(
     starred: Optional[str] = Query(None, description="Filter by starred status (starred/unstarred)"),
     topic: Optional[str] = Query(None, description="Filter by topic"),
     sort: Optional[str] = Query("publication_date", description="Sort by: publication_date, created_at, or engagement"),
+    cursor: Optional[str] = Query(None, description="Keyset pagination: next_cursor of the previous page ('' for the first page); offset is ignored"),
     include_hidden: bool = Query(False, description="Include hidden items"),
     db: Database = Depends(get_database_instance),
     session=Depends(verify_session_api)
@@ -518,7 +524,8 @@ async def get_group_feed(
             min_engagement=min_engagement,
             starred=starred,
             topic=topic,
-            sort=sort
+            sort=sort,
+            cursor=cursor
         )
         
         if not result["success"]:
@@ -529,6 +536,8 @@ async def get_group_feed(
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"API: Error getting group feed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get group feed: {str(e)}")
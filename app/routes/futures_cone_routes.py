@@ -685,7 +685,8 @@ def generate_futures_cone(
             pub_date_start=start_date_str,
             pub_date_end=end_date_str,
             page=1,
-            per_page=fetch_size
+            per_page=fetch_size,
+            projection='list'
         )
 
         logger.info(f"Initial fetch: {len(articles_list)} articles")
@@ -16,6 +16,7 @@ from fastapi import APIRouter, status, Request, Depends
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.templating import Jinja2Templates
 from app.security.session import verify_session
+from app.security.user_cache import get_user_cache
 
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
@@ -446,6 +447,7 @@ async def detailed_health():
     - Process information
     - API accessibility
     - Autopolling status
+    - Session user cache hit rate
     """
     uptime = time.time() - START_TIME
 
@@ -474,7 +476,8 @@ async def detailed_health():
             "vector_store": get_chromadb_stats(),
             "environment": get_environment_info(),
             "api_health": get_api_health(),
-            "autopolling": get_autopolling_status()
+            "autopolling": get_autopolling_status(),
+            "user_cache": get_user_cache().get_stats()
         }
 
         # Determine overall health status
@@ -3,7 +3,8 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 from app.database import Database, get_database_instance
-from app.tasks.keyword_monitor import KeywordMonitor, get_task_status
+from app.tasks.keyword_monitor import KeywordMonitor, get_task_status, get_dedup_stats
+from app.services.relevance_prefilter import get_relevance_prefilter
 from app.security.session import verify_session, verify_session_api
 from app.models.media_bias import MediaBias
 import logging
@@ -1911,7 +1912,8 @@ async def get_keyword_monitor_status(db=Depends(get_database_instance), session=
                 "requests_today": status_row[0] if status_row else 0,
                 "last_reset_date": status_row[1] if status_row else None,
                 "limit": settings[4] if settings else 100
-            }
+            },
+            "deduplication": get_dedup_stats()
         }
         
         return response
@@ -2282,6 +2284,7 @@ async def get_auto_ingest_status(
     """Get current auto-ingest status and settings"""
     try:
         settings = db.facade.get_auto_ingest_settings()
+        prefilter = get_relevance_prefilter()
 
         if settings:
             # Get processing statistics
@@ -2303,7 +2306,8 @@ async def get_auto_ingest_status(
                     "approved_count": stats[1] if stats else 0,
                     "failed_count": stats[2] if stats else 0,
                     "avg_quality_score": float(stats[3]) if stats and stats[3] else 0.0
-                }
+                },
+                "prefilter": prefilter.get_stats() if prefilter else None
             }
         else:
             # Return defaults for new users
@@ -4,6 +4,7 @@ from fastapi.templating import Jinja2Templates
 from app.security.session import verify_session
 from app.database import Database, get_database_instance
 from app.database_query_facade import DatabaseQueryFacade
+from app.services.ontology_registry import invalidate_topic
 import os
 import aiohttp
 import logging
@@ -1064,6 +1065,7 @@ async def save_topic(
                     status_code=500,
                     detail=f"Failed to save config: {str(e)}"
                 )
+        invalidate_topic(formatted_topic['name'])
 
         # Handle keyword group
         try:
@@ -7,6 +7,7 @@ from app.database import Database
 from app.database_query_facade import DatabaseQueryFacade
 from app.security.session import verify_session
 from app.config.config import load_config, get_news_query, get_paper_query
+from app.services.ontology_registry import invalidate_topic
 import json
 import os
 import logging
@@ -110,6 +111,7 @@ async def delete_topic(topic_name: str, request: Request, delete_request: Delete
             config['topics'] = topics
             with open(config_path, 'w') as f:
                 json.dump(config, f, indent=2)
+            invalidate_topic(topic_name)
         
         # Clean up keyword groups associated with this topic
         keyword_cleanup_result = {}
@@ -13,8 +13,9 @@ from pydantic import BaseModel, Field, field_validator
 from app.security.session import verify_session, verify_session_optional
 from app.vector_store import (
     search_articles,
-    upsert_article,
+    upsert_articles_bulk_async,
     similar_articles,
+    get_vectors_by_metadata,
     _get_collection as _vector_collection,
     get_chroma_client,
 )
@@ -49,11 +50,11 @@ def vector_search_endpoint(
     KISSQL syntax for advanced filtering and logic operations.
     """
     # Import the KISSQL module
-    from app.kissql.parser import parse_full_query, Constraint, MetaControl
+    from app.kissql.parser import parse_query_cached, Constraint, MetaControl
     from app.kissql.executor import execute_query
     
     # Parse the query using KISSQL
-    query_obj = parse_full_query(q)
+    query_obj = parse_query_cached(q)
     
     # Log the incoming parameters and parsed query for debugging
     logger = logging.getLogger(__name__)
@@ -126,6 +127,67 @@ def vector_search_endpoint(
     )
 
 
+@router.get("/kissql/explain")
+def kissql_explain(
+    q: str = Query(..., description="KISSQL query"),
+    execute: bool = Query(False, description="Also run the query and report stage timings"),
+    top_k: int = Query(100, ge=1),
+    session=Depends(verify_session),
+):
+    """EXPLAIN a KISSQL query.
+
+    Shows the normalized query, the parsed Query, the compiled SQL plan and
+    whether each came from cache, with parse/compile times. With
+    ``execute=true`` the query is also run and per-stage timings returned.
+    """
+    import time
+    from dataclasses import asdict
+    from app.kissql.executor import execute_query
+    from app.kissql.parser import normalize_query, parse_cache_info, parse_query_cached
+    from app.kissql.sql_compiler import KissqlCompileError, compile_plan, plan_cache_info
+
+    hits_before = parse_cache_info()["hits"]
+    start = time.perf_counter()
+    query_obj = parse_query_cached(q)
+    explain: Dict[str, Any] = {
+        "query": q,
+        "normalized": normalize_query(q),
+        "parse_ms": round((time.perf_counter() - start) * 1000, 3),
+        "parse_cache_hit": parse_cache_info()["hits"] > hits_before,
+        "parsed": asdict(query_obj),
+    }
+
+    hits_before = plan_cache_info()["hits"]
+    start = time.perf_counter()
+    try:
+        plan = compile_plan(query_obj.constraints)
+        explain["plan"] = {
+            "where": plan.where.sql,
+            "params": plan.where.params,
+            "facet_sql": " ".join(plan.facet_sql.split()),
+            "compile_ms": round((time.perf_counter() - start) * 1000, 3),
+            "cache_hit": plan_cache_info()["hits"] > hits_before,
+        }
+    except KissqlCompileError as exc:
+        explain["plan"] = {"error": str(exc)}
+
+    if execute:
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        result = execute_query(query_obj, top_k=top_k, timings=timings)
+        timings["total"] = round((time.perf_counter() - start) * 1000, 3)
+        explain["execution"] = {
+            "timings_ms": timings,
+            "results": len(result.get("results", [])),
+            "comparison": {
+                k: v for k, v in result.get("comparison", {}).items() if k != "facet_impact"
+            },
+        }
+
+    explain["cache"] = {"parse": parse_cache_info(), "plan": plan_cache_info()}
+    return explain
+
+
 @router.post("/vector-reindex")
 async def vector_reindex(
     db: Database = Depends(get_database_instance),
@@ -133,19 +195,18 @@ async def vector_reindex(
 ):
     """Re-index all articles currently stored in the relational DB.
 
-    Returns the number of articles sent to the vector store.  This can be
-    triggered after first enabling Chroma or when the collection has been
+    Returns the number of articles written to the vector store.  This can be
+    triggered after an embedding model change or when embeddings have been
     wiped.
     """
     articles = db.get_all_articles()
-    indexed = 0
-    for article in articles:
-        try:
-            upsert_article(article)
-            indexed += 1
-        except Exception as exc:  # pragma: no cover – continue on error
-            print(f"Vector upsert failed for {article.get('uri')}: {exc}")
-    return {"indexed": indexed, "total": len(articles)}
+    stats = await upsert_articles_bulk_async(articles)
+    return {
+        "indexed": stats["indexed"],
+        "total": len(articles),
+        "cached": stats["cached"],
+        "failed": stats["failed"],
+    }
 
 
 # ------------------------------------------------------------------
@@ -171,7 +232,7 @@ def vector_similar_endpoint(
 
 
 # Helper to fetch vectors with optional metadata filter.
-# Split parameters onto separate lines to satisfy line-length limit.
+# Shared by the projection and anomaly endpoints.
 
 def _fetch_vectors(
     limit: int | None = None,
@@ -180,29 +241,11 @@ def _fetch_vectors(
     """Return `(vectors, metadatas, ids)` truncated to *limit* items.
 
     Vectors are returned as an ``np.ndarray`` of shape ``(n, dim)`` to
-    allow efficient downstream numeric work.  We always request
-    *embeddings* and *metadatas* so callers can build richer responses.
+    allow efficient downstream numeric work.  Reads go straight to the
+    pgvector ``articles.embedding`` column; *where* filters are applied in
+    SQL (equality or ``{"$in": [...]}``).
     """
-    import numpy as np  # Local import to avoid module-level dependency
-
-    collection = _vector_collection()
-    try:
-        kw = {"include": ["embeddings", "metadatas"]}
-        if limit:
-            kw["limit"] = limit  # type: ignore[assignment]
-        if where:
-            kw["where"] = where  # type: ignore[assignment]
-        res = collection.get(**kw)  # type: ignore[arg-type]
-    except Exception as exc:  # Fallback – corrupted records without embeddings
-        logging.getLogger(__name__).error(
-            "Chroma get() failed: %s", exc
-        )
-        return np.empty((0, 0), dtype=np.float32), [], []
-
-    vectors = np.asarray(res.get("embeddings", []), dtype=np.float32)
-    metadatas = res.get("metadatas", [])
-    ids = res.get("ids", [])
-    return vectors, metadatas, ids
+    return get_vectors_by_metadata(limit=limit, where=where)
 
 
 @router.get("/embedding_projection")
@@ -236,6 +279,7 @@ def embedding_projection(
     future_signal: Optional[str] = None,
     sentiment: Optional[str] = None,
     news_source: Optional[str] = None,
+    refresh: bool = Query(False, description="Refit the projection for this scope"),
     session=Depends(verify_session),
 ) -> Dict[str, Any]:
     """Return a 2-D UMAP projection together with a lightweight cluster label.
@@ -243,6 +287,11 @@ def embedding_projection(
     The caller receives a JSON list of objects – *one per vector* – each
     containing ``id``, ``x``, ``y``, ``cluster`` and a couple of handy
     metadata fields (currently ``title``).
+
+    Projections are precomputed per filter scope by
+    ``app.services.projection_store``. The first request for a scope queues
+    its fit and gets a 202 with ``status: "pending"`` and no points; later
+    requests read the stored coordinates.
     """
     # Set up logging outside try block to ensure it's always available
     logger = logging.getLogger(__name__)
@@ -266,432 +315,49 @@ def embedding_projection(
                 where["future_signal"] = future_signal
         
         # Handle pipe operators through executor if present
+        uris = None
         if q and "|" in q:
-            from app.kissql.parser import parse_full_query
+            from app.kissql.parser import parse_query_cached
             from app.kissql.executor import execute_query
             
             logger.info("Query contains pipe operators")
             
             # Parse and execute the query with KISSQL
-            query_obj = parse_full_query(q)
+            query_obj = parse_query_cached(q)
             result = execute_query(query_obj, top_k=top_k)
             
             # Extract IDs from the filtered results
             filtered_results = result.get("results", [])
-            filtered_ids = [r["id"] for r in filtered_results]
+            uris = [r["id"] for r in filtered_results]
             
             # Handle case with no results after filtering
-            if not filtered_ids:
+            if not uris:
                 logger.warning("No results after pipe filtering")
                 return {"points": [], "explain": {}, "centroids": {}}
-                
-            # Add URI filter to where clause
-            if where is None:
-                where = {}
-            where["uri"] = {"$in": filtered_ids}
             
-            logger.info(f"Applied pipe filtering: {len(filtered_ids)} results")
+            logger.info(f"Applied pipe filtering: {len(uris)} results")
 
-        # Get vectors from Chroma – fetch a bit more than requested but cap at 10k
+        # Return a bit more than requested but cap at 10k
         fetch_limit = min(max(top_k * 2, 5000), 10000)
 
-        vecs, metas, ids = _fetch_vectors(limit=fetch_limit, where=where)
-        logger.info(f"📦 Fetched {len(vecs) if vecs.size > 0 else 0} vectors from database")
-        
-        if vecs.size == 0:
-            logger.warning("⚠️ No vectors found!")
-            return {"points": [], "explain": {}, "centroids": {}}
-        
-        # Log data characteristics
-        logger.info(f"📊 Processing {len(vecs)} vectors with shape {vecs.shape}")
-        logger.info(f"💾 Memory usage: {vecs.nbytes / 1024 / 1024:.1f} MB")
-        
-        # Auto-downsample large datasets for performance
-        MAX_UMAP_SIZE = 5000  # UMAP becomes very slow above this
-        if len(vecs) > MAX_UMAP_SIZE and method == "umap":
-            logger.warning(f"⚡ Dataset too large ({len(vecs)} > {MAX_UMAP_SIZE}), downsampling for performance...")
-            
-            # Stratified sampling to preserve data distribution
-            import numpy as np
-            np.random.seed(42)  # Reproducible sampling
-            indices = np.random.choice(len(vecs), size=MAX_UMAP_SIZE, replace=False)
-            indices = np.sort(indices)  # Keep original order
-            
-            vecs = vecs[indices]
-            metas = [metas[i] for i in indices]
-            ids = [ids[i] for i in indices]
-            
-            logger.info(f"📉 Downsampled to {len(vecs)} vectors for UMAP performance")
-        
-        # Projection
-        from sklearn.cluster import MiniBatchKMeans
-        import numpy as np
-        
-        # Choose reducer based on method
-        if method == "tsne":
-            from sklearn.manifold import TSNE
-            reducer = TSNE(
-                n_components=dims,
-                metric="cosine",
-                random_state=42,
-                init="random",
-                learning_rate="auto",
-            )
-        elif method == "pca":
-            from sklearn.decomposition import PCA
-            reducer = PCA(n_components=dims, random_state=42)
-        else:  # default UMAP
-            import umap
-            logger.info("🎯 Starting UMAP dimensionality reduction...")
-            
-            # Enable numba logging to match working version
-            import os
-            os.environ['NUMBA_ENABLE_CUDASIM'] = '0'  # Ensure CUDA sim is off
-            
-            # Set numba logging to match working version behavior
-            numba_logger = logging.getLogger('numba')
-            numba_logger.setLevel(logging.DEBUG)
-            
-            # Clear numba cache to avoid compilation issues
-            try:
-                import numba
-                logger.info("🧹 Clearing numba cache to avoid compilation conflicts...")
-                # Force fresh compilation
-                os.environ['NUMBA_CACHE_DIR'] = ''  # Disable cache temporarily
-            except Exception as e:
-                logger.warning(f"Could not configure numba cache: {e}")
-            
-            # Use simple UMAP configuration like working version
-            reducer = umap.UMAP(
-                n_components=dims,
-                metric="cosine",
-                random_state=42,
-            )
-            logger.info("⚙️ UMAP initialized, starting fit_transform...")
-        
-        # Do dimensionality reduction with timeout monitoring
-        import time
-        import threading
-        
-        start_time = time.time()
-        result_container = [None]
-        error_container = [None]
-        
-        def reduction_task():
-            try:
-                result_container[0] = reducer.fit_transform(vecs)
-            except Exception as e:
-                error_container[0] = e
-        
-        # Start reduction in thread so we can monitor progress
-        thread = threading.Thread(target=reduction_task)
-        thread.daemon = True
-        thread.start()
-        
-        # Monitor progress with warnings
-        while thread.is_alive():
-            elapsed = time.time() - start_time
-            if elapsed > 10 and elapsed % 10 < 0.1:  # Every 10 seconds
-                logger.warning(f"⏰ UMAP still running after {elapsed:.0f} seconds...")
-            if elapsed > 120:  # 2 minute timeout
-                logger.error("💥 UMAP timeout after 2 minutes - switching to PCA fallback")
-                from sklearn.decomposition import PCA
-                pca_reducer = PCA(n_components=dims, random_state=42)
-                coords = pca_reducer.fit_transform(vecs)
-                logger.info(f"✅ PCA fallback completed! Output shape: {coords.shape}")
-                break
-            time.sleep(0.1)
-        else:
-            # Thread completed normally
-            if error_container[0]:
-                raise error_container[0]
-            coords = result_container[0]
-            logger.info(f"✅ Dimensionality reduction completed! Output shape: {coords.shape}")
-        
-        # Clustering
-        from sklearn.decomposition import PCA
-        
-        # Dimensionality reduction for clustering
-        if vecs.shape[1] > 50:
-            max_comps = min(50, vecs.shape[0], vecs.shape[1])
-            try:
-                pca50 = PCA(n_components=max_comps, random_state=42)
-                vec_for_cluster = pca50.fit_transform(vecs)
-            except ValueError:
-                vec_for_cluster = vecs
-        else:
-            vec_for_cluster = vecs
-        
-        # K-means clustering
-        n_clusters = max(2, min(n_clusters, len(vec_for_cluster)))
-        km = MiniBatchKMeans(n_clusters=n_clusters, random_state=42)
-        clusters = km.fit_predict(vec_for_cluster)
-        
-        # Generate enhanced cluster explanations
-        import re
-        from collections import Counter, defaultdict
-        from sklearn.feature_extraction import text as _sk_text
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        import numpy as np
-        
-        STOP_WORDS = set(_sk_text.ENGLISH_STOP_WORDS)
-        
-        # Enhanced STOP_WORDS with common news terms that don't add meaning
-        ENHANCED_STOP_WORDS = STOP_WORDS | {
-            'said', 'says', 'according', 'report', 'reports', 'news', 'new', 'latest',
-            'today', 'yesterday', 'week', 'month', 'year', 'time', 'years', 'months',
-            'company', 'companies', 'people', 'person', 'world', 'country', 'countries',
-            'government', 'state', 'states', 'city', 'way', 'ways', 'day', 'days',
-            'first', 'second', 'third', 'last', 'next', 'previous', 'current', 'recent',
-            'major', 'large', 'small', 'big', 'high', 'low', 'good', 'bad', 'better',
-            'best', 'worst', 'long', 'short', 'old', 'young', 'early', 'late', 'local',
-            'national', 'international', 'global', 'public', 'private', 'official',
-            'officials', 'sources', 'source', 'including', 'include', 'includes',
-            'part', 'parts', 'group', 'groups', 'number', 'numbers', 'total', 'many',
-            'several', 'various', 'different', 'similar', 'same', 'other', 'others',
-            'million', 'billion', 'thousand', 'million', 'percent', 'percentage'
-        }
-        
-        # Collect documents and metadata by cluster
-        cluster_documents = defaultdict(list)
-        cluster_metadata = defaultdict(list)
-        
-        for idx, lbl in enumerate(clusters):
-            meta = metas[idx] if idx < len(metas) else {}
-            title = meta.get('title', '')
-            summary = meta.get('summary', '')
-            
-            # Combine title and summary with title weighted more heavily
-            document = f"{title} {title} {summary}"  # Title appears twice for emphasis
-            
-            cluster_documents[int(lbl)].append(document)
-            cluster_metadata[int(lbl)].append(meta)
-        
-        # Generate enhanced explanations using TF-IDF and contextual analysis
-        explain = {}
-        
-        for lbl, docs in cluster_documents.items():
-            if not docs:
-                explain[lbl] = ["empty cluster"]
-                continue
-                
-            cluster_metas = cluster_metadata[lbl]
-            
-            # Method 1: TF-IDF based keyword extraction
-            combined_text = " ".join(docs)
-            
-            # Clean and tokenize
-            tokens = [
-                t.lower() for t in re.findall(r"\b[a-zA-Z]{3,}\b", combined_text)
-                if t.lower() not in ENHANCED_STOP_WORDS and len(t) >= 3
-            ]
-            
-            if not tokens:
-                explain[lbl] = ["misc content"]
-                continue
-            
-            # Get top keywords by frequency
-            keyword_counts = Counter(tokens)
-            top_keywords = [w for w, c in keyword_counts.most_common(15) if c >= 2]
-            
-            # Method 2: Extract domain-specific patterns
-            domain_patterns = []
-            
-            # Extract named entities and proper nouns (capitalized words)
-            named_entities = set()
-            for doc in docs:
-                entities = re.findall(r"\b[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\b", doc)
-                for entity in entities:
-                    if len(entity.split()) <= 3 and entity.lower() not in ENHANCED_STOP_WORDS:
-                        named_entities.add(entity.lower())
-            
-            # Extract common phrases (2-3 word combinations)
-            phrase_counts = Counter()
-            for doc in docs:
-                words = re.findall(r"\b[a-zA-Z]{3,}\b", doc.lower())
-                clean_words = [w for w in words if w not in ENHANCED_STOP_WORDS]
-                
-                # Extract bigrams and trigrams
-                for i in range(len(clean_words) - 1):
-                    bigram = f"{clean_words[i]} {clean_words[i+1]}"
-                    phrase_counts[bigram] += 1
-                    
-                for i in range(len(clean_words) - 2):
-                    trigram = f"{clean_words[i]} {clean_words[i+1]} {clean_words[i+2]}"
-                    phrase_counts[trigram] += 1
-            
-            # Get meaningful phrases (appearing at least twice)
-            meaningful_phrases = [phrase for phrase, count in phrase_counts.most_common(5) if count >= 2]
-            
-            # Method 3: Analyze metadata patterns
-            categories = [meta.get('category') for meta in cluster_metas if meta.get('category')]
-            topics = [meta.get('topic') for meta in cluster_metas if meta.get('topic')]
-            sentiments = [meta.get('sentiment') for meta in cluster_metas if meta.get('sentiment')]
-            
-            category_pattern = Counter(categories).most_common(1)
-            topic_pattern = Counter(topics).most_common(1)
-            sentiment_pattern = Counter(sentiments).most_common(1)
-            
-            # Generate human-readable cluster title and description
-            cluster_info = {
-                "keywords": [],
-                "title": "",
-                "summary": "",
-                "count": len(cluster_metas)
-            }
-            
-            # Analyze dominant themes for title generation
-            title_components = []
-            summary_components = []
-            
-            # Priority 1: Category context for title
-            if category_pattern and len(category_pattern[0]) > 0:
-                cat, cat_count = category_pattern[0]
-                if cat_count >= len(cluster_metas) * 0.4:  # At least 40% of articles
-                    title_components.append(cat.title())
-            
-            # Priority 2: Topic context for title
-            if topic_pattern and len(topic_pattern[0]) > 0:
-                topic, topic_count = topic_pattern[0]
-                if topic_count >= len(cluster_metas) * 0.4:
-                    title_components.append(topic.title())
-            
-            # Priority 3: Most meaningful phrases for title
-            if meaningful_phrases:
-                # Use the most common meaningful phrase as part of title
-                best_phrase = meaningful_phrases[0].title()
-                if len(best_phrase.split()) <= 3:  # Keep titles concise
-                    title_components.append(best_phrase)
-            
-            # Priority 4: Top keywords for title if nothing else
-            if not title_components and top_keywords:
-                title_components.append(top_keywords[0].title())
-            
-            # Generate human-readable title
-            if title_components:
-                # Create a natural title
-                if len(title_components) == 1:
-                    cluster_title = f"{title_components[0]} News"
-                elif len(title_components) == 2:
-                    cluster_title = f"{title_components[0]} & {title_components[1]}"
-                else:
-                    cluster_title = f"{title_components[0]} Topics"
-            else:
-                cluster_title = "Mixed Content"
-            
-            # Generate summary description
-            summary_parts = []
-            
-            # Add article count context
-            article_count = len(cluster_metas)
-            if article_count > 1:
-                summary_parts.append(f"{article_count} articles about")
-            
-            # Add main themes
-            if meaningful_phrases:
-                main_themes = [phrase for phrase in meaningful_phrases[:2] if len(phrase.split()) <= 4]
-                if main_themes:
-                    summary_parts.append(" and ".join(main_themes))
-            elif top_keywords:
-                main_themes = top_keywords[:3]
-                summary_parts.append(", ".join(main_themes))
-            
-            # Add category/topic context to summary
-            context_parts = []
-            if category_pattern and len(category_pattern[0]) > 0:
-                cat, cat_count = category_pattern[0]
-                if cat_count >= len(cluster_metas) * 0.3:
-                    context_parts.append(f"in {cat.lower()}")
-            
-            if topic_pattern and len(topic_pattern[0]) > 0:
-                topic, topic_count = topic_pattern[0]
-                if topic_count >= len(cluster_metas) * 0.3 and topic.lower() not in " ".join(context_parts).lower():
-                    context_parts.append(f"related to {topic.lower()}")
-            
-            if context_parts:
-                summary_parts.extend(context_parts)
-            
-            # Add sentiment if very dominant
-            if sentiment_pattern and len(sentiment_pattern[0]) > 0:
-                sent, sent_count = sentiment_pattern[0]
-                if sent_count >= len(cluster_metas) * 0.7:  # At least 70% of articles
-                    summary_parts.append(f"with {sent.lower()} sentiment")
-            
-            # Create final summary
-            if summary_parts:
-                cluster_summary = " ".join(summary_parts).capitalize()
-                if not cluster_summary.endswith('.'):
-                    cluster_summary += "."
-            else:
-                cluster_summary = f"Collection of {article_count} related articles."
-            
-            # Collect keywords for legacy compatibility and detailed view
-            description_parts = []
-            
-            # Add top meaningful phrases
-            description_parts.extend(meaningful_phrases[:2])
-            
-            # Add top keywords
-            description_parts.extend(top_keywords[:6])
-            
-            # Add named entities
-            description_parts.extend(list(named_entities)[:2])
-            
-            # Clean up and deduplicate keywords
-            unique_parts = []
-            seen = set()
-            for part in description_parts:
-                if part and part not in seen and len(part.strip()) > 2:
-                    unique_parts.append(part.strip())
-                    seen.add(part)
-            
-            final_keywords = unique_parts[:8] if unique_parts else top_keywords[:5]
-            if not final_keywords:
-                final_keywords = ["misc content"]
-            
-            # Store enhanced cluster information
-            cluster_info["keywords"] = final_keywords
-            cluster_info["title"] = cluster_title
-            cluster_info["summary"] = cluster_summary
-            
-            explain[lbl] = cluster_info
-        
-        # Calculate centroids
-        centroids = {}
-        if dims == 2:
-            for lbl in set(clusters):
-                idxs = np.where(clusters == lbl)[0]
-                if idxs.size:
-                    centroids[int(lbl)] = [
-                        float(coords[idxs, 0].mean()),
-                        float(coords[idxs, 1].mean()),
-                    ]
-        
-        # Generate final points
-        points = []
-        for i, _id in enumerate(ids):
-            meta = metas[i] if i < len(metas) else {}
-            point = {
-                "id": _id,
-                "x": float(coords[i, 0]),
-                "y": float(coords[i, 1]),
-                "cluster": int(clusters[i]),
-                "title": meta.get("title"),
-                "sentiment": meta.get("sentiment"),
-                "driver_type": meta.get("driver_type"),
-                "category": meta.get("category"),
-                "time_to_impact": meta.get("time_to_impact"),
-            }
-            if dims == 3:
-                point["z"] = float(coords[i, 2])
-            points.append(point)
-        
-        logger.info(f"Generated projection with {len(points)} points")
-        return {
-            "points": points,
-            "explain": explain,
-            "centroids": centroids,
-        }
+        # Coordinates come from the precomputed projection of the filter
+        # scope; pipe-filtered queries read a subset of that scope.
+        from app.services.projection_store import get_projection_store
+
+        projection = get_projection_store().get_projection(
+            method,
+            dims,
+            n_clusters,
+            filters=where,
+            uris=uris,
+            limit=fetch_limit,
+            refit=refresh,
+        )
+        if projection.get("status") == "pending":
+            logger.info("Projection for this scope is being fitted in the background")
+            return JSONResponse(status_code=202, content=projection)
+        logger.info(f"Generated projection with {len(projection['points'])} points")
+        return projection
     except Exception as e:
         logger.exception(f"Error in embedding projection: {e}")
         # Return valid response even on error
@@ -772,11 +438,11 @@ def patterns_endpoint(
 
         # Handle pipe operators through executor if present
         if q and "|" in q:
-            from app.kissql.parser import parse_full_query
+            from app.kissql.parser import parse_query_cached
             from app.kissql.executor import execute_query
             
             logger.info("Query contains pipe operators")
-            query_obj = parse_full_query(q)
+            query_obj = parse_query_cached(q)
             result = execute_query(query_obj, top_k=top_k)
             articles = result.get("results", [])
             logger.info(f"Applied pipe filtering: {len(articles)} articles")
@@ -1050,11 +716,11 @@ def embedding_anomalies(
     
         # Handle pipe operators through executor if present
         if q and "|" in q:
-            from app.kissql.parser import parse_full_query
+            from app.kissql.parser import parse_query_cached
             from app.kissql.executor import execute_query
             
             logger.info("Query contains pipe operators")
-            query_obj = parse_full_query(q)
+            query_obj = parse_query_cached(q)
             result = execute_query(query_obj, top_k=5000)
             
             # Extract IDs from the results
@@ -111,11 +111,11 @@ async def enhanced_vector_search(
     
     try:
         # Import KISSQL components
-        from app.kissql.parser import parse_full_query
+        from app.kissql.parser import parse_query_cached
         from app.kissql.executor import execute_query
         
         # Parse and execute search
-        query_obj = parse_full_query(request.q)
+        query_obj = parse_query_cached(request.q)
         
         # Add filters from request
         for field, value in request.filters.items():
@@ -250,10 +250,10 @@ async def export_search_results(
     
     try:
         # Re-run the search to get current results
-        from app.kissql.parser import parse_full_query
+        from app.kissql.parser import parse_query_cached
         from app.kissql.executor import execute_query
         
-        query_obj = parse_full_query(query)
+        query_obj = parse_query_cached(query)
         result = execute_query(query_obj, top_k=10000)
         
         results = result.get("results", [])
@@ -460,8 +460,8 @@ async def search_stream_websocket(websocket):
             })
             
             # Parse query
-            from app.kissql.parser import parse_full_query
-            query_obj = parse_full_query(query)
+            from app.kissql.parser import parse_query_cached
+            query_obj = parse_query_cached(query)
             
             await websocket.send_json({
                 "type": "progress", 
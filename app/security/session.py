@@ -13,6 +13,7 @@ Replace app/security/session.py with this file after migration.
 
 from fastapi import Request, HTTPException, status
 from app.security.oauth_users import get_oauth_user_by_session
+from app.security.user_cache import get_cached_user_by_email, get_cached_user_by_username
 from typing import Optional
 import logging
 
@@ -36,9 +37,7 @@ def verify_session(request: Request):
         username = session_data["user"]
 
         # CRITICAL: Verify user still exists and is active
-        from app.database import get_database_instance
-        db = get_database_instance()
-        user = db.facade.get_user_by_username(username)
+        user = get_cached_user_by_username(username)
 
         if not user:
             logger.warning(f"Session for non-existent user: {username}")
@@ -70,11 +69,8 @@ def verify_session(request: Request):
     oauth_user = get_oauth_user_by_session(session_data)
     if oauth_user and oauth_user.get('is_oauth'):
         # CRITICAL: Check if OAuth user entry in users table is active
-        from app.database import get_database_instance
-        db = get_database_instance()
-
         # OAuth users are stored by email as username
-        user = db.facade.get_user_by_email(oauth_user.get('email'))
+        user = get_cached_user_by_email(oauth_user.get('email'))
 
         if not user or not user.get('is_active', True):
             logger.warning(f"OAuth session for inactive user: {oauth_user.get('email')}")
@@ -118,9 +114,7 @@ def verify_session_api(request: Request):
         username = session_data["user"]
 
         # CRITICAL: Verify user is active
-        from app.database import get_database_instance
-        db = get_database_instance()
-        user = db.facade.get_user_by_username(username)
+        user = get_cached_user_by_username(username)
 
         if not user or not user.get('is_active', True):
             raise HTTPException(
@@ -142,9 +136,7 @@ def verify_session_api(request: Request):
     oauth_user = get_oauth_user_by_session(session_data)
     if oauth_user and oauth_user.get('is_oauth'):
         # Check if OAuth user is active
-        from app.database import get_database_instance
-        db = get_database_instance()
-        user = db.facade.get_user_by_email(oauth_user.get('email'))
+        user = get_cached_user_by_email(oauth_user.get('email'))
 
         if not user or not user.get('is_active', True):
             raise HTTPException(
@@ -194,25 +186,16 @@ def require_admin(request: Request):
         dict: Session data if user is admin
     """
     session = verify_session(request)
-    username = session.get("user")
+    user = session.get("user")
 
-    if not username:
-        # OAuth user - get email
-        oauth_user = get_oauth_user_by_session(session)
-        if oauth_user:
-            username = oauth_user.get('email')
-
-    if not username:
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Authentication required"
         )
 
-    # Check if user is admin
-    from app.database import get_database_instance
-    db = get_database_instance()
-
-    if not db.facade.check_user_is_admin(username):
+    # verify_session has already loaded the user record (traditional or OAuth)
+    if user.get('role') != 'admin':
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -258,9 +241,7 @@ def get_current_user_info(request: Request):
     oauth_user = get_oauth_user_by_session(session_data)
     if oauth_user and oauth_user.get('email'):
         # Get role from users table
-        from app.database import get_database_instance
-        db = get_database_instance()
-        user = db.facade.get_user_by_email(oauth_user.get('email'))
+        user = get_cached_user_by_email(oauth_user.get('email'))
 
         return {
             'username': oauth_user.get('email'),
@@ -274,9 +255,7 @@ def get_current_user_info(request: Request):
     # Check for traditional user
     if session_data.get("user"):
         username = session_data['user']
-        from app.database import get_database_instance
-        db = get_database_instance()
-        user = db.facade.get_user_by_username(username)
+        user = get_cached_user_by_username(username)
 
         if user:
             return {
@@ -0,0 +1,123 @@
+"""
+Short-TTL cache of user records for session validation.
+
+verify_session and friends run on every authenticated request, and a
+dashboard page fires a dozen of them in parallel. This cache serves the
+``users`` row from memory for a few seconds instead of querying the
+database each time.
+
+Entries are dropped immediately by ``invalidate_user`` when a user is
+updated or deactivated, or when an email is added to or removed from the
+OAuth allowlist. Deactivation therefore still takes effect on the next
+request. Lookups that find no user are not cached.
+
+Configuration (environment):
+- USER_CACHE_TTL_SECONDS (default 30; 0 disables the cache)
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+USERNAME = "username"
+EMAIL = "email"
+
+
+class UserRecordCache:
+    """In-process TTL cache of user rows keyed by username or email."""
+
+    def __init__(self, ttl_seconds: float = 30):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, str], Tuple[Dict[str, Any], float]] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, kind: str, value: Optional[str], loader: Callable[[str], Optional[Dict[str, Any]]]):
+        """Return the user row for ``(kind, value)``, calling ``loader(value)`` on a miss."""
+        if not value:
+            return None
+        if not self.ttl_seconds:
+            return loader(value)
+
+        key = (kind, value.lower())
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[1] < self.ttl_seconds:
+                self._stats["hits"] += 1
+                return dict(entry[0])
+            self._stats["misses"] += 1
+
+        user = loader(value)
+        if user:
+            with self._lock:
+                self._entries[key] = (dict(user), now)
+        return user
+
+    def invalidate(self, username: Optional[str] = None, email: Optional[str] = None) -> None:
+        """Drop every entry for ``username`` or ``email``, however it was looked up."""
+        names = {name.lower() for name in (username, email) if name}
+        if not names:
+            return
+        with self._lock:
+            stale = [
+                key for key, (user, _) in self._entries.items()
+                if key[1] in names
+                or (user.get("username") or "").lower() in names
+                or (user.get("email") or "").lower() in names
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats["invalidations"] += 1
+        logger.debug("Invalidated %d cached user records for %s", len(stale), ", ".join(sorted(names)))
+
+    def clear(self) -> None:
+        """Drop every cached user record."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
+
+
+_user_cache: Optional[UserRecordCache] = None
+
+
+def get_user_cache() -> UserRecordCache:
+    """Return the process-wide user record cache."""
+    global _user_cache
+
+    if _user_cache is None:
+        _user_cache = UserRecordCache(ttl_seconds=float(os.getenv("USER_CACHE_TTL_SECONDS", "30")))
+    return _user_cache
+
+
+def get_cached_user_by_username(username: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Cached equivalent of ``db.facade.get_user_by_username``."""
+    from app.database import get_database_instance
+    return get_user_cache().get(USERNAME, username, get_database_instance().facade.get_user_by_username)
+
+
+def get_cached_user_by_email(email: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Cached equivalent of ``db.facade.get_user_by_email``."""
+    from app.database import get_database_instance
+    return get_user_cache().get(EMAIL, email, get_database_instance().facade.get_user_by_email)
+
+
+def invalidate_user(username: Optional[str] = None, email: Optional[str] = None) -> None:
+    """Forget cached records for a user after it changes."""
+    get_user_cache().invalidate(username=username, email=email)
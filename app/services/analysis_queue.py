@@ -1,15 +1,50 @@
 """
-Analysis queue service for non-blocking bulk article processing.
-Uses asyncio queues to prevent UI blocking during large operations.
+Durable, priority-aware analysis queue for bulk article processing.
+
+Each URL of a bulk analysis job is a row in ``analysis_job_items``; the job
+itself is the ``background_tasks`` row with the same id, which workers keep
+up to date with per-job progress and the final result.
+
+Workers claim items by priority (interactive > scheduled > backfill) under
+a lease. A worker that crashes or is redeployed simply stops renewing its
+leases, and its items are picked up again once the lease expires, unless
+that was their last attempt, in which case they fail. Items whose handler
+raised are retried with exponential backoff. Workers can run inside the web
+process or on their own:
+
+    python -m app.services.analysis_queue
+
+Configuration (environment):
+- ANALYSIS_QUEUE_WORKERS (default 2 in-process workers; 0 disables them)
+- ANALYSIS_QUEUE_LEASE_SECONDS (default 300)
+- ANALYSIS_QUEUE_MAX_ATTEMPTS (default 3)
+- ANALYSIS_QUEUE_RETRY_BACKOFF_SECONDS (default 30; doubles with each attempt)
 """
 import asyncio
+import json
 import logging
-from typing import List, Dict, Callable, Optional
-from dataclasses import dataclass
+import os
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+PRIORITY_INTERACTIVE = 100
+PRIORITY_SCHEDULED = 50
+PRIORITY_BACKFILL = 10
+
+PRIORITIES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "scheduled": PRIORITY_SCHEDULED,
+    "backfill": PRIORITY_BACKFILL,
+}
+
+PENDING_STATUSES = ("queued", "leased")
+
+
 @dataclass
 class AnalysisTask:
     """Represents a single article analysis task"""
@@ -19,21 +54,140 @@ class AnalysisTask:
     summary: str = ""
     source: str = ""
     publication_date: str = ""
-    metadata: Dict = None
+    metadata: Dict = field(default_factory=dict)
+
+
+ItemHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
 
 class AnalysisQueue:
-    """Non-blocking queue for article analysis"""
+    """Database-backed queue of article analysis items with leased workers"""
 
-    def __init__(self, max_concurrent: int = 3, max_queue_size: int = 100):
+    def __init__(self, max_concurrent: int = 2, lease_seconds: int = 300, max_attempts: int = 3,
+                 poll_interval: float = 1.0, db=None, handler: Optional[ItemHandler] = None,
+                 retry_backoff_seconds: float = 30):
         self.max_concurrent = max_concurrent
-        self.max_queue_size = max_queue_size
-        self.task_queue = asyncio.Queue(maxsize=max_queue_size)
-        self.result_queue = asyncio.Queue()
-        self.workers = []
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._db = db
+        self._handler = handler or self._analyze_and_save
+        self._bulk_research = None
+        self.workers: List[asyncio.Task] = []
         self.is_running = False
-        self.progress_callback = None
-        self.completed_count = 0
-        self.total_count = 0
+
+    def _facade(self):
+        if self._db is None:
+            from app.database import get_database_instance
+            self._db = get_database_instance()
+        return self._db.facade
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(self, job_id: str, tasks: List[AnalysisTask], priority: int = PRIORITY_SCHEDULED) -> int:
+        """Persist ``tasks`` as queued items of ``job_id``. Returns the number queued."""
+        self._facade().enqueue_analysis_job_items([
+            {
+                "job_id": job_id,
+                "url": task.url,
+                "topic": task.topic,
+                "priority": priority,
+                "payload": json.dumps({
+                    "title": task.title,
+                    "summary": task.summary,
+                    "source": task.source,
+                    "publication_date": task.publication_date,
+                    "metadata": task.metadata or {},
+                }),
+                "max_attempts": self.max_attempts,
+            }
+            for task in tasks
+        ])
+        logger.info(f"Queued {len(tasks)} analysis items for job {job_id} (priority {priority})")
+        return len(tasks)
+
+    async def add_tasks(self, tasks: List[AnalysisTask], job_id: Optional[str] = None,
+                        priority: int = PRIORITY_SCHEDULED) -> str:
+        """Queue ``tasks`` under ``job_id`` (a new id if omitted) and make sure workers are running."""
+        job_id = job_id or str(uuid.uuid4())
+        self.enqueue(job_id, tasks, priority)
+        if self.max_concurrent and not self.is_running:
+            await self.start_workers()
+        return job_id
+
+    def cancel_job(self, job_id: str) -> int:
+        """Cancel the items of ``job_id`` that no worker has picked up yet."""
+        cancelled = self._facade().cancel_analysis_job_items(job_id)
+        self._record_progress(job_id)
+        logger.info(f"Cancelled {cancelled} queued analysis items for job {job_id}")
+        return cancelled
+
+    def get_progress(self, job_id: str) -> Dict:
+        """Get per-job progress information"""
+        counts = self._facade().get_analysis_job_counts(job_id)
+        total = sum(counts.values())
+        done = total - sum(counts.get(status, 0) for status in PENDING_STATUSES)
+        return {
+            'job_id': job_id,
+            'completed': done,
+            'total': total,
+            'percentage': (done / total * 100) if total > 0 else 0,
+            'remaining': total - done,
+            'counts': counts,
+            'workers_active': len([w for w in self.workers if not w.done()]),
+            'is_running': self.is_running
+        }
+
+    async def wait_completion(self, job_id: str, timeout: Optional[float] = None,
+                              progress_callback: Callable = None) -> List[Dict]:
+        """Wait until no item of ``job_id`` is queued or leased, then return its results.
+
+        On timeout the results so far are returned; unfinished items stay
+        queued and are still processed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        last_done = -1
+
+        while True:
+            progress = self.get_progress(job_id)
+            if progress_callback and progress['completed'] != last_done:
+                last_done = progress['completed']
+                try:
+                    progress_callback(last_done, f"{last_done}/{progress['total']} articles analyzed")
+                except Exception as e:
+                    logger.error(f"Progress callback error: {e}")
+            if progress['remaining'] == 0:
+                break
+            if deadline and loop.time() >= deadline:
+                logger.warning(f"Analysis job {job_id} timed out after {timeout} seconds")
+                break
+            await asyncio.sleep(self.poll_interval)
+
+        return self.get_results(job_id)
+
+    def get_results(self, job_id: str) -> List[Dict]:
+        """Return one result dict per item of ``job_id``."""
+        results = []
+        for row in self._facade().get_analysis_job_results(job_id):
+            results.append({
+                'url': row['url'],
+                'topic': row['topic'],
+                'status': row['status'],
+                'success': row['status'] == 'completed',
+                'result': json.loads(row['result']) if row['result'] else None,
+                'error': row['error'],
+                'attempts': row['attempts'],
+            })
+        return results
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
 
     async def start_workers(self):
         """Start worker tasks for processing analysis"""
@@ -41,181 +195,174 @@ class AnalysisQueue:
             return
 
         self.is_running = True
-        self.workers = []
-
-        for i in range(self.max_concurrent):
-            worker = asyncio.create_task(self._worker(f"worker-{i}"))
-            self.workers.append(worker)
-
-        logger.info(f"Started {len(self.workers)} analysis workers")
+        self.workers = [
+            asyncio.create_task(self._worker(f"worker-{i}"))
+            for i in range(self.max_concurrent)
+        ]
+        logger.info(f"Started {len(self.workers)} analysis workers ({self.worker_id})")
 
     async def stop_workers(self):
-        """Stop all worker tasks"""
+        """Stop all worker tasks. Items they hold are re-claimed after their lease expires."""
         if not self.is_running:
             return
 
         self.is_running = False
-
-        # Cancel all workers
         for worker in self.workers:
             worker.cancel()
-
-        # Wait for workers to finish
         await asyncio.gather(*self.workers, return_exceptions=True)
         self.workers = []
 
         logger.info("Stopped all analysis workers")
 
-    async def add_tasks(self, tasks: List[AnalysisTask], progress_callback: Callable = None):
-        """Add analysis tasks to the queue"""
-        if not self.is_running:
-            await self.start_workers()
-
-        self.progress_callback = progress_callback
-        self.completed_count = 0
-        self.total_count = len(tasks)
-
-        for task in tasks:
-            try:
-                await self.task_queue.put(task)
-            except asyncio.QueueFull:
-                logger.warning(f"Analysis queue full, skipping task: {task.url}")
-
-        logger.info(f"Added {len(tasks)} tasks to analysis queue")
+    async def run_once(self, worker_name: str = "worker-0") -> bool:
+        """Claim and process one item. Returns False if nothing was claimable."""
+        owner = f"{self.worker_id}/{worker_name}"
+        for job_id in set(self._facade().fail_exhausted_analysis_job_items()):
+            self._record_progress(job_id)
+        items = self._facade().claim_analysis_job_items(owner, 1, self.lease_seconds)
+        if not items:
+            return False
+        await self._process(items[0], owner)
+        return True
 
     async def _worker(self, worker_name: str):
-        """Worker coroutine for processing analysis tasks"""
-        from app.bulk_research import BulkResearch
-        from app.database import get_database_instance
-
+        """Worker coroutine: claim, process, repeat; back off while the queue is empty"""
+        logger.debug(f"Analysis worker {worker_name} started")
         try:
-            db = get_database_instance()
-            bulk_research = BulkResearch(db)
-
-            logger.debug(f"Analysis worker {worker_name} started")
-
             while self.is_running:
                 try:
-                    # Get task from queue with timeout
-                    task = await asyncio.wait_for(
-                        self.task_queue.get(),
-                        timeout=1.0
-                    )
-
-                    # Process the task
-                    start_time = datetime.now()
-                    try:
-                        # Analyze single article
-                        results = await bulk_research.analyze_bulk_urls(
-                            urls=[task.url],
-                            topic=task.topic,
-                            summary_type='curious_ai',
-                            model_name='gpt-4',
-                            summary_length=50,
-                            summary_voice='neutral'
-                        )
-
-                        result = {
-                            'task': task,
-                            'success': True,
-                            'result': results[0] if results else None,
-                            'processing_time': (datetime.now() - start_time).total_seconds(),
-                            'worker': worker_name
-                        }
-
-                    except Exception as e:
-                        result = {
-                            'task': task,
-                            'success': False,
-                            'error': str(e),
-                            'processing_time': (datetime.now() - start_time).total_seconds(),
-                            'worker': worker_name
-                        }
-                        logger.error(f"Worker {worker_name} failed to process {task.url}: {e}")
-
-                    # Put result in result queue
-                    await self.result_queue.put(result)
-
-                    # Update progress
-                    self.completed_count += 1
-                    if self.progress_callback:
-                        try:
-                            self.progress_callback(
-                                self.completed_count,
-                                task.title or task.url
-                            )
-                        except Exception as e:
-                            logger.error(f"Progress callback error: {e}")
-
-                    # Mark task as done
-                    self.task_queue.task_done()
-
-                    logger.debug(f"Worker {worker_name} completed task: {task.url}")
-
-                except asyncio.TimeoutError:
-                    # Timeout waiting for task, continue loop
-                    continue
-
+                    if not await self.run_once(worker_name):
+                        await asyncio.sleep(self.poll_interval)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Analysis worker {worker_name} error: {e}")
+                    await asyncio.sleep(self.poll_interval)
         except asyncio.CancelledError:
             logger.debug(f"Analysis worker {worker_name} cancelled")
-        except Exception as e:
-            logger.error(f"Analysis worker {worker_name} error: {e}")
-
-    async def get_results(self) -> List[Dict]:
-        """Get all completed results"""
-        results = []
 
+    async def _renew_lease(self, item_id: int, owner: str):
         while True:
+            await asyncio.sleep(self.lease_seconds / 3)
             try:
-                result = self.result_queue.get_nowait()
-                results.append(result)
-            except asyncio.QueueEmpty:
-                break
-
-        return results
-
-    async def wait_completion(self, timeout: Optional[float] = None) -> List[Dict]:
-        """Wait for all tasks to complete and return results"""
+                self._facade().extend_analysis_job_item_leases([item_id], owner, self.lease_seconds)
+            except Exception as e:
+                logger.warning(f"Could not renew lease on analysis item {item_id}: {e}")
+
+    async def _process(self, item: Dict[str, Any], owner: str):
+        item = dict(item, payload=json.loads(item['payload']) if item.get('payload') else {})
+        start_time = datetime.now()
+        heartbeat = asyncio.create_task(self._renew_lease(item['id'], owner))
         try:
-            # Wait for all tasks to be processed
-            await asyncio.wait_for(self.task_queue.join(), timeout=timeout)
-
-            # Collect all results
-            results = await self.get_results()
-
-            logger.info(f"Analysis queue completed: {len(results)} results")
-            return results
-
-        except asyncio.TimeoutError:
-            logger.warning(f"Analysis queue timed out after {timeout} seconds")
-            # Return partial results
-            return await self.get_results()
+            result = await self._handler(item)
+            result = dict(result or {}, processing_time=(datetime.now() - start_time).total_seconds())
+            self._facade().finish_analysis_job_item(item['id'], owner, 'completed', result=json.dumps(result))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            retry = item['attempts'] < item['max_attempts']
+            logger.error(f"Analysis of {item['url']} failed (attempt {item['attempts']}/{item['max_attempts']}): {e}")
+            self._facade().finish_analysis_job_item(
+                item['id'], owner, 'queued' if retry else 'failed', error=str(e),
+                retry_delay_seconds=self.retry_backoff_seconds * 2 ** (item['attempts'] - 1) if retry else 0
+            )
+        finally:
+            heartbeat.cancel()
+
+        self._record_progress(item['job_id'], current=item['payload'].get('title') or item['url'])
+
+    def _record_progress(self, job_id: str, current: Optional[str] = None):
+        """Mirror per-job counts into the job's background_tasks row, completing it when done."""
+        try:
+            counts = self._facade().get_analysis_job_counts(job_id)
+            total = sum(counts.values())
+            done = total - sum(counts.get(status, 0) for status in PENDING_STATUSES)
+            finished = total > 0 and done == total
+            self._facade().update_background_task_progress(
+                job_id,
+                processed_items=done,
+                progress=(done / total * 100) if total else 0.0,
+                current_item=current,
+                status='completed' if finished else None,
+                result=json.dumps({
+                    "analyzed_count": counts.get('completed', 0),
+                    "error_count": counts.get('failed', 0),
+                    "cancelled_count": counts.get('cancelled', 0),
+                }) if finished else None
+            )
+        except Exception as e:
+            logger.warning(f"Could not update progress for analysis job {job_id}: {e}")
+
+    async def _analyze_and_save(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Default handler: analyze one URL and save it, so results survive a restart."""
+        if self._bulk_research is None:
+            from app.bulk_research import BulkResearch
+            from app.database import get_database_instance
+            self._bulk_research = BulkResearch(get_database_instance())
+
+        params = item['payload'].get('metadata') or {}
+        results = await self._bulk_research.analyze_bulk_urls(
+            urls=[item['url']],
+            topic=item['topic'],
+            summary_type=params.get('summary_type', 'curious_ai'),
+            model_name=params.get('model_name', 'gpt-4'),
+            summary_length=params.get('summary_length', 50),
+            summary_voice=params.get('summary_voice', 'neutral')
+        )
+        article = results[0] if results else None
+        if not article or article.get('error'):
+            raise RuntimeError(article.get('error') if article else "No analysis result")
+
+        saved = await self._bulk_research.save_bulk_articles([article])
+        if saved.get('errors'):
+            raise RuntimeError(f"Save failed: {saved['errors'][0]}")
+
+        return {'uri': article.get('uri', item['url']), 'title': article.get('title')}
 
-    def get_progress(self) -> Dict:
-        """Get current progress information"""
-        return {
-            'completed': self.completed_count,
-            'total': self.total_count,
-            'percentage': (self.completed_count / self.total_count * 100) if self.total_count > 0 else 0,
-            'remaining': self.total_count - self.completed_count,
-            'queue_size': self.task_queue.qsize(),
-            'workers_active': len([w for w in self.workers if not w.done()]),
-            'is_running': self.is_running
-        }
 
 # Global queue instance
 _analysis_queue: Optional[AnalysisQueue] = None
 
+
 def get_analysis_queue() -> AnalysisQueue:
     """Get or create the global analysis queue"""
     global _analysis_queue
     if _analysis_queue is None:
-        _analysis_queue = AnalysisQueue(max_concurrent=2, max_queue_size=50)
+        _analysis_queue = AnalysisQueue(
+            max_concurrent=int(os.getenv("ANALYSIS_QUEUE_WORKERS", "2")),
+            lease_seconds=int(os.getenv("ANALYSIS_QUEUE_LEASE_SECONDS", "300")),
+            max_attempts=int(os.getenv("ANALYSIS_QUEUE_MAX_ATTEMPTS", "3")),
+            retry_backoff_seconds=float(os.getenv("ANALYSIS_QUEUE_RETRY_BACKOFF_SECONDS", "30")),
+        )
     return _analysis_queue
 
+
+async def resume_analysis_queue():
+    """Start in-process workers if items were left queued or leased before a restart."""
+    queue = get_analysis_queue()
+    if queue.max_concurrent and queue._facade().has_pending_analysis_job_items():
+        logger.info("Resuming analysis jobs left over from a previous run")
+        await queue.start_workers()
+
+
 async def shutdown_analysis_queue():
     """Shutdown the global analysis queue"""
     global _analysis_queue
     if _analysis_queue:
         await _analysis_queue.stop_workers()
-        _analysis_queue = None
\ No newline at end of file
+        _analysis_queue = None
+
+
+async def _run_standalone_workers():
+    queue = get_analysis_queue()
+    queue.max_concurrent = queue.max_concurrent or 1
+    await queue.start_workers()
+    try:
+        await asyncio.gather(*queue.workers)
+    finally:
+        await queue.stop_workers()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    asyncio.run(_run_standalone_workers())
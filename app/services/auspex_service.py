@@ -17,7 +17,7 @@ from app.services.search_router import get_search_router, SearchSource
 from app.services.chart_service import ChartService
 from app.services.tool_plugin_base import get_tool_registry, init_tool_registry
 from app.analyze_db import AnalyzeDB
-from app.vector_store import search_articles as vector_search_articles
+from app.services.hybrid_search import hybrid_search_articles, hybrid_search_articles_async
 from app.ai_models import get_ai_model
 
 logger = logging.getLogger(__name__)
@@ -694,9 +694,11 @@ class AuspexService:
                 # Search using the database's search_articles method with keyword search
                 articles, count = self.db.search_articles(
                     topic=topic,
-                    keyword=entity,  # This searches title, summary, category, future_signal, sentiment, tags
+                    keyword=entity,  # Full-text search over title, summary, category, future_signal, sentiment, tags
                     page=1,
-                    per_page=100  # Get a reasonable sample to validate existence
+                    per_page=100,  # Get a reasonable sample to validate existence
+                    projection='list',
+                    sort='relevance'
                 )
                 
                 if articles:
@@ -738,7 +740,9 @@ class AuspexService:
                     topic=topic,
                     keyword=entity,
                     page=1,
-                    per_page=limit * 2  # Get more to allow for filtering
+                    per_page=limit * 2,  # Get more to allow for filtering
+                    projection='list',
+                    sort='relevance'  # Best full-text matches first
                 )
                 
                 # Filter to only include articles that actually contain the entity
@@ -1331,14 +1335,14 @@ CURRENT SESSION CONTEXT:
         """
         Get articles for chart generation.
 
-        Uses vector search to get articles with sentiment data for the given topic.
+        Uses hybrid search to get articles with sentiment data for the given topic.
         """
         try:
             # Build metadata filter for topic
             metadata_filter = {"topic": topic}
 
-            # Use vector search to get articles
-            vector_results = vector_search_articles(
+            # Use hybrid search to get articles
+            vector_results = await hybrid_search_articles_async(
                 query=f"articles about {topic}",
                 top_k=limit,
                 metadata_filter=metadata_filter
@@ -1440,7 +1444,7 @@ PRIORITIZE insights relevant to these concerns and tailor analysis to this organ
         context = {
             "topic": topic,
             "db": self.db,
-            "vector_store": vector_search_articles,
+            "vector_store": hybrid_search_articles,
             "ai_model": get_ai_model,
             "profile_context": profile_context
         }
@@ -1769,8 +1773,8 @@ Extracted search query (respond with ONLY the query, no explanation):"""
                 else:
                     metadata_filter = {"topic": topic}
 
-                # Use extracted search_query (not original message) for vector search
-                vector_results = vector_search_articles(
+                # Use extracted search_query (not original message) for hybrid search
+                vector_results = await hybrid_search_articles_async(
                     query=search_query,
                     top_k=search_limit,  # Use search_limit which may be increased by citation_limit
                     metadata_filter=metadata_filter
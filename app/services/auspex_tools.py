@@ -11,7 +11,7 @@ from typing import Dict, List, Optional
 from app.collectors.thenewsapi_collector import TheNewsAPICollector
 from app.database import get_database_instance
 from app.analyze_db import AnalyzeDB
-from app.vector_store import search_articles as vector_search_articles
+from app.services.hybrid_search import hybrid_search_articles_async
 from app.ai_models import get_ai_model
 
 logger = logging.getLogger(__name__)
@@ -54,8 +54,8 @@ class AuspexToolsService:
         if len(articles) <= limit:
             return articles
         
-        # Sort by similarity score first (best matches first)
-        sorted_articles = sorted(articles, key=lambda x: x.get('similarity_score', 1.0))
+        # Sort by fused relevance score first (best matches first)
+        sorted_articles = sorted(articles, key=lambda x: x.get('similarity_score', 0), reverse=True)
         
         selected = []
         seen_categories = set()
@@ -88,181 +88,110 @@ class AuspexToolsService:
         
         return selected[:limit]
 
+    def _query_days_back(self, query: str) -> Optional[int]:
+        """Publication-date window in days implied by the wording of ``query``, if any."""
+        query_lower = query.lower()
+
+        # Explicit periods first
+        explicit_date_patterns = {
+            "last 7 days": 7,
+            "past 7 days": 7,
+            "last week": 7,
+            "past week": 7,
+            "last month": 30,
+            "past month": 30,
+            "last 30 days": 30,
+            "past 30 days": 30,
+        }
+        for pattern, days in explicit_date_patterns.items():
+            if pattern in query_lower:
+                logger.info(f"EXPLICIT DATE PATTERN MATCH: '{pattern}' -> {days} days")
+                return days
+
+        time_keywords = ['past', 'last', 'recent', 'days', 'week', 'month', 'yesterday', 'today', 'current', 'latest', 'new']
+        analysis_keywords = ['analyze', 'analysis', 'provided', 'news articles', 'articles', 'developments', 'trends']
+        if not any(word in query_lower for word in time_keywords + analysis_keywords):
+            return None
+
+        if 'latest' in query_lower:
+            return 7
+        if 'yesterday' in query_lower:
+            return 1
+        if 'comprehensive' in query_lower or 'detailed' in query_lower:
+            return 30
+        if 'trends' in query_lower and any(word in query_lower for word in ['last', 'past', 'from']):
+            if '7' in query_lower or 'week' in query_lower:
+                return 7
+            if '30' in query_lower or 'month' in query_lower:
+                return 30
+        return 14  # Default for analysis requests
+
     async def enhanced_database_search(self, query: str, topic: str, limit: int = 50, model: str = "gpt-3.5-turbo") -> Dict:
         """Enhanced database search with hybrid vector/SQL search and intelligent query parsing."""
         try:
             # Get available options for this topic
             topic_options = self.analyze_db.get_topic_options(topic)
             
-            # Enhanced search strategy: Use both SQL and vector search
-            # First, try vector search for semantic understanding
-            vector_articles = []
+            # Hybrid retrieval: full-text and vector candidates fused by rank,
+            # with the topic and any date window filtered in SQL
+            hybrid_articles = []
             try:
-                # Build metadata filter for vector search
                 metadata_filter = {"topic": topic}
-                
-                # EXPLICIT CHECK for common date patterns (safety net)
-                explicit_date_patterns = {
-                    "trends from the last 7 days": 7,
-                    "trends from the past 7 days": 7,
-                    "trends in the last 7 days": 7,
-                    "trends over the last 7 days": 7,
-                    "last 7 days": 7,
-                    "past 7 days": 7,
-                    "last week": 7,
-                    "past week": 7,
-                    "last month": 30,
-                    "past month": 30,
-                    "last 30 days": 30,
-                    "past 30 days": 30,
-                }
-                
-                query_lower = query.lower()
-                explicit_days_back = None
-                for pattern, days in explicit_date_patterns.items():
-                    if pattern in query_lower:
-                        explicit_days_back = days
-                        logger.info(f"EXPLICIT DATE PATTERN MATCH: '{pattern}' -> {days} days")
-                        break
-                
-                if explicit_days_back:
-                    cutoff_datetime = datetime.now() - timedelta(days=explicit_days_back)
-                    cutoff_timestamp = int(cutoff_datetime.timestamp())
-                    # Use proper ChromaDB syntax for combining filters
-                    vector_date_filter = {
-                        "$and": [
-                            {"topic": topic},
-                            {"publication_date_ts": {"$gte": cutoff_timestamp}}
-                        ]
-                    }
-                    logger.info(f"EXPLICIT date filter applied: publication_date_ts >= {cutoff_timestamp} ({cutoff_datetime.strftime('%Y-%m-%d %H:%M:%S')})")
-                    logger.info(f"Vector date filter: {vector_date_filter}")
-                else:
-                    vector_date_filter = {"topic": topic}
-                
-                vector_results = vector_search_articles(
+                days_back = self._query_days_back(query)
+                if days_back:
+                    cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+                    logger.info(f"Date window for query: past {days_back} days (publication_date >= {cutoff_date})")
+                    # Undated articles are kept, as they cannot be ruled out
+                    metadata_filter = {"$and": [
+                        {"topic": topic},
+                        {"$or": [{"publication_date": {"$gte": cutoff_date}}, {"publication_date": None}]},
+                    ]}
+
+                results = await hybrid_search_articles_async(
                     query=query,
                     top_k=limit,
-                    metadata_filter=vector_date_filter
+                    metadata_filter=metadata_filter
                 )
-                
-                # Convert vector results to article format
-                for result in vector_results:
-                    if result.get("metadata"):
-                        vector_articles.append({
-                            "uri": result["metadata"].get("uri"),
-                            "title": result["metadata"].get("title"),
-                            "summary": result["metadata"].get("summary"),
-                            "category": result["metadata"].get("category"),
-                            "sentiment": result["metadata"].get("sentiment"),
-                            "future_signal": result["metadata"].get("future_signal"),
-                            "time_to_impact": result["metadata"].get("time_to_impact"),
-                            "publication_date": result["metadata"].get("publication_date"),
-                            "news_source": result["metadata"].get("news_source"),
-                            "tags": result["metadata"].get("tags", "").split(",") if result["metadata"].get("tags") else [],
-                            "similarity_score": result.get("score", 0)
-                        })
-                
-                logger.debug(f"Vector search found {len(vector_articles)} semantically relevant articles")
-                
-                # Post-processing date filter (fallback for articles without timestamp metadata)
-                time_keywords = ['past', 'last', 'recent', 'days', 'week', 'month', 'yesterday', 'today', 'current', 'latest', 'new']
-                analysis_keywords = ['analyze', 'analysis', 'provided', 'news articles', 'articles', 'developments', 'trends']
-                
-                query_lower = query.lower()
-                has_time_words = any(time_word in query_lower for time_word in time_keywords)
-                has_analysis_words = any(analysis_word in query_lower for analysis_word in analysis_keywords)
-                
-                logger.info(f"Fallback date filtering check for query: '{query}'")
-                logger.info(f"Has time words: {has_time_words} (found: {[word for word in time_keywords if word in query_lower]})")
-                logger.info(f"Has analysis words: {has_analysis_words} (found: {[word for word in analysis_keywords if word in query_lower]})")
-                
-                # Apply fallback date filtering for articles that might lack timestamp metadata
-                if has_time_words or has_analysis_words:
-                    days_back = 14  # Default for analysis requests
-                    
-                    # More comprehensive pattern matching for time periods
-                    if any(phrase in query_lower for phrase in ['past 7 days', 'last 7 days', 'from the last 7 days']):
-                        days_back = 7
-                    elif any(phrase in query_lower for phrase in ['past week', 'last week', 'from the last week']):
-                        days_back = 7
-                    elif 'latest' in query_lower:
-                        days_back = 7
-                    elif 'yesterday' in query_lower:
-                        days_back = 1
-                    elif any(phrase in query_lower for phrase in ['past month', 'last month', 'from the last month']):
-                        days_back = 30
-                    elif any(phrase in query_lower for phrase in ['past 30 days', 'last 30 days', 'from the last 30 days']):
-                        days_back = 30
-                    elif 'comprehensive' in query_lower or 'detailed' in query_lower:
-                        days_back = 30
-                    elif 'recent' in query_lower or 'current' in query_lower:
-                        days_back = 14
-                    elif 'trends' in query_lower and any(time_word in query_lower for time_word in ['last', 'past', 'from']):
-                        # Special handling for trend queries with time references
-                        if '7' in query_lower or 'week' in query_lower:
-                            days_back = 7
-                        elif '30' in query_lower or 'month' in query_lower:
-                            days_back = 30
-                        else:
-                            days_back = 14  # Default for trends
-                    
-                    logger.info(f"Fallback date filtering triggered: {days_back} days back")
-                    
-                    cutoff_date = datetime.now() - timedelta(days=days_back)
-                    original_count = len(vector_articles)
-                    
-                    # Filter articles by publication_date string (fallback for articles without timestamp)
-                    filtered_vector_articles = []
-                    for article in vector_articles:
-                        article_date_str = article.get('publication_date', '')
-                        if article_date_str:
-                            try:
-                                if ' ' in article_date_str:
-                                    date_part = article_date_str.split(' ')[0]
-                                else:
-                                    date_part = article_date_str[:10]
-                                
-                                article_date = datetime.strptime(date_part, '%Y-%m-%d')
-                                if article_date >= cutoff_date:
-                                    filtered_vector_articles.append(article)
-                                else:
-                                    logger.debug(f"Fallback filter: excluded article from {date_part}: {article.get('title', 'Unknown')[:50]}...")
-                            except Exception as e:
-                                logger.warning(f"Could not parse date '{article_date_str}' for article {article.get('uri', 'unknown')}: {e}")
-                                filtered_vector_articles.append(article)  # Include on error
-                        else:
-                            filtered_vector_articles.append(article)  # Include articles without dates
-                    
-                    if original_count != len(filtered_vector_articles):
-                        logger.info(f"Fallback date filtering: {original_count} -> {len(filtered_vector_articles)} articles (past {days_back} days, cutoff: {cutoff_date.strftime('%Y-%m-%d')})")
-                        vector_articles = filtered_vector_articles
-                    else:
-                        logger.info(f"Fallback date filtering: No articles filtered out (all {original_count} articles are recent)")
-                else:
-                    logger.info("Fallback date filtering: Not triggered (no time or analysis keywords found)")
-                
+
+                for result in results:
+                    metadata = result["metadata"]
+                    hybrid_articles.append({
+                        "uri": metadata.get("uri"),
+                        "title": metadata.get("title"),
+                        "summary": metadata.get("summary"),
+                        "category": metadata.get("category"),
+                        "sentiment": metadata.get("sentiment"),
+                        "future_signal": metadata.get("future_signal"),
+                        "time_to_impact": metadata.get("time_to_impact"),
+                        "publication_date": metadata.get("publication_date"),
+                        "news_source": metadata.get("news_source"),
+                        "tags": metadata.get("tags", "").split(",") if metadata.get("tags") else [],
+                        "similarity_score": result["score"]
+                    })
+
+                logger.debug(f"Hybrid search found {len(hybrid_articles)} relevant articles")
+
             except Exception as e:
-                logger.warning(f"Vector search failed, falling back to SQL search: {e}")
-                vector_articles = []
+                logger.warning(f"Hybrid search failed, falling back to SQL search: {e}")
+                hybrid_articles = []
 
-            # If vector search found good results, use them; otherwise fall back to SQL search
-            if len(vector_articles) >= 10:
+            # If hybrid search found good results, use them; otherwise fall back to SQL search
+            if len(hybrid_articles) >= 10:
                 # Enhanced selection: Apply diversity and quality filtering
-                articles = self._select_diverse_articles(vector_articles, limit)
-                total_count = len(vector_articles)
-                search_method = "semantic vector search with diversity filtering"
+                articles = self._select_diverse_articles(hybrid_articles, limit)
+                total_count = len(hybrid_articles)
+                search_method = "hybrid keyword and semantic search with diversity filtering"
                 
                 # Format search criteria for display
-                search_summary = f"""## Search Method: Enhanced Semantic Search
+                search_summary = f"""## Search Method: Hybrid Search
 - **Query**: "{query}"
 - **Topic Filter**: {topic}
-- **Search Type**: Vector similarity search using embeddings
-- **Results**: Found {total_count} semantically relevant articles
+- **Search Type**: Full-text and vector similarity search, fused by rank
+- **Results**: Found {total_count} relevant articles
 - **Analysis Limit**: {limit} articles
 
 ## Results Overview
-Analyzing the {len(articles)} most semantically similar articles
+Analyzing the {len(articles)} most relevant articles
 """
             else:
                 # Fall back to intelligent SQL-based search logic
@@ -665,7 +594,7 @@ Analyzing the {len(articles)} most recent articles
     async def get_article_categories(self, topic: str) -> Dict:
         """Get article categories and their distribution."""
         try:
-            articles, _ = self.db.facade.search_articles(topic=topic, page=1, per_page=1000)
+            articles, _ = self.db.facade.search_articles(topic=topic, page=1, per_page=1000, projection='list')
             
             # Analyze category distribution
             category_counts = {}
@@ -26,15 +26,43 @@ from app.relevance import RelevanceCalculator
 from app.analyzers.article_analyzer import ArticleAnalyzer
 from app.ai_models import LiteLLMModel, get_available_models
 import asyncio
-import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
 import requests
 from app.config.config import load_config, get_topic_description
+from app.services.ontology_registry import get_ontology_registry
+from app.services.ingest_pipeline import Stage, StagePipeline
 import time
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Per-article soft timeouts (seconds); on expiry the article continues without the step's output
+SCRAPE_TIMEOUT = 60
+ANALYSIS_TIMEOUT = 60
+VECTOR_INDEX_TIMEOUT = 30
+
+
+class _ArticleState:
+    """An article on its way through the ingest stages"""
+
+    def __init__(self, article: Dict[str, Any], topic: str, keywords: List[str]):
+        self.article = article
+        self.topic = topic
+        self.keywords = keywords
+        self.uri = article.get('uri', 'unknown')
+
+        # CRITICAL: Preserve original data from API throughout processing
+        self.original_title = article.get('title', '')
+        self.original_source = article.get('news_source', '')
+        self.original_pub_date = article.get('publication_date', '')
+
+        self.enriched: Dict[str, Any] = article
+        self.raw_content: Optional[str] = None
+        self.quick_score: float = 0
+        self.relevance_score: float = 0
+        self.quality_score: Optional[float] = None
+
+
 class AutomatedIngestService:
     """Service for automated article ingestion and processing"""
     
@@ -153,6 +181,11 @@ class AutomatedIngestService:
             self.logger.error(f"Error enriching article with bias data: {e}")
             return article_data
     
+    def _get_topic_ontology(self, topic: str) -> Optional[Dict[str, List[str]]]:
+        """Return the topic's ontology as ArticleAnalyzer keyword arguments, or None if unknown"""
+        ontology = get_ontology_registry().get(topic)
+        return ontology.analyzer_kwargs() if ontology else None
+
     def analyze_article_content(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Perform full article analysis including category, sentiment, etc.
@@ -186,46 +219,17 @@ class AutomatedIngestService:
                 self.logger.error(f"No topic specified for article {uri} - cannot determine ontology")
                 return article_data
             
-            # Get topic-specific ontology dynamically using Research class
-            from app.research import Research
-            model_name = self.get_llm_client()
-            research = Research(self.db, model_name=model_name)
-            self.logger.info(f"    🤖 Using LLM model: {model_name} for ontology retrieval")
-            
-            # Set topic and get dynamic ontology data
-            research.set_topic(topic)
-            
-            # Check if we're in an event loop context
-            try:
-                # Try to get the running event loop
-                loop = asyncio.get_running_loop()
-                # If we're in an event loop, use thread pool to avoid event loop conflicts
-                
-                def run_async_in_thread(coro_func, *args):
-                    """Helper function to run async function in a new thread with its own event loop"""
-                    return asyncio.run(coro_func(*args))
-                
-                # Use a thread pool to run the async methods
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future_categories = executor.submit(run_async_in_thread, research.get_categories, topic)
-                    future_signals_f = executor.submit(run_async_in_thread, research.get_future_signals, topic)
-                    future_sentiments = executor.submit(run_async_in_thread, research.get_sentiments, topic)
-                    future_time_to_impact = executor.submit(run_async_in_thread, research.get_time_to_impact, topic)
-                    future_driver_types = executor.submit(run_async_in_thread, research.get_driver_types, topic)
-                    
-                    categories = future_categories.result()
-                    future_signals = future_signals_f.result()
-                    sentiment_options = future_sentiments.result()
-                    time_to_impact_options = future_time_to_impact.result()
-                    driver_types = future_driver_types.result()
-                    
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                categories = asyncio.run(research.get_categories(topic))
-                future_signals = asyncio.run(research.get_future_signals(topic))
-                sentiment_options = asyncio.run(research.get_sentiments(topic))
-                time_to_impact_options = asyncio.run(research.get_time_to_impact(topic))
-                driver_types = asyncio.run(research.get_driver_types(topic))
+            # Get topic-specific ontology from the in-memory registry
+            ontology = self._get_topic_ontology(topic)
+            if not ontology:
+                self.logger.error(f"Topic '{topic}' not configured - cannot determine ontology for {uri}")
+                return article_data
+
+            categories = ontology["categories"]
+            future_signals = ontology["future_signals"]
+            sentiment_options = ontology["sentiment_options"]
+            time_to_impact_options = ontology["time_to_impact_options"]
+            driver_types = ontology["driver_types"]
             
             self.logger.debug(f"Using dynamic ontology for topic '{topic}':")
             self.logger.debug(f"  Categories: {categories}")
@@ -277,6 +281,14 @@ class AutomatedIngestService:
             self.logger.error(f"Error analyzing article content: {e}")
             return article_data
     
+    def _get_relevance_calculator(self) -> RelevanceCalculator:
+        """Return the relevance calculator, initializing it on first use"""
+        if not self.relevance_calculator:
+            # Get LLM model and initialize RelevanceCalculator with it
+            model_name = self.get_llm_client()
+            self.relevance_calculator = RelevanceCalculator(model_name=model_name)
+        return self.relevance_calculator
+
     def score_article_relevance(self, article_data: Dict[str, Any], topic: str, keywords: List[str]) -> Dict[str, Any]:
         """
         Score article relevance using the RelevanceCalculator
@@ -290,15 +302,7 @@ class AutomatedIngestService:
             Dictionary containing relevance score and details
         """
         try:
-            # Initialize relevance calculator if not already done
-            if not self.relevance_calculator:
-                from app.relevance import RelevanceCalculator
-
-                # Get LLM model and parameters
-                model_name = self.get_llm_client()
-
-                # Initialize RelevanceCalculator with model name
-                self.relevance_calculator = RelevanceCalculator(model_name=model_name)
+            self._get_relevance_calculator()
 
             # Get topic description from config
             topic_description = get_topic_description(topic)
@@ -418,6 +422,40 @@ class AutomatedIngestService:
             self.logger.error(f"Error scraping article content: {e}")
             return None
     
+    def _ingest_stages(self, concurrency: int = 5, defer_vector_index: bool = False) -> List[Stage]:
+        """
+        Stages of per-article processing, in order
+
+        ``concurrency`` bounds the slow stages (scraping and the LLM calls);
+        bias lookup, saving and vector indexing have their own limits.
+        Timeouts are per article and stage.
+        """
+        stages = [
+            Stage("screen", self._stage_screen, concurrency, timeout=120),
+            Stage("scrape", self._stage_scrape, concurrency, timeout=SCRAPE_TIMEOUT + 30),
+            Stage("bias", self._stage_bias, 10, timeout=30),
+            Stage("analyze", self._stage_analyze, concurrency, timeout=ANALYSIS_TIMEOUT + 30),
+            Stage("relevance", self._stage_relevance, concurrency, timeout=120),
+            Stage("quality", self._stage_quality, concurrency, timeout=120),
+            Stage("save", lambda state: self._stage_save(state, defer_vector_index), 3, timeout=60),
+        ]
+        if not defer_vector_index:
+            stages.append(Stage("vector_index", self._stage_vector_index, 3, timeout=VECTOR_INDEX_TIMEOUT + 30))
+        return stages
+
+    @staticmethod
+    def _stage_error_result(state: "_ArticleState", stage: Stage, error: BaseException) -> Dict[str, Any]:
+        if isinstance(error, asyncio.TimeoutError):
+            message = f"{stage.name} timed out after {stage.timeout}s"
+        else:
+            message = str(error)
+        return {
+            "status": "error",
+            "uri": state.uri,
+            "error": message,
+            "stage": stage.name
+        }
+
     async def process_articles_progressive(
         self, 
         articles: List[Dict[str, Any]], 
@@ -428,12 +466,17 @@ class AutomatedIngestService:
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Process articles progressively with real-time updates
+
+        Articles stream through the ingest stages (screen -> scrape -> bias ->
+        analyze -> relevance -> quality -> save -> vector index), each with its
+        own worker pool, bounded queue and per-article timeout. A progress
+        update is yielded as each article finishes.
         
         Args:
             articles: List of articles to process
             topic: Topic for context
             keywords: Keywords for relevance
-            batch_size: How many articles to process concurrently
+            batch_size: Concurrency of the scrape and LLM stages
             job_id: Job ID for WebSocket updates
         
         Yields:
@@ -468,97 +511,57 @@ class AutomatedIngestService:
                 except Exception as e:
                     self.logger.warning(f"Failed to send WebSocket update: {e}")
             
-            # Process in batches to avoid overwhelming the system
-            for i in range(0, total_articles, batch_size):
-                batch = articles[i:i + batch_size]
-                batch_number = (i // batch_size) + 1
-                total_batches = (total_articles + batch_size - 1) // batch_size
-                
-                self.logger.info(f"📦 Processing batch {batch_number}/{total_batches} ({len(batch)} articles)")
-                
-                # Process batch concurrently
-                tasks = []
-                for article in batch:
-                    task = asyncio.create_task(
-                        self._process_single_article_async(article, topic, keywords)
-                    )
-                    tasks.append(task)
-                
-                # Wait for batch completion with timeout
-                try:
-                    batch_results = await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True), 
-                        timeout=300  # 5 minute timeout per batch
-                    )
-                    
-                    # Process batch results
-                    for result in batch_results:
-                        if isinstance(result, Exception):
-                            results["errors"].append(str(result))
-                        elif isinstance(result, dict):
-                            if result.get("status") == "success":
-                                results["saved"] += 1
-                                results["vector_indexed"] += 1
-                                results["quality_passed"] += 1
-                            elif result.get("status") == "filtered":
-                                pass  # Article was filtered out
-                            elif result.get("status") == "error":
-                                results["errors"].append(result.get("error", "Unknown error"))
-                            
-                            results["processed"] += 1
-                            results["enriched"] += 1
-                            if result.get("relevance_score", 0) >= self.get_relevance_threshold():
-                                results["relevant"] += 1
-                    
-                    processed_count += len(batch)
-                    progress_percentage = (processed_count / total_articles) * 100
-                    
-                    # Yield progress update
-                    progress_data = {
-                        "type": "progress",
-                        "processed": processed_count,
-                        "total": total_articles,
-                        "percentage": progress_percentage,
-                        "batch_number": batch_number,
-                        "total_batches": total_batches,
-                        "current_results": results.copy(),
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "stage": "processing"
-                    }
-                    
-                    yield progress_data
-                    
-                    # Send WebSocket update
-                    if job_id:
-                        try:
-                            from app.routes.websocket_routes import send_batch_update
-                            await send_batch_update(job_id, {
-                                "progress": progress_percentage,
-                                "processed": processed_count,
-                                "total": total_articles,
-                                "batch_completed": batch_number,
-                                "total_batches": total_batches,
-                                "message": f"Completed batch {batch_number}/{total_batches}",
-                                "results": results.copy()
-                            })
-                        except Exception as e:
-                            self.logger.warning(f"Failed to send WebSocket batch update: {e}")
-                    
-                    # Brief pause to yield control
-                    await asyncio.sleep(0.1)
-                    
-                except asyncio.TimeoutError:
-                    error_msg = f"Batch {batch_number} timed out"
-                    self.logger.error(error_msg)
-                    results["errors"].append(error_msg)
-                    
-                    yield {
-                        "type": "error",
-                        "message": error_msg,
-                        "processed": processed_count,
-                        "total": total_articles,
-                        "batch_number": batch_number
-                    }
+            # Embedding pre-filter: reject/fast-track before any LLM calls
+            results["prefilter"] = await self._prefilter_articles(articles, topic, keywords)
+            results["relevance_batched"] = await self._quick_score_articles(articles, topic, keywords)
+
+            pipeline = StagePipeline(
+                self._ingest_stages(concurrency=batch_size),
+                on_error=self._stage_error_result
+            )
+            states = [_ArticleState(article, topic, keywords) for article in articles]
+
+            async for state, result in pipeline.run(states):
+                if result.get("status") == "success":
+                    results["saved"] += 1
+                    results["vector_indexed"] += 1
+                    results["quality_passed"] += 1
+                elif result.get("status") == "error":
+                    results["errors"].append(result.get("error", "Unknown error"))
+
+                results["processed"] += 1
+                results["enriched"] += 1
+                if result.get("relevance_score", 0) >= self.get_relevance_threshold():
+                    results["relevant"] += 1
+
+                processed_count += 1
+                progress_percentage = (processed_count / total_articles) * 100
+
+                yield {
+                    "type": "progress",
+                    "processed": processed_count,
+                    "total": total_articles,
+                    "percentage": progress_percentage,
+                    "uri": state.uri,
+                    "status": result.get("status"),
+                    "current_results": results.copy(),
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "stage": "processing"
+                }
+
+                if job_id:
+                    try:
+                        from app.routes.websocket_routes import send_progress_update
+                        await send_progress_update(job_id, {
+                            "progress": progress_percentage,
+                            "processed": processed_count,
+                            "total": total_articles,
+                            "message": f"Processed {processed_count}/{total_articles} articles",
+                            "stage": "processing",
+                            "results": results.copy()
+                        })
+                    except Exception as e:
+                        self.logger.warning(f"Failed to send WebSocket progress update: {e}")
             
             # Final results
             final_results = {
@@ -608,294 +611,403 @@ class AutomatedIngestService:
         self,
         article: Dict[str, Any],
         topic: str,
-        keywords: List[str]
+        keywords: List[str],
+        defer_vector_index: bool = False
     ) -> Dict[str, Any]:
-        """Process a single article asynchronously with optimized database operations"""
-        article_uri = article.get('uri', 'unknown')
-        article_title = article.get('title', 'Unknown Title')
+        """Process a single article asynchronously with optimized database operations
 
-        # CRITICAL: Preserve original data from API throughout processing
-        original_title = article.get('title', '')
-        original_summary = article.get('summary', '')
-        original_source = article.get('news_source', '')
-        original_pub_date = article.get('publication_date', '')
+        Runs the same stages as process_articles_progressive, one after the
+        other. When defer_vector_index is True the vector upsert is skipped
+        and the article to index is returned under "vector_article" so the
+        caller can index a whole batch at once.
+        """
+        state = _ArticleState(article, topic, keywords)
+        try:
+            self.logger.debug(f"🔄 Processing article: {state.original_title or 'Unknown Title'}")
+            for stage in self._ingest_stages(defer_vector_index=defer_vector_index):
+                result = await stage.handler(state)
+                if result is not None:
+                    return result
+            return {"status": "error", "uri": state.uri, "error": "Article left the pipeline without a result"}
+        except Exception as e:
+            self.logger.error(f"Error processing article {state.uri}: {e}")
+            return {
+                "status": "error",
+                "uri": state.uri,
+                "error": str(e)
+            }
 
+    def _restore_original_fields(self, state: "_ArticleState"):
+        """Keep title, source and date from the news API if enrichment dropped them
+
+        The summary is deliberately not restored: it may have been generated by the LLM.
+        """
+        enriched = state.enriched
+        enriched['title'] = enriched.get('title') or state.original_title
+        enriched['news_source'] = enriched.get('news_source') or state.original_source
+        enriched['publication_date'] = enriched.get('publication_date') or state.original_pub_date
+
+    async def _stage_screen(self, state: "_ArticleState") -> Optional[Dict[str, Any]]:
+        """Step 1: QUICK relevance check FIRST (before expensive operations)
+
+        Uses only title and existing summary to save costs.
+        """
+        article, article_uri, topic = state.article, state.uri, state.topic
         try:
-            self.logger.debug(f"🔄 Processing article: {article_title}")
-            self.logger.debug(f"📝 Original title: {original_title[:100]}")
+            prefilter = article.get("_prefilter") or {}
+            relevance_threshold = self.get_relevance_threshold()
 
-            # Step 1: QUICK relevance check FIRST (before expensive operations)
-            # Use only title and existing summary to save costs
-            try:
+            if prefilter.get("decision") == "reject":
+                # Embedding pre-filter: clearly off-topic, no LLM call
+                similarity = prefilter["similarity"]
+                quick_relevance_result = {
+                    "relevance_score": similarity,
+                    "keyword_relevance_score": similarity,
+                    "topic_alignment_score": similarity,
+                    "confidence_score": similarity,
+                    "overall_match_explanation": f"Rejected by embedding pre-filter (topic similarity {similarity})"
+                }
+            elif article.get("_quick_relevance"):
+                # Already scored in a batched LLM request
+                quick_relevance_result = article.pop("_quick_relevance")
+            elif prefilter.get("decision") == "fast_track":
+                # Embedding pre-filter: clearly on-topic, skip the quick LLM check;
+                # the full-content scoring in the relevance stage still applies
+                self.logger.debug(f"⏩ Article {article_uri} fast-tracked by pre-filter (similarity: {prefilter['similarity']})")
+                quick_relevance_result = {"relevance_score": max(prefilter["similarity"], relevance_threshold)}
+            else:
                 # Do a quick relevance check with just title + summary (no scraping/LLM yet)
                 quick_relevance_result = await self._score_article_relevance_async(
-                    article, topic, keywords
+                    article, topic, state.keywords
                 )
-                quick_relevance_score = quick_relevance_result.get("relevance_score", 0)
-                relevance_threshold = self.get_relevance_threshold()
+            state.quick_score = quick_relevance_result.get("relevance_score", 0)
 
-                self.logger.debug(f"🎯 Quick relevance check: {quick_relevance_score} (threshold: {relevance_threshold})")
+            self.logger.debug(f"🎯 Quick relevance check: {state.quick_score} (threshold: {relevance_threshold})")
 
-                # If article fails relevance threshold, stop processing immediately
-                if quick_relevance_score < relevance_threshold:
-                    self.logger.info(f"⚡ Article {article_uri} filtered early (score: {quick_relevance_score} < {relevance_threshold}) - saving costs")
-
-                    # Save with minimal data to database
-                    try:
-                        article.update({
-                            "topic": topic,
-                            "ingest_status": "filtered_relevance",
-                            # Populate ALL three score fields from relevance result
-                            "keyword_relevance_score": quick_relevance_result.get("keyword_relevance_score", quick_relevance_score),
-                            "topic_alignment_score": quick_relevance_result.get("topic_alignment_score", quick_relevance_score),
-                            "confidence_score": quick_relevance_result.get("confidence_score", quick_relevance_score),
-                            "overall_match_explanation": quick_relevance_result.get("overall_match_explanation", "")
-                        })
-                        await self.async_db.save_below_threshold_article(article)
-                        self.db.facade.mark_article_as_below_threshold(article_uri)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to save below-threshold article: {e}")
+            # If article fails relevance threshold, stop processing immediately
+            if prefilter.get("decision") == "reject" or state.quick_score < relevance_threshold:
+                self.logger.info(f"⚡ Article {article_uri} filtered early (score: {state.quick_score} < {relevance_threshold}) - saving costs")
 
-                    return {
-                        "status": "filtered",
-                        "uri": article_uri,
-                        "relevance_score": quick_relevance_score,
-                        "reason": "relevance_threshold",
-                        "threshold": relevance_threshold
-                    }
+                # Save with minimal data to database
+                try:
+                    article.update({
+                        "topic": topic,
+                        "ingest_status": "filtered_relevance",
+                        # Populate ALL three score fields from relevance result
+                        "keyword_relevance_score": quick_relevance_result.get("keyword_relevance_score", state.quick_score),
+                        "topic_alignment_score": quick_relevance_result.get("topic_alignment_score", state.quick_score),
+                        "confidence_score": quick_relevance_result.get("confidence_score", state.quick_score),
+                        "overall_match_explanation": quick_relevance_result.get("overall_match_explanation", "")
+                    })
+                    await self.async_db.save_below_threshold_article(article)
+                    self.db.facade.mark_article_as_below_threshold(article_uri)
+                except Exception as e:
+                    self.logger.warning(f"Failed to save below-threshold article: {e}")
 
-            except Exception as e:
-                self.logger.error(f"Quick relevance check failed for {article_uri}: {e}")
-                # Save article with error status but preserve attempt record
-                article.update({
-                    "topic": topic,
-                    "ingest_status": "relevance_check_failed",
-                    "keyword_relevance_score": 0.0,
-                    "topic_alignment_score": 0.0,
-                    "confidence_score": 0.0,
-                    "overall_match_explanation": f"Relevance check failed: {str(e)}"
-                })
-                await self.async_db.save_below_threshold_article(article)
-                self.logger.info(f"Saved article {article_uri} with relevance_check_failed status")
-                # Return early - skip enrichment for this article
                 return {
-                    "status": "error",
+                    "status": "filtered",
                     "uri": article_uri,
-                    "error": str(e),
-                    "reason": "relevance_check_failed"
+                    "relevance_score": state.quick_score,
+                    "reason": "relevance_threshold",
+                    "threshold": relevance_threshold,
+                    "prefilter": prefilter.get("decision")
                 }
 
-            # Step 2: Article PASSED quick check - now do expensive operations
-            self.logger.info(f"✅ Article {article_uri} passed quick check (score: {quick_relevance_score}) - proceeding with enrichment")
-
-            # Concurrent bias enrichment and content scraping
-            bias_task = asyncio.create_task(
-                self._enrich_article_with_bias_async(article)
-            )
-
-            # Check if we already have pre-scraped content (from batch processing)
-            raw_content = article.get('_scraped_content')
+        except Exception as e:
+            self.logger.error(f"Quick relevance check failed for {article_uri}: {e}")
+            # Save article with error status but preserve attempt record
+            article.update({
+                "topic": topic,
+                "ingest_status": "relevance_check_failed",
+                "keyword_relevance_score": 0.0,
+                "topic_alignment_score": 0.0,
+                "confidence_score": 0.0,
+                "overall_match_explanation": f"Relevance check failed: {str(e)}"
+            })
+            await self.async_db.save_below_threshold_article(article)
+            self.logger.info(f"Saved article {article_uri} with relevance_check_failed status")
+            # Return early - skip enrichment for this article
+            return {
+                "status": "error",
+                "uri": article_uri,
+                "error": str(e),
+                "reason": "relevance_check_failed"
+            }
 
-            if raw_content:
-                self.logger.debug(f"📄 Using pre-scraped content for {article_uri} ({len(raw_content)} chars)")
-                # Only need to wait for bias enrichment
-                try:
-                    enriched_article = await bias_task
-                except Exception as e:
-                    self.logger.error(f"Bias enrichment failed for {article_uri}: {e}")
-                    enriched_article = article
-            else:
-                # No pre-scraped content, scrape it now
-                content_task = asyncio.create_task(
-                    self.scrape_article_content(article_uri)
-                )
+        # Article PASSED quick check - the following stages do the expensive operations
+        self.logger.info(f"✅ Article {article_uri} passed quick check (score: {state.quick_score}) - proceeding with enrichment")
+        return None
 
-                # Wait for both to complete
-                try:
-                    enriched_article, raw_content = await asyncio.gather(
-                        bias_task, content_task, return_exceptions=True
-                    )
-                except Exception as e:
-                    self.logger.error(f"Error in concurrent operations for {article_uri}: {e}")
-                    enriched_article = article
-                    raw_content = None
-
-                # Handle exceptions from concurrent operations
-                if isinstance(enriched_article, Exception):
-                    self.logger.warning(f"Bias enrichment failed for {article_uri}: {enriched_article}")
-                    enriched_article = article  # Fallback to original
-                if isinstance(raw_content, Exception):
-                    self.logger.warning(f"Content scraping failed for {article_uri}: {raw_content}")
-                    raw_content = None
-
-            # CRITICAL: Ensure original data is preserved after bias enrichment
-            # IMPORTANT: Do NOT overwrite summary - it may have been generated by LLM
-            enriched_article['title'] = enriched_article.get('title') or original_title
-            # enriched_article['summary'] = enriched_article.get('summary') or original_summary  # REMOVED - prevents overwriting AI summaries
-            enriched_article['news_source'] = enriched_article.get('news_source') or original_source
-            enriched_article['publication_date'] = enriched_article.get('publication_date') or original_pub_date
-
-            # Save raw content if available
-            if raw_content:
-                try:
-                    await self.async_db.save_raw_article_async(article_uri, raw_content, topic)
-                    self.logger.debug(f"📄 Raw content saved for {article_uri}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to save raw content for {article_uri}: {e}")
+    async def _stage_scrape(self, state: "_ArticleState") -> None:
+        """Step 2a: Fetch full content, unless it was pre-scraped in a batch, and save it"""
+        article_uri = state.uri
+        raw_content = state.article.get('_scraped_content')
 
-            # Step 3: LLM analysis with timeout (only for relevant articles)
+        if raw_content:
+            self.logger.debug(f"📄 Using pre-scraped content for {article_uri} ({len(raw_content)} chars)")
+        else:
             try:
-                enriched_article = await asyncio.wait_for(
-                    self._analyze_article_content_async(enriched_article, topic),
-                    timeout=60  # 1 minute timeout
-                )
-                self.logger.debug(f"🧠 LLM analysis completed for {article_uri}")
-
-                # CRITICAL: Re-ensure original data after LLM analysis (in case it got lost)
-                # IMPORTANT: Do NOT overwrite summary - LLM analysis generates the proper summary
-                enriched_article['title'] = enriched_article.get('title') or original_title
-                # enriched_article['summary'] = enriched_article.get('summary') or original_summary  # REMOVED - prevents overwriting AI summaries
-                enriched_article['news_source'] = enriched_article.get('news_source') or original_source
-                enriched_article['publication_date'] = enriched_article.get('publication_date') or original_pub_date
-
+                raw_content = await asyncio.wait_for(self.scrape_article_content(article_uri), timeout=SCRAPE_TIMEOUT)
             except asyncio.TimeoutError:
-                self.logger.warning(f"LLM analysis timed out for {article_uri}")
-                enriched_article["analysis_error"] = "LLM analysis timed out"
+                self.logger.warning(f"Content scraping timed out for {article_uri}")
+                raw_content = None
             except Exception as e:
-                self.logger.error(f"LLM analysis failed for {article_uri}: {e}")
-                enriched_article["analysis_error"] = str(e)
+                self.logger.warning(f"Content scraping failed for {article_uri}: {e}")
+                raw_content = None
 
-            # Step 4: Final relevance scoring with full content
+        state.raw_content = raw_content
+        if raw_content:
             try:
-                relevance_result = await self._score_article_relevance_async(
-                    enriched_article, topic, keywords
-                )
-                enriched_article.update(relevance_result)
-                self.logger.debug(f"🎯 Final relevance scoring completed for {article_uri}")
+                await self.async_db.save_raw_article_async(article_uri, raw_content, state.topic)
+                self.logger.debug(f"📄 Raw content saved for {article_uri}")
             except Exception as e:
-                self.logger.error(f"Final relevance scoring failed for {article_uri}: {e}")
-                relevance_result = {
-                    "relevance_score": quick_relevance_score,
-                    "topic_alignment_score": quick_relevance_score,
-                    "keyword_relevance_score": quick_relevance_score,
-                    "confidence_score": quick_relevance_score,
-                    "overall_match_explanation": f"Final scoring failed, using quick score: {str(e)}"
-                }
-                enriched_article.update(relevance_result)
+                self.logger.warning(f"Failed to save raw content for {article_uri}: {e}")
+        return None
 
-            # Step 5: Check final relevance threshold (double-check after full analysis)
-            relevance_score = relevance_result.get("relevance_score", quick_relevance_score)
-            relevance_threshold = self.get_relevance_threshold()
-            
-            if relevance_score >= relevance_threshold:
-                # Step 5: Quality check (simplified for async)
-                try:
-                    quality_result = await self._quality_check_article_async(enriched_article)
-                    enriched_article.update(quality_result)
-                    self.logger.debug(f"🔍 Quality check completed for {article_uri}")
-                except Exception as e:
-                    self.logger.error(f"Quality check failed for {article_uri}: {e}")
-                    quality_result = {"quality_score": 0.0, "approved": False, "quality_issues": str(e)}
-                    enriched_article.update(quality_result)
-                
-                if quality_result.get("approved", False):
-                    # CRITICAL: Validate enrichment succeeded before approving
-                    if not enriched_article.get("analyzed", False):
-                        self.logger.error(
-                            f"❌ Enrichment validation failed for {article_uri}: "
-                            f"Article passed quality check but 'analyzed' flag is False. "
-                            f"This indicates enrichment failed silently. Marking as enrichment_failed."
-                        )
-                        return {
-                            "status": "error",
-                            "uri": article_uri,
-                            "error": "Enrichment failed - analyzed=False after quality check"
-                        }
-
-                    # Step 6: Async database update
-                    try:
-                        enriched_article.update({
-                            "ingest_status": "approved",
-                            "auto_ingested": True
-                        })
-                        
-                        success = await self.async_db.update_article_with_enrichment(enriched_article)
-                        
-                        if success:
-                            # Step 7: Vector database upsert (kept async but with timeout)
-                            try:
-                                await asyncio.wait_for(
-                                    self._upsert_to_vector_db_async(enriched_article, raw_content),
-                                    timeout=30  # 30 second timeout
-                                )
-                                self.logger.debug(f"🔍 Vector indexing completed for {article_uri}")
-                            except asyncio.TimeoutError:
-                                self.logger.warning(f"Vector indexing timed out for {article_uri}")
-                            except Exception as e:
-                                self.logger.error(f"Vector indexing failed for {article_uri}: {e}")
-                            
-                            return {
-                                "status": "success",
-                                "uri": article_uri,
-                                "relevance_score": relevance_score,
-                                "quality_score": quality_result.get("quality_score")
-                            }
-                        else:
-                            return {
-                                "status": "error",
-                                "uri": article_uri,
-                                "error": "Database update failed"
-                            }
-                    except Exception as e:
-                        return {
-                            "status": "error",
-                            "uri": article_uri,
-                            "error": f"Database operation failed: {str(e)}"
-                        }
-                else:
-                    return {
-                        "status": "filtered",
-                        "uri": article_uri,
-                        "relevance_score": relevance_score,
-                        "reason": "quality_check_failed",
-                        "quality_issues": quality_result.get("quality_issues")
-                    }
-            else:
-                # Save article with relevance scores even though it failed threshold
-                # This ensures the article is visible in the UI with proper context
-                try:
-                    # Prepare article data with relevance scores
-                    enriched_article.update({
-                        "topic": topic,  # Ensure topic is set
-                        "ingest_status": "filtered_relevance"
-                    })
+    async def _stage_bias(self, state: "_ArticleState") -> None:
+        """Step 2b: Media bias and factuality enrichment"""
+        try:
+            state.enriched = await self._enrich_article_with_bias_async(state.article)
+        except Exception as e:
+            self.logger.warning(f"Bias enrichment failed for {state.uri}: {e}")
+            state.enriched = state.article  # Fallback to original
 
-                    # Save to articles table with relevance scores
-                    await self.async_db.save_below_threshold_article(enriched_article)
-                    self.logger.debug(f"Saved below-threshold article {article_uri} with relevance scores")
+        # CRITICAL: Ensure original data is preserved after bias enrichment
+        self._restore_original_fields(state)
+        return None
 
-                    # Mark as below threshold in keyword_article_matches
-                    self.db.facade.mark_article_as_below_threshold(article_uri)
-                    self.logger.debug(f"Marked article {article_uri} as below threshold in keyword_article_matches")
-                except Exception as e:
-                    self.logger.warning(f"Failed to save below-threshold article: {e}")
+    async def _stage_analyze(self, state: "_ArticleState") -> None:
+        """Step 3: LLM analysis with timeout (only for relevant articles)"""
+        article_uri = state.uri
+        try:
+            state.enriched = await asyncio.wait_for(
+                self._analyze_article_content_async(state.enriched, state.topic),
+                timeout=ANALYSIS_TIMEOUT
+            )
+            self.logger.debug(f"🧠 LLM analysis completed for {article_uri}")
 
-                return {
-                    "status": "filtered",
-                    "uri": article_uri,
-                    "relevance_score": relevance_score,
-                    "reason": "relevance_threshold",
-                    "threshold": relevance_threshold
-                }
-                
+            # CRITICAL: Re-ensure original data after LLM analysis (in case it got lost)
+            self._restore_original_fields(state)
+
+        except asyncio.TimeoutError:
+            self.logger.warning(f"LLM analysis timed out for {article_uri}")
+            state.enriched["analysis_error"] = "LLM analysis timed out"
+        except Exception as e:
+            self.logger.error(f"LLM analysis failed for {article_uri}: {e}")
+            state.enriched["analysis_error"] = str(e)
+        return None
+
+    async def _stage_relevance(self, state: "_ArticleState") -> Optional[Dict[str, Any]]:
+        """Step 4: Final relevance scoring with full content, then the threshold check"""
+        article_uri = state.uri
+        enriched_article = state.enriched
+        quick_relevance_score = state.quick_score
+        try:
+            relevance_result = await self._score_article_relevance_async(
+                enriched_article, state.topic, state.keywords
+            )
+            enriched_article.update(relevance_result)
+            self.logger.debug(f"🎯 Final relevance scoring completed for {article_uri}")
         except Exception as e:
-            self.logger.error(f"Error processing article {article_uri}: {e}")
+            self.logger.error(f"Final relevance scoring failed for {article_uri}: {e}")
+            relevance_result = {
+                "relevance_score": quick_relevance_score,
+                "topic_alignment_score": quick_relevance_score,
+                "keyword_relevance_score": quick_relevance_score,
+                "confidence_score": quick_relevance_score,
+                "overall_match_explanation": f"Final scoring failed, using quick score: {str(e)}"
+            }
+            enriched_article.update(relevance_result)
+
+        # Step 5: Check final relevance threshold (double-check after full analysis)
+        state.relevance_score = relevance_result.get("relevance_score", quick_relevance_score)
+        relevance_threshold = self.get_relevance_threshold()
+
+        if state.relevance_score >= relevance_threshold:
+            return None
+
+        # Save article with relevance scores even though it failed threshold
+        # This ensures the article is visible in the UI with proper context
+        try:
+            # Prepare article data with relevance scores
+            enriched_article.update({
+                "topic": state.topic,  # Ensure topic is set
+                "ingest_status": "filtered_relevance"
+            })
+
+            # Save to articles table with relevance scores
+            await self.async_db.save_below_threshold_article(enriched_article)
+            self.logger.debug(f"Saved below-threshold article {article_uri} with relevance scores")
+
+            # Mark as below threshold in keyword_article_matches
+            self.db.facade.mark_article_as_below_threshold(article_uri)
+            self.logger.debug(f"Marked article {article_uri} as below threshold in keyword_article_matches")
+        except Exception as e:
+            self.logger.warning(f"Failed to save below-threshold article: {e}")
+
+        return {
+            "status": "filtered",
+            "uri": article_uri,
+            "relevance_score": state.relevance_score,
+            "reason": "relevance_threshold",
+            "threshold": relevance_threshold
+        }
+
+    async def _stage_quality(self, state: "_ArticleState") -> Optional[Dict[str, Any]]:
+        """Step 5: Quality check (simplified for async)"""
+        article_uri = state.uri
+        enriched_article = state.enriched
+        try:
+            quality_result = await self._quality_check_article_async(enriched_article)
+            enriched_article.update(quality_result)
+            self.logger.debug(f"🔍 Quality check completed for {article_uri}")
+        except Exception as e:
+            self.logger.error(f"Quality check failed for {article_uri}: {e}")
+            quality_result = {"quality_score": 0.0, "approved": False, "quality_issues": str(e)}
+            enriched_article.update(quality_result)
+
+        if not quality_result.get("approved", False):
+            return {
+                "status": "filtered",
+                "uri": article_uri,
+                "relevance_score": state.relevance_score,
+                "reason": "quality_check_failed",
+                "quality_issues": quality_result.get("quality_issues")
+            }
+
+        # CRITICAL: Validate enrichment succeeded before approving
+        if not enriched_article.get("analyzed", False):
+            self.logger.error(
+                f"❌ Enrichment validation failed for {article_uri}: "
+                f"Article passed quality check but 'analyzed' flag is False. "
+                f"This indicates enrichment failed silently. Marking as enrichment_failed."
+            )
             return {
                 "status": "error",
                 "uri": article_uri,
-                "error": str(e)
+                "error": "Enrichment failed - analyzed=False after quality check"
+            }
+
+        state.quality_score = quality_result.get("quality_score")
+        return None
+
+    async def _stage_save(self, state: "_ArticleState", defer_vector_index: bool = False) -> Optional[Dict[str, Any]]:
+        """Step 6: Async database update of the approved article"""
+        article_uri = state.uri
+        enriched_article = state.enriched
+        try:
+            enriched_article.update({
+                "ingest_status": "approved",
+                "auto_ingested": True
+            })
+
+            success = await self.async_db.update_article_with_enrichment(enriched_article)
+        except Exception as e:
+            return {
+                "status": "error",
+                "uri": article_uri,
+                "error": f"Database operation failed: {str(e)}"
             }
 
+        if not success:
+            return {
+                "status": "error",
+                "uri": article_uri,
+                "error": "Database update failed"
+            }
+
+        if defer_vector_index:
+            vector_article = enriched_article.copy()
+            if state.raw_content:
+                vector_article['raw'] = state.raw_content
+            return dict(self._success_result(state), vector_article=vector_article)
+        return None
+
+    async def _stage_vector_index(self, state: "_ArticleState") -> Dict[str, Any]:
+        """Step 7: Vector database upsert (kept async but with timeout)"""
+        article_uri = state.uri
+        try:
+            await asyncio.wait_for(
+                self._upsert_to_vector_db_async(state.enriched, state.raw_content),
+                timeout=VECTOR_INDEX_TIMEOUT
+            )
+            self.logger.debug(f"🔍 Vector indexing completed for {article_uri}")
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Vector indexing timed out for {article_uri}")
+        except Exception as e:
+            self.logger.error(f"Vector indexing failed for {article_uri}: {e}")
+
+        return self._success_result(state)
+
+    @staticmethod
+    def _success_result(state: "_ArticleState") -> Dict[str, Any]:
+        return {
+            "status": "success",
+            "uri": state.uri,
+            "relevance_score": state.relevance_score,
+            "quality_score": state.quality_score
+        }
+
+    async def _prefilter_articles(self, articles: List[Dict[str, Any]], topic: str, keywords: List[str]) -> Dict[str, int]:
+        """Tag articles with the embedding pre-filter decision before LLM scoring
+
+        Returns the per-stage counts, or an empty dict when the pre-filter is
+        disabled or fails (articles then all go through the LLM check).
+        """
+        from app.services.relevance_prefilter import get_relevance_prefilter
+
+        prefilter = get_relevance_prefilter()
+        if not prefilter or not articles:
+            return {}
+        try:
+            return await prefilter.annotate(articles, topic, keywords or [])
+        except Exception as e:
+            self.logger.warning(f"Relevance pre-filter failed, scoring all articles with the LLM: {e}")
+            return {}
+
+    async def _quick_score_articles(self, articles: List[Dict[str, Any]], topic: str, keywords: List[str]) -> int:
+        """Run the quick (title + summary) relevance check for many articles in batched LLM requests
+
+        Articles the pre-filter already decided are skipped. Each scored
+        article gets "_quick_relevance", which step 1 of
+        _process_single_article_async uses instead of its own LLM call.
+        Articles left unscored are checked individually as before.
+
+        Returns:
+            Number of articles scored
+        """
+        pending = [
+            article for article in articles
+            if (article.get("_prefilter") or {}).get("decision") not in ("reject", "fast_track")
+        ]
+        if len(pending) < 2:
+            return 0
+
+        try:
+            calculator = self._get_relevance_calculator()
+            keywords_str = ", ".join(keywords) if isinstance(keywords, list) else str(keywords or "")
+            records = [{
+                "title": article.get("title", ""),
+                "news_source": article.get("news_source", ""),
+                "content": f"{article.get('title', '')} {article.get('summary', '')}"
+            } for article in pending]
+
+            loop = asyncio.get_event_loop()
+            scores = await loop.run_in_executor(
+                None, calculator.analyze_relevance_batch,
+                records, topic, keywords_str, get_topic_description(topic)
+            )
+        except Exception as e:
+            self.logger.warning(f"Batched quick relevance check failed, checking articles individually: {e}")
+            return 0
+
+        scored = 0
+        for article, score in zip(pending, scores):
+            if score is not None:
+                article["_quick_relevance"] = score
+                scored += 1
+        return scored
+
     async def _enrich_article_with_bias_async(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
         """Async version of bias enrichment"""
         # For now, this is just a wrapper around the sync version
@@ -932,21 +1044,17 @@ class AutomatedIngestService:
             if not article_data.get('topic'):
                 article_data['topic'] = topic
             
-            # Get topic-specific ontology dynamically using Research class
-            from app.research import Research
-            model_name = self.get_llm_client()
-            research = Research(self.db, model_name=model_name)
-            self.logger.info(f"    🤖 Using LLM model: {model_name} for ontology retrieval")
-            
-            # Set topic and get dynamic ontology data asynchronously
-            research.set_topic(topic)
-            
-            # Get topic-specific analysis parameters dynamically
-            categories = await research.get_categories(topic)
-            future_signals = await research.get_future_signals(topic)
-            sentiment_options = await research.get_sentiments(topic)
-            time_to_impact_options = await research.get_time_to_impact(topic)
-            driver_types = await research.get_driver_types(topic)
+            # Get topic-specific ontology from the in-memory registry
+            ontology = self._get_topic_ontology(topic)
+            if not ontology:
+                self.logger.error(f"Topic '{topic}' not configured - cannot determine ontology for {uri}")
+                return article_data
+
+            categories = ontology["categories"]
+            future_signals = ontology["future_signals"]
+            sentiment_options = ontology["sentiment_options"]
+            time_to_impact_options = ontology["time_to_impact_options"]
+            driver_types = ontology["driver_types"]
             
             self.logger.debug(f"Using dynamic ontology for topic '{topic}':")
             self.logger.debug(f"  Categories: {categories}")
@@ -1066,8 +1174,15 @@ class AutomatedIngestService:
             # QUICK FIX: Use concurrent async processing instead of sequential loop
             # This prevents blocking the event loop during auto-ingest
 
+            # Embedding pre-filter: rejected articles are neither scraped nor sent to the LLM
+            results["prefilter"] = await self._prefilter_articles(articles, topic, keywords)
+            results["relevance_batched"] = await self._quick_score_articles(articles, topic, keywords)
+
             # Pre-scrape all articles in batch for efficiency
-            article_uris = [article.get('uri') for article in articles if article.get('uri')]
+            article_uris = [
+                article.get('uri') for article in articles
+                if article.get('uri') and (article.get('_prefilter') or {}).get('decision') != 'reject'
+            ]
             self.logger.info(f"🚀 Pre-scraping {len(article_uris)} articles in batch...")
 
             scraped_content = await self.scrape_articles_batch(article_uris)
@@ -1089,6 +1204,9 @@ class AutomatedIngestService:
                 article['_scraped_content'] = scraped_content.get(article_uri)
                 all_article_data.append(article)
 
+            # Saved articles are vector-indexed together once all batches finish
+            vector_articles = []
+
             # Process in batches to prevent connection pool exhaustion
             for batch_idx in range(0, len(all_article_data), MAX_CONCURRENT):
                 batch = all_article_data[batch_idx:batch_idx + MAX_CONCURRENT]
@@ -1101,7 +1219,7 @@ class AutomatedIngestService:
                 tasks = []
                 for article in batch:
                     task = asyncio.create_task(
-                        self._process_single_article_async(article, topic, keywords)
+                        self._process_single_article_async(article, topic, keywords, defer_vector_index=True)
                     )
                     tasks.append(task)
 
@@ -1122,7 +1240,8 @@ class AutomatedIngestService:
 
                             if result.get("status") == "success":
                                 results["saved"] += 1
-                                results["vector_indexed"] += 1
+                                if result.get("vector_article"):
+                                    vector_articles.append(result["vector_article"])
                                 results["quality_passed"] += 1
                                 results["relevant"] += 1
                                 results["enriched"] += 1
@@ -1148,6 +1267,15 @@ class AutomatedIngestService:
                     self.logger.error(error_msg)
                     results["errors"].append(error_msg)
 
+            if vector_articles:
+                try:
+                    from app.vector_store_pgvector import upsert_articles_bulk_async
+                    vector_stats = await upsert_articles_bulk_async(vector_articles)
+                    results["vector_indexed"] = vector_stats["indexed"]
+                except Exception as e:
+                    self.logger.error(f"Bulk vector indexing failed: {e}")
+                    results["errors"].append(f"Vector indexing error: {str(e)}")
+
             self.logger.info(f"🏁 All batches completed: {results['processed']} processed, "
                            f"{results['saved']} saved, {len(results['errors'])} errors")
 
@@ -296,75 +296,63 @@ def get_task_manager() -> BackgroundTaskManager:
     return _task_manager
 
 # Convenience functions for bulk operations
-async def run_bulk_analysis_task(urls: List[str], topic: str, progress_callback=None, **analysis_params):
-    """Background task wrapper for bulk analysis using analysis queue"""
-    try:
-        from app.services.analysis_queue import get_analysis_queue, AnalysisTask
-        from app.bulk_research import BulkResearch
-        from app.database import get_database_instance
+async def run_bulk_analysis_task(urls: List[str], topic: str, progress_callback=None, job_id: Optional[str] = None,
+                                 priority: Optional[int] = None, **analysis_params):
+    """Background task wrapper for bulk analysis using the durable analysis queue.
+
+    Each URL is queued as an item of ``job_id`` (the background task id), then
+    analyzed and saved by queue workers, which may run in another process.
+    This coroutine only waits for the job and mirrors its progress; if the
+    server restarts meanwhile, the items are still processed and the task row
+    is completed by the workers.
+    """
+    from app.services.analysis_queue import get_analysis_queue, AnalysisTask, PRIORITY_SCHEDULED
 
-        # Get analysis queue for non-blocking processing
-        analysis_queue = get_analysis_queue()
+    analysis_queue = get_analysis_queue()
+    job_id = job_id or str(uuid.uuid4())
 
+    try:
         # Setup progress tracking
         if progress_callback:
             progress_callback(0, f"Starting analysis of {len(urls)} articles")
 
-        # Create analysis tasks
-        tasks = []
-        for url in urls:
-            task = AnalysisTask(
-                url=url,
-                topic=topic,
-                metadata=analysis_params
-            )
-            tasks.append(task)
-
-        # Add tasks to queue with progress callback
-        await analysis_queue.add_tasks(tasks, progress_callback)
+        # The route queues the items up front; only queue them here if it did not
+        if not analysis_queue.get_progress(job_id)['total']:
+            tasks = [AnalysisTask(url=url, topic=topic, metadata=analysis_params) for url in urls]
+            await analysis_queue.add_tasks(tasks, job_id=job_id,
+                                           priority=PRIORITY_SCHEDULED if priority is None else priority)
 
-        # Wait for completion with timeout (30 minutes max)
-        task_results = await analysis_queue.wait_completion(timeout=1800)
+        task_results = await analysis_queue.wait_completion(job_id, progress_callback=progress_callback)
 
-        # Process results
         analysis_results = []
-        success_count = 0
-        error_count = 0
-
         for task_result in task_results:
             if task_result['success']:
                 analysis_results.append(task_result['result'])
-                success_count += 1
             else:
-                # Create error result
-                error_result = {
-                    'uri': task_result['task'].url,
-                    'error': task_result['error'],
+                analysis_results.append({
+                    'uri': task_result['url'],
+                    'error': task_result['error'] or task_result['status'],
                     'title': 'Analysis Failed',
-                    'topic': task_result['task'].topic
-                }
-                analysis_results.append(error_result)
-                error_count += 1
-
-        # Save results in batches
-        if analysis_results:
-            db = get_database_instance()
-            bulk_research = BulkResearch(db)
+                    'topic': task_result['topic']
+                })
 
-            save_results = await bulk_research.save_bulk_articles(analysis_results)
-
-            logger.info(f"Bulk analysis completed: {success_count} analyzed, {error_count} errors, "
-                       f"{len(save_results['success'])} saved, {len(save_results['errors'])} save errors")
+        success_count = sum(1 for r in task_results if r['success'])
+        error_count = len(task_results) - success_count
+        logger.info(f"Bulk analysis {job_id} completed: {success_count} analyzed and saved, {error_count} errors")
 
         return {
             "success": True,
             "analyzed_count": success_count,
             "error_count": error_count,
-            "saved_count": len(save_results.get('success', [])) if 'save_results' in locals() else 0,
-            "save_errors": len(save_results.get('errors', [])) if 'save_results' in locals() else 0,
+            "saved_count": success_count,
+            "save_errors": 0,
             "results": analysis_results
         }
 
+    except asyncio.CancelledError:
+        analysis_queue.cancel_job(job_id)
+        raise
+
     except Exception as e:
         logger.error(f"Bulk analysis task failed: {e}")
         return {
@@ -0,0 +1,263 @@
+"""
+Content-addressed embedding cache for the pgvector store.
+
+Embeddings are keyed by (model, sha256 of the exact text sent to the API), so
+the same article body or query string is only ever embedded once per model.
+
+Two tiers:
+- In-process LRU (bounded by entry count, TTL in seconds)
+- Database table ``embedding_cache`` (bounded by entry count, TTL in days)
+
+Configuration (environment):
+- EMBEDDING_CACHE_ENABLED (default "true")
+- EMBEDDING_CACHE_MEMORY_SIZE (default 5000 entries)
+- EMBEDDING_CACHE_MEMORY_TTL (default 86400 seconds)
+- EMBEDDING_CACHE_DB_MAX_ENTRIES (default 500000 rows)
+- EMBEDDING_CACHE_DB_TTL_DAYS (default 90 days)
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds to skip the database tier after it fails (e.g. migration not applied yet)
+DB_RETRY_INTERVAL = 60
+
+# Run database eviction after this many new rows have been written
+DB_EVICTION_EVERY = 1000
+
+
+def content_hash(text: str) -> str:
+    """Return the sha256 hex digest used as the cache key for ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """Two-tier (memory + database) cache of embedding vectors."""
+
+    def __init__(
+        self,
+        memory_size: int = 5000,
+        memory_ttl_seconds: int = 86400,
+        db_max_entries: Optional[int] = 500000,
+        db_ttl_days: Optional[int] = 90,
+        use_db: bool = True,
+    ):
+        self.memory_size = memory_size
+        self.memory_ttl_seconds = memory_ttl_seconds
+        self.db_max_entries = db_max_entries
+        self.db_ttl_days = db_ttl_days
+        self.use_db = use_db
+
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[List[float], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_retry_at = 0.0
+        self._writes_since_eviction = 0
+
+        self._stats = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "memory_evictions": 0,
+            "db_evictions": 0,
+            "db_errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _memory_get(self, key: Tuple[str, str]) -> Optional[List[float]]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        vector, stored_at = entry
+        if self.memory_ttl_seconds and time.monotonic() - stored_at > self.memory_ttl_seconds:
+            del self._memory[key]
+            self._stats["memory_evictions"] += 1
+            return None
+        self._memory.move_to_end(key)
+        return vector
+
+    def _memory_put(self, key: Tuple[str, str], vector: List[float]) -> None:
+        self._memory[key] = (vector, time.monotonic())
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Database tier
+    # ------------------------------------------------------------------
+
+    def _facade(self):
+        if not self.use_db or time.monotonic() < self._db_retry_at:
+            return None
+        from app.database import get_database_instance
+        return get_database_instance().facade
+
+    def _db_failed(self, operation: str, exc: Exception) -> None:
+        self._stats["db_errors"] += 1
+        self._db_retry_at = time.monotonic() + DB_RETRY_INTERVAL
+        logger.warning(
+            "Embedding cache %s failed, using memory tier only for %ds: %s",
+            operation, DB_RETRY_INTERVAL, exc
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_many(self, model: str, texts: List[str]) -> Dict[str, List[float]]:
+        """Look up cached embeddings for ``texts``.
+
+        Args:
+            model: Embedding model name
+            texts: Exact texts that would be sent to the embedding API
+
+        Returns:
+            Dict mapping each cached text to its embedding. Missing texts are
+            simply absent.
+        """
+        found: Dict[str, List[float]] = {}
+        pending: Dict[str, List[str]] = {}
+
+        with self._lock:
+            for text in texts:
+                if text in found:
+                    continue
+                digest = content_hash(text)
+                vector = self._memory_get((model, digest))
+                if vector is not None:
+                    found[text] = vector
+                    self._stats["memory_hits"] += 1
+                else:
+                    pending.setdefault(digest, []).append(text)
+
+        if pending:
+            facade = self._facade()
+            if facade is not None:
+                try:
+                    rows = facade.get_cached_embeddings(model, list(pending))
+                except Exception as exc:
+                    self._db_failed("lookup", exc)
+                    rows = {}
+
+                with self._lock:
+                    for digest, blob in rows.items():
+                        vector = _unpack(blob)
+                        self._memory_put((model, digest), vector)
+                        for text in pending.pop(digest):
+                            found[text] = vector
+                            self._stats["db_hits"] += 1
+
+        with self._lock:
+            self._stats["misses"] += sum(len(group) for group in pending.values())
+
+        return found
+
+    def set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        """Store freshly computed embeddings in both tiers.
+
+        Args:
+            model: Embedding model name
+            embeddings: Dict mapping the embedded text to its vector
+        """
+        if not embeddings:
+            return
+
+        blobs: Dict[str, bytes] = {}
+        dimensions = 0
+        with self._lock:
+            for text, vector in embeddings.items():
+                digest = content_hash(text)
+                self._memory_put((model, digest), vector)
+                blobs[digest] = _pack(vector)
+                dimensions = len(vector)
+            self._stats["writes"] += len(blobs)
+
+        facade = self._facade()
+        if facade is None:
+            return
+
+        try:
+            facade.save_cached_embeddings(model, dimensions, blobs)
+        except Exception as exc:
+            self._db_failed("write", exc)
+            return
+
+        self._writes_since_eviction += len(blobs)
+        if self._writes_since_eviction >= DB_EVICTION_EVERY:
+            self._writes_since_eviction = 0
+            self.evict()
+
+    def evict(self) -> int:
+        """Apply TTL and size limits to the database tier.
+
+        Returns:
+            Number of database rows removed
+        """
+        facade = self._facade()
+        if facade is None or not (self.db_ttl_days or self.db_max_entries):
+            return 0
+        try:
+            deleted = facade.evict_embedding_cache(self.db_ttl_days, self.db_max_entries)
+        except Exception as exc:
+            self._db_failed("eviction", exc)
+            return 0
+        with self._lock:
+            self._stats["db_evictions"] += deleted
+        if deleted:
+            logger.info("Evicted %d rows from embedding cache", deleted)
+        return deleted
+
+    def clear_memory(self) -> None:
+        """Drop every entry from the in-process tier."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["db_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the process-wide embedding cache, or None when disabled."""
+    global _embedding_cache
+
+    if os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() not in ("1", "true", "yes"):
+        return None
+
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            memory_size=int(os.getenv("EMBEDDING_CACHE_MEMORY_SIZE", "5000")),
+            memory_ttl_seconds=int(os.getenv("EMBEDDING_CACHE_MEMORY_TTL", "86400")),
+            db_max_entries=int(os.getenv("EMBEDDING_CACHE_DB_MAX_ENTRIES", "500000")) or None,
+            db_ttl_days=int(os.getenv("EMBEDDING_CACHE_DB_TTL_DAYS", "90")) or None,
+        )
+    return _embedding_cache
@@ -0,0 +1,206 @@
+"""
+Hybrid lexical + vector retrieval over articles.
+
+A query is ranked twice - by the full-text index (ts_rank over
+``articles.search_vector``, FTS5 bm25 on SQLite) and by the pgvector HNSW
+index (cosine distance over ``articles.embedding``) - and the two candidate
+lists are fused with reciprocal-rank fusion (RRF): an article scores
+sum(1 / (k + rank)) over the lists it appears in. RRF only looks at ranks,
+so ts_rank and cosine distance never have to be put on a common scale.
+
+Both candidate queries run concurrently, each on its own worker-thread
+connection, and metadata filters are applied in SQL inside both of them.
+If one side is unavailable (no embeddings on SQLite, embedding API down,
+full-text migration not applied) the other side's ranking is returned alone.
+
+Results keep the vector store's shape (``id``, ``score``, ``metadata``) so
+callers of ``vector_store.search_articles`` can switch over unchanged, except
+that ``score`` is now the fused score scaled to 0..1 (divided by its maximum
+2 / (k + 1), reached by an article ranked first in both lists) and higher is
+better. ``distance``
+(cosine, None for lexical-only hits) and per-list ``ranks`` are included.
+
+Configuration (environment):
+- HYBRID_SEARCH_RRF_K (default 60)
+- HYBRID_SEARCH_CANDIDATES (default 100 per index; never less than top_k)
+- HYBRID_SEARCH_WORKERS (default 8 threads)
+"""
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.database import get_database_instance
+
+logger = logging.getLogger(__name__)
+
+RRF_K = int(os.getenv("HYBRID_SEARCH_RRF_K", "60"))
+CANDIDATES = int(os.getenv("HYBRID_SEARCH_CANDIDATES", "100"))
+
+# Long-lived workers, so each keeps its per-thread database connection
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("HYBRID_SEARCH_WORKERS", "8")),
+    thread_name_prefix="hybrid_search",
+)
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, Sequence[str]],
+    k: int = RRF_K,
+) -> List[Tuple[str, float, Dict[str, int]]]:
+    """Fuse ranked id lists into (id, score, {list name: 1-based rank}), best first."""
+    fused: Dict[str, Tuple[float, Dict[str, int]]] = {}
+    for name, ids in rankings.items():
+        for rank, item_id in enumerate(ids, start=1):
+            score, ranks = fused.get(item_id, (0.0, {}))
+            if name in ranks:
+                continue
+            ranks[name] = rank
+            fused[item_id] = (score + 1.0 / (k + rank), ranks)
+
+    ordered = sorted(fused.items(), key=lambda item: (-item[1][0], min(item[1][1].values())))
+    return [(item_id, score, ranks) for item_id, (score, ranks) in ordered]
+
+
+def _lexical_candidates(facade, query: str, limit: int, condition) -> List[Dict[str, Any]]:
+    return facade.lexical_article_candidates(query, limit=limit, condition=condition)
+
+
+def _vector_candidates(facade, query: str, limit: int, condition, embedding=None) -> List[Dict[str, Any]]:
+    if facade.db.db_type != "postgresql":
+        return []
+    if embedding is None:
+        from app.vector_store_pgvector import _embed_texts
+        embedding = _embed_texts([query], strict=True)[0]
+    return facade.vector_article_candidates(embedding, limit=limit, condition=condition)
+
+
+def _condition(facade, metadata_filter: Optional[Dict[str, Any]], where):
+    condition = facade.article_filter_condition(metadata_filter)
+    if where is not None:
+        condition = condition & where
+    return condition
+
+
+def _arm_result(name: str, result) -> List[Dict[str, Any]]:
+    """Candidates of one index, or [] (logged) if that side raised."""
+    if isinstance(result, BaseException):
+        logger.warning("Hybrid search: %s candidates failed: %s", name, result)
+        return []
+    return result or []
+
+
+def _fuse(
+    lexical: List[Dict[str, Any]],
+    vector: List[Dict[str, Any]],
+    top_k: int,
+    rrf_k: int,
+) -> List[Dict[str, Any]]:
+    rows: Dict[str, Dict[str, Any]] = {}
+    for row in lexical + vector:
+        rows.setdefault(row["uri"], row)
+    distances = {row["uri"]: row.get("distance") for row in vector}
+
+    fused = reciprocal_rank_fusion(
+        {"lexical": [row["uri"] for row in lexical], "vector": [row["uri"] for row in vector]},
+        k=rrf_k,
+    )
+
+    # Scale so thresholds written for similarity scores (0..1) keep working
+    best_score = 2.0 / (rrf_k + 1)
+    results = []
+    for uri, score, ranks in fused[:top_k]:
+        metadata = {key: value for key, value in rows[uri].items() if key != "distance"}
+        distance = distances.get(uri)
+        results.append({
+            "id": uri,
+            "score": score / best_score,
+            "distance": float(distance) if distance is not None else None,
+            "ranks": ranks,
+            "metadata": metadata,
+        })
+    return results
+
+
+def hybrid_search_articles(
+    query: str,
+    top_k: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    where=None,
+    candidates: Optional[int] = None,
+    rrf_k: int = RRF_K,
+    db=None,
+) -> List[Dict[str, Any]]:
+    """Rank articles for ``query`` by RRF over full-text and vector candidates.
+
+    Args:
+        query: Free-text query
+        top_k: Number of results to return
+        metadata_filter: Vector-store style filter, e.g. {"topic": "AI"} or
+            {"$and": [{"topic": "AI"}, {"publication_date": {"$gte": "2026-01-01"}}]}
+        where: Optional extra SQLAlchemy condition on ``articles``
+        candidates: Candidates fetched from each index (default HYBRID_SEARCH_CANDIDATES)
+        rrf_k: RRF damping constant
+        db: Database instance (defaults to the shared one)
+
+    Returns:
+        List of dicts with id, score, distance, ranks and metadata, best first
+
+    Raises:
+        ValueError: If ``metadata_filter`` uses an unknown field or operator
+    """
+    facade = (db or get_database_instance()).facade
+    condition = _condition(facade, metadata_filter, where)
+    limit = max(top_k, candidates or CANDIDATES)
+
+    lexical_future = _EXECUTOR.submit(_lexical_candidates, facade, query, limit, condition)
+    vector_future = _EXECUTOR.submit(_vector_candidates, facade, query, limit, condition)
+    lexical = _arm_result("lexical", lexical_future.exception() or lexical_future.result())
+    vector = _arm_result("vector", vector_future.exception() or vector_future.result())
+    results = _fuse(lexical, vector, top_k, rrf_k)
+    logger.info(
+        "Hybrid search: query='%s', lexical=%d, vector=%d, returned=%d",
+        query, len(lexical), len(vector), len(results),
+    )
+    return results
+
+
+async def hybrid_search_articles_async(
+    query: str,
+    top_k: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    where=None,
+    candidates: Optional[int] = None,
+    rrf_k: int = RRF_K,
+    db=None,
+) -> List[Dict[str, Any]]:
+    """Async ``hybrid_search_articles``; the embedding request overlaps the full-text query."""
+    facade = (db or get_database_instance()).facade
+    condition = _condition(facade, metadata_filter, where)
+    limit = max(top_k, candidates or CANDIDATES)
+    loop = asyncio.get_running_loop()
+
+    async def vector_arm():
+        if facade.db.db_type != "postgresql":
+            return []
+        from app.vector_store_pgvector import _embed_texts_async
+        embedding = (await _embed_texts_async([query], strict=True))[0]
+        return await loop.run_in_executor(
+            _EXECUTOR, _vector_candidates, facade, query, limit, condition, embedding
+        )
+
+    lexical, vector = await asyncio.gather(
+        loop.run_in_executor(_EXECUTOR, _lexical_candidates, facade, query, limit, condition),
+        vector_arm(),
+        return_exceptions=True,
+    )
+
+    lexical = _arm_result("lexical", lexical)
+    vector = _arm_result("vector", vector)
+    results = _fuse(lexical, vector, top_k, rrf_k)
+    logger.info(
+        "Async hybrid search: query='%s', lexical=%d, vector=%d, returned=%d",
+        query, len(lexical), len(vector), len(results),
+    )
+    return results
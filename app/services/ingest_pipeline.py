@@ -0,0 +1,106 @@
+"""
+Streaming stage pipeline for per-article ingest work.
+
+Items flow through a fixed sequence of stages connected by bounded queues.
+Every stage runs its own pool of workers, so a slow item only occupies one
+worker of the stage it is in while other items keep moving, and end-to-end
+throughput is bounded by the slowest stage's concurrency rather than by the
+slowest item of a batch. Full queues push back on the stages before them.
+
+A stage handler receives the item and returns either None (pass the item on
+to the next stage) or a result, which finishes the item. Handlers that raise
+or exceed the stage's per-item timeout finish the item with the result of
+``on_error``; if ``on_error`` itself raises, the item finishes with that
+exception instead. Results are yielded as each item finishes.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """One pipeline stage: ``concurrency`` workers running ``handler`` with a per-item ``timeout``."""
+    name: str
+    handler: Callable[[Any], Awaitable[Optional[Any]]]
+    concurrency: int = 1
+    timeout: Optional[float] = None
+
+
+def _default_on_error(item: Any, stage: Stage, error: BaseException) -> Any:
+    return error
+
+
+class StagePipeline:
+    """Runs items through ``stages`` and yields ``(item, result)`` in completion order."""
+
+    def __init__(self, stages: List[Stage], queue_size: Optional[int] = None,
+                 on_error: Callable[[Any, Stage, BaseException], Any] = _default_on_error):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_error = on_error
+
+    def _handle_error(self, item: Any, stage: Stage, error: BaseException) -> Any:
+        """Result for a failed item; never raises, so the worker survives and the item is not lost."""
+        try:
+            return self.on_error(item, stage, error)
+        except Exception as callback_error:
+            logger.error("on_error for stage %s failed: %s", stage.name, callback_error)
+            return callback_error
+
+    async def run(self, items: Iterable[Any]) -> AsyncGenerator[Tuple[Any, Any], None]:
+        items = list(items)
+        if not items:
+            return
+
+        # Each stage reads from a bounded inbox sized to keep its workers busy
+        inboxes = [
+            asyncio.Queue(maxsize=self.queue_size or max(2 * stage.concurrency, 1))
+            for stage in self.stages
+        ]
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def feed():
+            for item in items:
+                await inboxes[0].put(item)
+
+        async def work(index: int):
+            stage = self.stages[index]
+            inbox = inboxes[index]
+            while True:
+                item = await inbox.get()
+                try:
+                    if stage.timeout:
+                        result = await asyncio.wait_for(stage.handler(item), timeout=stage.timeout)
+                    else:
+                        result = await stage.handler(item)
+                except asyncio.CancelledError:
+                    raise
+                except asyncio.TimeoutError as e:
+                    logger.warning("Stage %s timed out after %ss", stage.name, stage.timeout)
+                    result = self._handle_error(item, stage, e)
+                except Exception as e:
+                    logger.error("Stage %s failed: %s", stage.name, e)
+                    result = self._handle_error(item, stage, e)
+
+                if result is None and index + 1 < len(self.stages):
+                    await inboxes[index + 1].put(item)
+                else:
+                    await finished.put((item, result))
+
+        tasks = [asyncio.create_task(feed())]
+        for index, stage in enumerate(self.stages):
+            tasks.extend(asyncio.create_task(work(index)) for _ in range(max(stage.concurrency, 1)))
+
+        try:
+            for _ in range(len(items)):
+                yield await finished.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,193 @@
+"""
+Per-(keyword, provider) cursors for incremental keyword polling.
+
+A cursor remembers the newest publication date and the most recent result
+URLs a provider returned for a monitored keyword. The next poll asks only
+for items published since then (minus a small overlap, because most
+providers filter by day), and results the cursor has already seen are
+dropped before any database lookups. Cursors only move past articles that
+were stored, so a failed save is retried on the next poll.
+
+Each cursor also carries its own poll interval. It halves while polls keep
+returning new items and doubles while they come back empty, within
+[base / 4, base * 8] of the monitor's check interval. Pairs that are not
+due yet are skipped.
+"""
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.article_dedup import canonical_url
+
+logger = logging.getLogger(__name__)
+
+# How far before the cursor to search again, to catch late-indexed items
+OVERLAP = timedelta(hours=1)
+# Result URLs remembered per cursor
+MAX_SEEN_URLS = 200
+# Never poll a single pair more often than this
+MIN_POLL_INTERVAL = 300  # seconds
+SPEEDUP_FACTOR = 4
+SLOWDOWN_FACTOR = 8
+
+
+def parse_published(value: Any) -> Optional[datetime]:
+    """Parse a collector's published_date into a naive UTC datetime."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@dataclass
+class PollCursor:
+    keyword_id: int
+    provider: str
+    last_published_at: Optional[datetime] = None
+    seen_urls: List[str] = field(default_factory=list)
+    poll_interval_seconds: Optional[int] = None
+    next_poll_at: Optional[datetime] = None
+    empty_polls: int = 0
+    last_polled_at: Optional[datetime] = None
+    last_new_count: int = 0
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "PollCursor":
+        try:
+            seen_urls = json.loads(row.get('seen_urls') or '[]')
+        except ValueError:
+            seen_urls = []
+        return cls(
+            keyword_id=row['keyword_id'],
+            provider=row['provider'],
+            last_published_at=row.get('last_published_at'),
+            seen_urls=seen_urls,
+            poll_interval_seconds=row.get('poll_interval_seconds'),
+            next_poll_at=row.get('next_poll_at'),
+            empty_polls=row.get('empty_polls') or 0,
+            last_polled_at=row.get('last_polled_at'),
+            last_new_count=row.get('last_new_count') or 0,
+        )
+
+    def to_row(self) -> Dict[str, Any]:
+        return {
+            'keyword_id': self.keyword_id,
+            'provider': self.provider,
+            'last_published_at': self.last_published_at,
+            'seen_urls': json.dumps(self.seen_urls),
+            'poll_interval_seconds': self.poll_interval_seconds,
+            'next_poll_at': self.next_poll_at,
+            'empty_polls': self.empty_polls,
+            'last_polled_at': self.last_polled_at,
+            'last_new_count': self.last_new_count,
+        }
+
+    def is_due(self, now: datetime) -> bool:
+        return self.next_poll_at is None or self.next_poll_at <= now
+
+    def search_since(self, default_start: datetime) -> datetime:
+        """Start date for the next search: the cursor, but never before ``default_start``."""
+        if self.last_published_at is None:
+            return default_start
+        return max(default_start, self.last_published_at - OVERLAP)
+
+    def filter_new(self, articles: Iterable[Dict]) -> List[Dict]:
+        """Drop articles this cursor has already returned."""
+        seen = set(self.seen_urls)
+        fresh = []
+        for article in articles:
+            url = (article.get('url') or '').strip()
+            if url in seen:
+                continue
+            published = parse_published(article.get('published_date'))
+            if published and self.last_published_at and published < self.last_published_at - OVERLAP:
+                continue
+            fresh.append(article)
+        return fresh
+
+    def advance(self, new_articles: List[Dict], base_interval: int, now: datetime,
+                failed_urls: Iterable[str] = ()) -> None:
+        """Move the cursor past the saved ``new_articles`` and adapt the poll interval.
+
+        Articles whose URL is in ``failed_urls`` (compared by canonical URL)
+        were not stored; the cursor stops short of the oldest of them so the
+        next poll fetches them again.
+        """
+        failed_keys = {canonical_url(url) for url in failed_urls} - {''}
+        saved, failed = [], []
+        for article in new_articles:
+            (failed if canonical_url(article.get('url')) in failed_keys else saved).append(article)
+
+        published = [p for p in (parse_published(a.get('published_date')) for a in saved) if p]
+        failed_published = [parse_published(a.get('published_date')) for a in failed]
+        if published and None not in failed_published:
+            newest = max(published)
+            if failed_published:
+                newest = min(newest, min(failed_published))
+            if self.last_published_at is None or newest > self.last_published_at:
+                self.last_published_at = newest
+
+        urls = [(a.get('url') or '').strip() for a in saved if a.get('url')]
+        self.seen_urls = (urls + [u for u in self.seen_urls if u not in urls])[:MAX_SEEN_URLS]
+
+        base_interval = max(int(base_interval), 1)
+        floor = min(base_interval, max(base_interval // SPEEDUP_FACTOR, MIN_POLL_INTERVAL))
+        ceiling = base_interval * SLOWDOWN_FACTOR
+        interval = self.poll_interval_seconds or base_interval
+
+        if new_articles:
+            self.empty_polls = 0
+            interval = max(floor, interval // 2)
+        else:
+            self.empty_polls += 1
+            interval = min(ceiling, interval * 2)
+
+        self.poll_interval_seconds = interval
+        self.last_polled_at = now
+        self.next_poll_at = now + timedelta(seconds=interval)
+        self.last_new_count = len(new_articles)
+
+
+class KeywordCursorStore:
+    """Loads and saves poll cursors through the database facade."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def load(self, keyword_ids: List[int]) -> Dict[tuple, PollCursor]:
+        try:
+            rows = self.db.facade.get_keyword_poll_cursors(keyword_ids)
+        except Exception as e:
+            logger.warning("Could not load keyword poll cursors, polling everything: %s", e)
+            return {}
+        return {key: PollCursor.from_row(row) for key, row in rows.items()}
+
+    def get(self, cursors: Dict[tuple, PollCursor], keyword_id: int, provider: str) -> PollCursor:
+        return cursors.get((keyword_id, provider)) or PollCursor(keyword_id=keyword_id, provider=provider)
+
+    def save(self, cursors: Iterable[PollCursor]) -> None:
+        try:
+            self.db.facade.save_keyword_poll_cursors([cursor.to_row() for cursor in cursors])
+        except Exception as e:
+            logger.warning("Could not save keyword poll cursors: %s", e)
+
+    def seconds_until_next_poll(self, now: datetime) -> Optional[float]:
+        """Seconds until the earliest cursor is due, or None if there are no cursors."""
+        try:
+            next_poll = self.db.facade.get_next_keyword_poll_time()
+        except Exception as e:
+            logger.warning("Could not read next keyword poll time: %s", e)
+            return None
+        if next_poll is None:
+            return None
+        return max((next_poll - now).total_seconds(), 0.0)
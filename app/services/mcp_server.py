@@ -355,7 +355,7 @@ class AuspexMCPServer:
         topic = arguments["topic"]
         
         try:
-            articles, _ = self.db.search_articles(topic=topic, per_page=1000)
+            articles, _ = self.db.search_articles(topic=topic, per_page=1000, projection='list')
             
             # Analyze category distribution
             category_counts = {}
@@ -14,6 +14,7 @@ from app.database import Database, get_database_instance
 from app.database_query_facade import DatabaseQueryFacade
 from app.ai_models import LiteLLMModel, get_available_models
 from app.analyzers.prompt_manager import PromptManager
+from app.services.ontology_registry import get_ontology_registry
 
 logger = logging.getLogger(__name__)
 
@@ -174,41 +175,35 @@ class ModelBiasArenaService:
             from app.analyzers.article_analyzer import ArticleAnalyzer
             from app.ai_models import LiteLLMModel
             
-            # Load ontology configuration
-            from app.config.config import load_config
-            config = load_config()
-            topic_configs = {topic['name']: topic for topic in config['topics']}
+            # Load ontology configuration from the shared registry
+            registry = get_ontology_registry()
             
-            # Find the appropriate topic config from sampled articles
-            topic_config = None
+            # Find the appropriate topic ontology from sampled articles
+            ontology = None
             if articles:
                 try:
                     row = (DatabaseQueryFacade(self.db, logger)).get_topics_from_article(articles[0]["article_uri"],)
-                    if row and row[0] and row[0] in topic_configs:
-                        topic_config = topic_configs[row[0]]
-                        logger.info(f"Using topic config for: {row[0]}")
+                    if row and row[0]:
+                        ontology = registry.get(row[0])
+                        if ontology:
+                            logger.info(f"Using topic config for: {row[0]}")
                 except Exception as e:
                     logger.warning(f"Could not determine topic from articles: {e}")
             
             # Fallback to first available topic if none found
-            if not topic_config and topic_configs:
-                topic_config = next(iter(topic_configs.values()))
-                logger.info(f"Using fallback topic config: {topic_config.get('name', 'Unknown')}")
-            
-            # Extract ontology values or use defaults
-            if topic_config:
-                categories = topic_config.get('categories', ["Technology", "Business", "Politics", "Science", "Health", "Other"])
-                future_signals = topic_config.get('future_signals', ["Strong", "Moderate", "Weak", "None"])
-                sentiment_options = topic_config.get('sentiment', ["Positive", "Negative", "Neutral", "Mixed"])
-                time_to_impact_options = topic_config.get('time_to_impact', ["Immediate", "Short-term", "Medium-term", "Long-term", "Uncertain"])
-                driver_types = topic_config.get('driver_types', ["Technological", "Economic", "Social", "Political", "Environmental", "Regulatory"])
-            else:
-                # Final fallback defaults
-                categories = ["Technology", "Business", "Politics", "Science", "Health", "Other"]
-                future_signals = ["Strong", "Moderate", "Weak", "None"]
-                sentiment_options = ["Positive", "Negative", "Neutral", "Mixed"]
-                time_to_impact_options = ["Immediate", "Short-term", "Medium-term", "Long-term", "Uncertain"]
-                driver_types = ["Technological", "Economic", "Social", "Political", "Environmental", "Regulatory"]
+            if not ontology:
+                topic_names = registry.topics()
+                if topic_names:
+                    ontology = registry.get(topic_names[0])
+                    logger.info(f"Using fallback topic config: {topic_names[0]}")
+            
+            # Extract ontology values, using defaults for anything missing
+            ontology_values = ontology.analyzer_kwargs() if ontology else {}
+            categories = ontology_values.get('categories') or ["Technology", "Business", "Politics", "Science", "Health", "Other"]
+            future_signals = ontology_values.get('future_signals') or ["Strong", "Moderate", "Weak", "None"]
+            sentiment_options = ontology_values.get('sentiment_options') or ["Positive", "Negative", "Neutral", "Mixed"]
+            time_to_impact_options = ontology_values.get('time_to_impact_options') or ["Immediate", "Short-term", "Medium-term", "Long-term", "Uncertain"]
+            driver_types = ontology_values.get('driver_types') or ["Technological", "Economic", "Social", "Political", "Environmental", "Regulatory"]
             
             logger.info(f"Using ontology: categories={categories}, future_signals={future_signals}, driver_types={driver_types}")
             
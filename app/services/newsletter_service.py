@@ -311,73 +311,56 @@ class NewsletterService:
         except Exception as e:
             self.logger.warning(f"DB search failed: {e}")
 
-        # Strategy 2: Vector search
+        # Strategy 2: Vector search - every query variant in one embedding
+        # request and one SQL statement, with the date range applied in SQL
         if self.vector_store and len(articles) < 100:
+            search_queries = [
+                topic,
+                f"latest {topic} news",
+                f"{topic} regulation policy",
+                f"{topic} funding investment",
+                f"{topic} research breakthrough"
+            ]
+            metadata_filter = {
+                "publication_date": {
+                    "$gte": start_date.strftime('%Y-%m-%d'),
+                    # publication_date is text, so bound by the start of the next day
+                    "$lt": (end_date + timedelta(days=1)).strftime('%Y-%m-%d')
+                }
+            }
+            if topic:
+                metadata_filter["topic"] = topic
+
             try:
-                search_queries = [
-                    topic,
-                    f"latest {topic} news",
-                    f"{topic} regulation policy",
-                    f"{topic} funding investment",
-                    f"{topic} research breakthrough"
-                ]
-
-                for query in search_queries:
-                    try:
-                        results = self.vector_store(
-                            query=query,
-                            top_k=50,
-                            metadata_filter={"topic": topic} if topic else None
-                        )
-                        if results:
-                            for result in results:
-                                metadata = result.get('metadata', {})
-                                uri = metadata.get('uri') or result.get('id', '')
-                                if uri and uri not in seen_uris:
-                                    seen_uris.add(uri)
-                                    articles.append({
-                                        "uri": uri,
-                                        "url": metadata.get("url") or metadata.get("link") or uri,
-                                        "title": metadata.get("title", "Unknown Title"),
-                                        "summary": metadata.get("summary", ""),
-                                        "category": metadata.get("category", ""),
-                                        "sentiment": metadata.get("sentiment", ""),
-                                        "future_signal": metadata.get("future_signal", ""),
-                                        "pub_date": metadata.get("pub_date") or metadata.get("publication_date", ""),
-                                        "news_source": metadata.get("news_source", "Unknown"),
-                                        "similarity_score": result.get("score", 0.0)
-                                    })
-                    except Exception as e:
-                        self.logger.debug(f"Vector search failed: {e}")
+                results = await self.vector_store(
+                    queries=search_queries,
+                    top_k=50,
+                    metadata_filter=metadata_filter
+                )
+                for result in results:
+                    metadata = result.get('metadata', {})
+                    uri = metadata.get('uri') or result.get('id', '')
+                    if uri and uri not in seen_uris:
+                        seen_uris.add(uri)
+                        articles.append({
+                            "uri": uri,
+                            "url": metadata.get("url") or metadata.get("link") or uri,
+                            "title": metadata.get("title", "Unknown Title"),
+                            "summary": metadata.get("summary", ""),
+                            "category": metadata.get("category", ""),
+                            "sentiment": metadata.get("sentiment", ""),
+                            "future_signal": metadata.get("future_signal", ""),
+                            "pub_date": metadata.get("pub_date") or metadata.get("publication_date", ""),
+                            "news_source": metadata.get("news_source", "Unknown"),
+                            # score is cosine distance; rank by similarity
+                            "similarity_score": 1.0 - result.get("score", 1.0)
+                        })
+                self.logger.info(f"Vector search: {len(results)} articles for {len(search_queries)} queries")
             except Exception as e:
                 self.logger.warning(f"Vector search failed: {e}")
 
-        # Filter by date range
-        articles = [
-            art for art in articles
-            if self._is_within_date_range(art, start_date, end_date)
-        ]
-
         return articles
 
-    def _is_within_date_range(self, article: Dict, start_date: datetime, end_date: datetime) -> bool:
-        """Check if article is within date range."""
-        pub_date = article.get('pub_date') or article.get('publication_date', '')
-        if not pub_date:
-            return True
-
-        try:
-            if isinstance(pub_date, str):
-                if 'T' in pub_date:
-                    date_obj = datetime.fromisoformat(pub_date.replace('Z', '+00:00')).replace(tzinfo=None)
-                else:
-                    date_obj = datetime.strptime(pub_date[:10], '%Y-%m-%d')
-            else:
-                date_obj = pub_date
-            return start_date <= date_obj <= end_date
-        except:
-            return True
-
     def _categorize_articles(self, articles: List[Dict]) -> Dict[str, List[Dict]]:
         """Categorize articles by section."""
         categorized = defaultdict(list)
@@ -795,12 +778,12 @@ def get_newsletter_service():
     global _newsletter_service
     if _newsletter_service is None:
         from app.services.auspex_service import get_auspex_service
-        from app.vector_store import search_articles as vector_search_articles
+        from app.vector_store import multi_query_search_articles_async
         from app.ai_models import get_ai_model
         auspex = get_auspex_service()
         _newsletter_service = NewsletterService(
             db=auspex.db,
-            vector_store=vector_search_articles,
+            vector_store=multi_query_search_articles_async,
             ai_model_getter=get_ai_model
         )
     return _newsletter_service
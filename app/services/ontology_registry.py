@@ -0,0 +1,180 @@
+"""
+In-memory registry of per-topic ontologies.
+
+Article analysis needs each topic's categories, future signals, sentiment
+options, time-to-impact options and driver types. They come from the
+``topics`` section of config.json, which is read once and then served from
+memory. Each reload bumps a version number.
+
+Reloads happen when:
+- a topic is created, edited or deleted (routes call ``invalidate``)
+- config.json changes on disk (checked by modification time on access)
+- an unknown topic is requested (it may have been added at runtime)
+"""
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "config.json")
+
+
+@dataclass(frozen=True)
+class TopicOntology:
+    """Ontology lists for one topic, as loaded in registry version ``version``."""
+
+    name: str
+    version: int
+    categories: Tuple[str, ...] = ()
+    future_signals: Tuple[str, ...] = ()
+    sentiment: Tuple[str, ...] = ()
+    time_to_impact: Tuple[str, ...] = ()
+    driver_types: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, topic: Dict, version: int) -> "TopicOntology":
+        def values(key: str) -> Tuple[str, ...]:
+            return tuple(topic.get(key) or ())
+
+        return cls(
+            name=topic["name"],
+            version=version,
+            categories=values("categories"),
+            future_signals=values("future_signals"),
+            sentiment=values("sentiment"),
+            time_to_impact=values("time_to_impact"),
+            driver_types=values("driver_types"),
+        )
+
+    def analyzer_kwargs(self) -> Dict[str, List[str]]:
+        """Return the ontology as keyword arguments for ArticleAnalyzer.analyze_content."""
+        return {
+            "categories": list(self.categories),
+            "future_signals": list(self.future_signals),
+            "sentiment_options": list(self.sentiment),
+            "time_to_impact_options": list(self.time_to_impact),
+            "driver_types": list(self.driver_types),
+        }
+
+
+def normalize_topic_name(topic: str) -> str:
+    """Strip and collapse whitespace, as Research.set_topic does."""
+    return re.sub(r"\s+", " ", (topic or "").strip())
+
+
+class OntologyRegistry:
+    """Versioned, topic-keyed cache of TopicOntology objects."""
+
+    def __init__(self, config_path: str = CONFIG_PATH, loader: Optional[Callable[[], Dict]] = None):
+        self.config_path = config_path
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._topics: Dict[str, TopicOntology] = {}
+        self._missing: set = set()
+        self._loaded = False
+        self._mtime: Optional[float] = None
+        self._version = 0
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+
+    def _read_config(self) -> Dict:
+        if self._loader:
+            return self._loader()
+        from app.config.config import load_config
+        return load_config()
+
+    def _config_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.config_path)
+        except OSError:
+            return None
+
+    def _reload(self) -> None:
+        mtime = self._config_mtime()
+        config = self._read_config()
+        version = self._version + 1
+        topics = {}
+        for topic in config.get("topics", []):
+            if topic.get("name"):
+                topics[topic["name"]] = TopicOntology.from_config(topic, version)
+        self._topics = topics
+        self._missing = set()
+        self._version = version
+        self._mtime = mtime
+        self._loaded = True
+        logger.info("Loaded ontology registry v%d with %d topics", version, len(topics))
+
+    def _ensure_current(self) -> bool:
+        if not self._loaded or self._config_mtime() != self._mtime:
+            self._reload()
+            return True
+        return False
+
+    @property
+    def version(self) -> int:
+        """Number of times the registry has been (re)loaded."""
+        return self._version
+
+    def get(self, topic: str) -> Optional[TopicOntology]:
+        """Return the ontology for ``topic``, or None if no such topic is configured."""
+        name = normalize_topic_name(topic)
+        if not name:
+            return None
+        with self._lock:
+            reloaded = self._ensure_current()
+            ontology = self._topics.get(name)
+            if ontology is None and not reloaded and name not in self._missing:
+                # The topic may have been added without going through the routes
+                self._reload()
+                ontology = self._topics.get(name)
+            if ontology is None:
+                self._missing.add(name)
+        if ontology is None:
+            logger.warning("Topic '%s' not found in ontology registry", name)
+        return ontology
+
+    def topics(self) -> List[str]:
+        """Return the configured topic names, in config order."""
+        with self._lock:
+            self._ensure_current()
+            return list(self._topics)
+
+    def invalidate(self, topic: Optional[str] = None) -> None:
+        """Force a reload on next access after ``topic`` (or any topic) was edited.
+
+        Registered listeners are notified with the topic name (None for all).
+        """
+        with self._lock:
+            self._loaded = False
+            listeners = list(self._listeners)
+        logger.debug("Ontology registry invalidated for %s", topic or "all topics")
+        for listener in listeners:
+            try:
+                listener(topic)
+            except Exception as exc:
+                logger.warning("Ontology invalidation listener failed: %s", exc)
+
+    def subscribe(self, listener: Callable[[Optional[str]], None]) -> None:
+        """Call ``listener(topic)`` whenever the registry is invalidated."""
+        with self._lock:
+            self._listeners.append(listener)
+
+
+_ontology_registry: Optional[OntologyRegistry] = None
+
+
+def get_ontology_registry() -> OntologyRegistry:
+    """Return the process-wide ontology registry."""
+    global _ontology_registry
+
+    if _ontology_registry is None:
+        _ontology_registry = OntologyRegistry()
+    return _ontology_registry
+
+
+def invalidate_topic(topic: Optional[str] = None) -> None:
+    """Invalidate cached ontology (and dependent caches) after a topic edit."""
+    get_ontology_registry().invalidate(topic)
@@ -0,0 +1,689 @@
+"""
+Precomputed embedding projections for /api/embedding_projection.
+
+A projection is fitted once per scope (method, dims, cluster count and
+metadata filter) and its coordinates and k-means labels are stored in the
+``projection_scopes`` / ``projection_points`` tables, so projection requests
+are a table read.
+
+A scope is fitted on the PROJECTION_MAX_POINTS most recently submitted
+articles, and the reducer on at most PROJECTION_MAX_FIT_SIZE of them; every
+other article in the scope is placed with ``transform()`` (UMAP, PCA) or,
+for t-SNE and when the fitted models are no longer in memory, at the
+similarity-weighted mean of its nearest fitted neighbours. Fitted models
+are kept for the PROJECTION_MAX_MODELS most recently used scopes.
+
+The refresh task (app/tasks/projection_refresher.py) fits newly requested
+scopes in the background - until then requests get a "pending" response -
+and, every PROJECTION_REFRESH_INTERVAL, appends new articles to the
+PROJECTION_MAX_REFRESH_SCOPES most recently requested scopes the same way,
+refitting a scope once appended points make up more than
+PROJECTION_DRIFT_THRESHOLD of the fitted ones. Without the refresh task,
+scopes are fitted inside the request.
+
+Configuration (environment):
+- PROJECTION_MAX_FIT_SIZE (default 5000 vectors)
+- PROJECTION_MAX_POINTS (default 50000 points per scope)
+- PROJECTION_DRIFT_THRESHOLD (default 0.2)
+- PROJECTION_MAX_MODELS (default 8 scopes with fitted models in memory)
+- PROJECTION_MAX_REFRESH_SCOPES (default 32)
+- PROJECTION_REFRESH_INTERVAL (default 900 seconds)
+- PROJECTION_REFRESH_ENABLED (default "true", read at app startup)
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECTION_MAX_FIT_SIZE = int(os.getenv("PROJECTION_MAX_FIT_SIZE", "5000"))
+PROJECTION_MAX_POINTS = int(os.getenv("PROJECTION_MAX_POINTS", "50000"))
+PROJECTION_DRIFT_THRESHOLD = float(os.getenv("PROJECTION_DRIFT_THRESHOLD", "0.2"))
+PROJECTION_REFRESH_INTERVAL = int(os.getenv("PROJECTION_REFRESH_INTERVAL", "900"))
+PROJECTION_MAX_MODELS = int(os.getenv("PROJECTION_MAX_MODELS", "8"))
+PROJECTION_MAX_REFRESH_SCOPES = int(os.getenv("PROJECTION_MAX_REFRESH_SCOPES", "32"))
+
+# How often the refresh task looks for scopes waiting for their first fit
+PENDING_FIT_POLL_INTERVAL = 5  # seconds
+
+# Neighbours used to place points when no fitted transform is available
+PLACEMENT_NEIGHBOURS = 10
+
+
+def scope_key(method: str, dims: int, n_clusters: int, filters: Optional[Dict[str, Any]]) -> str:
+    """Return the stable key identifying a projection scope."""
+    payload = json.dumps(
+        {"method": method, "dims": dims, "n_clusters": n_clusters, "filters": filters or {}},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def explain_clusters(clusters, metas: List[Dict[str, Any]]) -> Dict[int, Any]:
+    """Build a human-readable title, summary and keywords for each cluster."""
+    from sklearn.feature_extraction import text as _sk_text
+
+    STOP_WORDS = set(_sk_text.ENGLISH_STOP_WORDS)
+    
+    # Enhanced STOP_WORDS with common news terms that don't add meaning
+    ENHANCED_STOP_WORDS = STOP_WORDS | {
+        'said', 'says', 'according', 'report', 'reports', 'news', 'new', 'latest',
+        'today', 'yesterday', 'week', 'month', 'year', 'time', 'years', 'months',
+        'company', 'companies', 'people', 'person', 'world', 'country', 'countries',
+        'government', 'state', 'states', 'city', 'way', 'ways', 'day', 'days',
+        'first', 'second', 'third', 'last', 'next', 'previous', 'current', 'recent',
+        'major', 'large', 'small', 'big', 'high', 'low', 'good', 'bad', 'better',
+        'best', 'worst', 'long', 'short', 'old', 'young', 'early', 'late', 'local',
+        'national', 'international', 'global', 'public', 'private', 'official',
+        'officials', 'sources', 'source', 'including', 'include', 'includes',
+        'part', 'parts', 'group', 'groups', 'number', 'numbers', 'total', 'many',
+        'several', 'various', 'different', 'similar', 'same', 'other', 'others',
+        'million', 'billion', 'thousand', 'million', 'percent', 'percentage'
+    }
+    
+    # Collect documents and metadata by cluster
+    cluster_documents = defaultdict(list)
+    cluster_metadata = defaultdict(list)
+    
+    for idx, lbl in enumerate(clusters):
+        meta = metas[idx] if idx < len(metas) else {}
+        title = meta.get('title') or ''
+        summary = meta.get('summary') or ''
+        
+        # Combine title and summary with title weighted more heavily
+        document = f"{title} {title} {summary}"  # Title appears twice for emphasis
+        
+        cluster_documents[int(lbl)].append(document)
+        cluster_metadata[int(lbl)].append(meta)
+    
+    # Generate enhanced explanations using TF-IDF and contextual analysis
+    explain = {}
+    
+    for lbl, docs in cluster_documents.items():
+        if not docs:
+            explain[lbl] = ["empty cluster"]
+            continue
+            
+        cluster_metas = cluster_metadata[lbl]
+        
+        # Method 1: TF-IDF based keyword extraction
+        combined_text = " ".join(docs)
+        
+        # Clean and tokenize
+        tokens = [
+            t.lower() for t in re.findall(r"\b[a-zA-Z]{3,}\b", combined_text)
+            if t.lower() not in ENHANCED_STOP_WORDS and len(t) >= 3
+        ]
+        
+        if not tokens:
+            explain[lbl] = ["misc content"]
+            continue
+        
+        # Get top keywords by frequency
+        keyword_counts = Counter(tokens)
+        top_keywords = [w for w, c in keyword_counts.most_common(15) if c >= 2]
+        
+        # Method 2: Extract named entities and proper nouns (capitalized words)
+        named_entities = set()
+        for doc in docs:
+            entities = re.findall(r"\b[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*\b", doc)
+            for entity in entities:
+                if len(entity.split()) <= 3 and entity.lower() not in ENHANCED_STOP_WORDS:
+                    named_entities.add(entity.lower())
+        
+        # Extract common phrases (2-3 word combinations)
+        phrase_counts = Counter()
+        for doc in docs:
+            words = re.findall(r"\b[a-zA-Z]{3,}\b", doc.lower())
+            clean_words = [w for w in words if w not in ENHANCED_STOP_WORDS]
+            
+            # Extract bigrams and trigrams
+            for i in range(len(clean_words) - 1):
+                bigram = f"{clean_words[i]} {clean_words[i+1]}"
+                phrase_counts[bigram] += 1
+                
+            for i in range(len(clean_words) - 2):
+                trigram = f"{clean_words[i]} {clean_words[i+1]} {clean_words[i+2]}"
+                phrase_counts[trigram] += 1
+        
+        # Get meaningful phrases (appearing at least twice)
+        meaningful_phrases = [phrase for phrase, count in phrase_counts.most_common(5) if count >= 2]
+        
+        # Method 3: Analyze metadata patterns
+        categories = [meta.get('category') for meta in cluster_metas if meta.get('category')]
+        topics = [meta.get('topic') for meta in cluster_metas if meta.get('topic')]
+        sentiments = [meta.get('sentiment') for meta in cluster_metas if meta.get('sentiment')]
+        
+        category_pattern = Counter(categories).most_common(1)
+        topic_pattern = Counter(topics).most_common(1)
+        sentiment_pattern = Counter(sentiments).most_common(1)
+        
+        # Generate human-readable cluster title and description
+        cluster_info = {
+            "keywords": [],
+            "title": "",
+            "summary": "",
+            "count": len(cluster_metas)
+        }
+        
+        # Analyze dominant themes for title generation
+        title_components = []
+        
+        # Priority 1: Category context for title
+        if category_pattern and len(category_pattern[0]) > 0:
+            cat, cat_count = category_pattern[0]
+            if cat_count >= len(cluster_metas) * 0.4:  # At least 40% of articles
+                title_components.append(cat.title())
+        
+        # Priority 2: Topic context for title
+        if topic_pattern and len(topic_pattern[0]) > 0:
+            topic, topic_count = topic_pattern[0]
+            if topic_count >= len(cluster_metas) * 0.4:
+                title_components.append(topic.title())
+        
+        # Priority 3: Most meaningful phrases for title
+        if meaningful_phrases:
+            # Use the most common meaningful phrase as part of title
+            best_phrase = meaningful_phrases[0].title()
+            if len(best_phrase.split()) <= 3:  # Keep titles concise
+                title_components.append(best_phrase)
+        
+        # Priority 4: Top keywords for title if nothing else
+        if not title_components and top_keywords:
+            title_components.append(top_keywords[0].title())
+        
+        # Generate human-readable title
+        if title_components:
+            # Create a natural title
+            if len(title_components) == 1:
+                cluster_title = f"{title_components[0]} News"
+            elif len(title_components) == 2:
+                cluster_title = f"{title_components[0]} & {title_components[1]}"
+            else:
+                cluster_title = f"{title_components[0]} Topics"
+        else:
+            cluster_title = "Mixed Content"
+        
+        # Generate summary description
+        summary_parts = []
+        
+        # Add article count context
+        article_count = len(cluster_metas)
+        if article_count > 1:
+            summary_parts.append(f"{article_count} articles about")
+        
+        # Add main themes
+        if meaningful_phrases:
+            main_themes = [phrase for phrase in meaningful_phrases[:2] if len(phrase.split()) <= 4]
+            if main_themes:
+                summary_parts.append(" and ".join(main_themes))
+        elif top_keywords:
+            main_themes = top_keywords[:3]
+            summary_parts.append(", ".join(main_themes))
+        
+        # Add category/topic context to summary
+        context_parts = []
+        if category_pattern and len(category_pattern[0]) > 0:
+            cat, cat_count = category_pattern[0]
+            if cat_count >= len(cluster_metas) * 0.3:
+                context_parts.append(f"in {cat.lower()}")
+        
+        if topic_pattern and len(topic_pattern[0]) > 0:
+            topic, topic_count = topic_pattern[0]
+            if topic_count >= len(cluster_metas) * 0.3 and topic.lower() not in " ".join(context_parts).lower():
+                context_parts.append(f"related to {topic.lower()}")
+        
+        if context_parts:
+            summary_parts.extend(context_parts)
+        
+        # Add sentiment if very dominant
+        if sentiment_pattern and len(sentiment_pattern[0]) > 0:
+            sent, sent_count = sentiment_pattern[0]
+            if sent_count >= len(cluster_metas) * 0.7:  # At least 70% of articles
+                summary_parts.append(f"with {sent.lower()} sentiment")
+        
+        # Create final summary
+        if summary_parts:
+            cluster_summary = " ".join(summary_parts).capitalize()
+            if not cluster_summary.endswith('.'):
+                cluster_summary += "."
+        else:
+            cluster_summary = f"Collection of {article_count} related articles."
+        
+        # Collect keywords for legacy compatibility and detailed view
+        description_parts = []
+        
+        # Add top meaningful phrases
+        description_parts.extend(meaningful_phrases[:2])
+        
+        # Add top keywords
+        description_parts.extend(top_keywords[:6])
+        
+        # Add named entities
+        description_parts.extend(list(named_entities)[:2])
+        
+        # Clean up and deduplicate keywords
+        unique_parts = []
+        seen = set()
+        for part in description_parts:
+            if part and part not in seen and len(part.strip()) > 2:
+                unique_parts.append(part.strip())
+                seen.add(part)
+        
+        final_keywords = unique_parts[:8] if unique_parts else top_keywords[:5]
+        if not final_keywords:
+            final_keywords = ["misc content"]
+        
+        # Store enhanced cluster information
+        cluster_info["keywords"] = final_keywords
+        cluster_info["title"] = cluster_title
+        cluster_info["summary"] = cluster_summary
+        
+        explain[lbl] = cluster_info
+
+    return explain
+
+
+def _build_reducer(method: str, dims: int):
+    if method == "tsne":
+        from sklearn.manifold import TSNE
+        return TSNE(
+            n_components=dims,
+            metric="cosine",
+            random_state=42,
+            init="random",
+            learning_rate="auto",
+        )
+    if method == "pca":
+        from sklearn.decomposition import PCA
+        return PCA(n_components=dims, random_state=42)
+
+    import umap
+    return umap.UMAP(n_components=dims, metric="cosine", random_state=42)
+
+
+def _place_by_neighbours(vectors, ref_vectors, ref_coords, ref_clusters, k: int = PLACEMENT_NEIGHBOURS):
+    """Place vectors at the similarity-weighted mean of their nearest reference points.
+
+    Used for reducers without ``transform()`` (t-SNE) and when the fitted
+    models are not in memory. The cluster is the weighted majority label
+    of the same neighbours.
+    """
+    import numpy as np
+
+    def _normalise(matrix):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    sims = _normalise(vectors) @ _normalise(ref_vectors).T
+    k = min(k, ref_vectors.shape[0])
+    nearest = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    weights = np.clip(np.take_along_axis(sims, nearest, axis=1), 1e-6, None)
+
+    coords = (ref_coords[nearest] * weights[..., None]).sum(axis=1) / weights.sum(axis=1, keepdims=True)
+
+    clusters = np.empty(len(vectors), dtype=int)
+    for row, (idxs, row_weights) in enumerate(zip(nearest, weights)):
+        votes = defaultdict(float)
+        for idx, weight in zip(idxs, row_weights):
+            votes[int(ref_clusters[idx])] += float(weight)
+        clusters[row] = max(votes, key=votes.get)
+
+    return coords, clusters
+
+
+def _point(uri: str, coords, cluster) -> Dict[str, Any]:
+    return {
+        "uri": uri,
+        "x": float(coords[0]),
+        "y": float(coords[1]),
+        "z": float(coords[2]) if len(coords) > 2 else None,
+        "cluster": int(cluster),
+    }
+
+
+class ProjectionStore:
+    """Fits, stores and incrementally extends embedding projections."""
+
+    def __init__(self, db=None):
+        self._db = db
+        # Fitted reducer / PCA / k-means per scope_key, least recently used
+        # first (lost on restart)
+        self._models: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Recently requested scope keys, least recent first; only these are refreshed
+        self._requested: "OrderedDict[str, None]" = OrderedDict()
+        # Scopes waiting for a background fit: key -> (method, dims, n_clusters, filters, refit)
+        self._pending: "OrderedDict[str, Tuple]" = OrderedDict()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # Set while the refresh task runs; without it scopes are fitted inline
+        self.background_fits = False
+
+    @property
+    def facade(self):
+        if self._db is None:
+            from app.database import get_database_instance
+            self._db = get_database_instance()
+        return self._db.facade
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _get_models(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._locks_guard:
+            models = self._models.get(key)
+            if models is not None:
+                self._models.move_to_end(key)
+            return models
+
+    def _keep_models(self, key: str, models: Dict[str, Any]) -> None:
+        with self._locks_guard:
+            self._models[key] = models
+            self._models.move_to_end(key)
+            while len(self._models) > PROJECTION_MAX_MODELS:
+                self._models.popitem(last=False)
+
+    def _mark_requested(self, key: str) -> None:
+        with self._locks_guard:
+            self._requested[key] = None
+            self._requested.move_to_end(key)
+            while len(self._requested) > PROJECTION_MAX_REFRESH_SCOPES:
+                self._requested.popitem(last=False)
+
+    @staticmethod
+    def is_stale(scope: Dict[str, Any]) -> bool:
+        """True once points added since the fit exceed the drift threshold."""
+        if not scope.get("fitted_count"):
+            return True
+        return scope.get("placed_count", 0) / scope["fitted_count"] > PROJECTION_DRIFT_THRESHOLD
+
+    # ------------------------------------------------------------------
+    # Fitting and placement
+    # ------------------------------------------------------------------
+
+    def _place(self, models, vectors, ref_vectors=None, ref_coords=None, ref_clusters=None):
+        if models and models.get("reducer") is not None:
+            coords = models["reducer"].transform(vectors)
+            space = models["pca"].transform(vectors) if models["pca"] is not None else vectors
+            return coords, models["kmeans"].predict(space)
+        return _place_by_neighbours(vectors, ref_vectors, ref_coords, ref_clusters)
+
+    def _fit(self, key: str, method: str, dims: int, n_clusters: int, filters: Dict[str, Any]) -> bool:
+        import numpy as np
+        from app.vector_store import get_vectors_by_metadata
+
+        vecs, metas, ids = get_vectors_by_metadata(
+            limit=PROJECTION_MAX_POINTS, where=filters or None, newest_first=True
+        )
+        if vecs.size == 0:
+            logger.warning("No vectors to project for scope %s", filters)
+            return False
+
+        from sklearn.cluster import MiniBatchKMeans
+        from sklearn.decomposition import PCA
+
+        if len(vecs) > PROJECTION_MAX_FIT_SIZE:
+            rng = np.random.default_rng(42)
+            fit_idx = np.sort(rng.choice(len(vecs), size=PROJECTION_MAX_FIT_SIZE, replace=False))
+        else:
+            fit_idx = np.arange(len(vecs))
+        fit_vecs = vecs[fit_idx]
+
+        logger.info("Fitting %s projection on %d of %d vectors", method, len(fit_vecs), len(vecs))
+        reducer = _build_reducer(method, dims)
+        try:
+            fit_coords = reducer.fit_transform(fit_vecs)
+        except Exception as exc:
+            if method == "pca":
+                raise
+            logger.warning("%s projection failed, falling back to PCA: %s", method, exc)
+            reducer = PCA(n_components=dims, random_state=42)
+            fit_coords = reducer.fit_transform(fit_vecs)
+
+        # Cluster in a 50-d PCA space rather than the raw embeddings
+        pca50 = None
+        cluster_space = fit_vecs
+        if fit_vecs.shape[1] > 50:
+            try:
+                pca50 = PCA(n_components=min(50, *fit_vecs.shape), random_state=42)
+                cluster_space = pca50.fit_transform(fit_vecs)
+            except ValueError:
+                pca50 = None
+                cluster_space = fit_vecs
+
+        km = MiniBatchKMeans(n_clusters=max(2, min(n_clusters, len(fit_vecs))), random_state=42)
+        fit_clusters = km.fit_predict(cluster_space)
+
+        models = {
+            "reducer": reducer if hasattr(reducer, "transform") else None,
+            "pca": pca50,
+            "kmeans": km,
+        }
+
+        coords = np.empty((len(vecs), fit_coords.shape[1]), dtype=np.float32)
+        clusters = np.empty(len(vecs), dtype=int)
+        coords[fit_idx] = fit_coords
+        clusters[fit_idx] = fit_clusters
+
+        rest = np.setdiff1d(np.arange(len(vecs)), fit_idx)
+        if rest.size:
+            coords[rest], clusters[rest] = self._place(models, vecs[rest], fit_vecs, fit_coords, fit_clusters)
+
+        scope = {
+            "scope_key": key,
+            "method": method,
+            "dims": dims,
+            "n_clusters": n_clusters,
+            "filters": json.dumps(filters or {}, sort_keys=True),
+            "explain": json.dumps(explain_clusters(clusters, metas)),
+        }
+        self.facade.save_projection(scope, [_point(ids[i], coords[i], clusters[i]) for i in range(len(ids))])
+        self._keep_models(key, models)
+
+        logger.info("Stored %s projection for scope %s: %d points", method, filters or "all", len(ids))
+        return True
+
+    def _append_new(self, scope: Dict[str, Any]) -> int:
+        """Place articles added to the scope since the last fit or refresh."""
+        import numpy as np
+        from app.vector_store import get_vectors_by_metadata
+
+        key = scope["scope_key"]
+        room = PROJECTION_MAX_POINTS - scope["fitted_count"] - scope["placed_count"]
+        if room <= 0:
+            return 0
+
+        uris = self.facade.get_unprojected_article_uris(key, json.loads(scope["filters"] or "{}"), room)
+        if not uris:
+            return 0
+
+        vecs, _, ids = get_vectors_by_metadata(where={"uri": {"$in": uris}})
+        if vecs.size == 0:
+            return 0
+
+        models = self._get_models(key)
+        ref_vecs = ref_coords = ref_clusters = None
+        if models is None or models.get("reducer") is None:
+            ref_points = self.facade.get_projection_points(key, limit=PROJECTION_MAX_FIT_SIZE, fitted_only=True)
+            ref_vecs, _, ref_ids = get_vectors_by_metadata(where={"uri": {"$in": [p["uri"] for p in ref_points]}})
+            if ref_vecs.size == 0:
+                return 0
+            by_uri = {p["uri"]: p for p in ref_points}
+            axes = ["x", "y", "z"][:scope["dims"]]
+            ref_coords = np.array([[by_uri[uri][axis] for axis in axes] for uri in ref_ids], dtype=np.float32)
+            ref_clusters = np.array([by_uri[uri]["cluster"] for uri in ref_ids])
+
+        coords, clusters = self._place(models, vecs, ref_vecs, ref_coords, ref_clusters)
+        self.facade.add_projection_points(key, [_point(ids[i], coords[i], clusters[i]) for i in range(len(ids))])
+        return len(ids)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def refresh(self, scope: Dict[str, Any]) -> Dict[str, Any]:
+        """Append new articles to a stored scope and refit it if it has drifted."""
+        key = scope["scope_key"]
+        with self._lock_for(key):
+            placed = self._append_new(scope)
+            scope = self.facade.get_projection_scope(key) or scope
+            refitted = False
+            if self.is_stale(scope):
+                logger.info(
+                    "Projection scope %s drifted (%d placed / %d fitted), refitting",
+                    key[:12], scope["placed_count"], scope["fitted_count"]
+                )
+                refitted = self._fit(
+                    key, scope["method"], scope["dims"], scope["n_clusters"],
+                    json.loads(scope["filters"] or "{}")
+                )
+        return {"placed": placed, "refitted": refitted}
+
+    def refresh_all(self) -> Dict[str, int]:
+        """Refresh the recently requested stored scopes. Called by the projection refresh task."""
+        with self._locks_guard:
+            requested = set(self._requested)
+        summary = {"scopes": 0, "placed": 0, "refitted": 0, "failed": 0}
+        for scope in self.facade.list_projection_scopes():
+            if scope["scope_key"] not in requested:
+                continue
+            summary["scopes"] += 1
+            try:
+                result = self.refresh(scope)
+                summary["placed"] += result["placed"]
+                summary["refitted"] += int(result["refitted"])
+            except Exception as exc:
+                summary["failed"] += 1
+                logger.error("Failed to refresh projection scope %s: %s", scope["scope_key"][:12], exc)
+        return summary
+
+    def fit_pending(self) -> int:
+        """Fit the scopes queued by get_projection. Called by the projection refresh task."""
+        fitted = 0
+        while True:
+            with self._locks_guard:
+                if not self._pending:
+                    return fitted
+                key, (method, dims, n_clusters, filters, refit) = self._pending.popitem(last=False)
+            try:
+                with self._lock_for(key):
+                    if refit or self.facade.get_projection_scope(key) is None:
+                        fitted += int(self._fit(key, method, dims, n_clusters, filters))
+            except Exception as exc:
+                logger.error("Failed to fit projection scope %s: %s", key[:12], exc)
+
+    def get_projection(
+        self,
+        method: str,
+        dims: int,
+        n_clusters: int,
+        filters: Optional[Dict[str, Any]] = None,
+        uris: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        refit: bool = False,
+    ) -> Dict[str, Any]:
+        """Return stored points, cluster explanations and centroids for a scope.
+
+        The first time a scope is requested (or when ``refit`` is set) it is
+        queued for the refresh task to fit, and until it is stored the
+        result has no points and ``status`` "pending". Without the refresh
+        task the scope is fitted inline. Afterwards this is a table read.
+
+        Args:
+            method: umap, tsne or pca
+            dims: 2 or 3
+            n_clusters: Desired k-means cluster count
+            filters: Article metadata equality filter defining the scope
+            uris: Optional subset of the scope to return
+            limit: Maximum number of points to return (most recent first)
+            refit: Refit the scope before reading
+        """
+        filters = filters or {}
+        key = scope_key(method, dims, n_clusters, filters)
+        self._mark_requested(key)
+
+        if self.background_fits:
+            scope = self.facade.get_projection_scope(key)
+            if scope is None or refit:
+                with self._locks_guard:
+                    queued = self._pending.get(key)
+                    self._pending[key] = (method, dims, n_clusters, filters, refit or bool(queued and queued[4]))
+            if scope is None:
+                return {"points": [], "explain": {}, "centroids": {}, "status": "pending"}
+        else:
+            scope = None if refit else self.facade.get_projection_scope(key)
+            if scope is None:
+                with self._lock_for(key):
+                    scope = None if refit else self.facade.get_projection_scope(key)
+                    if scope is None and self._fit(key, method, dims, n_clusters, filters):
+                        scope = self.facade.get_projection_scope(key)
+            if scope is None:
+                return {"points": [], "explain": {}, "centroids": {}}
+
+        rows = self.facade.get_projection_points(key, uris=uris, limit=limit)
+        points = []
+        by_cluster = defaultdict(list)
+        for row in rows:
+            point = {
+                "id": row["uri"],
+                "x": row["x"],
+                "y": row["y"],
+                "cluster": row["cluster"],
+                "title": row["title"],
+                "sentiment": row["sentiment"],
+                "driver_type": row["driver_type"],
+                "category": row["category"],
+                "time_to_impact": row["time_to_impact"],
+            }
+            if dims == 3:
+                point["z"] = row["z"]
+            points.append(point)
+            by_cluster[row["cluster"]].append((row["x"], row["y"]))
+
+        centroids = {}
+        if dims == 2:
+            for lbl, xy in by_cluster.items():
+                centroids[int(lbl)] = [sum(x for x, _ in xy) / len(xy), sum(y for _, y in xy) / len(xy)]
+
+        explain = {int(lbl): info for lbl, info in json.loads(scope["explain"] or "{}").items()}
+
+        return {
+            "points": points,
+            "explain": explain,
+            "centroids": centroids,
+            "projection": {
+                "fitted_at": str(scope["fitted_at"]) if scope.get("fitted_at") else None,
+                "fitted_count": scope["fitted_count"],
+                "placed_count": scope["placed_count"],
+                "stale": self.is_stale(scope),
+            },
+        }
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """Drop one stored scope (or all) so the next request refits it."""
+        with self._locks_guard:
+            if key is None:
+                self._models.clear()
+                self._pending.clear()
+            else:
+                self._models.pop(key, None)
+                self._pending.pop(key, None)
+        return self.facade.delete_projection_scopes(key)
+
+
+_projection_store: Optional[ProjectionStore] = None
+
+
+def get_projection_store() -> ProjectionStore:
+    """Return the process-wide projection store."""
+    global _projection_store
+    if _projection_store is None:
+        _projection_store = ProjectionStore()
+    return _projection_store
@@ -0,0 +1,225 @@
+"""
+Embedding-based relevance pre-filter for auto-ingest.
+
+Before an article is sent to the LLM relevance check, its title + summary
+embedding is compared with a per-topic centroid built from the topic
+description, the monitored keywords and articles already accepted into the
+topic. Similarities for a whole batch are one matrix-vector product.
+
+- similarity < floor   -> rejected without an LLM call
+- similarity >= ceiling -> fast-tracked past the quick LLM check
+- otherwise             -> scored by the LLM as before
+
+Configuration (environment):
+- RELEVANCE_PREFILTER_ENABLED (default "true")
+- RELEVANCE_PREFILTER_FLOOR (default 0.15)
+- RELEVANCE_PREFILTER_CEILING (default 0.6; 0 disables fast-tracking)
+- RELEVANCE_PREFILTER_CENTROID_TTL (default 3600 seconds)
+- RELEVANCE_PREFILTER_CENTROID_ARTICLES (default 200 accepted articles)
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REJECT = "reject"
+FAST_TRACK = "fast_track"
+LLM = "llm"
+
+
+def _article_text(article: Dict[str, Any]) -> str:
+    return f"{article.get('title') or ''} {article.get('summary') or ''}".strip()
+
+
+def _normalize_rows(matrix):
+    import numpy as np
+
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class RelevancePrefilter:
+    """Cosine-similarity gate in front of LLM relevance scoring."""
+
+    def __init__(
+        self,
+        floor: float = 0.15,
+        ceiling: Optional[float] = 0.6,
+        centroid_ttl_seconds: int = 3600,
+        centroid_articles: int = 200,
+    ):
+        self.floor = floor
+        self.ceiling = ceiling or None
+        self.centroid_ttl_seconds = centroid_ttl_seconds
+        self.centroid_articles = centroid_articles
+
+        self._centroids: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "scored": 0,
+            "rejected": 0,
+            "fast_tracked": 0,
+            "sent_to_llm": 0,
+            "unscored": 0,
+            "errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Centroids
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _centroid_key(topic: str, keywords: List[str]) -> Tuple[str, str]:
+        digest = hashlib.sha256("\n".join(sorted(keywords or [])).encode("utf-8")).hexdigest()
+        return topic, digest
+
+    async def _build_centroid(self, topic: str, keywords: List[str]):
+        import numpy as np
+        from app.config.config import get_topic_description
+        from app.vector_store_pgvector import _embed_texts_async, get_vectors_by_metadata_async
+
+        seeds = [text for text in (
+            f"{topic}: {get_topic_description(topic) or ''}".strip(),
+            ", ".join(keywords or []),
+        ) if text]
+        parts = [np.asarray(await _embed_texts_async(seeds, strict=True), dtype=np.float32)]
+
+        accepted, _, _ = await get_vectors_by_metadata_async(
+            limit=self.centroid_articles, where={"topic": topic}
+        )
+        if accepted.size and accepted.shape[1] == parts[0].shape[1]:
+            # Accepted articles count as one more seed, however many there are
+            parts.append(_normalize_rows(accepted).mean(axis=0, keepdims=True))
+
+        centroid = _normalize_rows(np.vstack([_normalize_rows(p) for p in parts]).mean(axis=0))
+        logger.debug(
+            "Built relevance centroid for %s from %d seeds and %d accepted articles",
+            topic, len(seeds), accepted.shape[0] if accepted.size else 0
+        )
+        return centroid
+
+    async def get_centroid(self, topic: str, keywords: List[str]):
+        """Return the cached unit centroid for (topic, keywords), building it if stale."""
+        key = self._centroid_key(topic, keywords)
+        with self._lock:
+            entry = self._centroids.get(key)
+        if entry and time.monotonic() - entry[1] < self.centroid_ttl_seconds:
+            return entry[0]
+
+        centroid = await self._build_centroid(topic, keywords)
+        with self._lock:
+            self._centroids[key] = (centroid, time.monotonic())
+        return centroid
+
+    def invalidate(self, topic: Optional[str] = None) -> None:
+        """Drop cached centroids for ``topic``, or all of them."""
+        with self._lock:
+            if topic is None:
+                self._centroids.clear()
+            else:
+                for key in [k for k in self._centroids if k[0] == topic]:
+                    del self._centroids[key]
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def decide(self, similarity: float) -> str:
+        """Map a similarity to REJECT, FAST_TRACK or LLM."""
+        if similarity < self.floor:
+            return REJECT
+        if self.ceiling is not None and similarity >= self.ceiling:
+            return FAST_TRACK
+        return LLM
+
+    async def annotate(self, articles: List[Dict[str, Any]], topic: str, keywords: List[str]) -> Dict[str, int]:
+        """Score ``articles`` against the topic and tag each with its decision.
+
+        Each scored article gets ``_prefilter = {"similarity", "decision"}``.
+        Articles without text, or every article when embeddings are not
+        available, are left untagged and go through the LLM as before.
+
+        Returns:
+            Counts for this batch: scored, rejected, fast_tracked, sent_to_llm,
+            unscored and llm_calls_saved
+        """
+        import numpy as np
+        from app.vector_store_pgvector import _embed_texts_async
+
+        counts = {"scored": 0, "rejected": 0, "fast_tracked": 0, "sent_to_llm": 0, "unscored": 0, "errors": 0}
+        candidates = [a for a in articles if _article_text(a)]
+        counts["unscored"] = len(articles) - len(candidates)
+
+        if candidates and topic:
+            try:
+                centroid = await self.get_centroid(topic, keywords)
+                vectors = np.asarray(
+                    await _embed_texts_async([_article_text(a) for a in candidates], strict=True),
+                    dtype=np.float32,
+                )
+                similarities = _normalize_rows(vectors) @ centroid
+            except Exception as exc:
+                logger.warning("Relevance pre-filter skipped for %s: %s", topic, exc)
+                counts["errors"] += 1
+                counts["unscored"] = len(articles)
+                candidates = []
+                similarities = []
+
+            for article, similarity in zip(candidates, similarities):
+                decision = self.decide(float(similarity))
+                article["_prefilter"] = {"similarity": round(float(similarity), 4), "decision": decision}
+                counts["scored"] += 1
+                counts[{REJECT: "rejected", FAST_TRACK: "fast_tracked", LLM: "sent_to_llm"}[decision]] += 1
+        elif not topic:
+            counts["unscored"] = len(articles)
+
+        counts["sent_to_llm"] += counts["unscored"]
+        counts["llm_calls_saved"] = counts["rejected"] + counts["fast_tracked"]
+
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] += counts[key]
+
+        logger.info(
+            "Relevance pre-filter for %s: %d rejected, %d fast-tracked, %d to LLM (%d LLM calls saved)",
+            topic, counts["rejected"], counts["fast_tracked"], counts["sent_to_llm"], counts["llm_calls_saved"]
+        )
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cumulative per-stage counts since process start."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached_centroids"] = len(self._centroids)
+        stats["llm_calls_saved"] = stats["rejected"] + stats["fast_tracked"]
+        stats["floor"] = self.floor
+        stats["ceiling"] = self.ceiling
+        return stats
+
+
+_relevance_prefilter: Optional[RelevancePrefilter] = None
+
+
+def get_relevance_prefilter() -> Optional[RelevancePrefilter]:
+    """Return the process-wide pre-filter, or None when disabled."""
+    global _relevance_prefilter
+
+    if os.getenv("RELEVANCE_PREFILTER_ENABLED", "true").lower() not in ("1", "true", "yes"):
+        return None
+
+    if _relevance_prefilter is None:
+        _relevance_prefilter = RelevancePrefilter(
+            floor=float(os.getenv("RELEVANCE_PREFILTER_FLOOR", "0.15")),
+            ceiling=float(os.getenv("RELEVANCE_PREFILTER_CEILING", "0.6")),
+            centroid_ttl_seconds=int(os.getenv("RELEVANCE_PREFILTER_CENTROID_TTL", "3600")),
+            centroid_articles=int(os.getenv("RELEVANCE_PREFILTER_CENTROID_ARTICLES", "200")),
+        )
+        # Topic edits change the description the centroid is built from
+        from app.services.ontology_registry import get_ontology_registry
+        get_ontology_registry().subscribe(_relevance_prefilter.invalidate)
+    return _relevance_prefilter
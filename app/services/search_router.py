@@ -184,7 +184,7 @@ class SearchRouter:
         """
         try:
             # Get article count for topic using facade
-            articles, total = self.db.facade.search_articles(topic=topic, page=1, per_page=1)
+            articles, total = self.db.facade.search_articles(topic=topic, page=1, per_page=1, projection='list')
 
             if total == 0:
                 return 0.0
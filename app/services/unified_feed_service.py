@@ -18,10 +18,20 @@ from app.collectors.bluesky_collector import BlueskyCollector
 from app.collectors.thenewsapi_collector import TheNewsAPICollector
 from app.collectors.newsdata_collector import NewsdataCollector
 from app.services.feed_group_service import FeedGroupService
+from app.utils.pagination import CountCache, decode_cursor, encode_cursor
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Feed totals per filter set, shared by the per-request service instances
+_feed_count_cache = CountCache()
+
+# Sort orders that support keyset (cursor) pagination, by sort column
+KEYSET_SORT_COLUMNS = {
+    "publication_date": "fi.publication_date",
+    "created_at": "fi.created_at",
+}
+
 @dataclass
 class FeedItem:
     """Data class for unified feed items."""
@@ -751,13 +761,14 @@ class UnifiedFeedService:
                         min_engagement: int = None,
                         starred: str = None,
                         topic: str = None,
-                        sort: str = "publication_date") -> dict:
+                        sort: str = "publication_date",
+                        cursor: str = None) -> dict:
         """
         Get unified feed items across all or specified groups.
         Supports advanced filtering by source+date combinations and all other filters.
         Args:
             limit: Maximum number of items to return
-            offset: Number of items to skip
+            offset: Number of items to skip (ignored when a cursor is given)
             group_ids: Optional list of group IDs to filter by
             source_types: Optional list of source types to filter by
             include_hidden: Whether to include hidden items
@@ -770,15 +781,19 @@ class UnifiedFeedService:
             starred: Optional starred filter ('starred', 'unstarred', or None)
             topic: Optional topic to filter by
             sort: Sort order ('publication_date', 'created_at', or 'engagement')
+            cursor: next_cursor of the previous page for keyset pagination
+                (publication_date and created_at sorts); '' starts at the top
         Returns:
-            Dictionary with feed items and metadata
+            Dictionary with feed items and metadata; next_cursor continues
+            after the last item when paging by keyset
         """
         try:
-            logger.info(f"Fetching unified feed (limit={limit}, offset={offset})")
+            logger.info(f"Fetching unified feed (limit={limit}, offset={offset}, cursor={cursor!r})")
+            keyset_column = KEYSET_SORT_COLUMNS.get(sort or "publication_date")
+            if cursor is not None and keyset_column is None:
+                raise ValueError(f"Cursor pagination is not supported for sort '{sort}'")
             
             with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                
                 # Build query
                 where_conditions = []
                 params = []
@@ -883,10 +898,30 @@ class UnifiedFeedService:
                          CAST(json_extract(fi.engagement_metrics, '$.reposts') AS INTEGER) + 
                          CAST(json_extract(fi.engagement_metrics, '$.replies') AS INTEGER)) DESC,
                         fi.publication_date DESC"""
+                elif cursor is not None:
+                    # Keyset order: unique, and the same on SQLite and PostgreSQL
+                    order_clause = f"ORDER BY {keyset_column} DESC NULLS LAST, fi.id DESC"
                 elif sort == "created_at":
                     order_clause = "ORDER BY fi.created_at DESC, fi.publication_date DESC"
                 else:  # default to publication_date
                     order_clause = "ORDER BY fi.publication_date DESC, fi.created_at DESC"
+
+                count_signature = (where_clause, tuple(params))
+                page_clause = where_clause
+                page_params = list(params)
+                if cursor:
+                    # Continue after the (sort value, id) of the previous page's last item
+                    last_value, last_id = decode_cursor(cursor, 2)
+                    if last_value is None:
+                        keyset_condition = f"({keyset_column} IS NULL AND fi.id < ?)"
+                        page_params.append(last_id)
+                    else:
+                        keyset_condition = (
+                            f"({keyset_column} < ? OR ({keyset_column} = ? AND fi.id < ?) "
+                            f"OR {keyset_column} IS NULL)"
+                        )
+                        page_params.extend([last_value, last_value, last_id])
+                    page_clause = (where_clause + " AND " if where_clause else "WHERE ") + keyset_condition
                 
                 # Main query
                 query = f"""
@@ -898,16 +933,27 @@ class UnifiedFeedService:
                         fkg.name as group_name, fkg.color as group_color
                     FROM feed_items fi
                     JOIN feed_keyword_groups fkg ON fi.group_id = fkg.id
-                    {where_clause}
+                    {page_clause}
                     {order_clause}
                     LIMIT ? OFFSET ?
                 """
                 
-                params.extend([limit, offset])
-                cursor.execute(query, params)
+                if cursor is not None:
+                    # One extra row tells whether there is a next page
+                    page_params.extend([limit + 1, 0])
+                else:
+                    page_params.extend([limit, offset])
+                db_cursor = conn.cursor()
+                db_cursor.execute(query, page_params)
+                rows = db_cursor.fetchall()
+                next_cursor = None
+                if cursor is not None and len(rows) > limit:
+                    rows = rows[:limit]
+                    sort_value = rows[-1][9] if keyset_column == "fi.publication_date" else rows[-1][16]
+                    next_cursor = encode_cursor([sort_value, rows[-1][0]])
                 
                 items = []
-                for row in cursor.fetchall():
+                for row in rows:
                     try:
                         engagement_metrics = json.loads(row[10]) if row[10] else {}
                         tags = json.loads(row[11]) if row[11] else []
@@ -941,17 +987,23 @@ class UnifiedFeedService:
                         logger.error(f"Error parsing feed item: {str(e)}")
                         continue
                 
-                # Get total count
+                # Get total count; keyset pages may reuse a recent count per
+                # filter set, offset pages need it exact for has_more
                 count_query = f"""
                     SELECT COUNT(*)
                     FROM feed_items fi
                     JOIN feed_keyword_groups fkg ON fi.group_id = fkg.id
                     {where_clause}
                 """
-                
-                count_params = params[:-2]  # Remove limit and offset
-                cursor.execute(count_query, count_params)
-                total_count = cursor.fetchone()[0]
+
+                def count_items():
+                    db_cursor.execute(count_query, params)
+                    return db_cursor.fetchone()[0]
+
+                if cursor is not None:
+                    total_count = _feed_count_cache.get(count_signature, count_items)
+                else:
+                    total_count = count_items()
                 
                 logger.info(f"Retrieved {len(items)} feed items (total: {total_count})")
                 
@@ -961,9 +1013,13 @@ class UnifiedFeedService:
                     "total_count": total_count,
                     "limit": limit,
                     "offset": offset,
-                    "has_more": offset + len(items) < total_count
+                    "has_more": next_cursor is not None if cursor is not None else offset + len(items) < total_count,
+                    "next_cursor": next_cursor
                 }
                 
+        except ValueError:
+            # Malformed cursor or unsupported cursor/sort combination
+            raise
         except Exception as e:
             logger.error(f"Error fetching unified feed: {str(e)}")
             return {
@@ -978,7 +1034,7 @@ class UnifiedFeedService:
                       combination_sources: List[str] = None, combination_dates: List[str] = None,
                       dateRange: str = None, search: str = None, author: str = None, 
                       min_engagement: int = None, starred: str = None, topic: str = None,
-                      sort: str = "publication_date") -> dict:
+                      sort: str = "publication_date", cursor: str = None) -> dict:
         """Get feed items for a specific group. Supports combination filter and all other filters."""
         return self.get_unified_feed(
             limit=limit,
@@ -994,7 +1050,8 @@ class UnifiedFeedService:
             min_engagement=min_engagement,
             starred=starred,
             topic=topic,
-            sort=sort
+            sort=sort,
+            cursor=cursor
         )
 
     def hide_feed_item(self, item_id: int) -> Dict[str, Any]:
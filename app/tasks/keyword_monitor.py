@@ -2,10 +2,14 @@
 
 import logging
 import asyncio
+import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from contextlib import aclosing
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
 from app.collectors.newsapi_collector import NewsAPICollector
 from app.database import Database
+from app.utils.article_dedup import deduplicate_articles
+from app.services.keyword_poll_cursors import KeywordCursorStore, PollCursor, MIN_POLL_INTERVAL
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -25,6 +29,30 @@ _background_task_status = {
     "next_check_time": None
 }
 
+# Provider priority for duplicates: newsapi > thenewsapi > newsdata > semantic_scholar/bluesky > arxiv
+PROVIDER_PRIORITY = {
+    'newsapi': 5,
+    'thenewsapi': 4,
+    'newsdata': 3,
+    'semantic_scholar': 2,
+    'bluesky': 2,
+    'arxiv': 1
+}
+
+# Optional MinHash pass merging near-identical titles across providers
+TITLE_DEDUP_ENABLED = os.getenv('KEYWORD_MONITOR_TITLE_DEDUP', 'false').lower() in ('1', 'true', 'yes')
+TITLE_DEDUP_THRESHOLD = float(os.getenv('KEYWORD_MONITOR_TITLE_DEDUP_THRESHOLD', '0.8'))
+
+# Cumulative per-provider deduplication counts since process start
+_dedup_stats = {
+    "runs": 0,
+    "input": 0,
+    "output": 0,
+    "url_duplicates": 0,
+    "near_duplicates": 0,
+    "providers": {}
+}
+
 # Global variable to track keyword monitor auto-ingest jobs
 # This integrates with the job tracking system in keyword_monitor.py routes
 _keyword_monitor_jobs = {}
@@ -46,6 +74,31 @@ def get_task_status() -> Dict:
     """Get the current status of the keyword monitor background task"""
     return _background_task_status.copy()
 
+def _record_dedup_stats(stats: Dict):
+    """Add one deduplication run to the cumulative stats"""
+    _dedup_stats["runs"] += 1
+    for key in ("input", "output", "url_duplicates", "near_duplicates"):
+        _dedup_stats[key] += stats.get(key, 0)
+    for provider, counts in stats.get("providers", {}).items():
+        totals = _dedup_stats["providers"].setdefault(
+            provider, {"received": 0, "kept": 0, "url_duplicates": 0, "near_duplicates": 0, "overlap": {}}
+        )
+        for key, value in counts.items():
+            if key == "overlap":
+                for other, overlap in value.items():
+                    totals["overlap"][other] = totals["overlap"].get(other, 0) + overlap
+            else:
+                totals[key] += value
+
+def get_dedup_stats() -> Dict:
+    """Get cumulative cross-provider deduplication stats, with per-provider overlap"""
+    stats = dict(_dedup_stats)
+    stats["providers"] = {
+        provider: {**counts, "overlap": dict(counts["overlap"])}
+        for provider, counts in _dedup_stats["providers"].items()
+    }
+    return stats
+
 def get_keyword_monitor_jobs() -> Dict:
     """Get all active keyword monitor jobs for integration with badge system"""
     return _keyword_monitor_jobs.copy()
@@ -57,11 +110,14 @@ class KeywordMonitor:
         self.collectors = {}  # Dictionary of collectors {provider_name: collector_instance}
         self.active_providers = []  # List of active provider names
         self.last_collector_init_attempt = None
+        self.last_dedup_stats = None  # Stats from the most recent _deduplicate_articles call
         # Initialize auto-ingest service if available
         self.auto_ingest_service = None
         if AutomatedIngestService:
             self.auto_ingest_service = AutomatedIngestService(db)
 
+        self.cursor_store = KeywordCursorStore(db)
+
         self._load_settings()
         self.check_and_reset_counter()  # Check for reset during initialization
 
@@ -187,49 +243,23 @@ class KeywordMonitor:
         return self._init_collectors()
 
     def _deduplicate_articles(self, articles: List[Dict]) -> List[Dict]:
-        """Remove duplicate articles based on URL, prioritizing providers with better metadata"""
-        seen_urls = {}
-        unique_articles = []
-
-        # Provider priority: newsapi > thenewsapi > newsdata > semantic_scholar/bluesky > arxiv
-        provider_priority = {
-            'newsapi': 5,
-            'thenewsapi': 4,
-            'newsdata': 3,
-            'semantic_scholar': 2,
-            'bluesky': 2,
-            'arxiv': 1
-        }
-
-        for article in articles:
-            url = article.get('url', '').strip()
-            if not url:
-                continue
-
-            if url not in seen_urls:
-                seen_urls[url] = article
-                unique_articles.append(article)
-            else:
-                # Article already exists - keep the one from higher priority provider
-                existing = seen_urls[url]
+        """Remove duplicate articles by canonical URL, prioritizing providers with better metadata.
 
-                current_priority = provider_priority.get(
-                    article.get('collector_source', ''), 0
-                )
-                existing_priority = provider_priority.get(
-                    existing.get('collector_source', ''), 0
-                )
-
-                if current_priority > existing_priority:
-                    # Replace with higher priority version
-                    seen_urls[url] = article
-                    unique_articles = [
-                        a for a in unique_articles if a.get('url') != url
-                    ]
-                    unique_articles.append(article)
+        With KEYWORD_MONITOR_TITLE_DEDUP enabled, near-identical titles from
+        different providers are merged as well.
+        """
+        unique_articles, stats = deduplicate_articles(
+            articles,
+            provider_priority=PROVIDER_PRIORITY,
+            near_duplicates=TITLE_DEDUP_ENABLED,
+            threshold=TITLE_DEDUP_THRESHOLD,
+        )
+        self.last_dedup_stats = stats
+        _record_dedup_stats(stats)
 
         logger.info(
-            f"Deduplicated {len(articles)} articles → {len(unique_articles)} unique articles"
+            f"Deduplicated {len(articles)} articles → {len(unique_articles)} unique articles "
+            f"({stats['url_duplicates']} URL duplicates, {stats['near_duplicates']} near-duplicate titles)"
         )
         return unique_articles
 
@@ -266,6 +296,99 @@ class KeywordMonitor:
             logger.error(f"{provider} search failed: {e}")
             return []
 
+    async def _search_keyword(
+        self,
+        keyword_id: int,
+        keyword_text: str,
+        topic: str,
+        start_date: datetime,
+        cursors: Dict,
+        due_only: bool = False
+    ) -> Tuple[List[Dict], List[Tuple[PollCursor, List[Dict]]]]:
+        """Search one keyword across all active collectors in parallel and combine the results
+
+        Each (keyword, provider) cursor limits the search to items newer than
+        what that provider already returned and drops results it has seen.
+        With due_only, providers whose cursor is not due yet are skipped.
+
+        Returns:
+            The new articles and (cursor, new articles) per searched provider;
+            the cursors are advanced once the articles are stored
+        """
+        now = datetime.utcnow()
+        polled = []
+        for provider, collector in self.collectors.items():
+            cursor = self.cursor_store.get(cursors, keyword_id, provider)
+            if due_only and not cursor.is_due(now):
+                logger.debug(f"Skipping {provider} for '{keyword_text}': next poll at {cursor.next_poll_at}")
+                continue
+            polled.append((provider, collector, cursor))
+
+        # MULTI-COLLECTOR: Search across all active collectors in parallel
+        results = await asyncio.gather(*[
+            self._search_with_collector(
+                provider=provider,
+                collector=collector,
+                keyword_text=keyword_text,
+                topic=topic,
+                start_date=cursor.search_since(start_date)
+            )
+            for provider, collector, cursor in polled
+        ], return_exceptions=True)
+
+        # Combine results from all collectors
+        all_articles, searched = [], []
+        for (provider, _, cursor), result in zip(polled, results):
+            if isinstance(result, Exception):
+                logger.error(f"{provider} search failed: {result}")
+                continue
+
+            new_articles = cursor.filter_new(result)
+            if len(new_articles) < len(result):
+                logger.info(f"{provider}: {len(result) - len(new_articles)} already-seen results skipped for '{keyword_text}'")
+            searched.append((cursor, new_articles))
+            all_articles.extend(new_articles)
+
+        return all_articles, searched
+
+    def _advance_cursors(self, searched: List[Tuple[PollCursor, List[Dict]]],
+                         failed_urls: List[str] = ()) -> None:
+        """Move each searched cursor past its stored articles and save them."""
+        now = datetime.utcnow()
+        for cursor, new_articles in searched:
+            cursor.advance(new_articles, self.check_interval, now, failed_urls=failed_urls)
+        self.cursor_store.save([cursor for cursor, _ in searched])
+
+    async def _iter_keyword_searches(
+        self,
+        keywords: List,
+        start_date: datetime,
+        cursors: Dict,
+        due_only: bool = False
+    ) -> AsyncIterator[Tuple[Any, Any]]:
+        """Search all keywords concurrently and yield (keyword, result) as each finishes
+
+        The result is what _search_keyword returned, or the exception it
+        raised. Searches still running when the caller stops are cancelled.
+        """
+        async def search(keyword):
+            try:
+                return keyword, await self._search_keyword(
+                    keyword['id'], keyword['keyword'], keyword['topic'],
+                    start_date, cursors, due_only=due_only
+                )
+            except Exception as e:
+                return keyword, e
+
+        tasks = [asyncio.create_task(search(keyword)) for keyword in keywords]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def check_and_reset_counter(self):
         """Check if the API usage counter needs to be reset for a new day"""
         try:
@@ -289,13 +412,14 @@ class KeywordMonitor:
         except Exception as e:
             logger.error(f"Error checking/resetting API counter: {str(e)}")
 
-    async def check_keywords(self, group_id=None, progress_callback=None, username=None):
+    async def check_keywords(self, group_id=None, progress_callback=None, username=None, due_only=False):
         """Check all keywords for new matches
 
         Args:
             group_id: Optional group ID to filter keywords by specific group
             progress_callback: Optional callback function(processed, current) for progress updates
             username: Optional username for notifications
+            due_only: Only poll (keyword, provider) pairs whose adaptive poll interval has elapsed
         """
         self.username = username  # Store for notification use
         if group_id:
@@ -343,164 +467,142 @@ class KeywordMonitor:
                 keywords = self.db.facade.get_monitored_keywords()
                 logger.info(f"Found {len(keywords)} keywords to check")
 
-            for keyword in keywords:
-                # Extract from mapping object
-                keyword_id = keyword['id']
-                keyword_text = keyword['keyword']
-                last_checked = keyword['last_checked']
-                topic = keyword['topic']
-
-                # Capture group name from first keyword (all keywords in same group)
-                if detected_group_name is None and 'group_name' in keyword:
-                    detected_group_name = keyword['group_name']
+            # Calculate start_date based on search_date_range instead of last_checked
+            start_date = datetime.now() - timedelta(days=self.search_date_range)
 
-                processed_keywords += 1
+            cursors = self.cursor_store.load([keyword['id'] for keyword in keywords])
 
-                # Report progress if callback provided
-                if progress_callback:
-                    progress_callback(processed_keywords, f"Checking: {keyword_text}")
+            # Fan out every keyword x provider search at once; the shared
+            # collector transport paces each provider with its own rate limiter.
+            # Keywords are saved (and progress reported) as their searches finish.
+            searches = self._iter_keyword_searches(keywords, start_date, cursors, due_only)
+            async with aclosing(searches):
+                async for keyword, search in searches:
+                    # Extract from mapping object
+                    keyword_id = keyword['id']
+                    keyword_text = keyword['keyword']
+                    last_checked = keyword['last_checked']
+                    topic = keyword['topic']
 
-                logger.info(
-                    f"Checking keyword: {keyword_text} (topic: {topic}, "
-                    f"requests_today: {self.collector.requests_today}/100)"
-                )
-
-                try:
-                    # Calculate start_date based on search_date_range instead of last_checked
-                    start_date = datetime.now() - timedelta(days=self.search_date_range)
-
-                    logger.debug(f"Searching for articles with keyword: '{keyword_text}', topic: '{topic}', start_date: {start_date.isoformat()}")
-
-                    # MULTI-COLLECTOR: Search across all active collectors in parallel
-                    search_tasks = []
-                    for provider, collector in self.collectors.items():
-                        task = self._search_with_collector(
-                            provider=provider,
-                            collector=collector,
-                            keyword_text=keyword_text,
-                            topic=topic,
-                            start_date=start_date
-                        )
-                        search_tasks.append(task)
+                    # Capture group name from first keyword (all keywords in same group)
+                    if detected_group_name is None and 'group_name' in keyword:
+                        detected_group_name = keyword['group_name']
 
-                    # Execute all searches in parallel
-                    results = await asyncio.gather(*search_tasks, return_exceptions=True)
+                    processed_keywords += 1
 
-                    # Combine results from all collectors
-                    all_articles = []
-                    for i, result in enumerate(results):
-                        provider = list(self.collectors.keys())[i]
+                    # Report progress if callback provided
+                    if progress_callback:
+                        progress_callback(processed_keywords, f"Checking: {keyword_text}")
 
-                        if isinstance(result, Exception):
-                            logger.error(f"{provider} search failed: {result}")
-                            continue
+                    logger.info(
+                        f"Checking keyword: {keyword_text} (topic: {topic}, "
+                        f"requests_today: {self.collector.requests_today}/100)"
+                    )
 
-                        all_articles.extend(result)
+                    try:
+                        if isinstance(search, Exception):
+                            logger.error(f"Search failed for keyword {keyword_text}: {search}")
+                            all_articles, searched = [], []
+                        else:
+                            all_articles, searched = search
 
-                    # Deduplicate articles across providers
-                    articles = self._deduplicate_articles(all_articles)
+                        # Deduplicate articles across providers
+                        articles = self._deduplicate_articles(all_articles)
 
-                    if not articles:
-                        logger.warning(f"No articles found or error occurred for keyword: {keyword_text}")
-                        continue
+                        if not articles:
+                            self._advance_cursors(searched)
+                            logger.warning(f"No new articles found or error occurred for keyword: {keyword_text}")
+                            continue
 
-                    logger.info(f"Found {len(articles)} unique articles for keyword: {keyword_text} (from {len(all_articles)} total across collectors)")
-                    # Log details of first few articles to help debug
-                    for i, article in enumerate(articles[:3]):  # Log up to first 3 articles
-                        logger.debug(f"Article {i+1}: title='{article.get('title', '')}', url='{article.get('url', '')}', published={article.get('published_date', '')}")
+                        logger.info(f"Found {len(articles)} unique articles for keyword: {keyword_text} (from {len(all_articles)} total across collectors)")
+                        # Log details of first few articles to help debug
+                        for i, article in enumerate(articles[:3]):  # Log up to first 3 articles
+                            logger.debug(f"Article {i+1}: title='{article.get('title', '')}', url='{article.get('url', '')}', published={article.get('published_date', '')}")
 
-                    # FIRST: Process each article and save to database
-                    for article in articles:
+                        # FIRST: Save all articles and group matches in bulk
                         try:
-                            article_url = article['url'].strip()
-
-                            # Log article details for debugging
-                            logger.debug(
-                                f"Processing article: url={article_url}, "
-                                f"title={article.get('title', '')}, "
-                                f"source={article.get('source', '')}, "
-                                f"published={article.get('published_date', '')}"
-                            )
-
-                            # First check if article exists outside transaction
-                            article_exists = self.db.facade.article_exists((article_url,))
-
-                            if article_exists:
-                                logger.debug(f"Article already exists: {article_url}")
-
-                            # Use shorter transaction by processing article individually
-                            (inserted_new_article, alert_inserted, match_updated) = self.db.facade.create_article(article_exists, article_url,article, topic, keyword_id)
-                            # Only count as new if we actually inserted or updated something
-                            if inserted_new_article or alert_inserted or match_updated:
-                                new_articles_count += 1
-                                logger.info(f"Added/updated article: {article_url}")
-
+                            saved = self.db.facade.save_keyword_articles(keyword_id, topic, articles)
                         except Exception as e:
-                            logger.error(f"Error processing article {article_url}: {str(e)}")
+                            # Cursors stay put, so the next check retries these articles
+                            logger.error(f"Error saving articles for keyword {keyword_text}: {str(e)}")
                             continue
+                        # Only count as new if we actually inserted or updated something
+                        new_articles_count += len(saved['changed'])
+                        logger.info(
+                            f"Saved articles for '{keyword_text}': {len(saved['inserted'])} new, "
+                            f"{len(saved['changed'])} new or with updated matches"
+                        )
 
-                    # SECOND: Now run auto-ingest pipeline on the saved articles
-                    should_auto_ingest = self.should_auto_ingest()
-                    logger.info(f"Auto-ingest check: enabled={should_auto_ingest}, articles_count={len(articles)}")
-
-                    if should_auto_ingest:
-                        try:
-                            topic_keywords = self.db.facade.get_monitored_keywords_for_topic((topic,))
-                            logger.info(f"Starting auto-ingest pipeline for {len(articles)} articles with {len(topic_keywords)} keywords")
-
-                            # Pass suppress_notifications=True to prevent per-keyword notifications
-                            auto_ingest_results = await self.auto_ingest_pipeline(
-                                articles, topic, topic_keywords, suppress_notifications=True
+                        if saved['failed']:
+                            logger.error(
+                                f"{len(saved['failed'])} articles for '{keyword_text}' could not be saved; "
+                                f"they are fetched again on the next check"
                             )
-                            logger.info(f"Auto-ingest pipeline completed. Results: {auto_ingest_results}")
-
-                            # Track cumulative stats
-                            auto_ingest_ran = True
-                            total_auto_ingest_processed += auto_ingest_results.get("processed", 0)
-                            total_auto_ingest_saved += auto_ingest_results.get("saved", 0)
-                            total_auto_ingest_errors += len(auto_ingest_results.get("errors", []))
-
-                            # Check if auto-regenerate reports is enabled
-                            if auto_ingest_results.get("saved", 0) > 0:
-                                try:
-                                    auto_regenerate = self.db.facade.get_auto_regenerate_reports_setting()
-
-                                    if auto_regenerate:
-                                        logger.info(f"Auto-regenerate enabled: regenerating Six Articles for topic '{topic}'")
-
-                                        # Run regeneration in background task to avoid blocking
-                                        asyncio.create_task(
-                                            self._regenerate_six_articles_background(topic)
-                                        )
-
-                                        logger.info(f"Six Articles regeneration task created for topic '{topic}'")
-
-                                except Exception as regen_err:
-                                    logger.error(f"Six Articles regeneration failed: {regen_err}", exc_info=True)
-                                    # Don't fail autocollect if regeneration fails
-
-                        except Exception as e:
-                            logger.error(f"Auto-ingest pipeline failed: {e}", exc_info=True)
-
-                    # Update last checked timestamp
-                    self.db.facade.update_monitored_keyword_last_checked((datetime.now().isoformat(), keyword_id))
-
-                    # After processing keywords, check and reset counter if needed before updating
-                    self.check_and_reset_counter()
-
-                    # Update request count in status
-                    self.db.facade.update_keyword_monitor_counter((self.collector.requests_today,))
-                except ValueError as e:
-                    if "Rate limit exceeded" in str(e):
-                        error_msg = "API daily request limit reached"
-                        logger.error(error_msg)
-                        self.db.facade.create_keyword_monitor_log_entry((check_start_time, error_msg, self.collector.requests_today if self.collector else 0))
-                        return {"success": False, "error": error_msg, "new_articles": new_articles_count}
-                    # Don't re-raise, return error response instead
-                    logger.error(f"ValueError in keyword check: {str(e)}")
-                    return {"success": False, "error": str(e), "new_articles": new_articles_count}
-
-                # Continue to next keyword (don't return here)
+                        # Move this keyword's cursors past the articles that were stored
+                        self._advance_cursors(searched, saved['failed'])
+
+                        # SECOND: Now run auto-ingest pipeline on the saved articles
+                        should_auto_ingest = self.should_auto_ingest()
+                        logger.info(f"Auto-ingest check: enabled={should_auto_ingest}, articles_count={len(articles)}")
+
+                        if should_auto_ingest:
+                            try:
+                                topic_keywords = self.db.facade.get_monitored_keywords_for_topic((topic,))
+                                logger.info(f"Starting auto-ingest pipeline for {len(articles)} articles with {len(topic_keywords)} keywords")
+
+                                # Pass suppress_notifications=True to prevent per-keyword notifications
+                                auto_ingest_results = await self.auto_ingest_pipeline(
+                                    articles, topic, topic_keywords, suppress_notifications=True
+                                )
+                                logger.info(f"Auto-ingest pipeline completed. Results: {auto_ingest_results}")
+
+                                # Track cumulative stats
+                                auto_ingest_ran = True
+                                total_auto_ingest_processed += auto_ingest_results.get("processed", 0)
+                                total_auto_ingest_saved += auto_ingest_results.get("saved", 0)
+                                total_auto_ingest_errors += len(auto_ingest_results.get("errors", []))
+
+                                # Check if auto-regenerate reports is enabled
+                                if auto_ingest_results.get("saved", 0) > 0:
+                                    try:
+                                        auto_regenerate = self.db.facade.get_auto_regenerate_reports_setting()
+
+                                        if auto_regenerate:
+                                            logger.info(f"Auto-regenerate enabled: regenerating Six Articles for topic '{topic}'")
+
+                                            # Run regeneration in background task to avoid blocking
+                                            asyncio.create_task(
+                                                self._regenerate_six_articles_background(topic)
+                                            )
+
+                                            logger.info(f"Six Articles regeneration task created for topic '{topic}'")
+
+                                    except Exception as regen_err:
+                                        logger.error(f"Six Articles regeneration failed: {regen_err}", exc_info=True)
+                                        # Don't fail autocollect if regeneration fails
+
+                            except Exception as e:
+                                logger.error(f"Auto-ingest pipeline failed: {e}", exc_info=True)
+
+                        # Update last checked timestamp
+                        self.db.facade.update_monitored_keyword_last_checked((datetime.now().isoformat(), keyword_id))
+
+                        # After processing keywords, check and reset counter if needed before updating
+                        self.check_and_reset_counter()
+
+                        # Update request count in status
+                        self.db.facade.update_keyword_monitor_counter((self.collector.requests_today,))
+                    except ValueError as e:
+                        if "Rate limit exceeded" in str(e):
+                            error_msg = "API daily request limit reached"
+                            logger.error(error_msg)
+                            self.db.facade.create_keyword_monitor_log_entry((check_start_time, error_msg, self.collector.requests_today if self.collector else 0))
+                            return {"success": False, "error": error_msg, "new_articles": new_articles_count}
+                        # Don't re-raise, return error response instead
+                        logger.error(f"ValueError in keyword check: {str(e)}")
+                        return {"success": False, "error": str(e), "new_articles": new_articles_count}
+
+                    # Continue to next keyword (don't return here)
 
             # Create consolidated notification after all keywords processed
             if auto_ingest_ran:
@@ -891,7 +993,7 @@ async def run_keyword_monitor():
                 _background_task_status["last_error"] = None
 
                 try:
-                    result = await monitor.check_keywords()
+                    result = await monitor.check_keywords(due_only=True)
                     if result.get("success", False):
                         logger.info(
                             f"Scheduled keyword check completed successfully. "
@@ -928,9 +1030,13 @@ async def run_keyword_monitor():
         except Exception as e:
             logger.error(f"Error refreshing check interval settings: {str(e)}", exc_info=True)
         
-        # Calculate next check time
-        next_check = datetime.now() + timedelta(seconds=monitor.check_interval)
+        # Calculate next check time: wake early if a hot keyword's cursor is due sooner
+        sleep_seconds = monitor.check_interval
+        next_due = monitor.cursor_store.seconds_until_next_poll(datetime.utcnow())
+        if next_due is not None:
+            sleep_seconds = min(sleep_seconds, max(next_due, MIN_POLL_INTERVAL))
+        next_check = datetime.now() + timedelta(seconds=sleep_seconds)
         _background_task_status["next_check_time"] = next_check
         
-        logger.debug(f"Sleeping for {monitor.check_interval} seconds until next keyword check")
-        await asyncio.sleep(monitor.check_interval) 
\ No newline at end of file
+        logger.debug(f"Sleeping for {sleep_seconds} seconds until next keyword check")
+        await asyncio.sleep(sleep_seconds) 
\ No newline at end of file
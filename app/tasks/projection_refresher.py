@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import time
+
+from app.services.projection_store import (
+    PENDING_FIT_POLL_INTERVAL,
+    PROJECTION_REFRESH_INTERVAL,
+    get_projection_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_projection_refresher():
+    """Background task that fits new projection scopes and keeps stored ones current.
+
+    Scopes requested for the first time are fitted within
+    PENDING_FIT_POLL_INTERVAL seconds. Every PROJECTION_REFRESH_INTERVAL
+    seconds new articles are placed into each recently requested scope with
+    transform(), and scopes that have drifted past PROJECTION_DRIFT_THRESHOLD
+    are refitted.
+    """
+    store = get_projection_store()
+    loop = asyncio.get_running_loop()
+    logger.info(f"Projection refresher started (interval {PROJECTION_REFRESH_INTERVAL}s)")
+
+    store.background_fits = True
+    next_refresh = time.monotonic() + PROJECTION_REFRESH_INTERVAL
+    try:
+        while True:
+            await asyncio.sleep(PENDING_FIT_POLL_INTERVAL)
+            try:
+                # Fitting is CPU bound, keep it off the event loop
+                fitted = await loop.run_in_executor(None, store.fit_pending)
+                if fitted:
+                    logger.info(f"Projection refresh: fitted {fitted} new scopes")
+
+                if time.monotonic() < next_refresh:
+                    continue
+                next_refresh = time.monotonic() + PROJECTION_REFRESH_INTERVAL
+                summary = await loop.run_in_executor(None, store.refresh_all)
+                if summary["scopes"]:
+                    logger.info(
+                        f"Projection refresh: {summary['scopes']} scopes, {summary['placed']} points placed, "
+                        f"{summary['refitted']} refitted, {summary['failed']} failed"
+                    )
+            except Exception as e:
+                logger.error(f"Error in projection refresher: {str(e)}")
+    finally:
+        # Requests fit inline again once nobody works through the queue
+        store.background_fits = False
@@ -5,6 +5,10 @@ from app.kissql.parser import (
     tokenize, 
     parse_query, 
     parse_full_query,
+    parse_query_cached,
+    parse_cache_info,
+    normalize_query,
+    Constraint,
 )
 
 
@@ -176,6 +180,43 @@ class TestKissqlParser(unittest.TestCase):
         self.assertEqual('TAIL', parsed.pipe_operations[2].operation)
         self.assertEqual(['10'], parsed.pipe_operations[2].params)
 
+    def test_not_negates_following_constraint(self):
+        """Test that NOT before a constraint negates it."""
+        parsed = parse_full_query('AI NOT sentiment=Negative NOT robots')
+        
+        self.assertEqual('AI NOT robots', parsed.text)
+        self.assertEqual(1, len(parsed.constraints))
+        self.assertTrue(parsed.constraints[0].negated)
+
+
+    def test_tokenize_skips_whitespace_and_unknown_characters(self):
+        """Test the combined tokenizer on mixed input."""
+        tokens = tokenize('AI  category="Tech"  ~ | HEAD 5')
+        
+        self.assertEqual(
+            ['WORD', 'CONSTRAINT_EQ_QUOTED', 'PIPE_OP'],
+            [t.type for t in tokens]
+        )
+        self.assertEqual(4, tokens[1].position)
+        self.assertEqual('| HEAD 5', tokens[2].value)
+
+    def test_normalize_query_keeps_quoted_phrases(self):
+        """Test that only whitespace outside quotes is collapsed."""
+        self.assertEqual(
+            'AI "large   language" models',
+            normalize_query('  AI   "large   language"\tmodels ')
+        )
+
+    def test_parse_query_cached_returns_copies(self):
+        """Test that cached parses are shared by equivalent queries but not mutated."""
+        first = parse_query_cached('AI  sentiment=Positive')
+        hits = parse_cache_info()['hits']
+        first.constraints.append(Constraint(field='topic', operator='=', value='x'))
+        second = parse_query_cached('AI sentiment=Positive')
+        
+        self.assertEqual(hits + 1, parse_cache_info()['hits'])
+        self.assertEqual(1, len(second.constraints))
+        self.assertEqual('Positive', second.constraints[0].value)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""Tests for the KISSQL to SQL compiler."""
+
+import unittest
+from app.kissql.executor import _collect_aggregates
+from app.kissql.parser import Constraint, parse_full_query
+from app.kissql.sql_compiler import (
+    FACET_FIELDS,
+    KissqlCompileError,
+    build_facet_query,
+    compile_plan,
+    compile_where,
+    plan_cache_info,
+)
+
+
+class TestKissqlSqlCompiler(unittest.TestCase):
+    """Test cases for compiling constraints to SQL."""
+
+    def test_no_constraints(self):
+        """Test that an empty constraint list compiles to TRUE."""
+        where = compile_where([])
+        
+        self.assertEqual('TRUE', where.sql)
+        self.assertEqual({}, where.params)
+
+    def test_comparison_and_range(self):
+        """Test numeric comparison and range constraints."""
+        parsed = parse_full_query('confidence_score>=0.5 quality_score=1..3')
+        where = compile_where(parsed.constraints)
+        
+        self.assertEqual(
+            'confidence_score >= :k0 AND quality_score BETWEEN :k1 AND :k2',
+            where.sql
+        )
+        self.assertEqual({'k0': 0.5, 'k1': 1.0, 'k2': 3.0}, where.params)
+
+    def test_text_range_matches_prefixes(self):
+        """Test that a range on a date column covers whole years."""
+        where = compile_where([
+            Constraint(field='date', operator='range', value={'min': 2023, 'max': 2024})
+        ])
+        
+        self.assertEqual(
+            '(publication_date >= :k0 AND publication_date < :k1)',
+            where.sql
+        )
+        self.assertEqual({'k0': '2023', 'k1': '2025'}, where.params)
+
+    def test_in_has_and_not(self):
+        """Test in(), has: and NOT constraints."""
+        constraints = [
+            Constraint(field='topic', operator='in', value=['AI', 'Climate']),
+            Constraint(field='tags', operator='exists', value=True),
+            Constraint(field='sentiment', operator='=', value='"Negative"', negated=True),
+        ]
+        where = compile_where(constraints)
+        
+        self.assertEqual(
+            "topic IN (:k0, :k1) AND (tags IS NOT NULL AND tags <> '') "
+            "AND NOT COALESCE(sentiment = :k2, FALSE)",
+            where.sql
+        )
+        self.assertEqual('Negative', where.params['k2'])
+
+    def test_unknown_field_and_bad_number(self):
+        """Test that invalid constraints are rejected rather than injected."""
+        with self.assertRaises(KissqlCompileError):
+            compile_where([Constraint(field='x; DROP TABLE articles', operator='=', value='1')])
+        with self.assertRaises(KissqlCompileError):
+            compile_where([Constraint(field='quality_score', operator='>', value='high')])
+
+    def test_facet_query_uses_grouping_sets(self):
+        """Test that facets and timeline come from one aggregate."""
+        sql = build_facet_query(compile_where([]))
+        
+        self.assertIn('GROUPING SETS', sql)
+        self.assertIn('SUM(CASE WHEN TRUE THEN 1 ELSE 0 END)', sql)
+
+    def test_collect_aggregates(self):
+        """Test folding grouping set rows into facets and timeline."""
+        def row(total, matching, day=None, g_day=1, **values):
+            r = {f: values.get(f) for f in FACET_FIELDS}
+            r.update({f'g_{f}': 0 if f in values else 1 for f in FACET_FIELDS})
+            r.update(day=day, g_day=g_day, total=total, matching=matching)
+            return r
+
+        rows = [
+            row(10, 4),
+            row(6, 4, topic='AI'),
+            row(4, 0, topic='Climate'),
+            row(3, 2, day='2024-05-01', g_day=0, category='Tech'),
+        ]
+        aggregates = _collect_aggregates(rows)
+        
+        self.assertEqual((10, 4), (aggregates['total'], aggregates['matching']))
+        self.assertEqual({'topic': {'AI': 6, 'Climate': 4}}, aggregates['facets'])
+        self.assertEqual({'topic': {'AI': 4}}, aggregates['filtered_facets'])
+        self.assertEqual({'Tech': {'2024-05-01': 2}}, aggregates['timeline'])
+
+
+    def test_compile_plan_is_cached_by_content(self):
+        """Test that equal constraint lists reuse one compiled plan."""
+        first = compile_plan(parse_full_query('sentiment=Neutral NOT category=Tech').constraints)
+        hits = plan_cache_info()['hits']
+        second = compile_plan(parse_full_query('sentiment=Neutral  NOT category=Tech').constraints)
+        
+        self.assertIs(first, second)
+        self.assertEqual(hits + 1, plan_cache_info()['hits'])
+        self.assertIn(first.where.sql, first.facet_sql)
+
+    def test_compile_plan_distinguishes_negation(self):
+        """Test that a negated constraint gets its own plan."""
+        plain = compile_plan([Constraint(field='topic', operator='=', value='AI')])
+        negated = compile_plan([Constraint(field='topic', operator='=', value='AI', negated=True)])
+        
+        self.assertNotEqual(plain.where.sql, negated.where.sql)
+
+if __name__ == '__main__':
+    unittest.main()
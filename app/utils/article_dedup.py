@@ -0,0 +1,268 @@
+"""
+Cross-provider article deduplication.
+
+Collectors return the same story under different URLs: tracking parameters,
+``http`` vs ``https``, ``www.``/``m.``/``amp.`` hosts, AMP paths and trailing
+slashes. ``canonical_url`` reduces those variants to one key, and
+``deduplicate_articles`` keeps one article per key in a single pass,
+preferring the provider with the higher priority.
+
+An optional second pass compares titles with MinHash over character
+shingles and drops near-duplicates reported by *different* providers
+(syndicated copies of the same wire story).
+"""
+import re
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that only track the click and never select content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid",
+    "mc_eid", "ref", "ref_src", "ref_url", "referrer", "cmpid", "ocid",
+    "smid", "sr_share", "share", "_ga", "guccounter", "spm", "amp",
+    "outputtype",
+}
+
+# Host prefixes that serve the same content as the bare host
+MIRROR_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# MinHash parameters: NUM_PERM = LSH_BANDS * LSH_ROWS
+SHINGLE_SIZE = 4
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = 4
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def _strip_mirror_prefix(host: str) -> str:
+    for prefix in MIRROR_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            return host[len(prefix):]
+    return host
+
+
+def _strip_amp_path(path: str) -> str:
+    segments = [s for s in path.split("/") if s]
+    if segments and segments[0] == "amp":
+        segments = segments[1:]
+    if segments and segments[-1] == "amp":
+        segments = segments[:-1]
+    if segments:
+        # story.amp.html -> story.html, story.amp -> story
+        segments[-1] = re.sub(r"\.amp(?=\.\w+$|$)", "", segments[-1])
+    return "/" + "/".join(segments) if segments else ""
+
+
+def canonical_url(url: str) -> str:
+    """Return the deduplication key for ``url``.
+
+    The key drops the scheme, fragment, default port, tracking parameters,
+    mirror host prefixes, AMP path markers and trailing slashes, lowercases
+    the host and sorts the remaining query parameters. It is only used for
+    comparison; the original URL is what gets stored.
+
+    Returns:
+        The canonical key, or "" for an empty URL
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "http://" + url.lstrip("/")
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    host = _strip_mirror_prefix(host)
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+
+    key = host + _strip_amp_path(parts.path)
+    if query:
+        key += "?" + urlencode(query)
+    return key
+
+
+def title_shingles(title: str, size: int = SHINGLE_SIZE) -> set:
+    """Return the set of character shingles of a normalized title."""
+    text = " ".join(re.findall(r"\w+", (title or "").lower()))
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """MinHash signatures with fixed, seeded permutations."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        import numpy as np
+
+        rng = np.random.RandomState(seed)
+        self._np = np
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingles: set):
+        """Return the signature of ``shingles`` as a uint64 array."""
+        np = self._np
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) & _MERSENNE_PRIME for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # (a * x + b) stays below 2**63 because a, x < 2**31
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    @staticmethod
+    def similarity(first, second) -> float:
+        """Estimate the Jaccard similarity of two signatures."""
+        return float((first == second).mean())
+
+
+def _empty_provider_stats() -> Dict[str, Any]:
+    return {"received": 0, "kept": 0, "url_duplicates": 0, "near_duplicates": 0, "overlap": {}}
+
+
+def deduplicate_articles(
+    articles: List[Dict],
+    provider_priority: Optional[Dict[str, int]] = None,
+    near_duplicates: bool = False,
+    threshold: float = 0.8,
+    provider_field: str = "collector_source",
+) -> Tuple[List[Dict], Dict[str, Any]]:
+    """Keep one article per canonical URL, and optionally per near-identical title.
+
+    When two articles collide, the one whose provider has the higher
+    priority replaces the other in its original position; on a tie the
+    first one seen is kept. The title pass only merges articles from
+    different providers.
+
+    Args:
+        articles: Articles with ``url``, ``title`` and a provider field
+        provider_priority: Provider name -> priority (higher wins)
+        near_duplicates: Also run the MinHash title pass
+        threshold: Estimated Jaccard similarity at which titles match
+        provider_field: Article key holding the provider name
+
+    Returns:
+        (unique articles, stats). Stats hold input/output totals and, per
+        provider, how many articles were received, kept and dropped, and
+        how often they overlapped with each other provider.
+    """
+    priority = provider_priority or {}
+    providers: Dict[str, Dict[str, Any]] = {}
+    stats: Dict[str, Any] = {
+        "input": len(articles),
+        "missing_url": 0,
+        "url_duplicates": 0,
+        "near_duplicates": 0,
+        "providers": providers,
+    }
+
+    def provider_of(article: Dict) -> str:
+        return article.get(provider_field) or "unknown"
+
+    def record_overlap(kept: Dict, dropped: Dict, counter: str) -> None:
+        kept_provider, dropped_provider = provider_of(kept), provider_of(dropped)
+        stats[counter] += 1
+        providers[dropped_provider][counter] += 1
+        if kept_provider != dropped_provider:
+            for one, other in ((kept_provider, dropped_provider), (dropped_provider, kept_provider)):
+                overlap = providers[one]["overlap"]
+                overlap[other] = overlap.get(other, 0) + 1
+
+    def wins(candidate: Dict, existing: Dict) -> bool:
+        return priority.get(provider_of(candidate), 0) > priority.get(provider_of(existing), 0)
+
+    slots: List[Dict] = []
+    slot_by_key: Dict[str, int] = {}
+
+    for article in articles:
+        provider_stats = providers.setdefault(provider_of(article), _empty_provider_stats())
+        key = canonical_url(article.get("url", ""))
+        if not key:
+            stats["missing_url"] += 1
+            continue
+        provider_stats["received"] += 1
+
+        index = slot_by_key.get(key)
+        if index is None:
+            slot_by_key[key] = len(slots)
+            slots.append(article)
+        elif wins(article, slots[index]):
+            record_overlap(article, slots[index], "url_duplicates")
+            slots[index] = article
+        else:
+            record_overlap(slots[index], article, "url_duplicates")
+
+    if near_duplicates and len(slots) > 1:
+        slots = _drop_near_duplicates(slots, wins, record_overlap, threshold, provider_of)
+
+    for article in slots:
+        providers[provider_of(article)]["kept"] += 1
+    stats["output"] = len(slots)
+    return slots, stats
+
+
+def _drop_near_duplicates(slots, wins, record_overlap, threshold, provider_of) -> List[Dict]:
+    """MinHash/LSH pass over titles; see deduplicate_articles."""
+    hasher = MinHasher(NUM_PERM)
+    kept: List[Dict] = []
+    signatures: List[Any] = []
+    buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    for article in slots:
+        shingles = title_shingles(article.get("title", ""))
+        if not shingles:
+            kept.append(article)
+            signatures.append(None)
+            continue
+        signature = hasher.signature(shingles)
+        bands = [
+            (band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes())
+            for band in range(LSH_BANDS)
+        ]
+
+        match = None
+        seen = set()
+        for band in bands:
+            for index in buckets.get(band, ()):
+                if index in seen:
+                    continue
+                seen.add(index)
+                if (
+                    provider_of(kept[index]) != provider_of(article)
+                    and hasher.similarity(signatures[index], signature) >= threshold
+                ):
+                    match = index
+                    break
+            if match is not None:
+                break
+
+        if match is None:
+            index = len(kept)
+            kept.append(article)
+            signatures.append(signature)
+            for band in bands:
+                buckets.setdefault(band, []).append(index)
+        elif wins(article, kept[match]):
+            record_overlap(article, kept[match], "near_duplicates")
+            kept[match] = article
+        else:
+            record_overlap(kept[match], article, "near_duplicates")
+
+    return kept
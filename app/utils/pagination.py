@@ -0,0 +1,89 @@
+"""
+Keyset pagination helpers.
+
+Listing endpoints page by the sort key of the last row they returned
+instead of an OFFSET, so deep pages cost the same as the first one. The key
+is handed to clients as an opaque cursor: URL-safe base64 of the JSON list
+of key values. Clients must not build or inspect cursors themselves.
+
+Totals are expensive on large tables and rarely need to be exact on every
+page, so listings asked for an estimated total may use ``CountCache``, which
+keeps recent counts per filter signature for a few seconds. Exact totals are
+never served from it.
+
+Configuration (environment):
+- LISTING_COUNT_CACHE_TTL_SECONDS (default 30; 0 disables the cache)
+"""
+import base64
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for the sort key ``values`` of the last row on a page."""
+    payload = json.dumps(list(values), separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Sort key values of ``cursor``; raises ValueError if it is malformed."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid page cursor: {e}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid page cursor")
+    return values
+
+
+class CountCache:
+    """Short-TTL cache of row counts keyed by a filter signature."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv('LISTING_COUNT_CACHE_TTL_SECONDS', '30'))
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+        }
+
+    def get(self, signature: Hashable, loader: Callable[[], int]) -> int:
+        """Return the count for ``signature``, calling ``loader()`` on a miss."""
+        if not self.ttl_seconds:
+            return loader()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(signature)
+            if entry and now - entry[1] < self.ttl_seconds:
+                self._stats["hits"] += 1
+                return entry[0]
+            self._stats["misses"] += 1
+
+        count = loader()
+        with self._lock:
+            # Drop expired entries so filter combinations don't pile up
+            self._entries = {
+                key: value for key, value in self._entries.items()
+                if now - value[1] < self.ttl_seconds
+            }
+            self._entries[signature] = (count, now)
+        return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
@@ -14,14 +14,18 @@ logger = logging.getLogger(__name__)
 from app.vector_store_pgvector import (
     # Sync functions
     upsert_article,
+    upsert_articles_bulk,
     search_articles,
+    multi_query_search_articles,
     similar_articles,
     get_vectors_by_metadata,
     get_by_ids,
 
     # Async functions
     upsert_article_async,
+    upsert_articles_bulk_async,
     search_articles_async,
+    multi_query_search_articles_async,
     similar_articles_async,
     get_vectors_by_metadata_async,
     get_by_ids_async,
@@ -71,14 +75,18 @@ def shutdown_vector_store():
 __all__ = [
     # Sync functions
     'upsert_article',
+    'upsert_articles_bulk',
     'search_articles',
+    'multi_query_search_articles',
     'similar_articles',
     'get_vectors_by_metadata',
     'get_by_ids',
 
     # Async functions
     'upsert_article_async',
+    'upsert_articles_bulk_async',
     'search_articles_async',
+    'multi_query_search_articles_async',
     'similar_articles_async',
     'get_vectors_by_metadata_async',
     'get_by_ids_async',
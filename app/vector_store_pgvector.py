@@ -14,9 +14,11 @@ Distance metric: Cosine distance (<=> operator)
 """
 import os
 import logging
+import weakref
 from typing import List, Dict, Any, Optional
 import asyncio
 from datetime import datetime, timezone
+from functools import lru_cache
 
 try:
     import openai
@@ -25,6 +27,7 @@ except ImportError:
 
 from sqlalchemy import text
 from app.database import get_database_instance
+from app.services.embedding_cache import get_embedding_cache
 
 # Import async database for native async operations
 try:
@@ -36,10 +39,21 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 1536
+
 # Singleton OpenAI client for embeddings
 _OPENAI_CLIENT: Optional[Any] = None
 
 
+# Async OpenAI clients and request semaphores, one per event loop so
+# connections are reused without sharing an httpx pool across loops
+_ASYNC_EMBEDDING_STATE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+
+# Maximum concurrent embedding requests per event loop
+EMBEDDING_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "8"))
+
+
 def _get_openai_client():
     """Get or create singleton OpenAI client for embeddings."""
     global _OPENAI_CLIENT
@@ -55,9 +69,36 @@ def _get_openai_client():
     return _OPENAI_CLIENT
 
 
+def _get_async_embedding_state():
+    """Get or create the AsyncOpenAI client and semaphore for the running loop.
+
+    Returns:
+        Tuple of (client or None, asyncio.Semaphore)
+    """
+    loop = asyncio.get_running_loop()
+    state = _ASYNC_EMBEDDING_STATE.get(loop)
+
+    if state is None:
+        client = None
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key and openai and hasattr(openai, "AsyncOpenAI"):
+            client = openai.AsyncOpenAI(api_key=api_key)
+            logger.info("Created shared AsyncOpenAI client for pgvector embeddings")
+        else:
+            logger.warning("AsyncOpenAI client not available for pgvector embeddings")
+        state = (client, asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY))
+        _ASYNC_EMBEDDING_STATE[loop] = state
+
+    return state
+
+
+@lru_cache(maxsize=128)
 def _truncate_text_for_embedding(text: str, max_tokens: int = 8000) -> str:
     """Truncate text to fit within OpenAI embedding token limits.
 
+    Results are memoised so re-embedding the same article body does not
+    re-run tiktoken.
+
     Args:
         text: Input text to truncate
         max_tokens: Maximum tokens allowed (default 8000 for safety buffer)
@@ -65,9 +106,13 @@ def _truncate_text_for_embedding(text: str, max_tokens: int = 8000) -> str:
     Returns:
         Truncated text that fits within token limit
     """
+    # Every BPE token covers at least one UTF-8 byte, so short texts can skip tokenization
+    if len(text) <= max_tokens and len(text.encode("utf-8")) <= max_tokens:
+        return text
+
     try:
         import tiktoken
-        encoding = tiktoken.encoding_for_model("text-embedding-3-small")
+        encoding = tiktoken.encoding_for_model(EMBEDDING_MODEL)
 
         tokens = encoding.encode(text)
         if len(tokens) <= max_tokens:
@@ -99,57 +144,179 @@ def _truncate_text_for_embedding(text: str, max_tokens: int = 8000) -> str:
         return text[:safe_chars] if len(text) > safe_chars else text
 
 
-def _embed_texts(texts: List[str]) -> List[List[float]]:
-    """Embed texts into vectors using OpenAI.
+def _count_tokens(text: str) -> int:
+    """Count embedding tokens in text, estimating when tiktoken is unavailable."""
+    try:
+        import tiktoken
+        return len(tiktoken.encoding_for_model(EMBEDDING_MODEL).encode(text))
+    except Exception:
+        return len(text) // 3 + 1
 
-    Args:
-        texts: List of texts to embed
 
-    Returns:
-        List of embedding vectors (1536 dimensions each)
+def _request_embeddings(client, texts: List[str]) -> List[List[float]]:
+    """Call the embedding API for texts and return vectors in input order.
+
+    Raises on API errors; callers decide how to fall back.
     """
-    # Clean and validate texts
+    resp = client.embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=texts,
+    )
+    return [item.embedding for item in sorted(resp.data, key=lambda x: x.index)]
+
+
+def _article_doc_text(article: Dict[str, Any]) -> str:
+    """Return the text that represents an article in the vector index."""
+    return (
+        article.get("raw")
+        or article.get("summary")
+        or article.get("title")
+        or ""
+    )
+
+
+def _clean_texts_for_embedding(texts: List[str]) -> List[str]:
+    """Drop empty texts, strip whitespace and truncate to the token limit."""
     cleaned_texts = []
     for text in texts:
         if text is None:
             continue
         cleaned = str(text).strip()
         if cleaned:
-            cleaned = _truncate_text_for_embedding(cleaned)
-            cleaned_texts.append(cleaned)
+            cleaned_texts.append(_truncate_text_for_embedding(cleaned))
+    return cleaned_texts
+
+
+def _embed_texts(texts: List[str], strict: bool = False) -> List[List[float]]:
+    """Embed texts into vectors using OpenAI.
+
+    Texts already present in the embedding cache are served from it; only
+    cache misses are sent to the API.
+
+    Args:
+        texts: List of texts to embed
+        strict: Raise RuntimeError instead of returning random vectors when
+            embeddings cannot be computed (for callers that rank by them)
+
+    Returns:
+        List of embedding vectors (1536 dimensions each)
+    """
+    cleaned_texts = _clean_texts_for_embedding(texts)
 
     if not cleaned_texts:
+        if strict:
+            raise RuntimeError("No valid texts to embed")
         import numpy as np
         logger.warning("No valid texts to embed")
-        return np.random.rand(1, 1536).tolist()
+        return np.random.rand(1, EMBEDDING_DIMENSIONS).tolist()
+
+    cache = get_embedding_cache()
+    cached = cache.get_many(EMBEDDING_MODEL, cleaned_texts) if cache else {}
+    missing = list(dict.fromkeys(t for t in cleaned_texts if t not in cached))
+
+    if not missing:
+        logger.debug("Embedding cache served all %d texts", len(cleaned_texts))
+        return [cached[t] for t in cleaned_texts]
 
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key or not openai:
+        if strict:
+            raise RuntimeError("OpenAI not available for embeddings")
         logger.warning("OpenAI not available, using random embeddings")
         import numpy as np
-        return np.random.rand(len(cleaned_texts), 1536).tolist()
+        return [cached.get(t) or np.random.rand(EMBEDDING_DIMENSIONS).tolist() for t in cleaned_texts]
 
     try:
         client = _get_openai_client()
         if client is None:
             raise Exception("OpenAI client not available")
 
-        logger.debug("Calling OpenAI embedding API with %d texts", len(cleaned_texts))
-        resp = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=cleaned_texts,
+        logger.debug(
+            "Calling OpenAI embedding API with %d texts (%d cached)",
+            len(missing), len(cleaned_texts) - len(missing)
         )
+        fresh = dict(zip(missing, _request_embeddings(client, missing)))
 
-        embeddings_list = []
-        for item in sorted(resp.data, key=lambda x: x.index):
-            embeddings_list.append(item.embedding)
+        if cache:
+            cache.set_many(EMBEDDING_MODEL, fresh)
 
-        return embeddings_list
+        cached.update(fresh)
+        return [cached[t] for t in cleaned_texts]
 
     except Exception as exc:
+        if strict:
+            raise RuntimeError(f"OpenAI embedding failed: {exc}") from exc
         logger.warning("OpenAI embedding failed, falling back to random: %s", exc)
         import numpy as np
-        return np.random.rand(len(cleaned_texts), 1536).tolist()
+        # Random fallbacks are never written to the cache
+        return [cached.get(t) or np.random.rand(EMBEDDING_DIMENSIONS).tolist() for t in cleaned_texts]
+
+
+async def _embed_texts_async(texts: List[str], strict: bool = False) -> List[List[float]]:
+    """Async counterpart of _embed_texts using a shared AsyncOpenAI client.
+
+    The API call never blocks the event loop and concurrent callers are
+    bounded by EMBEDDING_MAX_CONCURRENCY. Cache lookups and writes (which may
+    hit the database tier) run in the default thread pool.
+
+    Args:
+        texts: List of texts to embed
+        strict: Raise RuntimeError instead of returning random vectors when
+            embeddings cannot be computed (for callers that compare them)
+
+    Returns:
+        List of embedding vectors (1536 dimensions each)
+    """
+    import numpy as np
+
+    loop = asyncio.get_running_loop()
+    cleaned_texts = await loop.run_in_executor(None, _clean_texts_for_embedding, texts)
+
+    if not cleaned_texts:
+        if strict:
+            raise RuntimeError("No valid texts to embed")
+        logger.warning("No valid texts to embed")
+        return np.random.rand(1, EMBEDDING_DIMENSIONS).tolist()
+
+    cache = get_embedding_cache()
+    cached = await loop.run_in_executor(None, cache.get_many, EMBEDDING_MODEL, cleaned_texts) if cache else {}
+    missing = list(dict.fromkeys(t for t in cleaned_texts if t not in cached))
+
+    if not missing:
+        logger.debug("Embedding cache served all %d texts", len(cleaned_texts))
+        return [cached[t] for t in cleaned_texts]
+
+    client, semaphore = _get_async_embedding_state()
+    if client is None:
+        if strict:
+            raise RuntimeError("OpenAI not available for embeddings")
+        logger.warning("OpenAI not available, using random embeddings")
+        return [cached.get(t) or np.random.rand(EMBEDDING_DIMENSIONS).tolist() for t in cleaned_texts]
+
+    try:
+        logger.debug(
+            "Calling OpenAI embedding API (async) with %d texts (%d cached)",
+            len(missing), len(cleaned_texts) - len(missing)
+        )
+        async with semaphore:
+            resp = await client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=missing,
+            )
+        fresh = {missing[item.index]: item.embedding for item in resp.data}
+
+        if cache:
+            await loop.run_in_executor(None, cache.set_many, EMBEDDING_MODEL, fresh)
+
+        cached.update(fresh)
+        return [cached[t] for t in cleaned_texts]
+
+    except Exception as exc:
+        if strict:
+            raise RuntimeError(f"Async OpenAI embedding failed: {exc}") from exc
+        logger.warning("Async OpenAI embedding failed, falling back to random: %s", exc)
+        # Random fallbacks are never written to the cache
+        return [cached.get(t) or np.random.rand(EMBEDDING_DIMENSIONS).tolist() for t in cleaned_texts]
 
 
 # --------------------------------------------------------------------------------------
@@ -165,12 +332,7 @@ def upsert_article(article: Dict[str, Any]) -> None:
     conn = None
     try:
         # Get document text for embedding
-        doc_text = (
-            article.get("raw")
-            or article.get("summary")
-            or article.get("title")
-            or ""
-        )
+        doc_text = _article_doc_text(article)
         if not doc_text:
             logger.debug("No textual content for article %s – skipping vector index", article.get("uri"))
             return
@@ -223,18 +385,13 @@ async def upsert_article_async(article: Dict[str, Any]) -> None:
 
     try:
         # Get document text for embedding
-        doc_text = (
-            article.get("raw")
-            or article.get("summary")
-            or article.get("title")
-            or ""
-        )
+        doc_text = _article_doc_text(article)
         if not doc_text:
             logger.debug("No textual content for article %s – skipping vector index", article.get("uri"))
             return
 
-        # Generate embedding (sync call, but relatively fast)
-        embeddings = _embed_texts([doc_text])
+        # Generate embedding without blocking the event loop
+        embeddings = await _embed_texts_async([doc_text])
         embedding = embeddings[0]
 
         # Convert embedding to PostgreSQL array format
@@ -256,6 +413,179 @@ async def upsert_article_async(article: Dict[str, Any]) -> None:
         logger.error("Async vector upsert failed for article %s: %s", article.get("uri"), exc)
 
 
+def _pack_embedding_batches(
+    items: List[Dict[str, Any]],
+    max_batch_tokens: int,
+    max_batch_size: int,
+) -> List[List[Dict[str, Any]]]:
+    """Group items into embedding requests bounded by token count and input count."""
+    batches: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+
+    for item in items:
+        tokens = item["tokens"]
+        if current and (current_tokens + tokens > max_batch_tokens or len(current) >= max_batch_size):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(item)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _write_embeddings(conn, pairs: List[tuple]) -> int:
+    """Write (uri, embedding) pairs back to articles with a single UPDATE."""
+    if not pairs:
+        return 0
+
+    stmt = text("""
+        UPDATE articles AS a
+        SET embedding = CAST(v.embedding AS vector)
+        FROM unnest(CAST(:uris AS text[]), CAST(:embeddings AS text[])) AS v(uri, embedding)
+        WHERE a.uri = v.uri
+    """)
+    conn.execute(stmt, {
+        "uris": [uri for uri, _ in pairs],
+        "embeddings": ['[' + ','.join(str(x) for x in embedding) + ']' for _, embedding in pairs],
+    })
+    conn.commit()
+    return len(pairs)
+
+
+def upsert_articles_bulk(
+    articles: List[Dict[str, Any]],
+    max_batch_tokens: int = 100000,
+    max_batch_size: int = 512,
+    max_concurrency: int = 4,
+) -> Dict[str, int]:
+    """Embed and store many articles with batched API calls and batched writes.
+
+    Texts are packed into token-budgeted embedding requests, up to
+    ``max_concurrency`` requests run at once, and each completed batch is
+    written back with one UPDATE statement. Embeddings already in the
+    embedding cache are written without an API call. Articles whose batch
+    fails to embed are left untouched rather than given random vectors.
+
+    Args:
+        articles: Article dicts with uri and raw/summary/title
+        max_batch_tokens: Token budget per embedding request
+        max_batch_size: Maximum number of inputs per embedding request
+        max_concurrency: Number of embedding requests in flight
+
+    Returns:
+        Dict with indexed, cached, failed and skipped counts
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    stats = {"indexed": 0, "cached": 0, "failed": 0, "skipped": 0}
+
+    # Prepare one entry per distinct URI (last occurrence wins)
+    prepared: Dict[str, str] = {}
+    for article in articles:
+        uri = article.get("uri")
+        doc_text = str(_article_doc_text(article)).strip()
+        if not uri or not doc_text:
+            stats["skipped"] += 1
+            continue
+        prepared[uri] = _truncate_text_for_embedding(doc_text)
+
+    if not prepared:
+        return stats
+
+    cache = get_embedding_cache()
+    cached = cache.get_many(EMBEDDING_MODEL, list(prepared.values())) if cache else {}
+
+    ready = [(uri, cached[doc]) for uri, doc in prepared.items() if doc in cached]
+    stats["cached"] = len(ready)
+
+    # Texts still needing an API call, grouped so shared texts are embedded once
+    pending: Dict[str, List[str]] = {}
+    for uri, doc in prepared.items():
+        if doc not in cached:
+            pending.setdefault(doc, []).append(uri)
+
+    client = _get_openai_client() if pending else None
+    if pending and client is None:
+        logger.warning("OpenAI client not available, %d articles not indexed", sum(len(u) for u in pending.values()))
+        stats["failed"] += sum(len(uris) for uris in pending.values())
+        pending = {}
+
+    items = [{"text": doc, "tokens": _count_tokens(doc)} for doc in pending]
+    batches = _pack_embedding_batches(items, max_batch_tokens, max_batch_size)
+
+    conn = None
+    try:
+        db = get_database_instance()
+        conn = db._temp_get_connection()
+
+        for start in range(0, len(ready), max_batch_size):
+            stats["indexed"] += _write_embeddings(conn, ready[start:start + max_batch_size])
+
+        if batches:
+            logger.info(
+                "Bulk embedding %d texts in %d batches (%d served from cache)",
+                len(items), len(batches), stats["cached"]
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {
+                executor.submit(_request_embeddings, client, [item["text"] for item in batch]): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                batch_uris = sum(len(pending[item["text"]]) for item in batch)
+                try:
+                    vectors = future.result()
+                except Exception as exc:
+                    logger.error("Embedding batch of %d texts failed: %s", len(batch), exc)
+                    stats["failed"] += batch_uris
+                    continue
+
+                fresh = {item["text"]: vector for item, vector in zip(batch, vectors)}
+                if cache:
+                    cache.set_many(EMBEDDING_MODEL, fresh)
+
+                pairs = [(uri, vector) for doc, vector in fresh.items() for uri in pending[doc]]
+                try:
+                    stats["indexed"] += _write_embeddings(conn, pairs)
+                except Exception as exc:
+                    logger.error("Writing embedding batch of %d articles failed: %s", len(pairs), exc)
+                    stats["failed"] += len(pairs)
+                    conn.rollback()
+
+    except Exception as exc:
+        logger.error("Bulk vector upsert failed: %s", exc)
+        if conn is not None:
+            try:
+                conn.rollback()
+            except Exception as rollback_error:
+                logger.error("Rollback failed for bulk vector upsert: %s", rollback_error)
+
+    logger.info(
+        "Bulk vector upsert: %d indexed (%d from cache), %d failed, %d skipped",
+        stats["indexed"], stats["cached"], stats["failed"], stats["skipped"]
+    )
+    return stats
+
+
+async def upsert_articles_bulk_async(articles: List[Dict[str, Any]], **kwargs) -> Dict[str, int]:
+    """Async wrapper for upsert_articles_bulk.
+
+    Args:
+        articles: Article dicts with uri and raw/summary/title
+        **kwargs: Batching options passed to upsert_articles_bulk
+
+    Returns:
+        Dict with indexed, cached, failed and skipped counts
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, lambda: upsert_articles_bulk(articles, **kwargs))
+
+
 def search_articles(
     query: str,
     top_k: int = 10,
@@ -380,8 +710,8 @@ async def search_articles_async(
         return await loop.run_in_executor(None, search_articles, query, top_k, metadata_filter)
 
     try:
-        # Generate query embedding (this is still blocking, but relatively fast)
-        embeddings = _embed_texts([query])
+        # Generate query embedding without blocking the event loop
+        embeddings = await _embed_texts_async([query])
         query_embedding = embeddings[0]
 
         # Build WHERE clause for filters
@@ -461,6 +791,151 @@ async def search_articles_async(
         return await loop.run_in_executor(None, search_articles, query, top_k, metadata_filter)
 
 
+def _multi_query_search(
+    queries: List[str],
+    query_embeddings: List[List[float]],
+    top_k: int,
+    metadata_filter: Optional[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Top-k per query vector in one statement, deduplicated to each article's best match."""
+    where_clause, params = _vector_filter_sql(metadata_filter)
+    params["limit"] = top_k
+
+    values = []
+    for i, embedding in enumerate(query_embeddings):
+        params[f"q{i}"] = '[' + ','.join(str(x) for x in embedding) + ']'
+        values.append(f"({i}, CAST(:q{i} AS vector))")
+
+    # One HNSW scan per query vector (LATERAL), then DISTINCT ON keeps each
+    # article's closest query
+    stmt = text(f"""
+        SELECT * FROM (
+            SELECT DISTINCT ON (hit.uri)
+                hit.uri AS id,
+                q.query_index,
+                hit.score,
+                hit.title,
+                hit.news_source,
+                hit.category,
+                hit.future_signal,
+                hit.sentiment,
+                hit.time_to_impact,
+                hit.topic,
+                hit.publication_date,
+                hit.tags,
+                hit.summary
+            FROM (VALUES {", ".join(values)}) AS q(query_index, query_vector)
+            CROSS JOIN LATERAL (
+                SELECT
+                    uri, title, news_source, category, future_signal, sentiment,
+                    time_to_impact, topic, publication_date, tags, summary,
+                    (embedding <=> q.query_vector) AS score
+                FROM articles
+                WHERE {where_clause}
+                ORDER BY embedding <=> q.query_vector
+                LIMIT :limit
+            ) AS hit
+            ORDER BY hit.uri, hit.score
+        ) AS best
+        ORDER BY score
+    """)
+
+    db = get_database_instance()
+    conn = db._temp_get_connection()
+    try:
+        # The HNSW index never returns more than ef_search rows per scan
+        conn.execute(text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                     {"ef_search": str(max(top_k, 40))})
+        rows = conn.execute(stmt, params).mappings().all()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    docs = []
+    for row in rows:
+        docs.append({
+            "id": row["id"],
+            "score": float(row["score"]),
+            "query": queries[row["query_index"]],
+            "metadata": {
+                "title": row.get("title"),
+                "news_source": row.get("news_source"),
+                "category": row.get("category"),
+                "future_signal": row.get("future_signal"),
+                "sentiment": row.get("sentiment"),
+                "time_to_impact": row.get("time_to_impact"),
+                "topic": row.get("topic"),
+                "publication_date": row.get("publication_date"),
+                "tags": row.get("tags"),
+                "summary": row.get("summary"),
+                "uri": row["id"],
+            }
+        })
+    return docs
+
+
+def multi_query_search_articles(
+    queries: List[str],
+    top_k: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Semantic search for several phrasings of a question at once.
+
+    All queries are embedded in one API request and searched in one SQL
+    statement. Each article appears once, under the query it is closest to.
+
+    Args:
+        queries: Query texts
+        top_k: Results per query, before deduplication
+        metadata_filter: Optional filters, applied in SQL (see _vector_filter_sql),
+            e.g. {"publication_date": {"$gte": "2026-03-01", "$lt": "2026-04-01"}}
+
+    Returns:
+        List of dicts with id, score (cosine distance), query and metadata,
+        closest first
+    """
+    # Empty texts are not embedded, so drop them to keep vectors aligned
+    queries = [query for query in queries if query and query.strip()]
+    if not queries:
+        return []
+    logger.info("Multi-query vector search: %d queries, top_k=%d, filters=%s", len(queries), top_k, metadata_filter)
+
+    try:
+        embeddings = _embed_texts(queries, strict=True)
+        docs = _multi_query_search(queries, embeddings, top_k, metadata_filter)
+        logger.info("Multi-query vector search returned %d results", len(docs))
+        return docs
+    except Exception as exc:
+        logger.error("Multi-query vector search failed for %s: %s", queries, exc)
+        return []
+
+
+async def multi_query_search_articles_async(
+    queries: List[str],
+    top_k: int = 10,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Async multi_query_search_articles; the embedding request does not block the event loop."""
+    # Empty texts are not embedded, so drop them to keep vectors aligned
+    queries = [query for query in queries if query and query.strip()]
+    if not queries:
+        return []
+    logger.info("Async multi-query vector search: %d queries, top_k=%d, filters=%s", len(queries), top_k, metadata_filter)
+
+    try:
+        embeddings = await _embed_texts_async(queries, strict=True)
+        loop = asyncio.get_running_loop()
+        docs = await loop.run_in_executor(
+            None, _multi_query_search, queries, embeddings, top_k, metadata_filter
+        )
+        logger.info("Async multi-query vector search returned %d results", len(docs))
+        return docs
+    except Exception as exc:
+        logger.error("Async multi-query vector search failed for %s: %s", queries, exc)
+        return []
+
+
 def similar_articles(uri: str, top_k: int = 5) -> List[Dict[str, Any]]:
     """Find articles similar to the given URI.
 
@@ -613,88 +1088,146 @@ async def similar_articles_async(uri: str, top_k: int = 5) -> List[Dict[str, Any
         return await loop.run_in_executor(None, similar_articles, uri, top_k)
 
 
+# Metadata columns returned with each vector by get_vectors_by_metadata
+VECTOR_METADATA_FIELDS = (
+    "title", "summary", "news_source", "publication_date", "category",
+    "sentiment", "future_signal", "driver_type", "time_to_impact", "topic", "tags",
+)
+
+# Rows per round-trip when streaming vectors through a server-side cursor
+VECTOR_FETCH_BATCH = 2000
+
+_VECTOR_RANGE_OPERATORS = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def _vector_filter_sql(where: Optional[Dict[str, Any]]):
+    """Translate a metadata filter into SQL conditions and bind parameters.
+
+    Supports ``{"field": value}`` and ``{"field": {"$op": value, ...}}`` with
+    $in, $eq, $ne, $gt, $gte, $lt and $lte (several operators on one field
+    are ANDed, e.g. a publication_date range). Only article metadata columns
+    (and ``uri``) may be filtered on.
+    """
+    clauses = ["embedding IS NOT NULL"]
+    params: Dict[str, Any] = {}
+
+    for field, value in (where or {}).items():
+        if field != "uri" and field not in VECTOR_METADATA_FIELDS:
+            raise ValueError(f"Unsupported vector filter field: {field}")
+
+        operators = value if isinstance(value, dict) else {"$eq": value}
+        if not operators:
+            raise ValueError(f"Empty vector filter for {field}")
+
+        for op, operand in operators.items():
+            param = f"f{len(params)}"
+            if op == "$in":
+                clauses.append(f"{field} = ANY(:{param})")
+                operand = list(operand)
+            elif op == "$eq":
+                clauses.append(f"{field} = :{param}")
+            elif op == "$ne":
+                clauses.append(f"{field} IS DISTINCT FROM :{param}")
+            elif op in _VECTOR_RANGE_OPERATORS:
+                clauses.append(f"{field} {_VECTOR_RANGE_OPERATORS[op]} :{param}")
+            else:
+                raise ValueError(f"Unsupported vector filter operator for {field}: {op}")
+            params[param] = operand
+
+    return " AND ".join(clauses), params
+
+
+def _decode_vector(buf, out) -> int:
+    """Copy a pgvector binary value (``vector_send``) into the float32 row ``out``.
+
+    The wire format is a big-endian int16 dimension, an unused int16 and
+    ``dim`` big-endian float32 values. Returns the dimension.
+    """
+    import numpy as np
+
+    dim = int.from_bytes(buf[:2], "big")
+    out[:] = np.frombuffer(buf, dtype=">f4", count=dim, offset=4)
+    return dim
+
+
 def get_vectors_by_metadata(
     limit: Optional[int] = None,
-    where: Optional[Dict[str, Any]] = None
+    where: Optional[Dict[str, Any]] = None,
+    newest_first: bool = False
 ):
     """Fetch vectors and metadata based on a filter.
 
+    Embeddings are transferred in pgvector's binary format and copied
+    straight into float32 blocks, one per fetched partition, so no per-row
+    text parsing happens. Filters are evaluated in SQL and rows are streamed
+    through a server-side cursor on a dedicated connection, leaving the
+    shared facade connection's execution options untouched.
+
     Args:
         limit: Maximum number of results to fetch
-        where: Metadata filter dictionary (e.g., {"topic": "AI"})
+        where: Metadata filter dictionary (e.g., {"topic": "AI"} or
+            {"uri": {"$in": [...]}})
+        newest_first: Order by submission date, newest first, so a limited
+            fetch returns the same rows on every call
 
     Returns:
         Tuple of (vectors_array, metadatas_list, ids_list)
     """
     import numpy as np
 
-    conn = None
     try:
-        db = get_database_instance()
-        conn = db._temp_get_connection()
-
-        # Build WHERE clause
-        where_clauses = ["embedding IS NOT NULL"]
-        params = {}
-
-        if where:
-            for key, value in where.items():
-                where_clauses.append(f"{key} = :{key}")
-                params[key] = value
-
+        where_clause, params = _vector_filter_sql(where)
+        order_clause = "ORDER BY submission_date DESC NULLS LAST, uri" if newest_first else ""
+        limit_clause = ""
         if limit:
+            limit_clause = "LIMIT :limit"
             params["limit"] = limit
 
-        where_clause = " AND ".join(where_clauses)
-        limit_clause = "LIMIT :limit" if limit else ""
-
         stmt = text(f"""
             SELECT
                 uri,
-                embedding,
-                title,
-                topic,
-                category,
-                news_source
+                vector_send(embedding) AS embedding,
+                {", ".join(VECTOR_METADATA_FIELDS)}
             FROM articles
             WHERE {where_clause}
+            {order_clause}
             {limit_clause}
         """)
 
-        result = conn.execute(stmt, params)
-
-        vectors = []
+        blocks = []
         metadatas = []
         ids = []
-
-        for row in result.mappings():
-            # Parse embedding from database format
-            embedding = row["embedding"]
-            if embedding:
-                # pgvector returns embeddings as strings like '[0.1,0.2,...]'
-                if isinstance(embedding, str):
-                    embedding = [float(x) for x in embedding.strip('[]').split(',')]
-                vectors.append(embedding)
-                metadatas.append({
-                    "title": row.get("title"),
-                    "topic": row.get("topic"),
-                    "category": row.get("category"),
-                    "news_source": row.get("news_source"),
-                })
-                ids.append(row["uri"])
-
-        vectors_array = np.array(vectors, dtype=np.float32) if vectors else np.empty((0, 0), dtype=np.float32)
-        return vectors_array, metadatas, ids
+        dim = None
+
+        engine = get_database_instance()._temp_get_connection().engine
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=VECTOR_FETCH_BATCH).execute(stmt, params)
+            for partition in result.mappings().partitions():
+                if dim is None:
+                    dim = int.from_bytes(bytes(partition[0]["embedding"])[:2], "big")
+                block = np.empty((len(partition), dim), dtype=np.float32)
+                n = 0
+                for row in partition:
+                    buf = bytes(row["embedding"])
+                    row_dim = int.from_bytes(buf[:2], "big")
+                    if row_dim != dim:
+                        logger.warning("Skipping %s: embedding has %d dimensions, expected %d", row["uri"], row_dim, dim)
+                        continue
+                    _decode_vector(buf, block[n])
+                    metadatas.append({field: row[field] for field in VECTOR_METADATA_FIELDS})
+                    ids.append(row["uri"])
+                    n += 1
+                blocks.append(block[:n])
+
+        if not ids:
+            return np.empty((0, 0), dtype=np.float32), [], []
+
+        vectors = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+        logger.debug("get_vectors_by_metadata: fetched %d vectors (%d dims)", len(ids), dim)
+        return vectors, metadatas, ids
 
     except Exception as exc:
         logger.error("get_vectors_by_metadata failed: %s", exc)
-        # CRITICAL FIX: Rollback any failed transaction
-        if conn is not None:
-            try:
-                conn.rollback()
-                logger.debug("Rolled back failed get_vectors_by_metadata transaction")
-            except Exception as rollback_error:
-                logger.error("Rollback failed for get_vectors_by_metadata: %s", rollback_error)
         return np.empty((0, 0), dtype=np.float32), [], []
 
 
@@ -876,6 +1409,10 @@ def check_pgvector_health() -> Dict[str, Any]:
         health_status["healthy"] = True
         logger.info("pgvector health check passed")
 
+        cache = get_embedding_cache()
+        if cache:
+            health_status["embedding_cache"] = cache.get_stats()
+
     except Exception as exc:
         health_status["error"] = str(exc)
         logger.error(f"pgvector health check failed: {exc}")
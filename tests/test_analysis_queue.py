@@ -0,0 +1,184 @@
+"""
+Tests for the database-backed, priority-ordered analysis job queue.
+"""
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, text, update
+
+from app.database_models import t_analysis_job_items
+from app.database_query_facade import DatabaseQueryFacade
+from app.services.analysis_queue import (
+    PRIORITY_BACKFILL,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SCHEDULED,
+    AnalysisQueue,
+    AnalysisTask,
+)
+
+
+@pytest.fixture
+def db():
+    connection = create_engine("sqlite://").connect()
+    t_analysis_job_items.create(connection)
+    connection.execute(text("""
+        CREATE TABLE background_tasks (
+            id TEXT PRIMARY KEY, name TEXT, status TEXT, created_at TIMESTAMP,
+            started_at TIMESTAMP, completed_at TIMESTAMP, progress REAL,
+            total_items INTEGER, processed_items INTEGER, current_item TEXT,
+            result TEXT, error TEXT, metadata TEXT
+        )
+    """))
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    database.facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+    yield database
+    connection.close()
+
+
+def _tasks(*urls):
+    return [AnalysisTask(url=url, topic="AI") for url in urls]
+
+
+def _queue(db, handler=None, **kwargs):
+    return AnalysisQueue(max_concurrent=0, db=db, handler=handler, poll_interval=0.01, **kwargs)
+
+
+def test_interactive_items_are_claimed_before_backfill(db):
+    queue = _queue(db)
+    queue.enqueue("bulk", _tasks("http://a.com", "http://b.com"), PRIORITY_BACKFILL)
+    queue.enqueue("nightly", _tasks("http://c.com"), PRIORITY_SCHEDULED)
+    queue.enqueue("single", _tasks("http://d.com"), PRIORITY_INTERACTIVE)
+
+    claimed = [db.facade.claim_analysis_job_items("w1", 1, 60)[0]["url"] for _ in range(4)]
+
+    assert claimed == ["http://d.com", "http://c.com", "http://a.com", "http://b.com"]
+    assert db.facade.claim_analysis_job_items("w1", 1, 60) == []
+
+
+def test_expired_leases_are_reclaimed_and_old_owner_cannot_finish(db):
+    queue = _queue(db)
+    queue.enqueue("job", _tasks("http://a.com"))
+    item = db.facade.claim_analysis_job_items("crashed-worker", 1, 60)[0]
+    assert db.facade.claim_analysis_job_items("w2", 1, 60) == []
+
+    # Simulate the first worker dying: its lease runs out
+    db._temp_get_connection().execute(
+        update(t_analysis_job_items).values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+
+    reclaimed = db.facade.claim_analysis_job_items("w2", 1, 60)
+    assert [r["id"] for r in reclaimed] == [item["id"]]
+    assert reclaimed[0]["attempts"] == 2
+    assert db.facade.finish_analysis_job_item(item["id"], "crashed-worker", "completed") is False
+    assert db.facade.finish_analysis_job_item(item["id"], "w2", "completed") is True
+    assert db.facade.get_analysis_job_counts("job") == {"completed": 1}
+
+
+def test_failing_items_are_retried_until_max_attempts(db):
+    handler = Mock(side_effect=RuntimeError("fetch failed"))
+
+    async def failing(item):
+        return handler(item)
+
+    queue = _queue(db, failing, max_attempts=2, retry_backoff_seconds=0)
+    queue.enqueue("job", _tasks("http://a.com"))
+
+    async def drain():
+        while await queue.run_once():
+            pass
+
+    asyncio.run(drain())
+
+    assert handler.call_count == 2
+    [result] = queue.get_results("job")
+    assert result["status"] == "failed"
+    assert result["error"] == "fetch failed"
+    assert result["attempts"] == 2
+
+
+def test_retries_wait_for_their_backoff(db):
+    async def failing(item):
+        raise RuntimeError("fetch failed")
+
+    queue = _queue(db, failing, max_attempts=3, retry_backoff_seconds=60)
+    queue.enqueue("job", _tasks("http://a.com"))
+
+    assert asyncio.run(queue.run_once()) is True
+    # Requeued, but not claimable until its backoff has passed
+    assert db.facade.get_analysis_job_counts("job") == {"queued": 1}
+    assert asyncio.run(queue.run_once()) is False
+
+    db._temp_get_connection().execute(
+        update(t_analysis_job_items).values(not_before=datetime.utcnow() - timedelta(seconds=1))
+    )
+    assert [r["attempts"] for r in db.facade.claim_analysis_job_items("w1", 1, 60)] == [2]
+
+
+def test_expired_lease_on_last_attempt_fails_the_item(db):
+    queue = _queue(db, max_attempts=1)
+    queue.enqueue("job", _tasks("http://a.com"))
+    db.facade.claim_analysis_job_items("crashed-worker", 1, 60)
+    db._temp_get_connection().execute(
+        update(t_analysis_job_items).values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+
+    assert db.facade.claim_analysis_job_items("w2", 1, 60) == []
+    assert asyncio.run(queue.run_once()) is False
+    [result] = queue.get_results("job")
+    assert result["status"] == "failed"
+    assert result["attempts"] == 1
+
+
+def test_workers_complete_job_and_background_task_row(db):
+    db._temp_get_connection().execute(text(
+        "INSERT INTO background_tasks (id, name, status, processed_items, progress) "
+        "VALUES ('job-1', 'Bulk Analysis', 'running', 0, 0)"
+    ))
+
+    async def handler(item):
+        if item["url"] == "http://bad.com":
+            raise ValueError("unparseable")
+        return {"uri": item["url"]}
+
+    queue = AnalysisQueue(max_concurrent=2, db=db, handler=handler, poll_interval=0.01, max_attempts=1)
+    queue.enqueue("job-2", _tasks("http://other.com"))
+
+    async def run():
+        job_id = await queue.add_tasks(_tasks("http://a.com", "http://b.com", "http://bad.com"), job_id="job-1")
+        try:
+            return await queue.wait_completion(job_id, timeout=5)
+        finally:
+            await queue.stop_workers()
+
+    results = asyncio.run(run())
+
+    assert [r["success"] for r in results] == [True, True, False]
+    assert results[0]["result"]["uri"] == "http://a.com"
+    assert db.facade.get_analysis_job_counts("job-1") == {"completed": 2, "failed": 1}
+
+    row = db._temp_get_connection().execute(text(
+        "SELECT status, processed_items, progress, result FROM background_tasks WHERE id = 'job-1'"
+    )).fetchone()
+    assert row[0] == "completed"
+    assert row[1] == 3
+    assert row[2] == pytest.approx(100.0)
+    assert json.loads(row[3]) == {"analyzed_count": 2, "error_count": 1, "cancelled_count": 0}
+
+
+def test_cancel_job_only_cancels_unclaimed_items(db):
+    queue = _queue(db)
+    queue.enqueue("job", _tasks("http://a.com", "http://b.com", "http://c.com"))
+    db.facade.claim_analysis_job_items("w1", 1, 60)
+
+    assert queue.cancel_job("job") == 2
+    progress = queue.get_progress("job")
+    assert progress["counts"] == {"leased": 1, "cancelled": 2}
+    assert progress["remaining"] == 1
+    assert db.facade.has_pending_analysis_job_items() is True
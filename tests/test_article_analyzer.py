@@ -1,8 +1,13 @@
 from unittest.mock import Mock, patch
 import pytest
 import json
+import logging
 import os
+from sqlalchemy import create_engine
 from app.analyzers.article_analyzer import ArticleAnalyzer, ArticleAnalyzerError
+from app.analyzers.cache import AnalysisCache
+from app.database_models import t_article_analysis_cache
+from app.database_query_facade import DatabaseQueryFacade
 from app.analyzers.prompt_templates import PromptTemplates, PromptTemplateError
 
 @pytest.fixture
@@ -32,12 +37,25 @@ def custom_templates_file(tmp_path, custom_templates):
     return str(file_path)
 
 @pytest.fixture
-def analyzer(mock_ai_model):
-    return ArticleAnalyzer(mock_ai_model)
+def analysis_cache():
+    # In-memory table so cache tests never touch the application database
+    connection = create_engine("sqlite://").connect()
+    t_article_analysis_cache.create(connection)
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    database.facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+    yield AnalysisCache(db=database)
+    connection.close()
+
+@pytest.fixture
+def analyzer(mock_ai_model, analysis_cache):
+    return ArticleAnalyzer(mock_ai_model, cache=analysis_cache)
 
 @pytest.fixture
-def analyzer_with_custom_templates(mock_ai_model, custom_templates_file):
-    return ArticleAnalyzer(mock_ai_model, custom_templates_file)
+def analyzer_with_custom_templates(mock_ai_model, custom_templates_file, analysis_cache):
+    return ArticleAnalyzer(mock_ai_model, custom_templates_file, cache=analysis_cache)
 
 def test_init_without_model():
     with pytest.raises(ArticleAnalyzerError, match="AI model is required"):
@@ -480,13 +498,13 @@ def test_cache_operations(analyzer, mock_ai_model, sample_analysis):
     
     # Get cache stats
     stats = analyzer.get_cache_stats()
-    assert stats["total_files"] == 1
+    assert stats["total_entries"] == 1
     assert stats["total_size_bytes"] > 0
     
     # Clear cache
     analyzer.clear_cache()
     stats = analyzer.get_cache_stats()
-    assert stats["total_files"] == 0
+    assert stats["total_entries"] == 0
     
     # Analyze again to repopulate cache
     analyzer.analyze_content(**params)
@@ -0,0 +1,94 @@
+"""
+Tests for canonical-URL and near-duplicate article deduplication.
+"""
+import pytest
+
+from app.utils.article_dedup import MinHasher, canonical_url, deduplicate_articles, title_shingles
+
+
+PRIORITY = {"newsapi": 5, "thenewsapi": 4, "newsdata": 3, "arxiv": 1}
+
+
+@pytest.mark.parametrize("variant", [
+    "https://www.example.com/news/story",
+    "http://example.com/news/story/",
+    "https://example.com/news/story?utm_source=x&utm_medium=rss",
+    "https://m.example.com/news/story#comments",
+    "https://example.com/amp/news/story",
+    "https://example.com/news/story/amp/",
+    "https://example.com:443/news/story?fbclid=abc",
+    "example.com/news/story",
+])
+def test_canonical_url_variants_share_a_key(variant):
+    assert canonical_url(variant) == "example.com/news/story"
+
+
+def test_canonical_url_keeps_content_parameters():
+    assert canonical_url("https://example.com/view?id=2&utm_campaign=x&page=1") == \
+        "example.com/view?id=2&page=1"
+    assert canonical_url("https://example.com/story.amp.html") == "example.com/story.html"
+    assert canonical_url("https://example.com:8080/a") == "example.com:8080/a"
+    assert canonical_url("") == ""
+
+
+def _article(url, provider, title="Title"):
+    return {"url": url, "collector_source": provider, "title": title}
+
+
+def test_higher_priority_provider_replaces_in_place():
+    articles = [
+        _article("https://a.com/1", "newsdata"),
+        _article("https://b.com/2", "newsdata"),
+        _article("http://www.a.com/1/?utm_source=feed", "newsapi"),
+        _article("https://a.com/1", "arxiv"),
+    ]
+
+    unique, stats = deduplicate_articles(articles, PRIORITY)
+
+    assert [(a["url"], a["collector_source"]) for a in unique] == [
+        ("http://www.a.com/1/?utm_source=feed", "newsapi"),
+        ("https://b.com/2", "newsdata"),
+    ]
+    assert stats["url_duplicates"] == 2
+    assert stats["providers"]["newsdata"]["url_duplicates"] == 1
+    assert stats["providers"]["newsapi"]["overlap"] == {"newsdata": 1, "arxiv": 1}
+    assert stats["providers"]["newsapi"]["kept"] == 1
+
+
+def test_articles_without_url_are_dropped():
+    unique, stats = deduplicate_articles([_article("", "newsapi"), _article("  ", "newsapi")])
+
+    assert unique == []
+    assert stats["missing_url"] == 2
+
+
+def test_minhash_similarity_tracks_jaccard():
+    hasher = MinHasher()
+    first = title_shingles("Fed raises interest rates by a quarter point")
+    second = title_shingles("Fed raises interest rates by a quarter point - Reuters")
+    other = title_shingles("New telescope images reveal distant galaxies")
+
+    assert hasher.similarity(hasher.signature(first), hasher.signature(first)) == 1.0
+    assert hasher.similarity(hasher.signature(first), hasher.signature(second)) > 0.6
+    assert hasher.similarity(hasher.signature(first), hasher.signature(other)) < 0.2
+
+
+def test_near_duplicate_titles_merged_across_providers_only():
+    title = "Central bank raises interest rates to curb inflation"
+    articles = [
+        _article("https://wire.com/a", "newsdata", title),
+        _article("https://paper.com/b", "newsapi", title + "!"),
+        _article("https://wire.com/c", "newsdata", title),
+        _article("https://other.com/d", "thenewsapi", "Completely unrelated story about football"),
+    ]
+
+    unique, stats = deduplicate_articles(articles, PRIORITY, near_duplicates=True)
+
+    # newsapi wins the first pair; the second newsdata copy also matches it
+    assert [a["url"] for a in unique] == ["https://paper.com/b", "https://other.com/d"]
+    assert stats["near_duplicates"] == 2
+    assert stats["providers"]["newsdata"]["near_duplicates"] == 2
+
+    same_provider = [_article("https://x.com/1", "newsdata", title), _article("https://x.com/2", "newsdata", title)]
+    unique, _ = deduplicate_articles(same_provider, PRIORITY, near_duplicates=True)
+    assert len(unique) == 2
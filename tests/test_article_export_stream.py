@@ -0,0 +1,94 @@
+"""
+Tests for the streaming article export and batched NDJSON import.
+"""
+import gzip
+import json
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.routes.database import (
+    ARTICLE_EXPORT_FIELDS,
+    _gzip_chunks,
+    _import_article_batch,
+    _iter_article_export,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    columns = ", ".join(f"{field} TEXT" for field in ARTICLE_EXPORT_FIELDS)
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE TABLE articles (uri TEXT PRIMARY KEY, submission_date TEXT, {columns})"))
+        conn.execute(text(
+            "CREATE TABLE raw_articles (uri TEXT PRIMARY KEY, raw_markdown TEXT, topic TEXT, "
+            "submission_date TEXT, last_updated TEXT)"
+        ))
+        for i, topic in enumerate(["AI", "AI", "Climate"]):
+            conn.execute(
+                text("INSERT INTO articles (uri, submission_date, publication_date, title, topic) "
+                     "VALUES (:uri, :date, :date, :title, :topic)"),
+                {"uri": f"https://example.com/{i}", "date": f"2024-01-0{i + 1}", "title": f"t{i}", "topic": topic},
+            )
+
+    database = Mock()
+    database._temp_get_connection.return_value = engine.connect()
+    return database
+
+
+def test_json_export_keeps_legacy_shape(db):
+    document = json.loads("".join(_iter_article_export(db, "enriched", "json", None, None, None)))
+
+    assert document["export_type"] == "enriched"
+    assert document["total_articles"] == 3
+    assert [a["uri"] for a in document["articles"]][0] == "https://example.com/2"
+
+
+def test_ndjson_export_applies_filters(db):
+    lines = "".join(_iter_article_export(db, "raw", "ndjson", "AI", "2024-01-02", None)).splitlines()
+
+    assert [json.loads(line)["uri"] for line in lines] == ["https://example.com/1"]
+    assert "raw_markdown" in json.loads(lines[0])
+
+
+def test_gzip_chunks_round_trip():
+    compressed = b"".join(_gzip_chunks(iter(["a\n", "b\n"])))
+    assert gzip.decompress(compressed) == b"a\nb\n"
+
+
+def test_import_batch_inserts_and_skips(db):
+    conn = db._temp_get_connection()
+    conn.commit()
+    stats = {"total_records": 0, "imported": 0, "updated": 0, "skipped": 0, "failed": 0, "errors": []}
+    batch = [
+        {"uri": "https://example.com/0", "title": "dup"},
+        {"uri": "https://example.com/new", "title": "new", "raw_markdown": "# new"},
+        {"title": "no uri"},
+    ]
+
+    _import_article_batch(conn, batch, 0, stats, skip_duplicates=True, update_existing=False)
+
+    assert (stats["imported"], stats["skipped"], stats["failed"]) == (1, 1, 1)
+    assert conn.execute(text("SELECT raw_markdown FROM raw_articles")).scalar() == "# new"
+
+
+def test_failing_record_is_rolled_back_alone(db):
+    conn = db._temp_get_connection()
+    conn.execute(text("INSERT INTO raw_articles (uri, raw_markdown) VALUES ('https://example.com/bad', 'old')"))
+    conn.commit()
+    stats = {"total_records": 0, "imported": 0, "updated": 0, "skipped": 0, "failed": 0, "errors": []}
+    batch = [
+        {"uri": "https://example.com/a", "title": "a"},
+        # The article insert succeeds, the raw_articles insert hits the primary key
+        {"uri": "https://example.com/bad", "title": "bad", "raw_markdown": "# bad"},
+        {"uri": "https://example.com/b", "title": "b"},
+    ]
+
+    _import_article_batch(conn, batch, 0, stats, skip_duplicates=True, update_existing=False)
+
+    assert (stats["imported"], stats["failed"]) == (2, 1)
+    assert stats["errors"][0].startswith("Record 2 (URI: https://example.com/bad)")
+    uris = conn.execute(text("SELECT uri FROM articles WHERE title IN ('a', 'bad', 'b') ORDER BY uri")).scalars().all()
+    assert uris == ["https://example.com/a", "https://example.com/b"]
@@ -0,0 +1,89 @@
+"""
+Tests for full-text keyword search over articles.
+"""
+import logging
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.dialects import postgresql
+
+from app.database_models import t_articles
+from app.database_query_facade import DatabaseQueryFacade
+
+
+def _facade(db_type, connection=None):
+    database = Mock(db_type=db_type)
+    database._temp_get_connection.return_value = connection
+    return DatabaseQueryFacade(database, logging.getLogger(__name__))
+
+
+@pytest.fixture
+def facade():
+    connection = create_engine("sqlite://").connect()
+    t_articles.create(connection)
+    connection.execute(insert(t_articles), [
+        {"uri": "a", "title": "Autonomous agents in the enterprise", "summary": "Agent platforms",
+         "topic": "AI", "submission_date": "2026-03-01"},
+        {"uri": "b", "title": "Chip exports", "summary": "A note on agents",
+         "topic": "AI", "submission_date": "2026-03-03"},
+        {"uri": "c", "title": "Quarterly results", "summary": "Nothing relevant",
+         "topic": "AI", "submission_date": "2026-03-02", "tags": "earnings"},
+    ])
+    connection.commit()
+    yield _facade("sqlite", connection)
+    connection.close()
+
+
+def test_keyword_search_uses_fts_with_stemming_and_relevance(facade):
+    rows, total = facade.search_articles(keyword="agent", projection="list")
+    assert total == 2
+    assert [row["uri"] for row in rows] == ["b", "a"]
+
+    rows, _ = facade.search_articles(keyword="agent", projection="list", sort="relevance")
+    assert [row["uri"] for row in rows] == ["a", "b"]
+
+    rows, total = facade.search_articles(keyword='earnings "OR" x', projection="list")
+    assert total == 0
+
+
+def test_fts_index_follows_inserts_and_updates(facade):
+    facade.search_articles(keyword="agent")
+
+    connection = facade.db._temp_get_connection()
+    connection.execute(insert(t_articles).values(uri="d", title="Robotics", topic="AI"))
+    connection.execute(update(t_articles).where(t_articles.c.uri == "c").values(title="Agents report"))
+    connection.commit()
+
+    rows, _ = facade.search_articles(keyword="robotics")
+    assert [row["uri"] for row in rows] == ["d"]
+    rows, _ = facade.search_articles(keyword="agents")
+    assert {row["uri"] for row in rows} == {"a", "b", "c"}
+
+
+def test_postgres_search_uses_search_vector():
+    facade = _facade("postgresql")
+    facade._article_fts_ready = True
+    facade._execute_with_rollback = Mock(return_value=Mock(scalar=Mock(return_value=3)))
+
+    condition, rank = facade._article_text_search("openai agents")
+    sql = str(select(t_articles.c.uri).where(condition).order_by(rank.desc()).compile(dialect=postgresql.dialect()))
+
+    assert "articles.search_vector @@ websearch_to_tsquery('english', %(fts_query)s" in sql
+    assert "ts_rank(articles.search_vector" in sql
+
+
+def test_queries_without_indexable_terms_fall_back_to_like(facade):
+    assert facade._article_text_search("--") is None
+
+    connection = facade.db._temp_get_connection()
+    connection.execute(insert(t_articles).values(uri="d", title="C++ -- a retrospective", topic="AI"))
+    connection.commit()
+    rows, _ = facade.search_articles(keyword="--", projection="list")
+    assert [row["uri"] for row in rows] == ["d"]
+
+    postgres = _facade("postgresql")
+    postgres._article_fts_ready = True
+    # websearch_to_tsquery('english', 'the and') has no nodes left
+    postgres._execute_with_rollback = Mock(return_value=Mock(scalar=Mock(return_value=0)))
+    assert postgres._article_text_search("the and") is None
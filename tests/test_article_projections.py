@@ -0,0 +1,53 @@
+"""
+Tests for named article column projections.
+"""
+import logging
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects import postgresql
+
+from app.database_models import ARTICLE_PROJECTIONS, article_columns, t_articles
+from app.database_query_facade import DatabaseQueryFacade
+
+
+@pytest.fixture
+def db():
+    connection = create_engine("sqlite://").connect()
+    t_articles.create(connection)
+    connection.execute(insert(t_articles), [
+        {"uri": f"https://example.com/{n}", "title": f"Article {n}", "topic": "AI",
+         "submission_date": f"2026-03-0{n + 1}", "sentiment_explanation": "long text"}
+        for n in range(3)
+    ])
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    database.facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+    yield database
+    connection.close()
+
+
+def test_only_with_embedding_reads_the_vector():
+    for name in ("list", "analysis", "export"):
+        sql = str(select(*article_columns(name)).compile(dialect=postgresql.dialect()))
+        assert "embedding" not in sql
+
+    sql = str(select(*article_columns("with_embedding")).compile(dialect=postgresql.dialect()))
+    assert "articles.embedding AS embedding" in sql
+
+    with pytest.raises(ValueError):
+        article_columns("everything")
+
+
+def test_search_articles_returns_the_requested_projection(db):
+    rows, total = db.facade.search_articles(topic="AI", per_page=2, projection="list")
+
+    assert total == 3
+    assert [row["uri"] for row in rows] == ["https://example.com/2", "https://example.com/1"]
+    assert set(rows[0]) == set(ARTICLE_PROJECTIONS["list"])
+
+    rows, _ = db.facade.search_articles(topic="AI", per_page=1)
+    assert rows[0]["sentiment_explanation"] == "long text"
@@ -1,16 +1,29 @@
 import pytest
-import os
-import json
-from datetime import datetime, timedelta
+import logging
+from unittest.mock import Mock
+from sqlalchemy import create_engine, func, select
 from app.analyzers.cache import AnalysisCache, CacheError
+from app.database import Database
+from app.database_models import t_article_analysis_cache
+from app.database_query_facade import DatabaseQueryFacade
+
+MODEL = {"name": "gpt-4o", "provider": "openai"}
 
 @pytest.fixture
-def cache_dir(tmp_path):
-    return str(tmp_path / "test_cache")
+def db():
+    connection = create_engine("sqlite://").connect()
+    t_article_analysis_cache.create(connection)
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    database.facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+    yield database
+    connection.close()
 
 @pytest.fixture
-def cache(cache_dir):
-    return AnalysisCache(cache_dir=cache_dir, ttl_hours=24)
+def cache(db):
+    return AnalysisCache(db=db, ttl_hours=24)
 
 @pytest.fixture
 def sample_analysis():
@@ -20,161 +33,121 @@ def sample_analysis():
         "category": "Test Category"
     }
 
-def test_cache_initialization(cache_dir):
-    # Test normal initialization
-    cache = AnalysisCache(cache_dir)
-    assert os.path.exists(cache_dir)
-
-    # Test initialization with existing directory
-    cache = AnalysisCache(cache_dir)
-    assert os.path.exists(cache_dir)
+def _row_count(db):
+    return db._temp_get_connection().execute(select(func.count()).select_from(t_article_analysis_cache)).scalar()
 
 def test_cache_set_get(cache, sample_analysis):
     uri = "http://test.com"
     content_hash = "test_hash"
 
-    # Test setting cache
-    cache.set(uri, content_hash, sample_analysis)
-    
-    # Test getting cache
-    cached = cache.get(uri, content_hash)
-    assert cached == sample_analysis
+    cache.set(uri, content_hash, sample_analysis, MODEL, "tmpl1")
+    assert cache.get(uri, content_hash, MODEL, "tmpl1") == sample_analysis
+
+    # Re-setting the same key replaces the row
+    cache.set(uri, content_hash, {"title": "New"}, MODEL, "tmpl1")
+    assert cache.get(uri, content_hash, MODEL, "tmpl1") == {"title": "New"}
 
-    # Test getting non-existent cache
     assert cache.get("nonexistent", "hash") is None
 
-def test_cache_expiration(cache_dir, sample_analysis):
-    # Create cache with short TTL
-    cache = AnalysisCache(cache_dir, ttl_hours=0.001)  # ~3.6 seconds
-    uri = "http://test.com"
-    content_hash = "test_hash"
+def test_cache_key_includes_model_and_template(cache, sample_analysis):
+    cache.set("http://test.com", "hash", sample_analysis, MODEL, "tmpl1")
 
-    # Set cache
-    cache.set(uri, content_hash, sample_analysis)
-    
-    # Verify cache exists
-    assert cache.get(uri, content_hash) == sample_analysis
-    
-    # Wait for cache to expire
-    import time
-    time.sleep(4)
-    
-    # Verify cache is expired
-    assert cache.get(uri, content_hash) is None
-
-def test_cache_delete(cache, sample_analysis):
-    uri = "http://test.com"
-    content_hash = "test_hash"
+    assert cache.get("http://test.com", "hash", {"name": "other-model"}, "tmpl1") is None
+    assert cache.get("http://test.com", "hash", {"name": "gpt-4o", "provider": "azure"}, "tmpl1") is None
+    assert cache.get("http://test.com", "hash", MODEL, "tmpl2") is None
+    assert cache.get("http://test.com", "other_hash", MODEL, "tmpl1") is None
 
-    # Set and verify cache
-    cache.set(uri, content_hash, sample_analysis)
-    assert cache.get(uri, content_hash) == sample_analysis
+def test_get_many_and_hit_rate(cache, sample_analysis):
+    cache.set_many({
+        ("http://test1.com", "hash1"): sample_analysis,
+        ("http://test2.com", "hash2"): {"title": "Two"},
+    }, MODEL)
 
-    # Delete cache
-    cache.delete(uri, content_hash)
-    assert cache.get(uri, content_hash) is None
+    found = cache.get_many([("http://test1.com", "hash1"), ("http://test2.com", "hash2"),
+                            ("http://test3.com", "hash3")], MODEL)
 
-    # Test deleting non-existent cache
-    cache.delete("nonexistent", "hash")  # Should not raise error
+    assert found == {("http://test1.com", "hash1"): sample_analysis, ("http://test2.com", "hash2"): {"title": "Two"}}
+    stats = cache.get_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.6667)
+    assert stats["writes"] == 2
+    assert stats["total_entries"] == 2
+    assert stats["total_size_bytes"] > 0
+    assert stats["oldest_cache"] is not None
+
+def test_cache_expiration(db, sample_analysis):
+    cache = AnalysisCache(db=db, ttl_hours=-1)  # Already expired when written
+    entries = [("http://test1.com", "hash1"), ("http://test2.com", "hash2")]
 
-def test_cache_clear(cache, sample_analysis):
-    # Set multiple cache entries
-    entries = [
-        ("http://test1.com", "hash1"),
-        ("http://test2.com", "hash2"),
-        ("http://test3.com", "hash3")
-    ]
-    
     for uri, content_hash in entries:
         cache.set(uri, content_hash, sample_analysis)
-        assert cache.get(uri, content_hash) == sample_analysis
+        assert cache.get(uri, content_hash) is None
 
-    # Clear cache
-    cache.clear()
+    assert cache.cleanup_expired() == 2
+    assert _row_count(db) == 0
 
-    # Verify all entries are cleared
-    for uri, content_hash in entries:
-        assert cache.get(uri, content_hash) is None
+def test_size_eviction_drops_least_recently_used(db, sample_analysis):
+    cache = AnalysisCache(db=db, max_entries=2)
+    for uri in ("http://a.com", "http://b.com", "http://c.com"):
+        cache.set(uri, "hash", sample_analysis)
+    cache.get("http://a.com", "hash")  # "b" is now least recently used
 
-def test_cache_stats(cache, sample_analysis):
-    # Set multiple cache entries
-    entries = [
-        ("http://test1.com", "hash1"),
-        ("http://test2.com", "hash2"),
-        ("http://test3.com", "hash3")
-    ]
-    
-    for uri, content_hash in entries:
-        cache.set(uri, content_hash, sample_analysis)
+    assert cache.evict() == 1
+    assert cache.get("http://b.com", "hash") is None
+    assert cache.get("http://a.com", "hash") == sample_analysis
+    assert cache.get_stats()["evictions"] == 1
 
-    # Get stats
-    stats = cache.get_stats()
-    
-    assert stats["total_files"] == 3
-    assert stats["total_size_bytes"] > 0
-    assert stats["oldest_cache"] is not None
-    assert stats["newest_cache"] is not None
+def test_size_eviction_trims_a_same_timestamp_batch_to_the_cap(db, sample_analysis):
+    cache = AnalysisCache(db=db, max_entries=3)
+    # One batch shares a single last_accessed_at
+    cache.set_many({(f"http://{n}.com", "hash"): sample_analysis for n in range(5)}, MODEL)
+
+    assert cache.evict() == 2
+    assert _row_count(db) == 3
+    # Ties are broken by insertion order, oldest first
+    assert cache.get("http://0.com", "hash", MODEL) is None
+    assert cache.get("http://4.com", "hash", MODEL) == sample_analysis
 
-def test_cache_cleanup_expired(cache_dir, sample_analysis):
-    # Create cache with short TTL
-    cache = AnalysisCache(cache_dir, ttl_hours=0.001)  # ~3.6 seconds
-    
-    # Set multiple cache entries
+def test_cache_delete_and_clear(cache, sample_analysis):
     entries = [
         ("http://test1.com", "hash1"),
         ("http://test2.com", "hash2"),
         ("http://test3.com", "hash3")
     ]
-    
     for uri, content_hash in entries:
         cache.set(uri, content_hash, sample_analysis)
 
-    # Wait for cache to expire
-    import time
-    time.sleep(4)
-
-    # Clean up expired entries
-    cleaned = cache.cleanup_expired()
-    assert cleaned == 3
+    cache.delete("http://test1.com", "hash1")
+    assert cache.get("http://test1.com", "hash1") is None
+    assert cache.get("http://test2.com", "hash2") == sample_analysis
+    cache.delete("nonexistent", "hash")  # Should not raise error
 
-    # Verify all entries are cleaned
+    cache.clear()
     for uri, content_hash in entries:
         assert cache.get(uri, content_hash) is None
 
-def test_cache_error_handling(cache_dir):
-    # Test invalid cache directory
-    with pytest.raises(CacheError):
-        AnalysisCache("/nonexistent/path")
-
-    cache = AnalysisCache(cache_dir)
-
-    # Test invalid JSON in cache file
-    uri = "http://test.com"
-    content_hash = "test_hash"
-    cache_path = os.path.join(cache_dir, f"{uri}_{content_hash}.json")
-    
-    os.makedirs(cache_dir, exist_ok=True)
-    with open(cache_path, 'w') as f:
-        f.write("invalid json")
-
-    assert cache.get(uri, content_hash) is None
+def test_database_saves_share_the_table(db, cache, sample_analysis):
+    cache.set("http://test.com", "hash", sample_analysis, MODEL)
 
-def test_cache_concurrent_access(cache_dir, sample_analysis):
-    # Test multiple cache instances accessing same directory
-    cache1 = AnalysisCache(cache_dir)
-    cache2 = AnalysisCache(cache_dir)
+    assert Database.save_article_analysis_cache(db, "http://test.com", "summary", "first", "gpt-4o") is True
+    assert Database.save_article_analysis_cache(db, "http://test.com", "summary", "second", "gpt-4o") is True
 
-    uri = "http://test.com"
-    content_hash = "test_hash"
+    assert _row_count(db) == 2
+    # Clearing the analyzer cache leaves other analysis types alone
+    cache.clear()
+    assert _row_count(db) == 1
+
+def test_cache_error_handling(sample_analysis):
+    database = Mock()
+    database.facade.get_analysis_cache_entries.side_effect = RuntimeError("database down")
+    database.facade.save_analysis_cache_entries.side_effect = RuntimeError("database down")
+    database.facade.get_analysis_cache_summary.return_value = {
+        "entries": 0, "total_size_bytes": 0, "oldest": None, "newest": None
+    }
+    cache = AnalysisCache(db=database)
 
-    # Set with first instance
-    cache1.set(uri, content_hash, sample_analysis)
-    
-    # Get with second instance
-    assert cache2.get(uri, content_hash) == sample_analysis
-    
-    # Delete with second instance
-    cache2.delete(uri, content_hash)
-    
-    # Verify deleted in first instance
-    assert cache1.get(uri, content_hash) is None 
\ No newline at end of file
+    assert cache.get("http://test.com", "hash") is None
+    with pytest.raises(CacheError):
+        cache.set("http://test.com", "hash", sample_analysis)
+    assert cache.get_stats()["errors"] == 2
@@ -0,0 +1,150 @@
+"""
+Tests for the shared collector transport: rate limiting, Retry-After and coalescing.
+"""
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.collectors.transport import ProviderTransport, TokenBucket, _retry_after_seconds
+
+
+class FakeResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self._body = json.dumps(body).encode()
+        self.headers = FakeHeaders(headers or {})
+        self.url = "https://api.example.com/search"
+        self.content_type = "application/json"
+        self.charset = "utf-8"
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeHeaders(dict):
+    def copy(self):
+        return FakeHeaders(self)
+
+
+class FakeSession:
+    def __init__(self, responses, delay=0.0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.calls.append(params)
+        return self._respond()
+
+    @property
+    def closed(self):
+        return False
+
+    def _respond(self):
+        session = self
+
+        class _Context:
+            async def __aenter__(self):
+                await asyncio.sleep(session.delay)
+                self.response = session.responses.pop(0)
+                return self.response
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Context()
+
+
+def _transport(session, **kwargs):
+    transport = ProviderTransport("test", **kwargs)
+
+    async def _session():
+        return session
+
+    transport._session = _session
+    return transport
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    with patch("app.collectors.transport.time.monotonic", return_value=100.0):
+        bucket = TokenBucket(rate=2, capacity=2)
+        waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(0.5), pytest.approx(1.0)]
+
+
+def test_retry_after_parsing():
+    assert _retry_after_seconds("3") == 3.0
+    assert _retry_after_seconds(None) is None
+    assert _retry_after_seconds("soon") is None
+    assert _retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_429_is_retried_after_retry_after():
+    session = FakeSession([
+        FakeResponse(429, {"message": "slow down"}, {"Retry-After": "0.05"}),
+        FakeResponse(200, {"status": "ok"}),
+    ])
+    transport = _transport(session, requests_per_second=100, burst=10)
+
+    async def run():
+        async with transport.get("https://api.example.com/search", params={"q": "ai"}) as response:
+            return response.status, await response.json()
+
+    assert asyncio.run(run()) == (200, {"status": "ok"})
+    assert len(session.calls) == 2
+    assert transport.get_stats()["retries"] == 1
+
+
+def test_gives_up_when_retry_after_is_too_long():
+    session = FakeSession([FakeResponse(429, {"message": "daily quota"}, {"Retry-After": "86400"})])
+    transport = _transport(session, requests_per_second=100, burst=10)
+
+    async def run():
+        async with transport.get("https://api.example.com/search") as response:
+            return response.status
+
+    assert asyncio.run(run()) == 429
+    assert len(session.calls) == 1
+
+
+def test_identical_requests_in_flight_are_coalesced():
+    session = FakeSession([FakeResponse(200, {"n": 1}), FakeResponse(200, {"n": 2})], delay=0.05)
+    transport = _transport(session, requests_per_second=100, burst=10)
+
+    async def fetch(query):
+        async with transport.get("https://api.example.com/search", params={"q": query}) as response:
+            return (await response.json())["n"]
+
+    async def run():
+        return await asyncio.gather(fetch("ai"), fetch("ai"), fetch("ml"))
+
+    first, second, other = asyncio.run(run())
+
+    assert first == second
+    assert other != first
+    assert len(session.calls) == 2
+    assert transport.get_stats()["coalesced"] == 1
+
+
+def test_sessions_are_closed_when_their_loop_shuts_down():
+    transport = ProviderTransport("test")
+
+    async def open_session():
+        session = await transport._session()
+        assert await transport._session() is session
+        return session
+
+    sessions = [asyncio.run(open_session()) for _ in range(2)]
+
+    assert sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+    assert transport._sessions == {}
@@ -0,0 +1,79 @@
+"""
+Tests for the two-tier embedding cache used by the pgvector store.
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+from app.services.embedding_cache import EmbeddingCache, content_hash, _pack
+
+
+MODEL = "text-embedding-3-small"
+
+
+@pytest.fixture
+def memory_cache():
+    return EmbeddingCache(memory_size=2, memory_ttl_seconds=3600, use_db=False)
+
+
+def test_miss_then_hit(memory_cache):
+    assert memory_cache.get_many(MODEL, ["alpha"]) == {}
+
+    memory_cache.set_many(MODEL, {"alpha": [0.5, 0.25]})
+    assert memory_cache.get_many(MODEL, ["alpha"]) == {"alpha": [0.5, 0.25]}
+
+    stats = memory_cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_keys_include_model(memory_cache):
+    memory_cache.set_many(MODEL, {"alpha": [1.0]})
+    assert memory_cache.get_many("other-model", ["alpha"]) == {}
+
+
+def test_lru_eviction(memory_cache):
+    memory_cache.set_many(MODEL, {"a": [1.0], "b": [2.0]})
+    memory_cache.get_many(MODEL, ["a"])  # "b" is now least recently used
+    memory_cache.set_many(MODEL, {"c": [3.0]})
+
+    assert set(memory_cache.get_many(MODEL, ["a", "b", "c"])) == {"a", "c"}
+    assert memory_cache.get_stats()["memory_evictions"] == 1
+
+
+def test_memory_ttl_expiry():
+    cache = EmbeddingCache(memory_ttl_seconds=10, use_db=False)
+    with patch("app.services.embedding_cache.time.monotonic", return_value=100.0):
+        cache.set_many(MODEL, {"alpha": [1.0]})
+    with patch("app.services.embedding_cache.time.monotonic", return_value=111.0):
+        assert cache.get_many(MODEL, ["alpha"]) == {}
+
+
+def test_database_tier_fills_memory():
+    facade = Mock()
+    facade.get_cached_embeddings.return_value = {content_hash("alpha"): _pack([0.5, 0.25])}
+    cache = EmbeddingCache()
+
+    with patch.object(cache, "_facade", return_value=facade):
+        assert cache.get_many(MODEL, ["alpha"]) == {"alpha": [0.5, 0.25]}
+        # Second lookup is served from memory without touching the database
+        assert cache.get_many(MODEL, ["alpha"]) == {"alpha": [0.5, 0.25]}
+
+    facade.get_cached_embeddings.assert_called_once_with(MODEL, [content_hash("alpha")])
+    stats = cache.get_stats()
+    assert stats["db_hits"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_database_errors_fall_back_to_memory():
+    facade = Mock()
+    facade.save_cached_embeddings.side_effect = RuntimeError("no such table")
+    cache = EmbeddingCache()
+
+    with patch("app.database.get_database_instance", return_value=Mock(facade=facade)):
+        cache.set_many(MODEL, {"alpha": [1.0]})
+        # The failing tier is skipped until the retry interval passes
+        assert cache._facade() is None
+
+    assert cache.get_many(MODEL, ["alpha"]) == {"alpha": [1.0]}
+    assert cache.get_stats()["db_errors"] == 1
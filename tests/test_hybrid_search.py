@@ -0,0 +1,102 @@
+"""
+Tests for hybrid full-text + vector article retrieval.
+"""
+import logging
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.dialects.postgresql import psycopg2
+from sqlalchemy.pool import StaticPool
+
+from app.database_models import t_articles
+from app.database_query_facade import DatabaseQueryFacade
+from app.services import hybrid_search
+
+
+@pytest.fixture
+def database():
+    # The candidate queries run on worker threads
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    connection = engine.connect()
+    t_articles.create(connection)
+    connection.execute(insert(t_articles), [
+        {"uri": "a", "title": "Autonomous agents in the enterprise", "summary": None, "topic": "AI",
+         "publication_date": "2026-03-01"},
+        {"uri": "b", "title": "Agents and agent platforms", "summary": "Agents everywhere",
+         "topic": "AI", "publication_date": "2026-01-05"},
+        {"uri": "c", "title": "Chip exports", "summary": None, "topic": "AI",
+         "publication_date": "2026-03-02"},
+        {"uri": "d", "title": "Agents for climate models", "summary": None, "topic": "Climate",
+         "publication_date": "2026-03-03"},
+    ])
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    database.facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+    yield database
+    connection.close()
+
+
+def _vector_rows(*uris):
+    return lambda facade, query, limit, condition, embedding=None: [
+        {"uri": uri, "title": uri, "distance": 0.1 * i} for i, uri in enumerate(uris, start=1)
+    ]
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = hybrid_search.reciprocal_rank_fusion({"lexical": ["a", "b", "c"], "vector": ["c", "d"]}, k=60)
+
+    # b and d tie on score and best rank; list order breaks the tie
+    assert [item_id for item_id, _, _ in fused] == ["c", "a", "b", "d"]
+    assert fused[0][1] == pytest.approx(1 / 63 + 1 / 61)
+    assert fused[0][2] == {"lexical": 3, "vector": 1}
+
+
+def test_hybrid_search_fuses_lexical_and_vector_candidates(database):
+    with patch.object(hybrid_search, "_vector_candidates", _vector_rows("c", "a")):
+        results = hybrid_search.hybrid_search_articles("agents", top_k=3, metadata_filter={"topic": "AI"}, db=database)
+
+    assert [r["id"] for r in results] == ["a", "b", "c"]
+    assert results[0]["ranks"] == {"lexical": 2, "vector": 2}
+    assert results[0]["score"] == pytest.approx((1 / 62 + 1 / 62) / (2 / 61))
+    assert all(0 < r["score"] <= 1 for r in results)
+    assert results[0]["distance"] == pytest.approx(0.2)
+    assert results[1]["distance"] is None
+    assert results[1]["metadata"]["summary"] == "Agents everywhere"
+
+
+def test_hybrid_search_filters_in_sql_and_survives_vector_failure(database):
+    def fail(*args, **kwargs):
+        raise RuntimeError("embedding API down")
+
+    metadata_filter = {"$and": [
+        {"topic": {"$in": ["AI", "Climate"]}},
+        {"$or": [{"publication_date": {"$gte": "2026-03-01"}}, {"publication_date": None}]},
+    ]}
+    with patch.object(hybrid_search, "_vector_candidates", fail):
+        results = hybrid_search.hybrid_search_articles("agents", metadata_filter=metadata_filter, db=database)
+
+    assert {r["id"] for r in results} == {"a", "d"}
+    assert all(r["ranks"].keys() == {"lexical"} for r in results)
+
+    with pytest.raises(ValueError):
+        hybrid_search.hybrid_search_articles("agents", metadata_filter={"publication_date_ts": 1}, db=database)
+    with pytest.raises(ValueError):
+        hybrid_search.hybrid_search_articles("agents", metadata_filter={"topic": {"$regex": "A"}}, db=database)
+
+
+def test_vector_candidates_order_by_cosine_distance():
+    database = Mock(db_type="postgresql")
+    database._temp_get_connection.return_value = connection = MagicMock()
+    facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+
+    facade.vector_article_candidates([0.5, 0.25], limit=80, condition=facade.article_filter_condition({"topic": "AI"}))
+
+    ef_search, stmt = (call.args[0] for call in connection.execute.call_args_list)
+    sql = str(stmt.compile(dialect=psycopg2.dialect()))
+    assert "ORDER BY articles.embedding <=> CAST(%(query_embedding)s AS vector)" in sql
+    assert "articles.topic = %(topic_1)s" in sql
+    assert "80" in ef_search.compile().params.values()
+    connection.commit.assert_called_once()
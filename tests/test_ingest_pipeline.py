@@ -0,0 +1,98 @@
+"""
+Tests for the streaming stage pipeline used by progressive article ingest.
+"""
+import asyncio
+
+from app.services.ingest_pipeline import Stage, StagePipeline
+
+
+async def _collect_async(pipeline, items):
+    return [pair async for pair in pipeline.run(items)]
+
+
+def _collect(pipeline, items):
+    return asyncio.run(_collect_async(pipeline, items))
+
+
+def test_slow_item_does_not_hold_back_the_others():
+    async def fetch(item):
+        await asyncio.sleep(0.3 if item["id"] == 0 else 0.01)
+
+    async def finish(item):
+        return item["id"]
+
+    pipeline = StagePipeline([Stage("fetch", fetch, concurrency=2), Stage("finish", finish, concurrency=1)])
+    results = [result for _, result in _collect(pipeline, [{"id": i} for i in range(6)])]
+
+    assert sorted(results) == list(range(6))
+    assert results[-1] == 0
+
+
+def test_stage_concurrency_is_bounded():
+    running = {"now": 0, "peak": 0}
+
+    async def analyze(item):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        return "done"
+
+    pipeline = StagePipeline([Stage("analyze", analyze, concurrency=3)])
+    results = _collect(pipeline, range(12))
+
+    assert len(results) == 12
+    assert running["peak"] == 3
+
+
+def test_finished_items_skip_later_stages_and_errors_use_on_error():
+    seen = []
+
+    async def screen(item):
+        if item == "off-topic":
+            return "filtered"
+        if item == "broken":
+            raise ValueError("bad markup")
+        return None
+
+    async def slow(item):
+        if item == "hangs":
+            await asyncio.sleep(5)
+
+    async def save(item):
+        seen.append(item)
+        return "saved"
+
+    pipeline = StagePipeline(
+        [Stage("screen", screen), Stage("scrape", slow, timeout=0.05), Stage("save", save)],
+        on_error=lambda item, stage, error: f"{stage.name}: {type(error).__name__}"
+    )
+    results = dict(_collect(pipeline, ["ok", "off-topic", "broken", "hangs"]))
+
+    assert results == {
+        "ok": "saved",
+        "off-topic": "filtered",
+        "broken": "screen: ValueError",
+        "hangs": "scrape: TimeoutError",
+    }
+    assert seen == ["ok"]
+
+
+def test_failing_on_error_still_finishes_the_item():
+    async def analyze(item):
+        if item == "broken":
+            raise ValueError("bad markup")
+        return "done"
+
+    def on_error(item, stage, error):
+        raise RuntimeError("could not record failure")
+
+    pipeline = StagePipeline([Stage("analyze", analyze)], on_error=on_error)
+
+    async def run():
+        return await asyncio.wait_for(_collect_async(pipeline, ["broken", "ok"]), timeout=2)
+
+    results = dict(asyncio.run(run()))
+
+    assert results["ok"] == "done"
+    assert isinstance(results["broken"], RuntimeError)
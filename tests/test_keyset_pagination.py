@@ -0,0 +1,93 @@
+"""
+Tests for keyset pagination of article listings and listing count caching.
+"""
+import logging
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, delete, insert
+
+from app.database_models import t_articles
+from app.database_query_facade import DatabaseQueryFacade
+from app.utils.pagination import CountCache, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def facade():
+    connection = create_engine("sqlite://").connect()
+    t_articles.create(connection)
+    rows = [
+        {"uri": f"https://example.com/{n:02d}", "title": f"Article {n}",
+         "topic": "AI" if n % 3 else "Climate", "submission_date": f"2026-03-{n // 2 + 1:02d}"}
+        for n in range(12)
+    ]
+    rows.append({"uri": "https://example.com/undated", "title": "Undated", "topic": "AI",
+                 "submission_date": None})
+    connection.execute(insert(t_articles), rows)
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    yield DatabaseQueryFacade(database, logging.getLogger(__name__))
+    connection.close()
+
+
+def _all_pages(facade, per_page, **filters):
+    uris, cursor = [], None
+    while True:
+        page = facade.search_articles_page(cursor=cursor, per_page=per_page, **filters)
+        uris.extend(article["uri"] for article in page["articles"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return uris, page
+
+
+def test_cursor_pages_match_offset_pages(facade):
+    offset_uris = []
+    for page in range(1, 5):
+        rows, total = facade.search_articles(page=page, per_page=4)
+        offset_uris.extend(row["uri"] for row in rows)
+
+    keyset_uris, last_page = _all_pages(facade, per_page=4)
+
+    assert total == 13
+    assert keyset_uris == offset_uris
+    assert keyset_uris[-1] == "https://example.com/undated"
+    assert last_page["total_count"] == 13
+
+
+def test_cursor_pages_respect_filters_and_projection(facade):
+    uris, _ = _all_pages(facade, per_page=3, topic="Climate", projection="list", count=None)
+    assert uris == [f"https://example.com/{n:02d}" for n in (9, 6, 3, 0)]
+
+    page = facade.search_articles_page(per_page=2, projection="list", count=None, topic="AI")
+    assert page["total_count"] is None
+    assert "sentiment_explanation" not in page["articles"][0]
+
+    with pytest.raises(ValueError):
+        facade.search_articles_page(cursor="not-a-cursor")
+
+
+def test_only_estimated_counts_are_cached_per_filter_signature(facade):
+    page = facade.search_articles_page(topic="AI", count="estimated")
+    assert page["total_is_estimate"] is True
+    facade.db._temp_get_connection().execute(delete(t_articles).where(t_articles.c.topic == "AI"))
+
+    assert facade.search_articles_page(topic="AI", count="estimated")["total_count"] == page["total_count"]
+    assert facade.search_articles_page(topic="AI", count="exact")["total_count"] == 0
+    assert facade.search_articles(topic="AI")[1] == 0
+    assert facade.search_articles(topic="Climate")[1] == 4
+
+
+def test_cursor_round_trip_and_cache_ttl():
+    cursor = encode_cursor(["2026-03-01 10:00:00", "https://example.com/?a=1&b=2"])
+    assert "=" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor, 2) == ["2026-03-01 10:00:00", "https://example.com/?a=1&b=2"]
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 3)
+
+    calls = []
+    cache = CountCache(ttl_seconds=0)
+    assert cache.get("sig", lambda: calls.append(1) or 5) == 5
+    assert cache.get("sig", lambda: calls.append(1) or 5) == 5
+    assert len(calls) == 2
@@ -0,0 +1,91 @@
+"""
+Tests for the bulk keyword-monitor article save path.
+"""
+import logging
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+
+from app.database_models import (
+    t_articles,
+    t_keyword_article_matches,
+    t_keyword_groups,
+    t_monitored_keywords,
+)
+from app.database_query_facade import DatabaseQueryFacade
+
+
+@pytest.fixture
+def db():
+    connection = create_engine("sqlite://").connect()
+    for table in (t_keyword_groups, t_monitored_keywords, t_articles, t_keyword_article_matches):
+        table.create(connection)
+    connection.execute(insert(t_keyword_groups).values(id=1, name="AI", topic="AI"))
+    connection.execute(insert(t_monitored_keywords), [
+        {"id": 10, "group_id": 1, "keyword": "agents"},
+        {"id": 11, "group_id": 1, "keyword": "llm"},
+    ])
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    database.facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+    database.connection = connection
+    yield database
+    connection.close()
+
+
+def _article(n):
+    return {
+        "url": f"https://example.com/{n}",
+        "title": f"Article {n}",
+        "source": "Example",
+        "published_date": "2026-03-01T10:00:00Z",
+        "summary": "",
+    }
+
+
+def _matches(db):
+    rows = db.connection.execute(
+        select(t_keyword_article_matches.c.article_uri, t_keyword_article_matches.c.keyword_ids)
+    ).fetchall()
+    return dict(rows)
+
+
+def test_new_articles_and_matches_are_inserted_in_chunks(db):
+    articles = [_article(n) for n in range(5)] + [_article(0)]
+
+    saved = db.facade.save_keyword_articles(10, "AI", articles, chunk_size=2)
+
+    assert sorted(saved["inserted"]) == [f"https://example.com/{n}" for n in range(5)]
+    assert len(saved["changed"]) == 5
+    assert len(db.connection.execute(select(t_articles.c.uri)).fetchall()) == 5
+    assert set(_matches(db).values()) == {"10"}
+
+
+def test_existing_articles_only_get_their_matches_updated(db):
+    db.facade.save_keyword_articles(10, "AI", [_article(1), _article(2)])
+
+    saved = db.facade.save_keyword_articles(11, "AI", [_article(1), _article(3)])
+    assert saved["inserted"] == ["https://example.com/3"]
+    assert sorted(saved["changed"]) == ["https://example.com/1", "https://example.com/3"]
+    assert _matches(db) == {
+        "https://example.com/1": "10,11",
+        "https://example.com/2": "10",
+        "https://example.com/3": "11",
+    }
+
+    again = db.facade.save_keyword_articles(11, "AI", [_article(1), _article(3)])
+    assert again == {"inserted": [], "changed": [], "failed": []}
+
+
+def test_failed_chunk_is_reported_and_later_chunks_are_saved(db):
+    broken = dict(_article(2), published_date={"unbindable": True})
+    articles = [_article(0), _article(1), broken, _article(3), _article(4)]
+
+    saved = db.facade.save_keyword_articles(10, "AI", articles, chunk_size=2)
+
+    assert saved["failed"] == ["https://example.com/2", "https://example.com/3"]
+    assert sorted(saved["inserted"]) == [f"https://example.com/{n}" for n in (0, 1, 4)]
+    assert sorted(_matches(db)) == [f"https://example.com/{n}" for n in (0, 1, 4)]
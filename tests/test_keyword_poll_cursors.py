@@ -0,0 +1,125 @@
+"""
+Tests for incremental keyword polling cursors.
+"""
+import logging
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.database_models import t_keyword_poll_cursors
+from app.database_query_facade import DatabaseQueryFacade
+from app.services.keyword_poll_cursors import (
+    MAX_SEEN_URLS,
+    MIN_POLL_INTERVAL,
+    OVERLAP,
+    KeywordCursorStore,
+    PollCursor,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+def _article(n, published="2026-03-01T10:00:00Z"):
+    return {"url": f"https://example.com/{n}", "published_date": published}
+
+
+@pytest.fixture
+def db():
+    connection = create_engine("sqlite://").connect()
+    t_keyword_poll_cursors.create(connection)
+    connection.commit()
+
+    database = Mock(db_type="sqlite")
+    database._temp_get_connection.return_value = connection
+    database.facade = DatabaseQueryFacade(database, logging.getLogger(__name__))
+    yield database
+    connection.close()
+
+
+def test_filter_new_drops_seen_and_old_articles():
+    cursor = PollCursor(
+        keyword_id=1, provider="newsapi",
+        last_published_at=datetime(2026, 3, 1, 10, 0),
+        seen_urls=["https://example.com/1"],
+    )
+    articles = [
+        _article(1),
+        _article(2, "2026-03-01T10:30:00+00:00"),
+        _article(3, "2026-02-27T08:00:00Z"),
+        _article(4, ""),
+    ]
+
+    assert [a["url"] for a in cursor.filter_new(articles)] == ["https://example.com/2", "https://example.com/4"]
+    assert cursor.search_since(datetime(2026, 2, 1)) == datetime(2026, 3, 1, 10, 0) - OVERLAP
+    assert cursor.search_since(datetime(2026, 3, 1, 11, 0)) == datetime(2026, 3, 1, 11, 0)
+
+
+def test_interval_shrinks_for_hot_keywords_and_grows_for_quiet_ones():
+    base = 3600
+    hot = PollCursor(keyword_id=1, provider="newsapi")
+    for _ in range(5):
+        hot.advance([_article(1, "2026-03-01T11:00:00Z")], base, NOW)
+    assert hot.poll_interval_seconds == max(base // 4, MIN_POLL_INTERVAL)
+    assert hot.last_published_at == datetime(2026, 3, 1, 11, 0)
+    assert hot.next_poll_at == NOW + timedelta(seconds=hot.poll_interval_seconds)
+
+    quiet = PollCursor(keyword_id=2, provider="newsapi")
+    for _ in range(10):
+        quiet.advance([], base, NOW)
+    assert quiet.poll_interval_seconds == base * 8
+    assert quiet.empty_polls == 10
+    assert not quiet.is_due(NOW)
+    assert quiet.is_due(NOW + timedelta(seconds=base * 8))
+
+
+def test_seen_urls_are_capped_newest_first():
+    cursor = PollCursor(keyword_id=1, provider="newsapi", seen_urls=["https://example.com/old"])
+    cursor.advance([_article(n) for n in range(MAX_SEEN_URLS)], 3600, NOW)
+
+    assert len(cursor.seen_urls) == MAX_SEEN_URLS
+    assert cursor.seen_urls[0] == "https://example.com/0"
+    assert "https://example.com/old" not in cursor.seen_urls
+
+
+def test_cursor_stops_before_articles_that_failed_to_save():
+    cursor = PollCursor(keyword_id=1, provider="newsapi")
+    articles = [
+        _article(1, "2026-03-01T09:00:00Z"),
+        _article(2, "2026-03-01T10:00:00Z"),
+        _article(3, "2026-03-01T11:00:00Z"),
+    ]
+    cursor.advance(articles, 3600, NOW, failed_urls=["https://example.com/2?utm_source=feed"])
+
+    assert cursor.last_published_at == datetime(2026, 3, 1, 10, 0)
+    assert cursor.seen_urls == ["https://example.com/1", "https://example.com/3"]
+    assert [a["url"] for a in cursor.filter_new(articles)] == ["https://example.com/2"]
+
+    undated = PollCursor(keyword_id=1, provider="newsapi")
+    undated.advance([_article(1), _article(2, "")], 3600, NOW, failed_urls=["https://example.com/2"])
+    assert undated.last_published_at is None
+    assert undated.seen_urls == ["https://example.com/1"]
+
+
+def test_store_round_trip(db):
+    store = KeywordCursorStore(db)
+    assert store.load([1]) == {}
+    assert store.seconds_until_next_poll(NOW) is None
+
+    cursors = {}
+    first = store.get(cursors, 1, "newsapi")
+    first.advance([_article(1)], 3600, NOW)
+    second = store.get(cursors, 1, "thenewsapi")
+    second.advance([], 3600, NOW)
+    store.save([first, second])
+
+    first.advance([_article(2)], 3600, NOW)
+    store.save([first])
+
+    loaded = store.load([1, 2])
+    assert set(loaded) == {(1, "newsapi"), (1, "thenewsapi")}
+    assert loaded[(1, "newsapi")].seen_urls == ["https://example.com/2", "https://example.com/1"]
+    assert loaded[(1, "newsapi")].poll_interval_seconds == 900
+    assert loaded[(1, "thenewsapi")].empty_polls == 1
+    assert store.seconds_until_next_poll(NOW) == 900
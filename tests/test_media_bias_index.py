@@ -0,0 +1,129 @@
+"""
+Tests for the media bias domain index.
+
+The index must return exactly the source a linear scan with
+domains_match() would have returned first.
+"""
+import pytest
+from unittest.mock import Mock
+
+from app.models.media_bias import (
+    DomainIndex,
+    MediaBias,
+    domains_match,
+    invalidate_media_bias_index,
+    normalize_domain,
+)
+
+
+SOURCE_DOMAINS = [
+    "https://www.bbc.co.uk",
+    "theguardian.com",
+    "news.example.com",
+    "example.org",
+    "westernjournal",
+    "edition.cnn.com",
+    "cnn.com",
+    "https://uk.reuters.com/world",
+    "Associated Press",
+]
+
+QUERIES = [
+    "bbc.co.uk", "www.bbc.co.uk", "sport.bbc.co.uk", "itv.co.uk",
+    "theguardian.com", "amp.theguardian.com", "guardian.com",
+    "example.com", "news.example.com", "deep.news.example.com", "example.org", "example",
+    "westernjournal.com", "westernjournal", "cnn", "money.cnn.com",
+    "reuters.com", "reuters", "associated press", "unknown.net", "com",
+]
+
+
+def _linear_first(domains, query):
+    for position, domain in enumerate(domains):
+        if domains_match(domain, query):
+            return position
+    return None
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_find_match_agrees_with_linear_scan(query):
+    domains = [normalize_domain(s) for s in SOURCE_DOMAINS]
+    index = DomainIndex()
+    for position, domain in enumerate(domains):
+        index.add(domain, position)
+
+    assert index.find_match(query) == _linear_first(domains, query)
+
+
+def test_remove_restores_next_candidate():
+    index = DomainIndex()
+    index.add("edition.cnn.com", 0)
+    index.add("cnn.com", 1)
+
+    assert index.find_match("money.cnn.com") == 0
+    index.remove("edition.cnn.com", 0)
+    assert index.find_match("money.cnn.com") == 1
+    assert index.find_exact("edition.cnn.com") is None
+
+
+def _media_bias(rows):
+    db = Mock()
+    db.facade.load_media_bias_sources_from_database.return_value = rows
+    db.facade.get_media_bias_source.return_value = (1,)
+    db.facade.update_media_bias_last_updated.return_value = 1
+    return MediaBias(db)
+
+
+def test_get_bias_prefers_enabled_sources():
+    media_bias = _media_bias([
+        {"id": 1, "source": "cnn.com", "bias": "left", "enabled": 0},
+        {"id": 2, "source": "edition.cnn.com", "bias": "center", "enabled": 1},
+    ])
+
+    assert media_bias.get_bias_for_source("https://cnn.com/story")["id"] == 2
+
+
+def test_get_bias_auto_enables_disabled_match():
+    media_bias = _media_bias([{"id": 1, "source": "cnn.com", "bias": "left", "enabled": 0}])
+
+    assert media_bias.get_bias_for_source("cnn.com")["id"] == 1
+    media_bias.db.facade.enable_media_source.assert_called_once_with("cnn.com")
+    assert media_bias._enabled_index.find_exact("cnn.com") == 0
+
+
+def test_update_and_delete_keep_index_current():
+    media_bias = _media_bias([
+        {"id": 1, "source": "cnn.com", "bias": "left", "enabled": 1},
+        {"id": 2, "source": "foxnews.com", "bias": "right", "enabled": 1},
+    ])
+
+    media_bias.update_source(1, {"source": "msnbc.com", "bias": "left"})
+    assert media_bias.get_bias_for_source("cnn.com") is None
+    assert media_bias.get_bias_for_source("msnbc.com")["id"] == 1
+
+    media_bias.delete_source(2)
+    assert media_bias.get_bias_for_source("foxnews.com") is None
+    assert [s["id"] for s in media_bias.sources] == [1]
+
+    media_bias.db.facade.insert_media_bias.return_value = 3
+    media_bias.add_source({"source": "npr.org", "bias": "center"})
+    assert media_bias.get_bias_for_source("www.npr.org")["id"] == 3
+
+
+def test_instances_share_one_index_until_invalidated():
+    first = _media_bias([
+        {"id": 1, "source": "cnn.com", "bias": "left", "enabled": 1},
+        {"id": 2, "source": "foxnews.com", "bias": "right", "enabled": 1},
+    ])
+    db = first.db
+    second = MediaBias(db)
+    assert first._index is second._index
+    db.facade.load_media_bias_sources_from_database.assert_called_once()
+
+    first.delete_source(1)
+    assert second.get_bias_for_source("cnn.com") is None
+
+    db.facade.load_media_bias_sources_from_database.return_value = [
+        {"id": 3, "source": "npr.org", "bias": "center", "enabled": 1},
+    ]
+    invalidate_media_bias_index(db)
+    assert MediaBias(db).get_bias_for_source("npr.org")["id"] == 3
@@ -0,0 +1,86 @@
+"""
+Tests for the in-memory per-topic ontology registry.
+"""
+import os
+
+import pytest
+
+from app.services.ontology_registry import OntologyRegistry
+
+
+def _topic(name, categories=("AI",)):
+    return {
+        "name": name,
+        "categories": list(categories),
+        "future_signals": ["Hype"],
+        "sentiment": ["Positive"],
+        "time_to_impact": ["Immediate"],
+        "driver_types": ["Accelerator"],
+    }
+
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text("{}")
+    state = {"topics": [_topic("AI and Machine Learning")], "loads": 0}
+
+    def loader():
+        state["loads"] += 1
+        return {"topics": state["topics"]}
+
+    return OntologyRegistry(config_path=str(path), loader=loader), state, path
+
+
+def test_get_serves_from_memory(config):
+    registry, state, _ = config
+
+    ontology = registry.get("AI and Machine Learning")
+    again = registry.get("  AI   and Machine Learning ")
+
+    assert again is ontology
+    assert ontology.version == registry.version == 1
+    assert state["loads"] == 1
+    assert ontology.analyzer_kwargs() == {
+        "categories": ["AI"],
+        "future_signals": ["Hype"],
+        "sentiment_options": ["Positive"],
+        "time_to_impact_options": ["Immediate"],
+        "driver_types": ["Accelerator"],
+    }
+
+
+def test_invalidate_reloads_and_notifies(config):
+    registry, state, _ = config
+    notified = []
+    registry.subscribe(notified.append)
+    registry.get("AI and Machine Learning")
+
+    state["topics"] = [_topic("AI and Machine Learning", ["AI", "Robotics"])]
+    registry.invalidate("AI and Machine Learning")
+
+    assert notified == ["AI and Machine Learning"]
+    assert registry.get("AI and Machine Learning").categories == ("AI", "Robotics")
+    assert registry.version == 2
+
+
+def test_config_file_change_reloads(config):
+    registry, state, path = config
+    registry.get("AI and Machine Learning")
+
+    state["topics"] = [_topic("Climate")]
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert registry.topics() == ["Climate"]
+    assert state["loads"] == 2
+
+
+def test_unknown_topic_reloads_once(config):
+    registry, state, _ = config
+    registry.get("AI and Machine Learning")
+
+    assert registry.get("Quantum") is None
+    assert registry.get("Quantum") is None
+    assert state["loads"] == 2  # one retry, then the miss is remembered
+    assert registry.get("") is None
@@ -0,0 +1,143 @@
+"""
+Tests for the precomputed embedding projection store.
+"""
+import json
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from app.services.projection_store import ProjectionStore, _place_by_neighbours, scope_key
+
+
+def _store(facade):
+    return ProjectionStore(db=Mock(facade=facade))
+
+
+def test_scope_key_ignores_filter_order():
+    a = scope_key("umap", 2, 30, {"topic": "AI", "sentiment": "Positive"})
+    b = scope_key("umap", 2, 30, {"sentiment": "Positive", "topic": "AI"})
+
+    assert a == b
+    assert a != scope_key("pca", 2, 30, {"topic": "AI", "sentiment": "Positive"})
+
+
+def test_place_by_neighbours_uses_nearest_fitted_points():
+    ref_vectors = np.array([[1.0, 0.0], [0.0, 1.0], [0.9, 0.1]], dtype=np.float32)
+    ref_coords = np.array([[10.0, 0.0], [-10.0, 0.0], [10.0, 2.0]], dtype=np.float32)
+    ref_clusters = np.array([1, 2, 1])
+
+    coords, clusters = _place_by_neighbours(
+        np.array([[1.0, 0.05]], dtype=np.float32), ref_vectors, ref_coords, ref_clusters, k=2
+    )
+
+    assert clusters.tolist() == [1]
+    assert coords[0][0] == pytest.approx(10.0)
+    assert 0.0 < coords[0][1] < 2.0
+
+
+@pytest.mark.parametrize("fitted, placed, stale", [(100, 0, False), (100, 20, False), (100, 21, True), (0, 0, True)])
+def test_is_stale_uses_drift_threshold(fitted, placed, stale):
+    assert ProjectionStore.is_stale({"fitted_count": fitted, "placed_count": placed}) is stale
+
+
+def test_get_projection_reads_stored_scope():
+    facade = Mock()
+    facade.get_projection_scope.return_value = {
+        "scope_key": "k", "fitted_count": 2, "placed_count": 0, "fitted_at": None,
+        "explain": json.dumps({"0": {"title": "AI News"}}),
+    }
+    facade.get_projection_points.return_value = [
+        {"uri": "u1", "x": 0.0, "y": 2.0, "z": None, "cluster": 0, "title": "a",
+         "sentiment": None, "driver_type": None, "category": None, "time_to_impact": None},
+        {"uri": "u2", "x": 2.0, "y": 4.0, "z": None, "cluster": 0, "title": "b",
+         "sentiment": None, "driver_type": None, "category": None, "time_to_impact": None},
+    ]
+    store = _store(facade)
+
+    with patch.object(store, "_fit") as fit:
+        result = store.get_projection("umap", 2, 30, {"topic": "AI"}, uris=["u1", "u2"], limit=10)
+
+    fit.assert_not_called()
+    assert [p["id"] for p in result["points"]] == ["u1", "u2"]
+    assert result["centroids"] == {0: [1.0, 3.0]}
+    assert result["explain"] == {0: {"title": "AI News"}}
+    facade.get_projection_points.assert_called_once_with(
+        scope_key("umap", 2, 30, {"topic": "AI"}), uris=["u1", "u2"], limit=10
+    )
+
+
+def test_refresh_places_new_articles_and_refits_on_drift():
+    facade = Mock()
+    scope = {"scope_key": "k", "method": "pca", "dims": 2, "n_clusters": 2,
+             "filters": "{}", "fitted_count": 4, "placed_count": 0}
+    facade.get_unprojected_article_uris.return_value = ["new"]
+    facade.get_projection_scope.return_value = dict(scope, placed_count=1)
+    store = _store(facade)
+
+    models = {"reducer": Mock(), "pca": None, "kmeans": Mock()}
+    models["reducer"].transform.return_value = np.array([[0.5, 0.5]])
+    models["kmeans"].predict.return_value = np.array([1])
+    store._models["k"] = models
+
+    vectors = (np.ones((1, 3), dtype=np.float32), [{}], ["new"])
+    with patch("app.vector_store.get_vectors_by_metadata", return_value=vectors), \
+         patch.object(store, "_fit", return_value=True) as fit:
+        result = store.refresh(scope)
+
+    assert result == {"placed": 1, "refitted": True}
+    facade.add_projection_points.assert_called_once_with(
+        "k", [{"uri": "new", "x": 0.5, "y": 0.5, "z": None, "cluster": 1}]
+    )
+    fit.assert_called_once_with("k", "pca", 2, 2, {})
+
+
+def test_first_request_is_fitted_in_the_background():
+    facade = Mock()
+    facade.get_projection_scope.return_value = None
+    store = _store(facade)
+    store.background_fits = True
+
+    with patch.object(store, "_fit", return_value=True) as fit:
+        result = store.get_projection("pca", 2, 5, {"topic": "AI"})
+        store.get_projection("pca", 2, 5, {"topic": "AI"})
+        fit.assert_not_called()
+        assert result["status"] == "pending"
+        assert result["points"] == []
+
+        assert store.fit_pending() == 1
+
+    fit.assert_called_once_with(scope_key("pca", 2, 5, {"topic": "AI"}), "pca", 2, 5, {"topic": "AI"})
+    assert store.fit_pending() == 0
+
+
+def test_models_and_refreshed_scopes_are_capped_to_recent_scopes():
+    facade = Mock()
+    facade.list_projection_scopes.return_value = [{"scope_key": "old"}, {"scope_key": "new"}]
+    store = _store(facade)
+
+    with patch("app.services.projection_store.PROJECTION_MAX_MODELS", 2), \
+         patch("app.services.projection_store.PROJECTION_MAX_REFRESH_SCOPES", 1):
+        for key in ("a", "b"):
+            store._keep_models(key, {"reducer": None})
+        store._get_models("a")
+        store._keep_models("c", {"reducer": None})
+        store._mark_requested("old")
+        store._mark_requested("new")
+
+    assert list(store._models) == ["a", "c"]
+    with patch.object(store, "refresh", return_value={"placed": 0, "refitted": False}) as refresh:
+        summary = store.refresh_all()
+    refresh.assert_called_once_with({"scope_key": "new"})
+    assert summary["scopes"] == 1
+
+
+def test_fit_samples_the_newest_articles():
+    store = _store(Mock())
+    empty = (np.empty((0, 0), dtype=np.float32), [], [])
+
+    with patch("app.vector_store.get_vectors_by_metadata", return_value=empty) as fetch:
+        assert store._fit("k", "pca", 2, 5, {"topic": "AI"}) is False
+
+    fetch.assert_called_once()
+    assert fetch.call_args.kwargs["newest_first"] is True
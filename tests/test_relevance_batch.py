@@ -0,0 +1,113 @@
+"""
+Tests for batched multi-article relevance scoring in RelevanceCalculator.
+"""
+import json
+import re
+import pytest
+from unittest.mock import Mock
+
+from app.relevance import RelevanceCalculator
+
+
+def _item(article_id, topic_score=0.8, keyword_score=0.6):
+    return {
+        "id": article_id,
+        "topic_alignment_score": topic_score,
+        "keyword_relevance_score": keyword_score,
+        "overall_match_explanation": "ok",
+        "confidence_score": 0.9,
+        "extracted_article_topics": ["AI"],
+        "extracted_article_keywords": ["llm"],
+    }
+
+
+def _single_response(topic_score=0.2):
+    item = _item("x", topic_score, topic_score)
+    del item["id"]
+    return json.dumps(item)
+
+
+@pytest.fixture
+def calculator():
+    calc = RelevanceCalculator()
+    calc.ai_model = Mock()
+    return calc
+
+
+def _articles(n):
+    return [{"uri": f"u{i}", "title": f"Title {i}", "source": "src", "content": "body " * 20} for i in range(n)]
+
+
+def test_batch_packs_articles_into_few_requests(calculator):
+    def respond(messages):
+        ids = re.findall(r'"id": "(\d+)"', messages[1]["content"])
+        return json.dumps({"results": [_item(article_id) for article_id in ids]})
+
+    calculator.ai_model.generate_response.side_effect = respond
+
+    results = calculator.analyze_relevance_batch(_articles(7), "AI", "llm", batch_size=3)
+
+    assert calculator.ai_model.generate_response.call_count == 3
+    assert len(results) == 7
+    assert all(r["relevance_score"] == pytest.approx(0.7) for r in results)
+    assert calculator.batch_stats == {"requests": 3, "batched": 7, "fallbacks": 0}
+
+
+def test_token_budget_splits_batches(calculator):
+    batches = calculator._pack_batches(
+        [{"id": str(i), "content": "x" * 400} for i in range(4)], batch_size=10, token_budget=250
+    )
+
+    assert [len(b) for b in batches] == [2, 2]
+
+
+def test_dropped_and_malformed_items_fall_back_individually(calculator):
+    batch_response = json.dumps({"results": [
+        _item("0", 1.0, 1.0),
+        {"id": "1", "topic_alignment_score": "not a number"},
+        # "2" is missing
+    ]})
+    calculator.ai_model.generate_response.side_effect = [batch_response, _single_response(), _single_response()]
+
+    results = calculator.analyze_relevance_batch(_articles(3), "AI", "llm")
+
+    assert results[0]["relevance_score"] == 1.0
+    assert results[1]["relevance_score"] == pytest.approx(0.2)
+    assert results[2]["relevance_score"] == pytest.approx(0.2)
+    assert calculator.batch_stats["fallbacks"] == 2
+    # The individual prompt names the article it scores
+    assert "Title 2" in calculator.ai_model.generate_response.call_args[0][0][1]["content"]
+
+
+def test_items_without_scores_fall_back_instead_of_scoring_zero(calculator):
+    batch_response = json.dumps({"results": [
+        _item("0", 1.0, 1.0),
+        {"id": "1"},
+        dict(_item("2"), keyword_relevance_score=None),
+    ]})
+    calculator.ai_model.generate_response.side_effect = [batch_response, _single_response(), _single_response()]
+
+    results = calculator.analyze_relevance_batch(_articles(3), "AI", "llm")
+
+    assert [r["relevance_score"] for r in results] == [1.0, pytest.approx(0.2), pytest.approx(0.2)]
+    assert calculator.batch_stats == {"requests": 1, "batched": 1, "fallbacks": 2}
+    assert "Title 2" in calculator.ai_model.generate_response.call_args[0][0][1]["content"]
+
+
+def test_unparseable_batch_response_falls_back_for_whole_batch(calculator):
+    calculator.ai_model.generate_response.side_effect = ["I cannot help with that", _single_response(), _single_response()]
+
+    results = calculator.analyze_relevance_batch(_articles(2), "AI", "llm")
+
+    assert [r["relevance_score"] for r in results] == [pytest.approx(0.2), pytest.approx(0.2)]
+
+
+def test_analyze_articles_batch_keeps_article_fields(calculator):
+    calculator.ai_model.generate_response.side_effect = [
+        json.dumps([_item("0"), _item("1")]),
+    ]
+
+    results = calculator.analyze_articles_batch(_articles(2), "AI", "llm")
+
+    assert [r["uri"] for r in results] == ["u0", "u1"]
+    assert results[1]["topic_alignment_score"] == 0.8
@@ -0,0 +1,90 @@
+"""
+Tests for the embedding-based relevance pre-filter used by auto-ingest.
+"""
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.relevance_prefilter import FAST_TRACK, LLM, REJECT, RelevancePrefilter
+
+
+# Unit vectors along the axes: the topic points along x
+VECTORS = {
+    "AI: Artificial intelligence": [1.0, 0.0, 0.0],
+    "llm, agents": [1.0, 0.0, 0.0],
+    "on topic": [1.0, 0.1, 0.0],
+    "borderline": [0.4, 0.9, 0.0],
+    "off topic": [0.0, 0.0, 1.0],
+}
+
+
+async def _fake_embed(texts, strict=False):
+    return [VECTORS[text] for text in texts]
+
+
+@pytest.fixture
+def patched_store():
+    accepted = (np.empty((0, 0), dtype=np.float32), [], [])
+    with patch("app.vector_store_pgvector._embed_texts_async", side_effect=_fake_embed) as embed, \
+            patch("app.vector_store_pgvector.get_vectors_by_metadata_async",
+                  new=AsyncMock(return_value=accepted)) as accepted_mock, \
+            patch("app.config.config.get_topic_description", return_value="Artificial intelligence"):
+        yield embed, accepted_mock
+
+
+def _articles(*titles):
+    return [{"uri": title, "title": title} for title in titles]
+
+
+def test_decide_thresholds():
+    prefilter = RelevancePrefilter(floor=0.2, ceiling=0.8)
+
+    assert prefilter.decide(0.1) == REJECT
+    assert prefilter.decide(0.5) == LLM
+    assert prefilter.decide(0.8) == FAST_TRACK
+    assert RelevancePrefilter(floor=0.2, ceiling=0).decide(0.99) == LLM
+
+
+@pytest.mark.asyncio
+async def test_annotate_tags_articles_and_counts_saved_calls(patched_store):
+    prefilter = RelevancePrefilter(floor=0.2, ceiling=0.8)
+    articles = _articles("on topic", "borderline", "off topic") + [{"uri": "empty"}]
+
+    counts = await prefilter.annotate(articles, "AI", ["llm", "agents"])
+
+    assert [a.get("_prefilter", {}).get("decision") for a in articles] == [FAST_TRACK, LLM, REJECT, None]
+    assert counts["rejected"] == 1
+    assert counts["fast_tracked"] == 1
+    assert counts["sent_to_llm"] == 2  # borderline + the article without text
+    assert counts["llm_calls_saved"] == 2
+    assert prefilter.get_stats()["llm_calls_saved"] == 2
+
+
+@pytest.mark.asyncio
+async def test_centroid_cached_per_topic_and_keywords(patched_store):
+    embed, accepted = patched_store
+    prefilter = RelevancePrefilter()
+
+    await prefilter.annotate(_articles("on topic"), "AI", ["llm", "agents"])
+    await prefilter.annotate(_articles("off topic"), "AI", ["agents", "llm"])
+    assert accepted.await_count == 1
+
+    prefilter.invalidate("AI")
+    await prefilter.annotate(_articles("on topic"), "AI", ["llm", "agents"])
+    assert accepted.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_sends_everything_to_llm():
+    prefilter = RelevancePrefilter()
+    articles = _articles("on topic", "off topic")
+
+    with patch("app.vector_store_pgvector._embed_texts_async",
+               new=AsyncMock(side_effect=RuntimeError("OpenAI not available"))), \
+            patch("app.config.config.get_topic_description", return_value=""):
+        counts = await prefilter.annotate(articles, "AI", [])
+
+    assert all("_prefilter" not in a for a in articles)
+    assert counts["sent_to_llm"] == 2
+    assert counts["llm_calls_saved"] == 0
+    assert counts["errors"] == 1
@@ -0,0 +1,88 @@
+"""
+Tests for the short-TTL user record cache used by session validation.
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.security.user_cache import EMAIL, USERNAME, UserRecordCache
+
+
+def _user(username="alice", email="alice@example.com", is_active=True, role="user"):
+    return {"username": username, "email": email, "is_active": is_active, "role": role}
+
+
+def test_hits_within_ttl_and_reloads_after():
+    cache = UserRecordCache(ttl_seconds=30)
+    loader = Mock(return_value=_user())
+
+    with patch("app.security.user_cache.time.monotonic", return_value=100.0):
+        assert cache.get(USERNAME, "Alice", loader)["email"] == "alice@example.com"
+        assert cache.get(USERNAME, "alice", loader)["email"] == "alice@example.com"
+    with patch("app.security.user_cache.time.monotonic", return_value=131.0):
+        cache.get(USERNAME, "alice", loader)
+
+    assert loader.call_count == 2
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(0.3333)
+
+
+def test_missing_users_are_not_cached():
+    cache = UserRecordCache()
+    loader = Mock(return_value=None)
+
+    assert cache.get(USERNAME, "ghost", loader) is None
+    assert cache.get(USERNAME, "ghost", loader) is None
+    assert cache.get(USERNAME, "", loader) is None
+    assert loader.call_count == 2
+
+
+def test_invalidate_drops_username_and_email_entries():
+    cache = UserRecordCache()
+    cache.get(USERNAME, "alice", Mock(return_value=_user()))
+    cache.get(EMAIL, "alice@example.com", Mock(return_value=_user()))
+    cache.get(USERNAME, "bob", Mock(return_value=_user("bob", "bob@example.com")))
+
+    # Deactivating by username also drops the entry looked up by email
+    cache.invalidate(username="alice")
+
+    assert cache.get_stats()["entries"] == 1
+    loader = Mock(return_value=_user(is_active=False))
+    assert cache.get(EMAIL, "alice@example.com", loader)["is_active"] is False
+    loader.assert_called_once()
+
+
+def test_zero_ttl_disables_cache():
+    cache = UserRecordCache(ttl_seconds=0)
+    loader = Mock(return_value=_user())
+
+    cache.get(USERNAME, "alice", loader)
+    cache.get(USERNAME, "alice", loader)
+
+    assert loader.call_count == 2
+
+
+def test_verify_session_sees_deactivation_immediately():
+    from app.security import session as session_module
+    from app.security.user_cache import invalidate_user
+
+    cache = UserRecordCache()
+    facade = Mock()
+    facade.get_user_by_username.return_value = _user()
+    request = Mock(session={"user": "alice"})
+
+    with patch("app.security.user_cache.get_user_cache", return_value=cache), \
+            patch("app.database.get_database_instance", return_value=Mock(facade=facade)):
+        for _ in range(3):
+            assert session_module.verify_session(request)["user"]["username"] == "alice"
+        assert facade.get_user_by_username.call_count == 1
+
+        facade.get_user_by_username.return_value = _user(is_active=False)
+        invalidate_user(username="alice")
+        with pytest.raises(HTTPException) as excinfo:
+            session_module.verify_session(request)
+
+    assert excinfo.value.headers["Location"] == "/login?error=account_inactive"
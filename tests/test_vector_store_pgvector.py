@@ -0,0 +1,195 @@
+"""
+Tests for embedding and bulk vector indexing in the pgvector store.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from app import vector_store_pgvector as store
+
+
+def _fake_client():
+    client = Mock()
+
+    def create(model, input):
+        data = [Mock(index=i, embedding=[float(len(text)), 0.0]) for i, text in enumerate(input)]
+        return Mock(data=list(reversed(data)))
+
+    client.embeddings.create.side_effect = create
+    return client
+
+
+def test_pack_embedding_batches_respects_budgets():
+    items = [{"text": str(i), "tokens": 40} for i in range(5)]
+
+    batches = store._pack_embedding_batches(items, max_batch_tokens=100, max_batch_size=10)
+    assert [len(b) for b in batches] == [2, 2, 1]
+
+    batches = store._pack_embedding_batches(items, max_batch_tokens=1000, max_batch_size=3)
+    assert [len(b) for b in batches] == [3, 2]
+
+
+def test_pack_embedding_batches_oversized_item_gets_own_batch():
+    items = [{"text": "a", "tokens": 10}, {"text": "b", "tokens": 500}, {"text": "c", "tokens": 10}]
+
+    batches = store._pack_embedding_batches(items, max_batch_tokens=100, max_batch_size=10)
+    assert [[i["text"] for i in b] for b in batches] == [["a"], ["b"], ["c"]]
+
+
+def test_upsert_articles_bulk_batches_and_writes_once_per_batch():
+    client = _fake_client()
+    conn = Mock()
+    articles = [
+        {"uri": "u1", "raw": "first body"},
+        {"uri": "u2", "summary": "second"},
+        {"uri": "u3", "title": "first body"},  # same text as u1, embedded once
+        {"uri": "u4"},  # no text
+    ]
+
+    with patch.object(store, "_get_openai_client", return_value=client), \
+         patch.object(store, "get_embedding_cache", return_value=None), \
+         patch.object(store, "get_database_instance", return_value=Mock(_temp_get_connection=Mock(return_value=conn))):
+        stats = store.upsert_articles_bulk(articles, max_batch_size=10)
+
+    assert stats == {"indexed": 3, "cached": 0, "failed": 0, "skipped": 1}
+    client.embeddings.create.assert_called_once()
+    assert sorted(client.embeddings.create.call_args.kwargs["input"]) == ["first body", "second"]
+
+    conn.execute.assert_called_once()
+    params = conn.execute.call_args.args[1]
+    written = dict(zip(params["uris"], params["embeddings"]))
+    assert written == {"u1": "[10.0,0.0]", "u3": "[10.0,0.0]", "u2": "[6.0,0.0]"}
+
+
+def test_upsert_articles_bulk_failed_batch_is_not_written():
+    client = Mock()
+    client.embeddings.create.side_effect = RuntimeError("rate limited")
+    conn = Mock()
+
+    with patch.object(store, "_get_openai_client", return_value=client), \
+         patch.object(store, "get_embedding_cache", return_value=None), \
+         patch.object(store, "get_database_instance", return_value=Mock(_temp_get_connection=Mock(return_value=conn))):
+        stats = store.upsert_articles_bulk([{"uri": "u1", "raw": "text"}])
+
+    assert stats["failed"] == 1
+    assert stats["indexed"] == 0
+    conn.execute.assert_not_called()
+
+
+def test_embed_texts_async_uses_shared_client_without_blocking():
+    calls = []
+
+    async def create(model, input):
+        calls.append(list(input))
+        await asyncio.sleep(0)
+        return Mock(data=[Mock(index=i, embedding=[float(i)]) for i in range(len(input))])
+
+    client = Mock()
+    client.embeddings.create = AsyncMock(side_effect=create)
+
+    async def run():
+        with patch.object(store, "get_embedding_cache", return_value=None), \
+             patch.object(store, "_get_async_embedding_state", return_value=(client, asyncio.Semaphore(2))):
+            return await asyncio.gather(
+                store._embed_texts_async(["a", "b", "a"]),
+                store._embed_texts_async(["c"]),
+            )
+
+    first, second = asyncio.run(run())
+
+    assert first == [[0.0], [1.0], [0.0]]
+    assert second == [[0.0]]
+    # Duplicate texts are sent once
+    assert sorted(calls) == [["a", "b"], ["c"]]
+
+
+def test_async_embedding_state_is_per_loop():
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+        first = asyncio.run(_get_state())
+        second = asyncio.run(_get_state())
+
+    assert first[0] is first[1]
+    assert first[0] is not second[0]
+
+
+async def _get_state():
+    return store._get_async_embedding_state(), store._get_async_embedding_state()
+
+
+def _vector_send(values):
+    return len(values).to_bytes(2, "big") + b"\x00\x00" + np.asarray(values, dtype=">f4").tobytes()
+
+
+def test_vector_filter_sql_pushes_filters_into_sql():
+    clause, params = store._vector_filter_sql({"topic": "AI", "uri": {"$in": ["a", "b"]}})
+
+    assert clause == "embedding IS NOT NULL AND topic = :f0 AND uri = ANY(:f1)"
+    assert params == {"f0": "AI", "f1": ["a", "b"]}
+
+
+def test_vector_filter_sql_supports_ranges():
+    clause, params = store._vector_filter_sql({"publication_date": {"$gte": "2026-03-01", "$lt": "2026-04-01"}})
+
+    assert clause == "embedding IS NOT NULL AND publication_date >= :f0 AND publication_date < :f1"
+    assert params == {"f0": "2026-03-01", "f1": "2026-04-01"}
+
+
+def test_multi_query_search_embeds_once_and_runs_one_statement():
+    conn = Mock()
+    conn.execute.return_value.mappings.return_value.all.return_value = [
+        {"id": "u2", "query_index": 2, "score": 0.1, "title": "Funding", **dict.fromkeys(("publication_date", "topic"))},
+        {"id": "u1", "query_index": 0, "score": 0.3, "title": "AI", **dict.fromkeys(("publication_date", "topic"))},
+    ]
+    embed = Mock(return_value=[[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+
+    with patch.object(store, "_embed_texts", embed), \
+         patch.object(store, "get_database_instance", return_value=Mock(_temp_get_connection=Mock(return_value=conn))):
+        results = store.multi_query_search_articles(
+            ["AI", "", "latest AI news", "AI funding"],
+            top_k=50,
+            metadata_filter={"topic": "AI", "publication_date": {"$gte": "2026-03-01"}},
+        )
+
+    embed.assert_called_once_with(["AI", "latest AI news", "AI funding"], strict=True)
+    ef_search, search = conn.execute.call_args_list
+    assert ef_search.args[1] == {"ef_search": "50"}
+    sql, params = str(search.args[0]), search.args[1]
+    assert "(VALUES (0, CAST(:q0 AS vector)), (1, CAST(:q1 AS vector)), (2, CAST(:q2 AS vector)))" in sql
+    assert "CROSS JOIN LATERAL" in sql and "DISTINCT ON (hit.uri)" in sql
+    assert "topic = :f0 AND publication_date >= :f1" in sql
+    assert params["q2"] == "[0.5,0.5]" and params["limit"] == 50
+    conn.commit.assert_called_once()
+
+    assert [(r["id"], r["query"], r["score"]) for r in results] == [("u2", "AI funding", 0.1), ("u1", "AI", 0.3)]
+    assert results[0]["metadata"]["uri"] == "u2"
+
+
+def test_vector_filter_sql_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        store._vector_filter_sql({"1=1; DROP TABLE articles": "x"})
+
+
+def test_get_vectors_by_metadata_decodes_binary_into_matrix():
+    rows = [
+        {"uri": "u1", "embedding": memoryview(_vector_send([0.5, -1.0, 2.0])), **dict.fromkeys(store.VECTOR_METADATA_FIELDS)},
+        {"uri": "u2", "embedding": memoryview(_vector_send([1.0, 0.0, 0.25])), **dict.fromkeys(store.VECTOR_METADATA_FIELDS, "x")},
+    ]
+    conn = Mock()
+    conn.execution_options.return_value.execute.return_value.mappings.return_value.partitions.return_value = [rows[:1], rows[1:]]
+    engine = MagicMock()
+    engine.connect.return_value.__enter__.return_value = conn
+    shared_conn = Mock(engine=engine)
+
+    with patch.object(store, "get_database_instance", return_value=Mock(_temp_get_connection=Mock(return_value=shared_conn))):
+        vectors, metadatas, ids = store.get_vectors_by_metadata(limit=10, where={"topic": "AI"})
+
+    assert ids == ["u1", "u2"]
+    assert vectors.dtype.name == "float32"
+    assert vectors.tolist() == [[0.5, -1.0, 2.0], [1.0, 0.0, 0.25]]
+    assert metadatas[1]["title"] == "x"
+    assert "vector_send(embedding)" in str(conn.execution_options.return_value.execute.call_args.args[0])
+    # Streaming must not change the shared facade connection's options
+    shared_conn.execution_options.assert_not_called()
+    shared_conn.execute.assert_not_called()